@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks
+==========
+
+Defines the *airspeed velocity* (asv) benchmark suite of the library hot
+paths and the objects shared by the benchmarks:
+
+-   :attr:`benchmarks.SIZES`
+-   :func:`benchmarks.random_array`
+
+Notes
+-----
+-   The suite is run with the *benchmarks* *Invoke* task, e.g.
+    ``invoke benchmarks`` or ``invoke benchmarks --compare develop``.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SIZES', 'random_array']
+
+SIZES = OrderedDict([
+    ('Sample', ()),
+    ('Row', (1920, )),
+    ('HD', (1080, 1920)),
+    ('UHD', (2160, 3840)),
+])
+"""
+Benchmarks input shapes, from a single sample to a *4K UHD* frame, excluding
+the last components axis.
+
+SIZES : OrderedDict
+"""
+
+
+def random_array(size, components=3, low=0, high=1):
+    """
+    Returns a reproducible random array of given size.
+
+    Parameters
+    ----------
+    size : unicode
+        **{'Sample', 'Row', 'HD', 'UHD'}**,
+        :attr:`benchmarks.SIZES` attribute key.
+    components : int, optional
+        Components count of the last axis.
+    low : numeric, optional
+        Lower boundary of the values.
+    high : numeric, optional
+        Upper boundary of the values.
+
+    Returns
+    -------
+    ndarray
+        Random array.
+
+    Examples
+    --------
+    >>> random_array('Row').shape
+    (1920, 3)
+    """
+
+    return np.random.RandomState(4).uniform(low, high,
+                                            SIZES[size] + (components, ))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Appearance Models Benchmarks
+===================================
+
+Defines the :mod:`colour.appearance` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour import XYZ_to_CAM16, XYZ_to_CIECAM02
+
+from benchmarks import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZToCIECAM02', 'XYZToCAM16']
+
+
+class XYZToCIECAM02(object):
+    """
+    Defines :func:`colour.XYZ_to_CIECAM02` definition benchmarks.
+
+    Notes
+    -----
+    -   The *UHD* size is not benchmarked because of the memory used by the
+        model intermediate arrays.
+    """
+
+    params = [['Sample', 'Row', 'HD']]
+    param_names = ['size']
+    timeout = 180
+
+    def setup(self, size):
+        """
+        Initialises the benchmark.
+        """
+
+        self._XYZ = random_array(size, high=100)
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def time_XYZ_to_CIECAM02(self, size):
+        """
+        Times :func:`colour.XYZ_to_CIECAM02` definition.
+        """
+
+        XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, 318.31, 20.0)
+
+
+class XYZToCAM16(object):
+    """
+    Defines :func:`colour.XYZ_to_CAM16` definition benchmarks.
+
+    Notes
+    -----
+    -   The *UHD* size is not benchmarked because of the memory used by the
+        model intermediate arrays.
+    """
+
+    params = [['Sample', 'Row', 'HD']]
+    param_names = ['size']
+    timeout = 180
+
+    def setup(self, size):
+        """
+        Initialises the benchmark.
+        """
+
+        self._XYZ = random_array(size, high=100)
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def time_XYZ_to_CAM16(self, size):
+        """
+        Times :func:`colour.XYZ_to_CAM16` definition.
+        """
+
+        XYZ_to_CAM16(self._XYZ, self._XYZ_w, 318.31, 20.0)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Colorimetry Benchmarks
+======================
+
+Defines the :mod:`colour.colorimetry` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour import (COLOURCHECKERS_SDS, ILLUMINANTS_SDS,
+                    STANDARD_OBSERVERS_CMFS, SpectralShape, multi_sd_to_XYZ,
+                    sd_to_XYZ)
+
+from benchmarks import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SdToXYZ', 'MultiSdToXYZ']
+
+
+class SdToXYZ(object):
+    """
+    Defines :func:`colour.sd_to_XYZ` definition benchmarks.
+    """
+
+    params = [['Integration', 'ASTM E308-15'], [1, 5, 10]]
+    param_names = ['method', 'interval']
+
+    def setup(self, method, interval):
+        """
+        Initialises the benchmark.
+        """
+
+        self._sd = COLOURCHECKERS_SDS['ColorChecker N Ohta'][
+            'dark skin'].copy().align(SpectralShape(360, 780, interval))
+        self._cmfs = STANDARD_OBSERVERS_CMFS[
+            'CIE 1931 2 Degree Standard Observer']
+        self._illuminant = ILLUMINANTS_SDS['D65']
+
+    def time_sd_to_XYZ(self, method, interval):
+        """
+        Times :func:`colour.sd_to_XYZ` definition.
+        """
+
+        sd_to_XYZ(self._sd, self._cmfs, self._illuminant, method)
+
+
+class MultiSdToXYZ(object):
+    """
+    Defines :func:`colour.multi_sd_to_XYZ` definition benchmarks.
+
+    Notes
+    -----
+    -   The *UHD* size is not benchmarked as the 31 bins multi-spectral array
+        would not fit in memory on most machines.
+    """
+
+    params = [['Sample', 'Row', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark.
+        """
+
+        self._shape = SpectralShape(400, 700, 10)
+        self._msd = random_array(size, len(self._shape.range()))
+        self._cmfs = STANDARD_OBSERVERS_CMFS[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+        self._illuminant = ILLUMINANTS_SDS['D65'].copy().align(self._shape)
+
+    def time_multi_sd_to_XYZ(self, size):
+        """
+        Times :func:`colour.multi_sd_to_XYZ` definition.
+        """
+
+        multi_sd_to_XYZ(self._msd, self._shape, self._cmfs, self._illuminant)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Difference Benchmarks
+============================
+
+Defines the :mod:`colour.difference` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour import delta_E
+
+from benchmarks import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DeltaE']
+
+
+class DeltaE(object):
+    """
+    Defines :func:`colour.delta_E` definition benchmarks.
+    """
+
+    params = [
+        list(SIZES), ['CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99']
+    ]
+    param_names = ['size', 'method']
+    timeout = 180
+
+    def setup(self, size, method):
+        """
+        Initialises the benchmark.
+        """
+
+        self._Lab_1 = random_array(size, low=-100, high=100)
+        self._Lab_2 = self._Lab_1[::-1].copy()
+
+    def time_delta_E(self, size, method):
+        """
+        Times :func:`colour.delta_E` definition.
+        """
+
+        delta_E(self._Lab_1, self._Lab_2, method)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Import Benchmarks
+=================
+
+Defines the package import benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Import']
+
+
+class Import(object):
+    """
+    Defines the package import benchmarks, run in a new interpreter for each
+    repeat.
+    """
+
+    def timeraw_import_colour(self):
+        """
+        Times the package import.
+        """
+
+        return 'import colour'
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing Benchmarks
+=========================
+
+Defines the :mod:`colour.io.luts` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour import LUT3D
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+
+from benchmarks import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['INTERPOLATORS', 'LUT3DApply']
+
+INTERPOLATORS = {
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral': table_interpolation_tetrahedral,
+}
+"""
+Benchmarked *LUT* table interpolators.
+
+INTERPOLATORS : dict
+"""
+
+
+class LUT3DApply(object):
+    """
+    Defines :meth:`colour.LUT3D.apply` method benchmarks.
+    """
+
+    params = [list(SIZES), sorted(INTERPOLATORS)]
+    param_names = ['size', 'interpolator']
+    timeout = 180
+
+    def setup(self, size, interpolator):
+        """
+        Initialises the benchmark.
+        """
+
+        self._LUT = LUT3D(LUT3D.linear_table(33) ** (1 / 2.2))
+        self._RGB = random_array(size)
+
+    def time_apply(self, size, interpolator):
+        """
+        Times :meth:`colour.LUT3D.apply` method.
+        """
+
+        self._LUT.apply(self._RGB, INTERPOLATORS[interpolator])
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Models Benchmarks
+========================
+
+Defines the :mod:`colour.models` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour import RGB_COLOURSPACES, RGB_to_RGB, XYZ_to_RGB
+from colour.models import decoding_cctf, encoding_cctf
+
+from benchmarks import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZToRGB', 'RGBToRGB', 'CCTFs']
+
+
+class XYZToRGB(object):
+    """
+    Defines :func:`colour.XYZ_to_RGB` definition benchmarks.
+    """
+
+    params = [list(SIZES)]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark.
+        """
+
+        self._XYZ = random_array(size)
+        self._colourspace = RGB_COLOURSPACES['sRGB']
+
+    def time_XYZ_to_RGB(self, size):
+        """
+        Times :func:`colour.XYZ_to_RGB` definition.
+        """
+
+        XYZ_to_RGB(self._XYZ, self._colourspace.whitepoint,
+                   self._colourspace.whitepoint,
+                   self._colourspace.XYZ_to_RGB_matrix)
+
+
+class RGBToRGB(object):
+    """
+    Defines :func:`colour.RGB_to_RGB` definition benchmarks.
+    """
+
+    params = [list(SIZES)]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark.
+        """
+
+        self._RGB = random_array(size)
+
+    def time_RGB_to_RGB(self, size):
+        """
+        Times :func:`colour.RGB_to_RGB` definition.
+        """
+
+        RGB_to_RGB(self._RGB, RGB_COLOURSPACES['sRGB'],
+                   RGB_COLOURSPACES['ACES2065-1'], 'Bradford')
+
+
+class CCTFs(object):
+    """
+    Defines :func:`colour.encoding_cctf` and :func:`colour.decoding_cctf`
+    definitions benchmarks.
+    """
+
+    params = [
+        list(SIZES),
+        ['sRGB', 'ST 2084', 'ITU-R BT.2100 HLG', 'ALEXA Log C', 'S-Log3']
+    ]
+    param_names = ['size', 'function']
+
+    def setup(self, size, function):
+        """
+        Initialises the benchmark.
+        """
+
+        self._RGB = random_array(size)
+
+    def time_encoding_cctf(self, size, function):
+        """
+        Times :func:`colour.encoding_cctf` definition.
+        """
+
+        encoding_cctf(self._RGB, function)
+
+    def time_decoding_cctf(self, size, function):
+        """
+        Times :func:`colour.decoding_cctf` definition.
+        """
+
+        decoding_cctf(self._RGB, function)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Notation Systems Benchmarks
+==================================
+
+Defines the :mod:`colour.notation` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.notation.munsell import xyY_to_munsell_specification
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYY_SAMPLES', 'XyYToMunsellSpecification']
+
+XYY_SAMPLES = {
+    'Neutral': np.array([0.31006, 0.31616, 0.10000]),
+    'Dark Skin': np.array([0.40058, 0.35000, 0.10102]),
+    'Blue Sky': np.array([0.25137, 0.26724, 0.19165]),
+    'Red': np.array([0.53817, 0.31375, 0.12275]),
+}
+"""
+Benchmarked *CIE xyY* colourspace samples, the conversion being iterative,
+its cost depends on the sample.
+
+XYY_SAMPLES : dict
+"""
+
+
+class XyYToMunsellSpecification(object):
+    """
+    Defines :func:`colour.notation.munsell.xyY_to_munsell_specification`
+    definition benchmarks.
+
+    Notes
+    -----
+    -   The definition is not vectorised, thus only single samples are
+        benchmarked.
+    """
+
+    params = [sorted(XYY_SAMPLES)]
+    param_names = ['sample']
+
+    def time_xyY_to_munsell_specification(self, sample):
+        """
+        Times :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition.
+        """
+
+        xyY_to_munsell_specification(XYY_SAMPLES[sample])
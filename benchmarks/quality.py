@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Quality Benchmarks
+=========================
+
+Defines the :mod:`colour.quality` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour import ILLUMINANTS_SDS, colour_rendering_index
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['ColourRenderingIndex']
+
+
+class ColourRenderingIndex(object):
+    """
+    Defines :func:`colour.colour_rendering_index` definition benchmarks.
+    """
+
+    params = [['A', 'D65', 'F2', 'FL3.15']]
+    param_names = ['illuminant']
+
+    def time_colour_rendering_index(self, illuminant):
+        """
+        Times :func:`colour.colour_rendering_index` definition.
+        """
+
+        colour_rendering_index(ILLUMINANTS_SDS[illuminant])
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Temperature Benchmarks
+=============================
+
+Defines the :mod:`colour.temperature` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour import uv_to_CCT
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['UvToCCT']
+
+
+class UvToCCT(object):
+    """
+    Defines :func:`colour.uv_to_CCT` definition benchmarks.
+
+    Notes
+    -----
+    -   The methods are not vectorised, thus only single samples are
+        benchmarked.
+    """
+
+    params = [['Ohno 2013', 'Robertson 1968']]
+    param_names = ['method']
+
+    def setup(self, method):
+        """
+        Initialises the benchmark.
+        """
+
+        self._uv = np.array([0.1978, 0.3122])
+
+    def time_uv_to_CCT(self, method):
+        """
+        Times :func:`colour.uv_to_CCT` definition.
+        """
+
+        uv_to_CCT(self._uv, method)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Volume Benchmarks
+========================
+
+Defines the :mod:`colour.volume` package benchmarks.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour import (RGB_COLOURSPACES, RGB_colourspace_volume_MonteCarlo,
+                    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
+                    RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['MonteCarlo']
+
+
+class MonteCarlo(object):
+    """
+    Defines the *Monte Carlo* colour volume definitions benchmarks.
+    """
+
+    params = [[10 ** 4, 10 ** 5, 10 ** 6]]
+    param_names = ['samples']
+    timeout = 300
+
+    def setup(self, samples):
+        """
+        Initialises the benchmark.
+        """
+
+        self._colourspace = RGB_COLOURSPACES['sRGB']
+
+    def time_RGB_colourspace_volume_MonteCarlo(self, samples):
+        """
+        Times :func:`colour.RGB_colourspace_volume_MonteCarlo` definition.
+        """
+
+        RGB_colourspace_volume_MonteCarlo(
+            self._colourspace,
+            samples,
+            random_state=np.random.RandomState(4),
+            processes=1)
+
+    def time_RGB_colourspace_pointer_gamut_coverage_MonteCarlo(self, samples):
+        """
+        Times :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
+        definition.
+        """
+
+        RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
+            self._colourspace, samples, random_state=np.random.RandomState(4))
+
+    def time_RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
+            self, samples):
+        """
+        Times
+        :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+        definition.
+        """
+
+        RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
+            self._colourspace, samples, random_state=np.random.RandomState(4))
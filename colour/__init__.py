@@ -81,23 +81,28 @@ from .appearance import (
     RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
     XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
     XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
+from .difference import (DELTA_E_METHODS, delta_E, delta_E_pairwise,
+                         delta_E_nearest)
 from .characterisation import (
     CAMERAS_RGB_SPECTRAL_SENSITIVITIES, COLOURCHECKERS, COLOURCHECKERS_SDS,
     DISPLAYS_RGB_PRIMARIES, POLYNOMIAL_EXPANSION_METHODS, polynomial_expansion,
     COLOUR_CORRECTION_MATRIX_METHODS, colour_correction_matrix,
     COLOUR_CORRECTION_METHODS, colour_correction)
 from .io import (LUT1D, LUT2D, LUT3D, LUTSequence,
-                 SpectralDistribution_IESTM2714, read_image, read_LUT,
-                 read_sds_from_csv_file, read_sds_from_xrite_file,
-                 read_spectral_data_from_csv_file, write_image, write_LUT,
-                 write_sds_to_csv_file)
+                 SpectralDistribution_IESTM2714, read_image,
+                 read_image_scanlines, read_LUT,
+                 read_multi_sd_from_IESTM2714_files,
+                 read_multi_sd_from_csv_file, read_multi_sd_from_xrite_file,
+                 read_sds_from_csv_file,
+                 read_sds_from_xrite_file,
+                 read_spectral_data_from_csv_file, write_image,
+                 write_image_scanlines, write_LUT, write_sds_to_csv_file)
 from .models import (
-    CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
+    BakedCCTF, CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
-    CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    DECODING_CCTFS, DIN99_to_Lab, ENCODING_CCTFS, EOTFS, EOTFS_REVERSE,
-    HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB, HSV_to_RGB,
+    CAM16UCS_to_JMh_CAM16, CCTF_SHAPERS, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB,
+    CV_range, DECODING_CCTFS, DIN99_to_Lab, ENCODING_CCTFS, EOTFS,
+    EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB, HSV_to_RGB,
     Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle,
     IPT_to_XYZ, JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD,
     JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
@@ -109,12 +114,14 @@ from .models import (
     POINTER_GAMUT_ILLUMINANT, Prismatic_to_RGB, RGB_COLOURSPACES,
     RGB_Colourspace, RGB_luminance, RGB_luminance_equation, RGB_to_CMY,
     RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP, RGB_to_Prismatic, RGB_to_RGB,
-    RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YcCbcCrc, RGB_to_YCoCg,
-    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab,
-    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966,
-    XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
+    RGB_to_RGB_Converter, RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr,
+    RGB_to_YCbCr_Converter, RGB_to_YcCbcCrc, RGB_to_YCoCg, UCS_to_XYZ,
+    UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab,
+    XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab,
+    XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
     XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY,
-    YCBCR_WEIGHTS, YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB,
+    YCBCR_WEIGHTS, YCbCr_to_RGB, YCbCr_to_RGB_Converter, YcCbcCrc_to_RGB,
+    YCoCg_to_RGB, bake_decoding_cctf, bake_encoding_cctf,
     chromatically_adapted_primaries, decoding_cctf, encoding_cctf, eotf,
     eotf_reverse, full_to_legal, function_gamma, function_linear,
     hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, legal_to_full, log_decoding_curve,
@@ -141,8 +148,12 @@ from .volume import (
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
+    RGB_colourspace_volume_coverage_MonteCarlo,
+    RGB_colourspace_pointer_gamut_coverage_Mesh,
+    RGB_colourspace_visible_spectrum_coverage_Mesh,
+    RGB_colourspace_volume_Mesh, RGB_colourspace_volume_coverage_Mesh,
+    is_within_macadam_limits, is_within_mesh_volume, is_within_pointer_gamut,
+    is_within_visible_spectrum)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -198,7 +209,9 @@ __all__ += [
     'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
     'XYZ_to_RLAB'
 ]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
+__all__ += [
+    'DELTA_E_METHODS', 'delta_E', 'delta_E_pairwise', 'delta_E_nearest'
+]
 __all__ += [
     'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
     'COLOURCHECKERS_SDS', 'DISPLAYS_RGB_PRIMARIES',
@@ -208,37 +221,42 @@ __all__ += [
 ]
 __all__ += [
     'LUT1D', 'LUT2D', 'LUT3D', 'LUTSequence', 'SpectralDistribution_IESTM2714',
-    'read_image', 'read_LUT', 'read_sds_from_csv_file',
-    'read_sds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_LUT', 'write_sds_to_csv_file'
+    'read_image', 'read_image_scanlines', 'read_LUT',
+    'read_multi_sd_from_IESTM2714_files', 'read_multi_sd_from_csv_file',
+    'read_multi_sd_from_xrite_file',
+    'read_sds_from_csv_file', 'read_sds_from_xrite_file',
+    'read_spectral_data_from_csv_file', 'write_image', 'write_image_scanlines',
+    'write_LUT', 'write_sds_to_csv_file'
 ]
 __all__ += [
-    'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
+    'BakedCCTF', 'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
     'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
-    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'DECODING_CCTFS', 'DIN99_to_Lab',
-    'ENCODING_CCTFS', 'EOTFS', 'EOTFS_REVERSE', 'HDR_CIELAB_METHODS',
-    'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB', 'Hunter_Lab_to_XYZ',
-    'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
-    'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
-    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
-    'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
-    'LCHuv_to_Luv', 'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES',
-    'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv', 'Luv_to_XYZ',
-    'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE', 'OOTFS',
-    'MACADAM_1942_ELLIPSES_DATA', 'OOTFS_REVERSE', 'OSA_UCS_to_XYZ',
-    'POINTER_GAMUT_BOUNDARIES', 'POINTER_GAMUT_DATA',
+    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CCTF_SHAPERS',
+    'CMYK_to_CMY', 'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'DECODING_CCTFS',
+    'DIN99_to_Lab', 'ENCODING_CCTFS', 'EOTFS', 'EOTFS_REVERSE',
+    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
+    'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle',
+    'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD',
+    'JMh_CAM16_to_CAM16UCS', 'JMh_CIECAM02_to_CAM02LCD',
+    'JMh_CIECAM02_to_CAM02SCD', 'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ',
+    'LCHab_to_Lab', 'LCHuv_to_Luv', 'LOG_DECODING_CURVES',
+    'LOG_ENCODING_CURVES', 'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ',
+    'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
+    'OETFS_REVERSE', 'OOTFS', 'MACADAM_1942_ELLIPSES_DATA', 'OOTFS_REVERSE',
+    'OSA_UCS_to_XYZ', 'POINTER_GAMUT_BOUNDARIES', 'POINTER_GAMUT_DATA',
     'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
     'RGB_Colourspace', 'RGB_luminance', 'RGB_luminance_equation', 'RGB_to_CMY',
     'RGB_to_HSL', 'RGB_to_HSV', 'RGB_to_ICTCP', 'RGB_to_Prismatic',
-    'RGB_to_RGB', 'RGB_to_RGB_matrix', 'RGB_to_XYZ', 'RGB_to_YCbCr',
-    'RGB_to_YcCbcCrc', 'RGB_to_YCoCg', 'UCS_to_XYZ', 'UCS_to_uv',
-    'UCS_uv_to_xy', 'UVW_to_XYZ', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab',
-    'XYZ_to_IPT', 'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
-    'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
-    'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
-    'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
-    'YCoCg_to_RGB', 'chromatically_adapted_primaries', 'decoding_cctf',
+    'RGB_to_RGB', 'RGB_to_RGB_Converter', 'RGB_to_RGB_matrix', 'RGB_to_XYZ',
+    'RGB_to_YCbCr', 'RGB_to_YCbCr_Converter', 'RGB_to_YcCbcCrc',
+    'RGB_to_YCoCg', 'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
+    'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_JzAzBz',
+    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_OSA_UCS',
+    'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab',
+    'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY',
+    'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YCbCr_to_RGB_Converter',
+    'YcCbcCrc_to_RGB', 'YCoCg_to_RGB', 'bake_decoding_cctf',
+    'bake_encoding_cctf', 'chromatically_adapted_primaries', 'decoding_cctf',
     'encoding_cctf', 'eotf', 'eotf_reverse', 'full_to_legal', 'function_gamma',
     'function_linear', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
     'log_decoding_curve', 'log_encoding_curve', 'normalised_primary_matrix',
@@ -269,9 +287,12 @@ __all__ += [
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
     'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
+    'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_pointer_gamut_coverage_Mesh',
+    'RGB_colourspace_visible_spectrum_coverage_Mesh',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_coverage_Mesh',
+    'is_within_macadam_limits', 'is_within_mesh_volume',
+    'is_within_pointer_gamut', 'is_within_visible_spectrum'
 ]
 __application_name__ = 'Colour'
 
@@ -24,7 +24,7 @@ References
 from __future__ import absolute_import
 
 from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
-                              get_domain_range_scale, as_float_array)
+                              get_domain_range_scale, as_float_array, profiled)
 
 from .dataset import *  # noqa
 from . import dataset
@@ -70,6 +70,7 @@ CHROMATIC_ADAPTATION_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def chromatic_adaptation(XYZ, XYZ_w, XYZ_wr, method='Von Kries', **kwargs):
     """
     Adapts given stimulus from test viewing conditions to reference viewing
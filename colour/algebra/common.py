@@ -125,7 +125,7 @@ class spow_enable(object):
         return wrapper
 
 
-def spow(a, p):
+def spow(a, p, out=None):
     """
     Raises given array :math:`a` to the power :math:`p` as follows:
     :math:`sign(a) * |a|^p`.
@@ -139,6 +139,8 @@ def spow(a, p):
         Array :math:`a`.
     p : numeric or array_like
         Power :math:`p`.
+    out : ndarray, optional
+        Array the result is written into, it can be array :math:`a` itself.
 
     Returns
     -------
@@ -153,10 +155,27 @@ def spow(a, p):
     -1.1095694...
     >>> spow(0, 0)
     0.0
+    >>> a = np.array([-2.0, 0.0, 2.0])
+    >>> spow(a, 0.15, out=a)  # doctest: +ELLIPSIS
+    array([-1.1095694...,  0.        ,  1.1095694...])
     """
 
     if not _SPOW_ENABLED:
-        return np.power(a, p)
+        return np.power(a, p, out=out)
+
+    if out is not None:
+        # The signs are stored as boolean masks so that the power can be
+        # computed in place without allocating a float array.
+        a = as_float_array(a)
+        negative = a < 0
+        zero = a == 0
+
+        np.abs(a, out=out)
+        np.power(out, p, out=out)
+        np.negative(out, out=out, where=negative)
+        out[np.logical_or(zero, np.isnan(out))] = 0
+
+        return out
 
     a = np.atleast_1d(a)
     p = as_float_array(p)
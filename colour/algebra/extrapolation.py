@@ -21,8 +21,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import as_float, is_numeric, is_string
+from colour.utilities import (as_float, get_default_float_dtype, is_numeric,
+                              is_string)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -63,8 +63,9 @@ class Extrapolator(object):
         Value to return for x < xi[0].
     right : numeric, optional
         Value to return for x > xi[-1].
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Methods
     -------
@@ -119,7 +120,7 @@ class Extrapolator(object):
                  method='Linear',
                  left=None,
                  right=None,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
 
         self._interpolator = None
         self.interpolator = interpolator
@@ -130,6 +131,8 @@ class Extrapolator(object):
         self._left = None
         self.left = left
 
+        if dtype is None:
+            dtype = get_default_float_dtype()
         self._dtype = dtype
 
     @property
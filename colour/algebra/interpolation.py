@@ -63,10 +63,11 @@ import scipy.interpolate
 from collections import OrderedDict, Mapping
 from six.moves import reduce
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
-                              closest_indexes, interval, is_integer,
-                              is_numeric, runtime_warning, tsplit)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.utilities import (
+    CaseInsensitiveMapping, as_float_array, as_float, closest_indexes,
+    get_default_float_dtype, interval, is_integer, is_numeric, runtime_warning,
+    tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -291,8 +292,9 @@ class KernelInterpolator(object):
     padding_args : dict, optional
          Arguments to use when padding :math:`y` variable values with the
          :func:`np.pad` definition.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Attributes
     ----------
@@ -352,7 +354,7 @@ class KernelInterpolator(object):
                  kernel=kernel_lanczos,
                  kernel_args=None,
                  padding_args=None,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
         self._x_p = None
         self._y_p = None
 
@@ -360,6 +362,8 @@ class KernelInterpolator(object):
         self._y = None
         self._window = None
         self._padding_args = {'pad_width': (window, window), 'mode': 'reflect'}
+        if dtype is None:
+            dtype = get_default_float_dtype()
         self._dtype = dtype
 
         self.x = x
@@ -692,8 +696,9 @@ class NearestNeighbourInterpolator(KernelInterpolator):
     padding_args : dict, optional
          Arguments to use when padding :math:`y` variable values with the
          :func:`np.pad` definition.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
     """
 
     def __init__(self, *args, **kwargs):
@@ -716,8 +721,9 @@ class LinearInterpolator(object):
     y : array_like
         Dependent and already known :math:`y` variable values to
         interpolate.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Attributes
     ----------
@@ -750,9 +756,11 @@ class LinearInterpolator(object):
     array([ 6.7825,  8.5075])
     """
 
-    def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
+    def __init__(self, x, y, dtype=None):
         self._x = None
         self._y = None
+        if dtype is None:
+            dtype = get_default_float_dtype()
         self._dtype = dtype
 
         self.x = x
@@ -910,8 +918,9 @@ class SpragueInterpolator(object):
     y : array_like
         Dependent and already known :math:`y` variable values to
         interpolate.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Attributes
     ----------
@@ -965,12 +974,14 @@ class SpragueInterpolator(object):
     :cite:`CIETC1-382005h`
     """
 
-    def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
+    def __init__(self, x, y, dtype=None):
         self._xp = None
         self._yp = None
 
         self._x = None
         self._y = None
+        if dtype is None:
+            dtype = get_default_float_dtype()
         self._dtype = dtype
 
         self.x = x
@@ -1232,8 +1243,9 @@ class NullInterpolator(object):
         Relative tolerance.
     default : numeric, optional
         Default value for interpolation outside tolerances.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Attributes
     ----------
@@ -1268,12 +1280,14 @@ class NullInterpolator(object):
                  absolute_tolerance=10e-7,
                  relative_tolerance=10e-7,
                  default=np.nan,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
         self._x = None
         self._y = None
         self._absolute_tolerance = None
         self._relative_tolerance = None
         self._default = None
+        if dtype is None:
+            dtype = get_default_float_dtype()
         self._dtype = dtype
 
         self.x = x
@@ -103,6 +103,19 @@ class TestSpow(unittest.TestCase):
         with spow_enable(False):
             np.testing.assert_equal(spow(-2, 0.15), np.nan)
 
+        a = np.array([2, -2, -2, 0, np.nan])
+        out = np.empty(5)
+        self.assertIs(spow(a, [2, 2, 0.15, 0, 1], out), out)
+        np.testing.assert_almost_equal(
+            out,
+            np.array([4.00000000, -4.00000000, -1.10956947, 0.00000000, 0]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            spow(a, 0.15, a),
+            np.array([1.10956947, -1.10956947, -1.10956947, 0.00000000, 0]),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.CAM16_Specification`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
+-   :class:`colour.appearance.CAM16_ViewingConditions`
 
 See Also
 --------
@@ -32,11 +33,12 @@ from collections import namedtuple
 
 from colour.algebra import spow
 from colour.appearance.ciecam02 import (
-    CIECAM02_VIEWING_CONDITIONS, P, achromatic_response_forward,
-    achromatic_response_reverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
-    hue_angle, hue_quadrature, lightness_correlate,
-    opponent_colour_dimensions_forward, opponent_colour_dimensions_reverse,
+    CIECAM02_VIEWING_CONDITIONS, CIECAM02_ViewingConditions, P,
+    achromatic_response_forward, achromatic_response_reverse,
+    brightness_correlate, chroma_correlate, colourfulness_correlate,
+    degree_of_adaptation, eccentricity_factor, hue_angle, hue_quadrature,
+    lightness_correlate, opponent_colour_dimensions_forward,
+    opponent_colour_dimensions_reverse,
     post_adaptation_non_linear_response_compression_forward,
     post_adaptation_non_linear_response_compression_reverse,
     post_adaptation_non_linear_response_compression_matrix,
@@ -57,7 +59,7 @@ __status__ = 'Production'
 __all__ = [
     'M_16', 'M_16_INVERSE', 'CAM16_InductionFactors',
     'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_to_XYZ', 'CAM16_ViewingConditions'
 ]
 
 M_16 = np.array([
@@ -457,3 +459,94 @@ def CAM16_to_XYZ(CAM16_specification,
     XYZ = dot_vector(M_16_INVERSE, RGB)
 
     return from_range_100(XYZ)
+
+
+class CAM16_ViewingConditions(CIECAM02_ViewingConditions):
+    """
+    Defines the *CAM16* colour appearance model viewing conditions, i.e.
+    reference white, adapting field *luminance*, background relative
+    *luminance* and surround.
+
+    Everything depending only on the viewing conditions, e.g. the viewing
+    condition dependent parameters, the degree of adaptation :math:`D`, the
+    achromatic response :math:`A_w` of the whitepoint and the matrices
+    combining the conversion to sharpened *RGB* values with the chromatic
+    adaptation, is computed once at instantiation so that the
+    :meth:`colour.appearance.CAM16_ViewingConditions.forward` and
+    :meth:`colour.appearance.CAM16_ViewingConditions.reverse` methods only
+    perform the per-stimulus computations.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    forward_image
+    reverse
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   ``XYZ_w`` is converted with the domain-range scale active at
+        instantiation.
+
+    References
+    ----------
+    :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = CAM16_ViewingConditions(XYZ_w, L_A, Y_b)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> viewing_conditions.forward(XYZ)  # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
+s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
+    >>> viewing_conditions.reverse(
+    ...     viewing_conditions.forward(XYZ))  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION = CAM16_Specification
+    _CLIP_DEGREE_OF_ADAPTATION = True
+    _XYZ_TO_RGB_MATRIX = M_16
+    _RGB_TO_XYZ_MATRIX = M_16_INVERSE
+    _RGB_TO_RGB_P_MATRIX = np.identity(3)
+    _RGB_P_TO_RGB_MATRIX = np.identity(3)
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CAM16_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        super(CAM16_ViewingConditions, self).__init__(
+            XYZ_w, L_A, Y_b, surround, discount_illuminant)
@@ -10,6 +10,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CIECAM02_Specification`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.appearance.CIECAM02_ViewingConditions`
 
 See Also
 --------
@@ -39,7 +40,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.algebra import spow
+from colour.algebra import is_spow_enabled, spow
 from colour.adaptation import CAT02_CAT
 from colour.appearance.hunt import (HPE_TO_XYZ_MATRIX, XYZ_TO_HPE_MATRIX,
                                     luminance_level_adaptation_factor)
@@ -60,7 +61,8 @@ __all__ = [
     'CAT02_INVERSE_CAT', 'CIECAM02_InductionFactors',
     'CIECAM02_VIEWING_CONDITIONS', 'HUE_DATA_FOR_HUE_QUADRATURE',
     'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
-    'chromatic_induction_factors', 'base_exponential_non_linearity',
+    'CIECAM02_ViewingConditions', 'chromatic_induction_factors',
+    'base_exponential_non_linearity',
     'viewing_condition_dependent_parameters', 'degree_of_adaptation',
     'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_reverse',
     'RGB_to_rgb', 'rgb_to_RGB',
@@ -471,6 +473,696 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     return from_range_100(XYZ)
 
 
+_HUE_QUADRATURE_SEGMENTS = np.array([
+    [20.14, 69.86, 1 / 0.8, 1 / 0.7, 0.0, 100.0],
+    [90.00, 74.25, 1 / 0.7, 1 / 1.0, 100.0, 100.0],
+    [164.25, 73.28, 1 / 1.0, 1 / 1.2, 200.0, 100.0],
+    [237.53, 122.47, 1 / 1.2, 1 / 0.856, 300.0, 85.9],
+    [360.00, 20.14, 1 / 0.856, 1 / 0.8, 385.9, 14.1],
+])
+"""
+Hue quadrature :math:`H` look-up table of the segments between the unique
+hues, expressed on hue :math:`h` angles in domain [20.14, 380.14]. Each row
+stores the segment start hue angle, length, reciprocal eccentricities at both
+ends, start hue quadrature and hue quadrature increment, the segment starting
+at 360 degrees implementing the *red* unique hue split used by
+:func:`colour.appearance.ciecam02.hue_quadrature` definition.
+
+_HUE_QUADRATURE_SEGMENTS : ndarray, (5, 6)
+"""
+
+
+def _spow_in_place(a, p, scratch):
+    """
+    Raises given array to given power in-place using the same semantics than
+    :func:`colour.algebra.spow` definition.
+
+    Parameters
+    ----------
+    a : ndarray
+        Array to raise to the power, modified in-place.
+    p : numeric
+        Power.
+    scratch : ndarray
+        Scratch array with the same shape than ``a``.
+
+    Returns
+    -------
+    ndarray
+        Array ``a``.
+    """
+
+    if not is_spow_enabled():
+        return np.power(a, p, out=a)
+
+    np.abs(a, out=scratch)
+    np.power(scratch, p, out=scratch)
+    np.copysign(scratch, a, out=a)
+    a[np.isnan(a)] = 0
+
+    return a
+
+
+class CIECAM02_ViewingConditions(object):
+    """
+    Defines the *CIECAM02* colour appearance model viewing conditions, i.e.
+    reference white, adapting field *luminance*, background relative
+    *luminance* and surround.
+
+    Everything depending only on the viewing conditions, e.g. the viewing
+    condition dependent parameters, the degree of adaptation :math:`D`, the
+    achromatic response :math:`A_w` of the whitepoint and the matrices
+    combining the chromatic adaptation with the conversion to
+    *Hunt-Pointer-Estevez* :math:`\\rho\\gamma\\beta` colourspace, is
+    computed once at instantiation so that the
+    :meth:`colour.appearance.CIECAM02_ViewingConditions.forward` and
+    :meth:`colour.appearance.CIECAM02_ViewingConditions.reverse` methods only
+    perform the per-stimulus computations.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    forward_image
+    reverse
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   ``XYZ_w`` is converted with the domain-range scale active at
+        instantiation.
+
+    References
+    ----------
+    :cite:`Fairchild2004c`, :cite:`Luo2013`, :cite:`Moroneya`,
+    :cite:`Wikipedia2007a`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = CIECAM02_ViewingConditions(XYZ_w, L_A, Y_b)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> viewing_conditions.forward(XYZ)  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+    """
+
+    _SPECIFICATION = CIECAM02_Specification
+    _CLIP_DEGREE_OF_ADAPTATION = False
+    _XYZ_TO_RGB_MATRIX = CAT02_CAT
+    _RGB_TO_XYZ_MATRIX = CAT02_INVERSE_CAT
+    _RGB_TO_RGB_P_MATRIX = dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT)
+    _RGB_P_TO_RGB_MATRIX = dot_matrix(CAT02_CAT, HPE_TO_XYZ_MATRIX)
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CIECAM02_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = to_domain_100(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        n, F_L, N_bb, N_cb, z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        RGB_w = dot_vector(self._XYZ_TO_RGB_MATRIX, self._XYZ_w)
+
+        # Computing degree of adaptation :math:`D`.
+        if discount_illuminant:
+            D = np.ones(self._L_A.shape)
+        else:
+            D = degree_of_adaptation(surround.F, self._L_A)
+            if self._CLIP_DEGREE_OF_ADAPTATION:
+                D = np.clip(D, 0, 1)
+
+        D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+
+        # Combining conversion to sharpened *RGB* values, full chromatic
+        # adaptation and conversion to *Hunt-Pointer-Estevez* colourspace.
+        self._M_forward = dot_matrix(
+            self._RGB_TO_RGB_P_MATRIX,
+            D_RGB[..., np.newaxis] * self._XYZ_TO_RGB_MATRIX)
+        self._M_reverse = dot_matrix(
+            self._RGB_TO_XYZ_MATRIX,
+            self._RGB_P_TO_RGB_MATRIX / D_RGB[..., np.newaxis])
+
+        # Computing achromatic response for the whitepoint.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            dot_vector(self._M_forward, self._XYZ_w), F_L)
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+        c = as_float_array(surround.c)
+        N_c = as_float_array(surround.N_c)
+
+        self._n = n
+        self._F_L = F_L
+        self._F_L_100 = F_L[..., np.newaxis] / 100
+        self._F_L_4 = spow(F_L, 0.25)
+        self._N_bb = N_bb
+        self._N_cb = N_cb
+        self._A_w = A_w
+        self._c = c
+        self._N_c = N_c
+        self._cz = c * z
+        self._Q_k = (4 / c) * (A_w + 4) * self._F_L_4
+        self._t_k = (50000 / 13) * N_c * N_cb
+        self._C_k = spow(1.64 - 0.29 ** n, 0.73)
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        CIECAM02_InductionFactors
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Truth value indicating if the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    def _dot(self, M, a):
+        """
+        Multiplies given array by given matrix, using :func:`np.dot` definition
+        when a single matrix is used for all the elements.
+        """
+
+        if M.ndim == 2:
+            return np.dot(a, np.transpose(M))
+
+        return dot_vector(M, a)
+
+    def forward(self, XYZ):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            Colour appearance model specification.
+
+        Notes
+        -----
+
+        +---------------------+-----------------------+---------------+
+        | **Domain**          | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``XYZ``             | [0, 100]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+
+        +---------------------+-----------------------+---------------+
+        | **Range**           | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``specification.h`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+        | ``specification.H`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+        """
+
+        XYZ = to_domain_100(XYZ)
+
+        # Applying the combined chromatic adaptation and forward
+        # post-adaptation non linear response compression.
+        F_L_RGB = spow(self._dot(self._M_forward, XYZ) * self._F_L_100, 0.42)
+        RGB_a = (400 * F_L_RGB) / (27.13 + F_L_RGB) + 0.1
+        R_a, G_a, B_a = tsplit(RGB_a)
+
+        # Converting to preliminary cartesian coordinates.
+        a = R_a - 12 * G_a / 11 + B_a / 11
+        b = (R_a + G_a - 2 * B_a) / 9
+
+        # Computing the *hue* angle :math:`h`, hue quadrature :math:`H` and
+        # eccentricity factor *e_t*.
+        h = hue_angle(a, b)
+        H = hue_quadrature(h)
+        e_t = eccentricity_factor(h)
+
+        # Computing the achromatic response and the correlate of *Lightness*
+        # :math:`J`.
+        A = (2 * R_a + G_a + (1 / 20) * B_a - 0.305) * self._N_bb
+        J = 100 * spow(A / self._A_w, self._cz)
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = self._Q_k * np.sqrt(J / 100)
+
+        # Computing the correlates of *chroma* :math:`C`, *colourfulness*
+        # :math:`M` and *saturation* :math:`s`.
+        t = (self._t_k * (e_t * spow(a ** 2 + b ** 2, 0.5)) /
+             (R_a + G_a + 21 * B_a / 20))
+        C = spow(t, 0.9) * spow(J / 100, 0.5) * self._C_k
+        M = C * self._F_L_4
+        s = 100 * spow(M / Q, 0.5)
+
+        return self._SPECIFICATION(J, C, from_range_degrees(h), s, Q, M,
+                                   from_range_degrees(H), None)
+
+    def forward_image(self, XYZ, correlates=None, dtype=np.float32,
+                      tile_size=2 ** 16):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values image.
+
+        Contrary to
+        :meth:`colour.appearance.CIECAM02_ViewingConditions.forward` method,
+        the computations are performed in given dtype, tile by tile with
+        scratch buffers reused across tiles, and only the requested
+        correlates, and those they depend on, are computed. The hue
+        quadrature :math:`H` is computed from a look-up table of the segments
+        between the unique hues rather than by successive selections.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of the image.
+        correlates : array_like, optional
+            **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+            Correlates to compute, all of them if *None*.
+        dtype : type, optional
+            **{np.float32, np.float64}**,
+            Computation and output dtype.
+        tile_size : int, optional
+            Maximum pixels count processed at once.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            Colour appearance model specification, correlates that have not
+            been requested are *None*.
+
+        Raises
+        ------
+        ValueError
+            If the viewing conditions are not uniform or if a requested
+            correlate is invalid.
+
+        Notes
+        -----
+
+        +---------------------+-----------------------+---------------+
+        | **Domain**          | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``XYZ``             | [0, 100]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+
+        +---------------------+-----------------------+---------------+
+        | **Range**           | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``specification.h`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+        | ``specification.H`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+
+        -   The viewing conditions must be uniform, i.e. a single reference
+            white, adapting field *luminance* and background relative
+            *luminance* must have been given at instantiation.
+        -   With *np.float32* dtype, near neutral stimuli correlates depending
+            on the opponent colour dimensions, i.e. :math:`C`, :math:`M`,
+            :math:`s`, :math:`h` and :math:`H`, have an absolute error in
+            the order of 1e-2.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> viewing_conditions = CIECAM02_ViewingConditions(
+        ...     XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([[20.654008, 12.197225, 5.136952]])
+        >>> J, _C, h, _s, _Q, M, _H, _HC = viewing_conditions.forward_image(
+        ...     XYZ, ('J', 'M', 'h'))
+        >>> J  # doctest: +ELLIPSIS
+        array([ 34.4345...], dtype=float32)
+        >>> M  # doctest: +ELLIPSIS
+        array([ 70.0249...], dtype=float32)
+        >>> h  # doctest: +ELLIPSIS
+        array([ 22.2791...], dtype=float32)
+        """
+
+        if self._M_forward.ndim != 2:
+            raise ValueError('Viewing conditions must be uniform to compute '
+                             'the correlates of an image!')
+
+        fields = self._SPECIFICATION._fields[:-1]
+        if correlates is None:
+            correlates = fields
+
+        for correlate in correlates:
+            if correlate not in fields:
+                raise ValueError(
+                    '"{0}" correlate is invalid, it must be one of {1}!'.
+                    format(correlate, fields))
+
+        need_C = bool({'C', 'M', 's'}.intersection(correlates))
+        need_Q = bool({'Q', 's'}.intersection(correlates))
+        need_J = need_C or need_Q or 'J' in correlates
+        need_h = bool({'h', 'H'}.intersection(correlates))
+
+        dtype = np.dtype(dtype)
+        XYZ = np.asarray(XYZ)
+        shape = XYZ.shape[:-1]
+        XYZ = np.reshape(XYZ, (-1, 3))
+        count = XYZ.shape[0]
+
+        M_forward = self._M_forward.astype(dtype)
+        F_L_100 = float(self._F_L_100)
+        k_A = float(self._N_bb / self._A_w)
+        cz = float(self._cz)
+        Q_k = float(self._Q_k)
+        t_k = float(self._t_k)
+        C_k = float(self._C_k)
+        F_L_4 = float(self._F_L_4)
+        e_a = 0.25 * np.cos(2)
+        e_b = 0.25 * np.sin(2)
+
+        H_LUT = _HUE_QUADRATURE_SEGMENTS.astype(dtype)
+
+        specification = {
+            correlate: np.empty(count, dtype)
+            for correlate in correlates
+        }
+
+        buffers = {}
+        for i in range(0, count, tile_size):
+            tile = to_domain_100(XYZ[i:i + tile_size])
+            size = tile.shape[0]
+
+            if size not in buffers:
+                buffers[size] = (np.empty((3, size), dtype),
+                                 np.empty((3, size), dtype),
+                                 np.empty((8, size), dtype))
+            RGB, T, W = buffers[size]
+            a, b, J, Q, C, h, D, S = W
+
+            # Applying the combined chromatic adaptation and forward
+            # post-adaptation non linear response compression.
+            np.dot(M_forward, np.transpose(tile).astype(dtype), out=RGB)
+            RGB *= F_L_100
+            _spow_in_place(RGB, 0.42, T)
+            np.add(RGB, 27.13, out=T)
+            RGB *= 400
+            RGB /= T
+            RGB += 0.1
+            R_a, G_a, B_a = RGB
+
+            # Converting to preliminary cartesian coordinates.
+            np.multiply(G_a, -12 / 11, out=a)
+            a += R_a
+            np.multiply(B_a, 1 / 11, out=S)
+            a += S
+            np.add(R_a, G_a, out=b)
+            np.multiply(B_a, 2, out=S)
+            b -= S
+            b /= 9
+
+            if need_J:
+                # Computing the correlate of *Lightness* :math:`J` from the
+                # achromatic response.
+                np.multiply(R_a, 2, out=J)
+                J += G_a
+                np.multiply(B_a, 1 / 20, out=S)
+                J += S
+                J -= 0.305
+                J *= k_A
+                _spow_in_place(J, cz, S)
+                J *= 100
+
+            if need_Q:
+                # Computing the correlate of *brightness* :math:`Q`.
+                np.divide(J, 100, out=Q)
+                np.sqrt(Q, out=Q)
+                Q *= Q_k
+
+            if need_C:
+                # Computing the temporary magnitude quantity :math:`t`, the
+                # eccentricity factor being expanded so that no hue angle is
+                # required.
+                np.multiply(a, a, out=C)
+                np.multiply(b, b, out=S)
+                C += S
+                np.sqrt(C, out=C)
+                C *= 0.95
+                np.multiply(a, e_a, out=S)
+                C += S
+                np.multiply(b, e_b, out=S)
+                C -= S
+                np.multiply(B_a, 21 / 20, out=D)
+                D += R_a
+                D += G_a
+                C /= D
+                C *= t_k
+
+                # Computing the correlate of *chroma* :math:`C`.
+                _spow_in_place(C, 0.9, S)
+                np.divide(J, 100, out=D)
+                _spow_in_place(D, 0.5, S)
+                C *= D
+                C *= C_k
+
+            if need_h:
+                # Computing the *hue* angle :math:`h`.
+                np.arctan2(b, a, out=h)
+                np.degrees(h, out=h)
+                np.mod(h, 360, out=h)
+
+            if 'H' in correlates:
+                # Computing hue quadrature :math:`H` from the segments
+                # look-up table.
+                np.subtract(h, 20.14, out=S)
+                np.mod(S, 360, out=S)
+                S += 20.14
+                index = np.searchsorted(H_LUT[..., 0], S, side='right') - 1
+                np.clip(index, 0, H_LUT.shape[0] - 1, out=index)
+                h_a, L, k_a, k_b, H_a, H_d = np.transpose(H_LUT[index])
+                S -= h_a
+                np.subtract(L, S, out=D)
+                D *= k_b
+                S *= k_a
+                D += S
+                S *= H_d
+                S /= D
+                S += H_a
+                specification['H'][i:i + size] = S
+
+            for correlate, value in (('J', J), ('C', C), ('h', h), ('Q', Q)):
+                if correlate in correlates:
+                    specification[correlate][i:i + size] = value
+
+            if 'M' in correlates or 's' in correlates:
+                # Computing the correlates of *colourfulness* :math:`M` and
+                # *saturation* :math:`s`.
+                C *= F_L_4
+                if 'M' in correlates:
+                    specification['M'][i:i + size] = C
+
+                if 's' in correlates:
+                    C /= Q
+                    _spow_in_place(C, 0.5, S)
+                    C *= 100
+                    specification['s'][i:i + size] = C
+
+        for correlate in correlates:
+            specification[correlate] = np.reshape(specification[correlate],
+                                                  shape)
+
+        for correlate in ('h', 'H'):
+            if correlate in specification:
+                specification[correlate] = from_range_degrees(
+                    specification[correlate])
+
+        return self._SPECIFICATION(**specification)
+
+    def reverse(self, specification):
+        """
+        Converts given colour appearance model specification to *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        specification : CIECAM02_Specification
+            Colour appearance model specification. Correlate of *Lightness*
+            :math:`J`, correlate of *chroma* :math:`C` or correlate of
+            *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees
+            must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``specification`` argument.
+
+        Notes
+        -----
+
+        +---------------------+-----------------------+---------------+
+        | **Domain**          | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``specification.h`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+        | ``specification.H`` | [0, 360]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+
+        +---------------------+-----------------------+---------------+
+        | **Range**           | **Scale - Reference** | **Scale - 1** |
+        +=====================+=======================+===============+
+        | ``XYZ``             | [0, 100]              | [0, 1]        |
+        +---------------------+-----------------------+---------------+
+
+        -   ``specification`` can also be passed as a compatible argument
+            to :func:`colour.utilities.as_namedtuple` definition.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> viewing_conditions = CIECAM02_ViewingConditions(
+        ...     XYZ_w, 318.31, 20.0)
+        >>> specification = CIECAM02_Specification(J=41.731091132513917,
+        ...                                        C=0.104707757171031,
+        ...                                        h=219.048432658311780)
+        >>> viewing_conditions.reverse(specification)  # doctest: +ELLIPSIS
+        array([ 19.01...,  20...  ,  21.78...])
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
+                                                    self._SPECIFICATION)
+
+        J = as_float_array(J)
+        h = to_domain_degrees(h)
+
+        if C is None and M is not None:
+            C = as_float_array(M) / self._F_L_4
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "specification" argument!')
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = spow(
+            C / (np.sqrt(np.maximum(J, EPSILON) / 100) * self._C_k), 1 / 0.9)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = self._A_w * spow(J / 100, 1 / self._cz)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(self._N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, self._F_L)
+
+        # Applying the combined reverse chromatic adaptation.
+        XYZ = self._dot(self._M_reverse, RGB_p)
+
+        return from_range_100(XYZ)
+
+
 def chromatic_induction_factors(n):
     """
     Returns the chromatic induction factors :math:`N_{bb}` and :math:`N_{cb}`.
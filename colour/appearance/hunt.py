@@ -342,7 +342,7 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     XYZ_b = to_domain_100(XYZ_b)
     _X, Y, _Z = tsplit(XYZ)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    X_b, Y_b, _Z_b = tsplit(XYZ_b)
+    X_b, Y_b, Z_b = tsplit(XYZ_b)
 
     # Arguments handling.
     if XYZ_p is not None:
@@ -350,15 +350,17 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     else:
         X_p = X_b
         Y_p = Y_b
-        Z_p = Y_b
+        Z_p = Z_b
         usage_warning('Unspecified proximal field "XYZ_p" argument, using '
                       'background "XYZ_b" as approximation!')
 
-    if surround.N_cb is None:
+    N_cb = surround.N_cb
+    if N_cb is None:
         N_cb = 0.725 * spow(Y_w / Y_b, 0.2)
         usage_warning('Unspecified "N_cb" argument, using approximation: '
                       '"{0}"'.format(N_cb))
-    if surround.N_bb is None:
+    N_bb = surround.N_bb
+    if N_bb is None:
         N_bb = 0.725 * spow(Y_w / Y_b, 0.2)
         usage_warning('Unspecified "N_bb" argument, using approximation: '
                       '"{0}"'.format(N_bb))
@@ -653,15 +655,15 @@ def chromatic_adaptation(XYZ,
 
     # Computing chromatic adaptation factors.
     if not discount_illuminant:
-        L_A_p = spow(L_A, 1 / 3)
+        L_A_p = spow(L_A, 1 / 3)[..., np.newaxis]
         F_rgb = ((1 + L_A_p + h_rgb) / (1 + L_A_p + (1 / h_rgb)))
     else:
         F_rgb = np.ones(h_rgb.shape)
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
-        D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) - f_n(
-            (Y_b / Y_w) * F_L * F_rgb))
+        Y_bw_F_L = ((Y_b / Y_w) * F_L)[..., np.newaxis]
+        D_rgb = (f_n(Y_bw_F_L * F_rgb[..., 1:2]) - f_n(Y_bw_F_L * F_rgb))
     else:
         D_rgb = np.zeros(F_rgb.shape)
 
@@ -720,7 +722,7 @@ def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
     rgb_p = as_float_array(rgb_p)
     rgb_b = as_float_array(rgb_b)
     rgb_w = as_float_array(rgb_w)
-    p = as_float_array(p)
+    p = as_float_array(p)[..., np.newaxis]
 
     p_rgb = rgb_p / rgb_b
     rgb_w = (rgb_w * (spow((1 - p) * p_rgb + (1 + p) / p_rgb, 0.5)) / (spow(
@@ -284,8 +284,9 @@ def XYZ_to_LLAB(
 s=0.0002395..., M=0.0190185..., HC=None, a=..., b=-0.0190185...)
     """
 
-    _X, Y, _Z = tsplit(to_domain_100(XYZ))
-    RGB = XYZ_to_RGB_LLAB(to_domain_100(XYZ))
+    XYZ = to_domain_100(XYZ)
+    _X, Y, _Z = tsplit(XYZ)
+    RGB = XYZ_to_RGB_LLAB(XYZ)
     RGB_0 = XYZ_to_RGB_LLAB(to_domain_100(XYZ_0))
 
     # Reference illuminant *CIE Standard Illuminant D Series* *D65*.
@@ -354,10 +355,9 @@ def XYZ_to_RGB_LLAB(XYZ):
     array([ 0.9414279...,  1.0404012...,  1.0897088...])
     """
 
-    _X, Y, _Z = tsplit(XYZ)
+    XYZ = as_float_array(XYZ)
 
-    Y = tstack([Y, Y, Y])
-    XYZ_n = XYZ / Y
+    XYZ_n = XYZ / XYZ[..., 1][..., np.newaxis]
 
     return dot_vector(LLAB_XYZ_TO_RGB_MATRIX, XYZ_n)
 
@@ -409,9 +409,7 @@ def chromatic_adaptation(RGB, RGB_0, RGB_0r, Y, D=1):
 
     RGB_r = tstack([R_r, G_r, B_r])
 
-    Y = tstack([Y, Y, Y])
-
-    XYZ_r = dot_vector(LLAB_RGB_TO_XYZ_MATRIX, RGB_r * Y)
+    XYZ_r = dot_vector(LLAB_RGB_TO_XYZ_MATRIX, RGB_r * Y[..., np.newaxis])
 
     return XYZ_r
 
@@ -496,9 +494,10 @@ def opponent_colour_dimensions(XYZ, Y_b, F_S, F_L):
     z = 1 + F_L * spow(Y_b / 100, 0.5)
 
     # Computing modified *CIE L\\*a\\*b\\** colourspace array.
-    L = 116 * spow(f(Y / 100, F_S), z) - 16
-    a = 500 * (f(X / 95.05, F_S) - f(Y / 100, F_S))
-    b = 200 * (f(Y / 100, F_S) - f(Z / 108.88, F_S))
+    f_Y = f(Y / 100, F_S)
+    L = 116 * spow(f_Y, z) - 16
+    a = 500 * (f(X / 95.05, F_S) - f_Y)
+    b = 200 * (f_Y - f(Z / 108.88, F_S))
 
     Lab = tstack([L, a, b])
 
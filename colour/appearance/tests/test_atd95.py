@@ -94,6 +94,35 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_n_dimensional_viewing_conditions_XYZ_to_ATD95(self):
+        """
+        Tests :func:`colour.appearance.atd95.XYZ_to_ATD95` definition
+        n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+        ])
+        XYZ_0 = np.array([
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [96.42, 100.00, 82.49],
+        ])
+        Y_0 = np.array([318.31, 31.83, 100.00])
+        k_1 = np.array([0.0, 1.0, 0.5])
+        k_2 = np.array([50.0, 5.0, 15.0])
+        sigma = np.array([300.0, 300.0, 250.0])
+        specification = XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma)
+
+        for i in range(XYZ.shape[0]):
+            np.testing.assert_almost_equal(
+                np.array(specification)[:, i],
+                XYZ_to_ATD95(XYZ[i], XYZ_0[i], Y_0[i], k_1[i], k_2[i],
+                             sigma[i]),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_ATD95(self):
         """
@@ -7,11 +7,13 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (CAM16_VIEWING_CONDITIONS,
                                CAM16_InductionFactors, CAM16_Specification,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+                               XYZ_to_CAM16, CAM16_to_XYZ,
+                               CAM16_ViewingConditions)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -25,7 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelReverse'
+    'TestCAM16ColourAppearanceModelReverse',
+    'TestCAM16_ViewingConditions'
 ]
 
 
@@ -271,3 +274,249 @@ class TestCAM16ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CAM16_InductionFactors(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM16_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCAM16_ViewingConditions(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.CAM16_ViewingConditions`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CAM16_ViewingConditions))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'forward_image', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CAM16_ViewingConditions))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditions.\
+forward` method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((4, 4, 3)) * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        for surround in CAM16_VIEWING_CONDITIONS.values():
+            for discount_illuminant in (False, True):
+                viewing_conditions = CAM16_ViewingConditions(
+                    XYZ_w, L_A, Y_b, surround, discount_illuminant)
+
+                np.testing.assert_almost_equal(
+                    viewing_conditions.forward(XYZ)[:-1],
+                    XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround,
+                                 discount_illuminant)[:-1],
+                    decimal=7)
+
+    def test_forward_image(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditions.\
+forward_image` method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((8, 8, 3)) * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        for surround in CAM16_VIEWING_CONDITIONS.values():
+            viewing_conditions = CAM16_ViewingConditions(
+                XYZ_w, L_A, Y_b, surround)
+            specification = viewing_conditions.forward(XYZ)
+
+            for tile_size in (7, 64, 2 ** 16):
+                specification_i = viewing_conditions.forward_image(
+                    XYZ, dtype=np.float64, tile_size=tile_size)
+                np.testing.assert_almost_equal(
+                    specification_i[:-1], specification[:-1], decimal=7)
+
+                specification_i = viewing_conditions.forward_image(
+                    XYZ.astype(np.float32), tile_size=tile_size)
+                for correlate in ('J', 'C', 's', 'Q', 'M'):
+                    value = getattr(specification_i, correlate)
+                    self.assertEqual(value.dtype, np.float32)
+                    np.testing.assert_allclose(
+                        value,
+                        getattr(specification, correlate),
+                        rtol=0.001,
+                        atol=0.05)
+
+                for correlate, period in (('h', 360), ('H', 400)):
+                    value = getattr(specification_i, correlate)
+                    self.assertEqual(value.dtype, np.float32)
+                    delta = np.abs(value - getattr(specification, correlate))
+                    np.testing.assert_array_less(
+                        np.minimum(delta, period - delta), 0.05)
+
+        specification_i = viewing_conditions.forward_image(
+            XYZ, ('J', 'M', 'h'), dtype=np.float64)
+        for correlate in specification_i._fields:
+            value = getattr(specification_i, correlate)
+            if correlate in ('J', 'M', 'h'):
+                np.testing.assert_almost_equal(
+                    value, getattr(specification, correlate), decimal=7)
+            else:
+                self.assertIsNone(value)
+
+        self.assertRaises(ValueError, viewing_conditions.forward_image, XYZ,
+                          ('J', 'HC'))
+
+        viewing_conditions = CAM16_ViewingConditions(
+            np.tile(XYZ_w, (6, 1)), np.tile(L_A, 6), np.tile(Y_b, 6))
+        self.assertRaises(ValueError, viewing_conditions.forward_image, XYZ)
+
+    def test_domain_range_scale_forward_image(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditions.\
+forward_image` method domain and range scale support.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        viewing_conditions = CAM16_ViewingConditions(XYZ_w, L_A, Y_b)
+        specification = viewing_conditions.forward_image(
+            XYZ, dtype=np.float64)[:-1]
+
+        d_r = (
+            ('reference', 1, 1),
+            (1, 0.01, np.array([1, 1, 1 / 360, 1, 1, 1, 1 / 360])),
+            (100, 1, np.array([1, 1, 100 / 360, 1, 1, 1, 100 / 360])),
+        )
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                viewing_conditions = CAM16_ViewingConditions(
+                    XYZ_w * factor_a, L_A, Y_b)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.forward_image(
+                        XYZ * factor_a, dtype=np.float64)[:-1],
+                    specification * factor_b,
+                    decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_forward_image(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditions.\
+forward_image` method nan support.
+        """
+
+        viewing_conditions = CAM16_ViewingConditions(
+            np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        viewing_conditions.forward_image(cases)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditions.\
+reverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((4, 4, 3)) * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        surround = CAM16_VIEWING_CONDITIONS['Average']
+        viewing_conditions = CAM16_ViewingConditions(XYZ_w, L_A, Y_b, surround)
+        specification = viewing_conditions.forward(XYZ)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.reverse(specification), XYZ, decimal=7)
+
+        J, C, h, _s, _Q, M, _H, _HC = specification
+        np.testing.assert_almost_equal(
+            viewing_conditions.reverse(CAM16_Specification(J=J, M=M, h=h)),
+            CAM16_to_XYZ(
+                CAM16_Specification(J=J, M=M, h=h), XYZ_w, L_A, Y_b, surround),
+            decimal=7)
+
+        self.assertRaises(ValueError, viewing_conditions.reverse,
+                          CAM16_Specification(J=J, h=h))
+
+    def test_n_dimensional_viewing_conditions(self):
+        """
+        Tests :class:`colour.appearance.cam16.CAM16_ViewingConditions`
+        class n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((6, 3)) * 100
+        XYZ_w = np.tile(np.array([95.05, 100.00, 108.88]), (6, 1))
+        XYZ_w[3:] = np.array([109.85, 100.00, 35.58])
+        L_A = np.linspace(20, 318.31, 6)
+        Y_b = np.linspace(10, 20, 6)
+        surround = CAM16_VIEWING_CONDITIONS['Dim']
+        viewing_conditions = CAM16_ViewingConditions(XYZ_w, L_A, Y_b, surround)
+        specification = viewing_conditions.forward(XYZ)
+
+        np.testing.assert_almost_equal(
+            specification[:-1],
+            XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround)[:-1],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.reverse(specification), XYZ, decimal=7)
+
+    def test_domain_range_scale_viewing_conditions(self):
+        """
+        Tests :class:`colour.appearance.cam16.CAM16_ViewingConditions`
+        class domain and range scale support.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        specification = CAM16_ViewingConditions(XYZ_w, L_A,
+                                                Y_b).forward(XYZ)[:-1]
+
+        d_r = (
+            ('reference', 1, 1),
+            (1, 0.01, np.array([1, 1, 1 / 360, 1, 1, 1, 1 / 360])),
+            (100, 1, np.array([1, 1, 100 / 360, 1, 1, 1, 100 / 360])),
+        )
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                viewing_conditions = CAM16_ViewingConditions(
+                    XYZ_w * factor_a, L_A, Y_b)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.forward(XYZ * factor_a)[:-1],
+                    specification * factor_b,
+                    decimal=7)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.reverse(specification * factor_b),
+                    XYZ * factor_a,
+                    decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_viewing_conditions(self):
+        """
+        Tests :class:`colour.appearance.cam16.CAM16_ViewingConditions`
+        class nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            viewing_conditions = CAM16_ViewingConditions(
+                np.array(case), case[0], case[0],
+                CAM16_InductionFactors(case[0], case[0], case[0]))
+            viewing_conditions.forward(np.array(case))
+            viewing_conditions.reverse(
+                CAM16_Specification(case[0], case[0], case[0]))
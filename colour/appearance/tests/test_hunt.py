@@ -104,6 +104,62 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_n_dimensional_viewing_conditions_XYZ_to_Hunt(self):
+        """
+        Tests :func:`colour.appearance.hunt.XYZ_to_Hunt` definition
+        n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+        ])
+        XYZ_w = np.array([
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [96.42, 100.00, 82.49],
+        ])
+        XYZ_b = XYZ_w * 0.2
+        XYZ_p = XYZ_w * np.array([0.25, 0.15, 0.30])[:, np.newaxis]
+        L_A = np.array([318.31, 31.83, 100.00])
+        surround = Hunt_InductionFactors(
+            np.array([1.00, 1.00, 0.95]), np.array([75, 75, 25]),
+            np.array([0.725, 0.800, 1.000]), np.array([0.725, 0.800, 1.000]))
+        p = np.array([0.1, -0.2, 0.3])
+        CCT_w = np.array([6504.0, 2856.0, 5003.0])
+
+        for discount_illuminant in (True, False):
+            for helson_judd_effect in (True, False):
+                specification = XYZ_to_Hunt(
+                    XYZ,
+                    XYZ_w,
+                    XYZ_b,
+                    L_A,
+                    surround,
+                    XYZ_p=XYZ_p,
+                    p=p,
+                    CCT_w=CCT_w,
+                    helson_judd_effect=helson_judd_effect,
+                    discount_illuminant=discount_illuminant)[:-2]
+
+                for i in range(XYZ.shape[0]):
+                    np.testing.assert_almost_equal(
+                        np.array(specification)[:, i],
+                        XYZ_to_Hunt(
+                            XYZ[i],
+                            XYZ_w[i],
+                            XYZ_b[i],
+                            L_A[i],
+                            Hunt_InductionFactors(*[
+                                factor[i] for factor in surround]),
+                            XYZ_p=XYZ_p[i],
+                            p=p[i],
+                            CCT_w=CCT_w[i],
+                            helson_judd_effect=helson_judd_effect,
+                            discount_illuminant=discount_illuminant)[:-2],
+                        decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Hunt(self):
         """
@@ -161,6 +161,37 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_n_dimensional_viewing_conditions_XYZ_to_LLAB(self):
+        """
+        Tests :func:`colour.appearance.llab.XYZ_to_LLAB` definition
+        n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+        ])
+        XYZ_0 = np.array([
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [96.42, 100.00, 82.49],
+        ])
+        Y_b = np.array([20.0, 20.0, 10.0])
+        L = np.array([318.31, 31.83, 100.00])
+        surround = LLAB_InductionFactors(
+            np.array([1.0, 0.5, 1.0]), np.array([3.0, 3.5, 4.0]),
+            np.array([1.0, 0.0, 1.0]), np.array([1.0, 1.0, 0.95]))
+        specification = XYZ_to_LLAB(XYZ, XYZ_0, Y_b, L, surround)[:5]
+
+        for i in range(XYZ.shape[0]):
+            np.testing.assert_almost_equal(
+                np.array(specification)[:, i],
+                XYZ_to_LLAB(XYZ[i], XYZ_0[i], Y_b[i], L[i],
+                            LLAB_InductionFactors(
+                                *[factor[i] for factor in surround]))[:5],
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_LLAB(self):
         """
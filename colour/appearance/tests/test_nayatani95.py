@@ -91,6 +91,37 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_n_dimensional_viewing_conditions_XYZ_to_Nayatani95(self):
+        """
+        Tests :func:`colour.appearance.nayatani95.XYZ_to_Nayatani95`
+        definition n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+        ])
+        XYZ_n = np.array([
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [96.42, 100.00, 82.49],
+        ])
+        Y_o = np.array([20.0, 20.0, 35.0])
+        E_o = np.array([5000.0, 500.0, 1500.0])
+        E_or = np.array([1000.0, 1000.0, 2000.0])
+        n = np.array([1.0, 1.0, 2.0])
+        specification = XYZ_to_Nayatani95(XYZ, XYZ_n, Y_o, E_o, E_or, n)
+        specification = np.array(specification[:6] + specification[-1:])
+
+        for i in range(XYZ.shape[0]):
+            specification_i = XYZ_to_Nayatani95(XYZ[i], XYZ_n[i], Y_o[i],
+                                                E_o[i], E_or[i], n[i])
+            np.testing.assert_almost_equal(
+                specification[:, i],
+                specification_i[:6] + specification_i[-1:],
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Nayatani95(self):
         """
@@ -91,6 +91,33 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_n_dimensional_viewing_conditions_XYZ_to_RLAB(self):
+        """
+        Tests :func:`colour.appearance.rlab.XYZ_to_RLAB` definition
+        n-dimensional viewing conditions support.
+        """
+
+        XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+        ])
+        XYZ_n = np.array([
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [96.42, 100.00, 82.49],
+        ])
+        Y_n = np.array([318.31, 31.83, 100.00])
+        sigma = np.array([1 / 2.3, 1 / 2.9, 1 / 3.5])
+        D = np.array([1.0, 0.0, 0.5])
+        specification = XYZ_to_RLAB(XYZ, XYZ_n, Y_n, sigma, D)[:4]
+
+        for i in range(XYZ.shape[0]):
+            np.testing.assert_almost_equal(
+                np.array(specification)[:, i],
+                XYZ_to_RLAB(XYZ[i], XYZ_n[i], Y_n[i], sigma[i], D[i])[:4],
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RLAB(self):
         """
@@ -55,7 +55,7 @@ import numpy as np
 
 from colour.algebra import least_square_mapping_MoorePenrose
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_int,
-                              closest, filter_kwargs, tsplit, tstack)
+                              closest, filter_kwargs, profiled, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -795,6 +795,7 @@ COLOUR_CORRECTION_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def colour_correction(RGB, M_T, M_R, method='Cheung 2004', **kwargs):
     """
     Performs colour correction of given *RGB* colourspace array using the
@@ -64,7 +64,7 @@ from colour.biochemistry import reaction_rate_MichealisMenten
 from colour.constants import CIE_E, CIE_K
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
                               filter_kwargs, from_range_100,
-                              get_domain_range_scale, to_domain_1,
+                              get_domain_range_scale, profiled, to_domain_1,
                               to_domain_100, usage_warning)
 
 __author__ = 'Colour Developers'
@@ -383,6 +383,7 @@ Aliases:
 LIGHTNESS_METHODS['Lstar1976'] = LIGHTNESS_METHODS['CIE 1976']
 
 
+@profiled
 def lightness(Y, method='CIE 1976', **kwargs):
     """
     Returns the *Lightness* :math:`L` using given method.
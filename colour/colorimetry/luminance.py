@@ -65,7 +65,7 @@ from colour.biochemistry import substrate_concentration_MichealisMenten
 from colour.constants import CIE_E, CIE_K
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
                               filter_kwargs, from_range_1, from_range_100,
-                              get_domain_range_scale, to_domain_10,
+                              get_domain_range_scale, profiled, to_domain_10,
                               to_domain_100)
 
 __author__ = 'Colour Developers'
@@ -384,6 +384,7 @@ LUMINANCE_METHODS['astm2008'] = (LUMINANCE_METHODS['ASTM D1535-08'])
 LUMINANCE_METHODS['cie1976'] = (LUMINANCE_METHODS['CIE 1976'])
 
 
+@profiled
 def luminance(LV, method='CIE 1976', **kwargs):
     """
     Returns the *luminance* :math:`Y` of given *Lightness* :math:`L^*` or given
@@ -39,8 +39,8 @@ from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
                                 STANDARD_OBSERVERS_CMFS, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100, runtime_warning,
-                              tsplit)
+                              filter_kwargs, from_range_100, profiled,
+                              register_cache, runtime_warning, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -70,9 +70,11 @@ References
 ASTME30815_PRACTISE_SHAPE : SpectralShape
 """
 
-_LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
+_LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = register_cache(
+    '_LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE')
 
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE = register_cache(
+    '_TRISTIMULUS_WEIGHTING_FACTORS_CACHE', maximum_size=256)
 
 
 def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
@@ -124,13 +126,10 @@ def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE
-    if _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE is None:
-        _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = CaseInsensitiveMapping()
-
-    name_lica = ', '.join((str(interval), interval_type))
-    if name_lica in _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE:
-        return _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE[name_lica]
+    name_lica = ', '.join((str(interval), interval_type.lower()))
+    lica = _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE.get(name_lica)
+    if lica is not None:
+        return lica
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -177,9 +176,9 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
     -   The tables of tristimulus weighting factors are cached in
         :attr:`colour.colorimetry.tristimulus.\
 _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
+        defined by the lower-cased colour matching functions and illuminant
+        names along the current shape such as:
+        `cie 1964 10 degree standard observer, a, (360.0, 830.0, 10.0)`
         Considering the above, one should be mindful that using similar colour
         matching functions and illuminant names but with different spectral
         data will lead to unexpected behaviour.
@@ -242,13 +241,10 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
-    if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
-
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape))).lower()
+    W = _TRISTIMULUS_WEIGHTING_FACTORS_CACHE.get(name_twf)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
@@ -608,9 +604,9 @@ def sd_to_XYZ_ASTME30815(
     -   The tables of tristimulus weighting factors are cached in
         :attr:`colour.colorimetry.tristimulus.\
 _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
+        defined by the lower-cased colour matching functions and illuminant
+        names along the current shape such as:
+        `cie 1964 10 degree standard observer, a, (360.0, 830.0, 10.0)`
         Considering the above, one should be mindful that using similar colour
         matching functions and illuminant names but with different spectral
         data will lead to unexpected behaviour.
@@ -732,6 +728,7 @@ Aliases:
 SD_TO_XYZ_METHODS['astm2015'] = (SD_TO_XYZ_METHODS['ASTM E308-15'])
 
 
+@profiled
 def sd_to_XYZ(
         sd,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
@@ -959,6 +956,7 @@ MULTI_SD_TO_XYZ_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def multi_sd_to_XYZ(
         msd,
         shape=DEFAULT_SPECTRAL_SHAPE,
@@ -48,7 +48,8 @@ apps_engineering_techdocuments/c/09_color_calculations_en.pdf
 from __future__ import division, unicode_literals
 
 from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
-                              from_range_100, to_domain_100, tsplit, tstack)
+                              from_range_100, profiled, to_domain_100, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -458,6 +459,7 @@ Aliases:
 WHITENESS_METHODS['cie2004'] = WHITENESS_METHODS['CIE 2004']
 
 
+@profiled
 def whiteness(method='CIE 2004', **kwargs):
     """
     Returns the *whiteness* :math:`W` using given method.
@@ -28,7 +28,7 @@ apps_engineering_techdocuments/c/09_color_calculations_en.pdf
 
 from __future__ import division, unicode_literals
 
-from colour.utilities import (CaseInsensitiveMapping, from_range_100,
+from colour.utilities import (CaseInsensitiveMapping, from_range_100, profiled,
                               to_domain_100, tsplit)
 
 __author__ = 'Colour Developers'
@@ -167,6 +167,7 @@ YELLOWNESS_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def yellowness(XYZ, method='ASTM E313'):
     """
     Returns the *yellowness* :math:`W` using given method.
@@ -200,6 +200,7 @@ class Signal(AbstractContinuousFunction):
         self._dtype = None
         self._domain = None
         self._range = None
+        self._function = None
         self._interpolator = KernelInterpolator
         self._interpolator_args = {}
         self._extrapolator = Extrapolator
@@ -218,8 +219,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_args = kwargs.get('extrapolator_args')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -308,7 +307,7 @@ class Signal(AbstractContinuousFunction):
                     self._range = np.resize(self._range, value.shape)
 
             self._domain = value
-            self._create_function()
+            self._function = None
 
     @property
     def range(self):
@@ -350,7 +349,7 @@ class Signal(AbstractContinuousFunction):
                     '"domain" and "range" variables must have same size!')
 
             self._range = value
-            self._create_function()
+            self._function = None
 
     @property
     def interpolator(self):
@@ -380,7 +379,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._function = None
 
     @property
     def interpolator_args(self):
@@ -415,7 +414,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_args', value)
 
             self._interpolator_args = value
-            self._create_function()
+            self._function = None
 
     @property
     def extrapolator(self):
@@ -445,7 +444,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._function = None
 
     @property
     def extrapolator_args(self):
@@ -480,7 +479,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_args', value))
 
             self._extrapolator_args = value
-            self._create_function()
+            self._function = None
 
     @property
     def function(self):
@@ -500,8 +499,15 @@ class Signal(AbstractContinuousFunction):
         Notes
         -----
         -   This property is read only.
+        -   The callable is created on first access after any change to the
+            continuous signal, so that building signals, e.g. the many
+            signals of a :class:`colour.continuous.MultiSignal` class
+            instance, does not create interpolators that are never used.
         """
 
+        if self._function is None:
+            self._create_function()
+
         return self._function
 
     def __str__(self):
@@ -643,7 +649,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -733,7 +739,7 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._function = None
 
     def __contains__(self, x):
         """
@@ -908,7 +914,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._function = None
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -931,7 +937,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._function = None
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
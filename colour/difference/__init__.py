@@ -33,13 +33,21 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 
 from __future__ import absolute_import
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+import multiprocessing
+import numpy as np
+from multiprocessing.pool import ThreadPool
+
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              filter_kwargs, get_default_float_dtype,
+                              profiled)
+from colour.utilities.common import _bind_context
 
 from .cam02_ucs import delta_E_CAM02LCD, delta_E_CAM02SCD, delta_E_CAM02UCS
 from .cam16_ucs import delta_E_CAM16LCD, delta_E_CAM16SCD, delta_E_CAM16UCS
 from .delta_e import (delta_E_CIE1976, delta_E_CIE1994, delta_E_CIE2000,
                       delta_E_CMC)
 from .din99 import delta_E_DIN99
+from .nearest import NearestColourIndex
 
 __all__ = ['delta_E_CAM02LCD', 'delta_E_CAM02SCD', 'delta_E_CAM02UCS']
 __all__ += ['delta_E_CAM16LCD', 'delta_E_CAM16SCD', 'delta_E_CAM16UCS']
@@ -47,6 +55,7 @@ __all__ += [
     'delta_E_CIE1976', 'delta_E_CIE1994', 'delta_E_CIE2000', 'delta_E_CMC'
 ]
 __all__ += ['delta_E_DIN99']
+__all__ += ['NearestColourIndex']
 
 DELTA_E_METHODS = CaseInsensitiveMapping({
     'CIE 1976': delta_E_CIE1976,
@@ -85,6 +94,7 @@ DELTA_E_METHODS['cie1994'] = DELTA_E_METHODS['CIE 1994']
 DELTA_E_METHODS['cie2000'] = DELTA_E_METHODS['CIE 2000']
 
 
+@profiled
 def delta_E(a, b, method='CIE 2000', **kwargs):
     """
     Returns the difference :math:`\\Delta E_{ab}` between two given
@@ -161,3 +171,272 @@ def delta_E(a, b, method='CIE 2000', **kwargs):
 
 
 __all__ += ['DELTA_E_METHODS', 'delta_E']
+
+
+def _delta_E_chunks_slices(rows, columns, chunk_size):
+    """
+    Returns the row slices splitting a :math:`(rows, columns)` colour
+    difference matrix into chunks of at most ``chunk_size`` elements, a chunk
+    always having at least one row.
+    """
+
+    step = max(int(chunk_size // max(columns, 1)), 1)
+
+    return [slice(i, i + step) for i in range(0, rows, step)]
+
+
+def _map_delta_E_chunks(function, slices, threads=None, pool=None):
+    """
+    Maps given function to given chunks slices using either given pool, a
+    thread pool of given size or the current thread.
+
+    The pool workers run the function with the caller context so that they
+    use its domain-range scale and floating point number dtype.
+    """
+
+    if pool is not None:
+        return pool.map(_bind_context(function), slices)
+
+    threads = min(threads if threads else multiprocessing.cpu_count(),
+                  len(slices))
+    if threads <= 1:
+        return list(map(function, slices))
+
+    function = _bind_context(function)
+    owned_pool = ThreadPool(processes=threads)
+    try:
+        return owned_pool.map(function, slices)
+    finally:
+        owned_pool.close()
+        owned_pool.join()
+
+
+def delta_E_pairwise(a,
+                     b,
+                     method='CIE 2000',
+                     chunk_size=2 ** 20,
+                     threads=None,
+                     pool=None,
+                     **kwargs):
+    """
+    Returns the pairwise difference :math:`\\Delta E_{ab}` matrix between
+    every element of given *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace
+    arrays using given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`,
+        e.g. the image pixels or samples to match.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        e.g. the palette references.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    chunk_size : numeric, optional
+        Maximum colour differences count computed at once, bounding the size
+        of the intermediate arrays.
+    threads : integer, optional
+        Threads count, default to :func:`multiprocessing.cpu_count`
+        definition, a value of 1 performs the computation in the current
+        thread.
+    pool : ThreadPool, optional
+        :class:`multiprocessing.pool.ThreadPool` class instance to use for the
+        computation, it is neither closed nor joined so that it can be reused
+        across calls.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.difference.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        Colour difference :math:`\\Delta E_{ab}` matrix of shape
+        ``a.shape[:-1] + b.shape[:-1]``.
+
+    Notes
+    -----
+    -   The colour differences are computed by chunks of rows of :math:`a`
+        against the whole :math:`b` array, the chunks are written directly
+        into the output matrix.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [51.86016031, 32.39284112, 22.24212018],
+    ...     [41.20510519, -25.46171880, 19.01722460],
+    ... ])
+    >>> b = np.array([
+    ...     [50.00000000, 30.00000000, 20.00000000],
+    ...     [40.00000000, -30.00000000, 20.00000000],
+    ...     [45.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_pairwise(a, b)  # doctest: +ELLIPSIS
+    array([[  2.2401297...,  48.0640849...,  23.9914289...],
+           [ 44.0421541...,   2.2890918...,  21.4479130...]])
+    """
+
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    shape = a.shape[:-1] + b.shape[:-1]
+    a = np.reshape(a, (-1, a.shape[-1]))
+    b = np.reshape(b, (1, -1, b.shape[-1]))
+
+    function = DELTA_E_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    delta_E_ab = np.empty((a.shape[0], b.shape[1]),
+                          dtype=get_default_float_dtype())
+
+    def _delta_E_chunk(chunk):
+        """
+        Computes the colour differences of given chunk of rows.
+        """
+
+        delta_E_ab[chunk] = function(a[chunk, np.newaxis], b, **kwargs)
+
+    _map_delta_E_chunks(
+        _delta_E_chunk,
+        _delta_E_chunks_slices(a.shape[0], b.shape[1], chunk_size), threads,
+        pool)
+
+    return np.reshape(delta_E_ab, shape)
+
+
+def delta_E_nearest(a,
+                    b,
+                    method='CIE 2000',
+                    k=None,
+                    chunk_size=2 ** 20,
+                    threads=None,
+                    pool=None,
+                    **kwargs):
+    """
+    Returns the indexes of the nearest elements of given *CIE L\\*a\\*b\\**
+    or :math:`J'a'b'` colourspace array :math:`b` to the elements of array
+    :math:`a` and their difference :math:`\\Delta E_{ab}` using given
+    method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`,
+        e.g. the image pixels or samples to match.
+    b : array_like, (M, 3)
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        e.g. the palette references.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    k : integer, optional
+        Nearest matches count, sorted by increasing colour difference, the
+        single nearest match is returned without the trailing matches axis if
+        not given. The matches count is limited to the references count.
+    chunk_size : numeric, optional
+        Maximum colour differences count computed at once, bounding the size
+        of the intermediate arrays.
+    threads : integer, optional
+        Threads count, default to :func:`multiprocessing.cpu_count`
+        definition, a value of 1 performs the computation in the current
+        thread.
+    pool : ThreadPool, optional
+        :class:`multiprocessing.pool.ThreadPool` class instance to use for the
+        computation, it is neither closed nor joined so that it can be reused
+        across calls.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.difference.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    tuple
+        Indexes of the nearest elements of :math:`b` and their colour
+        difference :math:`\\Delta E_{ab}`, both of shape ``a.shape[:-1]`` or
+        ``a.shape[:-1] + (k, )`` if :math:`k` is given.
+
+    Notes
+    -----
+    -   The full colour difference matrix is never materialised: each chunk is
+        reduced to its nearest matches with :func:`np.argmin` or
+        :func:`np.argpartition` definitions before the next one is computed.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [51.86016031, 32.39284112, 22.24212018],
+    ...     [41.20510519, -25.46171880, 19.01722460],
+    ... ])
+    >>> b = np.array([
+    ...     [50.00000000, 30.00000000, 20.00000000],
+    ...     [40.00000000, -30.00000000, 20.00000000],
+    ...     [45.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_nearest(a, b)  # doctest: +ELLIPSIS
+    (array([0, 1]), array([ 2.2401297...,  2.2890918...]))
+    >>> delta_E_nearest(a, b, k=2)  # doctest: +ELLIPSIS
+    (array([[0, 2],
+           [1, 2]]), array([[  2.2401297...,  23.9914289...],
+           [  2.2890918...,  21.4479130...]]))
+    """
+
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    shape = a.shape[:-1]
+    a = np.reshape(a, (-1, a.shape[-1]))
+    b = np.reshape(b, (1, -1, b.shape[-1]))
+
+    function = DELTA_E_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    count = 1 if k is None else min(k, b.shape[1])
+
+    indexes = np.empty((a.shape[0], count), dtype=np.int_)
+    delta_E_ab = np.empty((a.shape[0], count), dtype=get_default_float_dtype())
+
+    def _delta_E_nearest_chunk(chunk):
+        """
+        Computes the nearest matches of given chunk of rows.
+        """
+
+        delta_E_c = function(a[chunk, np.newaxis], b, **kwargs)
+        rows = np.arange(delta_E_c.shape[0])[..., np.newaxis]
+
+        if count == 1:
+            indexes_c = np.argmin(delta_E_c, axis=-1)[..., np.newaxis]
+        else:
+            if count < delta_E_c.shape[-1]:
+                indexes_c = np.argpartition(
+                    delta_E_c, count - 1, axis=-1)[..., :count]
+            else:
+                indexes_c = np.tile(np.arange(count), (delta_E_c.shape[0], 1))
+
+            indexes_c = indexes_c[
+                rows, np.argsort(delta_E_c[rows, indexes_c], axis=-1)]
+
+        indexes[chunk] = indexes_c
+        delta_E_ab[chunk] = delta_E_c[rows, indexes_c]
+
+    _map_delta_E_chunks(
+        _delta_E_nearest_chunk,
+        _delta_E_chunks_slices(a.shape[0], b.shape[1], chunk_size), threads,
+        pool)
+
+    if k is None:
+        return (np.reshape(indexes, shape), np.reshape(delta_E_ab, shape))
+    else:
+        return (np.reshape(indexes, shape + (count, )),
+                np.reshape(delta_E_ab, shape + (count, )))
+
+
+__all__ += ['delta_E_pairwise', 'delta_E_nearest']
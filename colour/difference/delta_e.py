@@ -289,7 +289,7 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     c_bar = 0.5 * (c_1 + c_2)
     c_bar7 = c_bar ** 7
 
-    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25.0 ** 7)))
 
     a_1_prime = a_1 * (1 + g)
     a_2_prime = a_2 * (1 + g)
@@ -331,7 +331,7 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
 
     c_bar_prime7 = c_bar_prime ** 7
 
-    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25 ** 7))
+    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25.0 ** 7))
     r_T = -2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
 
     d_E = np.sqrt((delta_L_prime / (k_L * s_L)) ** 2 + (delta_C_prime / (
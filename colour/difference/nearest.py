@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+Nearest Colour Index
+====================
+
+Defines a spatial index for nearest colour lookups against large reference
+sets:
+
+-   :class:`colour.difference.NearestColourIndex`
+
+The references are indexed with a *k-d tree* in a colourspace where the
+euclidean distance is the colour difference metric, e.g. *CAM02-UCS*,
+*CAM16-UCS*, *DIN99* or :math:`J_za_zb_z`. The *CIE 1994*, *CIE 2000* and
+*CMC* colour difference formulae being non-euclidean, the candidates are
+searched in *DIN99* colourspace and re-ranked with the exact colour difference
+formula.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from itertools import chain
+from scipy.spatial import cKDTree
+
+from colour.difference.delta_e import (delta_E_CIE1994, delta_E_CIE2000,
+                                       delta_E_CMC)
+from colour.models import Lab_to_DIN99
+from colour.models.cam02_ucs import COEFFICIENTS_UCS_LUO2006
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              filter_kwargs, get_domain_range_scale,
+                              to_domain_1, to_domain_100)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['NearestColourIndex']
+
+
+def _UCS_Luo2006_to_euclidean(method):
+    """
+    Returns the callable scaling *Luo et al. (2006)* or *Li et al. (2017)*
+    :math:`J'a'b'` arrays so that the euclidean distance is the colour
+    difference :math:`\\Delta E'` of given method.
+    """
+
+    K_L = COEFFICIENTS_UCS_LUO2006[method.replace('CAM16', 'CAM02')].K_L
+    scale = np.array([1 / K_L, 1, 1])
+
+    def _to_euclidean(Jpapbp, **kwargs):
+        """
+        Scales given :math:`J'a'b'` array.
+        """
+
+        return as_float_array(Jpapbp) * scale
+
+    return _to_euclidean
+
+
+def _Lab_to_euclidean(Lab, **kwargs):
+    """
+    Returns given *CIE L\\*a\\*b\\** colourspace array in reference domain
+    scale.
+    """
+
+    return to_domain_100(Lab)
+
+
+def _DIN99_to_euclidean(Lab, textiles=False, **kwargs):
+    """
+    Converts given *CIE L\\*a\\*b\\** colourspace array to *DIN99* colourspace
+    as done by :func:`colour.difference.delta_E_DIN99` definition.
+    """
+
+    k_E = 2 if textiles else 1
+    k_CH = 0.5 if textiles else 1
+
+    factor = 100 if get_domain_range_scale() == '1' else 1
+
+    return Lab_to_DIN99(Lab, k_E, k_CH) * factor
+
+
+def _Lab_to_DIN99_candidates(Lab, **kwargs):
+    """
+    Converts given *CIE L\\*a\\*b\\** colourspace array to *DIN99* colourspace
+    in order to search the candidates of the non-euclidean methods, the
+    *DIN99* colour difference being closer to them than the *CIE 1976* colour
+    difference.
+    """
+
+    return _DIN99_to_euclidean(Lab)
+
+
+def _JzAzBz_to_euclidean(JzAzBz, **kwargs):
+    """
+    Returns given :math:`J_za_zb_z` colourspace array in reference domain
+    scale.
+    """
+
+    return to_domain_1(JzAzBz)
+
+
+class NearestColourIndex(object):
+    """
+    Defines a spatial index for nearest colour lookups of samples against a
+    set of references.
+
+    The index is built once from the references and can then be queried for
+    the :math:`k` nearest references or the references within a given colour
+    difference radius of millions of samples.
+
+    Parameters
+    ----------
+    references : array_like, (M, 3)
+        References, *CIE L\\*a\\*b\\** colourspace array for the
+        *CIE 1976*, *CIE 1994*, *CIE 2000*, *CMC* and *DIN99* methods,
+        :math:`J'a'b'` colourspace array for the *CAM02-LCD*, *CAM02-SCD*,
+        *CAM02-UCS*, *CAM16-LCD*, *CAM16-SCD* and *CAM16-UCS* methods and
+        :math:`J_za_zb_z` colourspace array for the *JzAzBz* method.
+    method : unicode, optional
+        **{'CAM02-UCS', 'CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC',
+        'CAM02-LCD', 'CAM02-SCD', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS',
+        'DIN99', 'JzAzBz'}**,
+        Colour difference method, *JzAzBz* uses the euclidean distance in
+        :math:`J_za_zb_z` colourspace.
+    leaf_size : int, optional
+        *k-d tree* leaf size.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.difference.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Attributes
+    ----------
+    references
+    method
+    euclidean
+
+    Methods
+    -------
+    query
+    query_radius
+
+    Notes
+    -----
+    -   The colour differences are computed with the samples as first
+        argument and the references as second argument, which matters for
+        the asymmetric *CIE 1994* and *CMC* formulae.
+    -   For the non-euclidean *CIE 1994*, *CIE 2000* and *CMC* methods, the
+        lookups are approximate: a reference is only found if it is among the
+        candidates nearest in *DIN99* colourspace.
+
+    Examples
+    --------
+    >>> references = np.array([
+    ...     [50.00000000, 30.00000000, 20.00000000],
+    ...     [40.00000000, -30.00000000, 20.00000000],
+    ...     [45.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> index = NearestColourIndex(references, 'CIE 2000')
+    >>> samples = np.array([
+    ...     [51.86016031, 32.39284112, 22.24212018],
+    ...     [41.20510519, -25.46171880, 19.01722460],
+    ... ])
+    >>> index.query(samples)  # doctest: +ELLIPSIS
+    (array([0, 1]), array([ 2.2401297...,  2.2890918...]))
+    >>> index.query(samples, k=2)  # doctest: +ELLIPSIS
+    (array([[0, 2],
+           [1, 2]]), array([[  2.2401297...,  23.9914289...],
+           [  2.2890918...,  21.4479130...]]))
+    """
+
+    _TO_EUCLIDEAN_METHODS = CaseInsensitiveMapping({
+        'CIE 1976': _Lab_to_euclidean,
+        'CIE 1994': _Lab_to_DIN99_candidates,
+        'CIE 2000': _Lab_to_DIN99_candidates,
+        'CMC': _Lab_to_DIN99_candidates,
+        'CAM02-LCD': _UCS_Luo2006_to_euclidean('CAM02-LCD'),
+        'CAM02-SCD': _UCS_Luo2006_to_euclidean('CAM02-SCD'),
+        'CAM02-UCS': _UCS_Luo2006_to_euclidean('CAM02-UCS'),
+        'CAM16-LCD': _UCS_Luo2006_to_euclidean('CAM16-LCD'),
+        'CAM16-SCD': _UCS_Luo2006_to_euclidean('CAM16-SCD'),
+        'CAM16-UCS': _UCS_Luo2006_to_euclidean('CAM16-UCS'),
+        'DIN99': _DIN99_to_euclidean,
+        'JzAzBz': _JzAzBz_to_euclidean,
+    })
+    """
+    Callables converting the references and samples to a colourspace where
+    the euclidean distance is, or approximates, the colour difference.
+    """
+
+    _RE_RANKING_METHODS = CaseInsensitiveMapping({
+        'CIE 1994': delta_E_CIE1994,
+        'CIE 2000': delta_E_CIE2000,
+        'CMC': delta_E_CMC,
+    })
+    """
+    Exact colour difference formulae of the non-euclidean methods.
+    """
+
+    _SEARCH_FACTORS = CaseInsensitiveMapping({
+        'CIE 1994': 2,
+        'CIE 2000': 4,
+        'CMC': 2.5,
+    })
+    """
+    Default factors applied to the colour difference radius of the
+    non-euclidean methods to search the candidates in *DIN99* colourspace,
+    doubled for the textiles parametric factors. They bound the ratio of the
+    *DIN99* colour difference to the method colour difference for radii up to
+    about 20 over the *CIE L\\*a\\*b\\** colourspace.
+    """
+
+    def __init__(self, references, method='CAM02-UCS', leaf_size=16, **kwargs):
+        self._references = np.copy(
+            np.reshape(as_float_array(references), (-1, 3)))
+        self._references.setflags(write=False)
+        self._method = method
+
+        self._to_euclidean = self._TO_EUCLIDEAN_METHODS[method]
+        self._kwargs = kwargs
+
+        self._delta_E = self._RE_RANKING_METHODS.get(method)
+        if self._delta_E is not None:
+            self._delta_E_kwargs = filter_kwargs(self._delta_E, **kwargs)
+
+        self._tree = cKDTree(
+            self._to_euclidean(self._references, **kwargs), leafsize=leaf_size)
+
+    @property
+    def references(self):
+        """
+        Getter property for the references.
+
+        Returns
+        -------
+        ndarray
+            References.
+        """
+
+        return self._references
+
+    @property
+    def method(self):
+        """
+        Getter property for the colour difference method.
+
+        Returns
+        -------
+        unicode
+            Colour difference method.
+        """
+
+        return self._method
+
+    @property
+    def euclidean(self):
+        """
+        Getter property for whether the colour difference method is
+        the euclidean distance in the indexed colourspace, i.e. whether the
+        lookups are exact.
+
+        Returns
+        -------
+        bool
+            Whether the colour difference method is euclidean.
+        """
+
+        return self._delta_E is None
+
+    def _samples(self, samples):
+        """
+        Returns given samples reshaped to a 2d array and their original leading
+        shape.
+        """
+
+        samples = as_float_array(samples)
+
+        return np.reshape(samples, (-1, 3)), samples.shape[:-1]
+
+    def query(self, samples, k=None, candidates=None, chunk_size=2 ** 16):
+        """
+        Returns the indexes of the :math:`k` nearest references to given
+        samples and their colour difference.
+
+        Parameters
+        ----------
+        samples : array_like
+            Samples, in the same colourspace than the references.
+        k : integer, optional
+            Nearest references count, sorted by increasing colour difference,
+            the single nearest reference is returned without the trailing
+            references axis if not given. The references count is limited to
+            the index references count.
+        candidates : integer, optional
+            Candidates count searched in *DIN99* colourspace and
+            re-ranked with the exact colour difference formula for the
+            non-euclidean methods, default to :math:`max(8k, 32)`.
+        chunk_size : integer, optional
+            Maximum samples count queried at once.
+
+        Returns
+        -------
+        tuple
+            Indexes of the nearest references and their colour difference,
+            both of shape ``samples.shape[:-1]`` or
+            ``samples.shape[:-1] + (k, )`` if :math:`k` is given.
+
+        Examples
+        --------
+        >>> references = np.array([
+        ...     [50.00000000, 30.00000000, 20.00000000],
+        ...     [40.00000000, -30.00000000, 20.00000000],
+        ...     [45.00000000, 0.00000000, 0.00000000],
+        ... ])
+        >>> index = NearestColourIndex(references, 'DIN99')
+        >>> index.query(np.array([51.86016031, 32.39284112, 22.24212018]))
+        ... # doctest: +ELLIPSIS
+        (0, 2.0849534...)
+        """
+
+        samples, shape = self._samples(samples)
+
+        size = self._references.shape[0]
+        count = 1 if k is None else min(k, size)
+        if self._delta_E is not None:
+            if candidates is None:
+                candidates = max(8 * count, 32)
+
+            count_c = min(max(count, candidates), size)
+        else:
+            count_c = count
+
+        indexes = np.empty((samples.shape[0], count), dtype=np.int_)
+        delta_E = np.empty((samples.shape[0], count))
+        for i in range(0, samples.shape[0], chunk_size):
+            chunk = samples[i:i + chunk_size]
+            delta_E_c, indexes_c = self._tree.query(
+                self._to_euclidean(chunk, **self._kwargs), count_c)
+            indexes_c = np.reshape(indexes_c, (-1, count_c))
+            delta_E_c = np.reshape(delta_E_c, (-1, count_c))
+
+            if self._delta_E is not None:
+                delta_E_c = self._delta_E(chunk[:, np.newaxis],
+                                          self._references[indexes_c],
+                                          **self._delta_E_kwargs)
+                rows = np.arange(chunk.shape[0])[..., np.newaxis]
+                order = np.argsort(delta_E_c, axis=-1)[..., :count]
+                indexes_c = indexes_c[rows, order]
+                delta_E_c = delta_E_c[rows, order]
+
+            indexes[i:i + chunk_size] = indexes_c
+            delta_E[i:i + chunk_size] = delta_E_c
+
+        if k is None:
+            return np.reshape(indexes, shape)[()], np.reshape(delta_E,
+                                                              shape)[()]
+        else:
+            return (np.reshape(indexes, shape + (count, )),
+                    np.reshape(delta_E, shape + (count, )))
+
+    def query_radius(self,
+                     samples,
+                     radius,
+                     search_factor=None,
+                     chunk_size=2 ** 10):
+        """
+        Returns the indexes of the references within given colour difference
+        radius of given samples and their colour difference.
+
+        Parameters
+        ----------
+        samples : array_like
+            Samples, in the same colourspace than the references.
+        radius : numeric
+            Colour difference radius.
+        search_factor : numeric, optional
+            Factor applied to the radius to search the candidates in *DIN99*
+            colourspace for the non-euclidean methods, default to 2 for
+            *CIE 1994*, 4 for *CIE 2000* and 2.5 for *CMC*, doubled for the
+            textiles parametric factors.
+        chunk_size : integer, optional
+            Maximum samples count queried at once.
+
+        Returns
+        -------
+        tuple
+            Object arrays of shape ``samples.shape[:-1]`` of the indexes of the
+            references within the radius and of their colour difference, each
+            element being sorted by increasing colour difference.
+
+        Examples
+        --------
+        >>> references = np.array([
+        ...     [50.00000000, 30.00000000, 20.00000000],
+        ...     [40.00000000, -30.00000000, 20.00000000],
+        ...     [45.00000000, 0.00000000, 0.00000000],
+        ... ])
+        >>> index = NearestColourIndex(references, 'CIE 2000')
+        >>> indexes, delta_E = index.query_radius(
+        ...     np.array([48.0, 10.0, 8.0]), 20)
+        >>> indexes
+        array([0, 2])
+        >>> delta_E  # doctest: +ELLIPSIS
+        array([ 11.9956753...,  12.6161693...])
+        """
+
+        samples, shape = self._samples(samples)
+
+        if self._delta_E is None:
+            search_factor = 1
+        elif search_factor is None:
+            search_factor = self._SEARCH_FACTORS[self._method]
+            if self._kwargs.get('textiles'):
+                search_factor *= 2
+
+        indexes = np.empty(samples.shape[0], dtype=np.object_)
+        delta_E = np.empty(samples.shape[0], dtype=np.object_)
+        for i in range(0, samples.shape[0], chunk_size):
+            chunk = samples[i:i + chunk_size]
+            points = self._to_euclidean(chunk, **self._kwargs)
+            neighbours = self._tree.query_ball_point(points,
+                                                     radius * search_factor)
+
+            counts = [len(neighbours_j) for neighbours_j in neighbours]
+            indexes_c = np.fromiter(
+                chain.from_iterable(neighbours),
+                dtype=np.int_,
+                count=np.sum(counts, dtype=np.int_))
+            rows = np.repeat(np.arange(chunk.shape[0]), counts)
+
+            if self._delta_E is not None:
+                delta_E_c = self._delta_E(chunk[rows],
+                                          self._references[indexes_c],
+                                          **self._delta_E_kwargs)
+                within = delta_E_c <= radius
+                indexes_c = indexes_c[within]
+                delta_E_c = delta_E_c[within]
+                rows = rows[within]
+            else:
+                delta_E_c = np.sqrt(
+                    np.sum(
+                        (self._tree.data[indexes_c] - points[rows]) ** 2,
+                        axis=-1))
+
+            order = np.lexsort([delta_E_c, rows])
+            splits = np.cumsum(np.bincount(rows,
+                                           minlength=chunk.shape[0]))[:-1]
+            for j, (indexes_j, delta_E_j) in enumerate(
+                    zip(
+                        np.split(indexes_c[order], splits),
+                        np.split(delta_E_c[order], splits))):
+                indexes[i + j] = indexes_j
+                delta_E[i + j] = delta_E_j
+
+        return np.reshape(indexes, shape)[()], np.reshape(delta_E, shape)[()]
@@ -8,9 +8,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.difference import delta_E
+from multiprocessing.pool import ThreadPool
 
-from colour.utilities import domain_range_scale
+from colour.difference import delta_E, delta_E_nearest, delta_E_pairwise
+
+from colour.utilities import default_float_dtype, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestDelta_E']
+__all__ = ['TestDelta_E', 'TestDelta_E_pairwise', 'TestDelta_E_nearest']
 
 
 class TestDelta_E(unittest.TestCase):
@@ -49,5 +51,173 @@ class TestDelta_E(unittest.TestCase):
                         decimal=7)
 
 
+class TestDelta_E_pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_pairwise` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(4)
+        self._a = prng.uniform([0, -100, -100], [100, 100, 100], (4, 5, 3))
+        self._b = prng.uniform([0, -100, -100], [100, 100, 100], (7, 3))
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.delta_E_pairwise` definition.
+        """
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99'):
+            delta_E_ab = delta_E_pairwise(self._a, self._b, method)
+            self.assertTupleEqual(delta_E_ab.shape, (4, 5, 7))
+
+            for i, j in np.ndindex(4, 5):
+                for k in range(7):
+                    self.assertAlmostEqual(
+                        delta_E_ab[i, j, k],
+                        delta_E(self._a[i, j], self._b[k], method),
+                        places=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(self._a, self._b, 'CIE 1994', textiles=True),
+            delta_E(
+                self._a[..., np.newaxis, :],
+                self._b,
+                'CIE 1994',
+                textiles=True),
+            decimal=7)
+
+    def test_chunks_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.delta_E_pairwise` definition chunks and
+        threads support.
+        """
+
+        delta_E_ab = delta_E_pairwise(self._a, self._b, threads=1)
+
+        for chunk_size in (1, 7, 15, 10e5):
+            for threads in (1, 3):
+                np.testing.assert_almost_equal(
+                    delta_E_pairwise(
+                        self._a,
+                        self._b,
+                        chunk_size=chunk_size,
+                        threads=threads),
+                    delta_E_ab,
+                    decimal=7)
+
+        pool = ThreadPool(processes=2)
+        try:
+            np.testing.assert_almost_equal(
+                delta_E_pairwise(self._a, self._b, chunk_size=7, pool=pool),
+                delta_E_ab,
+                decimal=7)
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_context_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.delta_E_pairwise` definition threads
+        use of the caller domain-range scale and floating point number dtype.
+        """
+
+        a = self._a / 100
+        b = self._b / 100
+
+        pool = ThreadPool(processes=2)
+        try:
+            with domain_range_scale('1'), default_float_dtype(np.float32):
+                delta_E_ab = delta_E_pairwise(a, b, threads=1)
+                for kwargs in ({'threads': 4}, {'pool': pool}):
+                    np.testing.assert_almost_equal(
+                        delta_E_pairwise(a, b, chunk_size=7, **kwargs),
+                        delta_E_ab,
+                        decimal=7)
+        finally:
+            pool.close()
+            pool.join()
+
+        np.testing.assert_almost_equal(
+            delta_E_ab, delta_E_pairwise(self._a, self._b), decimal=2)
+        self.assertEqual(delta_E_ab.dtype, np.float32)
+
+
+class TestDelta_E_nearest(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_nearest` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(4)
+        self._a = prng.uniform([0, -100, -100], [100, 100, 100], (4, 5, 3))
+        self._b = prng.uniform([0, -100, -100], [100, 100, 100], (7, 3))
+
+    def test_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition.
+        """
+
+        for method in ('CIE 1976', 'CIE 2000', 'CAM16-UCS'):
+            delta_E_ab = delta_E_pairwise(self._a, self._b, method)
+
+            indexes, delta_E_n = delta_E_nearest(self._a, self._b, method)
+            np.testing.assert_equal(indexes, np.argmin(delta_E_ab, axis=-1))
+            np.testing.assert_almost_equal(
+                delta_E_n, np.min(delta_E_ab, axis=-1), decimal=7)
+
+            for k in (1, 3, 7, 10):
+                indexes, delta_E_n = delta_E_nearest(
+                    self._a, self._b, method, k=k, chunk_size=7, threads=2)
+                self.assertTupleEqual(indexes.shape, (4, 5, min(k, 7)))
+                np.testing.assert_equal(
+                    indexes,
+                    np.argsort(delta_E_ab, axis=-1)[..., :min(k, 7)])
+                np.testing.assert_almost_equal(
+                    delta_E_n,
+                    np.sort(delta_E_ab, axis=-1)[..., :min(k, 7)],
+                    decimal=7)
+
+        indexes, delta_E_n = delta_E_nearest(self._a[0, 0], self._b)
+        self.assertTupleEqual(indexes.shape, ())
+        self.assertTupleEqual(delta_E_n.shape, ())
+
+    def test_context_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition threads
+        use of the caller domain-range scale and floating point number dtype.
+        """
+
+        a = self._a / 100
+        b = self._b / 100
+
+        pool = ThreadPool(processes=2)
+        try:
+            with domain_range_scale('1'), default_float_dtype(np.float32):
+                indexes, delta_E_n = delta_E_nearest(a, b, k=3, threads=1)
+                for kwargs in ({'threads': 4}, {'pool': pool}):
+                    indexes_t, delta_E_t = delta_E_nearest(
+                        a, b, k=3, chunk_size=7, **kwargs)
+                    np.testing.assert_equal(indexes_t, indexes)
+                    np.testing.assert_almost_equal(
+                        delta_E_t, delta_E_n, decimal=7)
+        finally:
+            pool.close()
+            pool.join()
+
+        np.testing.assert_equal(
+            indexes, delta_E_nearest(self._a, self._b, k=3)[0])
+        self.assertEqual(delta_E_n.dtype, np.float32)
+
+
 if __name__ == '__main__':
     unittest.main()
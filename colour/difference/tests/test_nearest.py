@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.nearest` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.difference import (NearestColourIndex, delta_E_nearest,
+                               delta_E_pairwise)
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestNearestColourIndex']
+
+
+class TestNearestColourIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.nearest.NearestColourIndex` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(8)
+        self._references = prng.uniform([0, -80, -80], [100, 80, 80], (256, 3))
+        self._samples = prng.uniform([0, -80, -80], [100, 80, 80], (4, 16, 3))
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('references', 'method', 'euclidean')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(NearestColourIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('query', 'query_radius')
+
+        for method in required_methods:
+            self.assertIn(method, dir(NearestColourIndex))
+
+    def test_references(self):
+        """
+        Tests :attr:`colour.difference.nearest.NearestColourIndex.references`
+        property.
+        """
+
+        index = NearestColourIndex(self._references)
+        np.testing.assert_equal(index.references, self._references)
+        self.assertFalse(index.references.flags.writeable)
+
+    def test_query(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.query`
+        method.
+        """
+
+        for method in ('CIE 1976', 'CIE 2000', 'CMC', 'CAM02-LCD', 'CAM16-UCS',
+                       'DIN99'):
+            index = NearestColourIndex(self._references, method)
+            candidates = None if index.euclidean else 256
+
+            np.testing.assert_almost_equal(
+                index.query(
+                    self._samples, candidates=candidates, chunk_size=5),
+                delta_E_nearest(self._samples, self._references, method),
+                decimal=7)
+
+            for k in (1, 4, 300):
+                np.testing.assert_almost_equal(
+                    index.query(self._samples, k, candidates, chunk_size=5),
+                    delta_E_nearest(self._samples, self._references, method,
+                                    k),
+                    decimal=7)
+
+        index = NearestColourIndex(self._references, 'CIE 1994', textiles=True)
+        np.testing.assert_almost_equal(
+            index.query(self._samples, 3, candidates=256),
+            delta_E_nearest(
+                self._samples, self._references, 'CIE 1994', 3, textiles=True),
+            decimal=7)
+
+        index = NearestColourIndex(self._references / 100, 'JzAzBz')
+        indexes, delta_E = index.query(self._samples / 100)
+        distances = np.linalg.norm(
+            self._samples[..., np.newaxis, :] / 100 - self._references / 100,
+            axis=-1)
+        np.testing.assert_equal(indexes, np.argmin(distances, axis=-1))
+        np.testing.assert_almost_equal(
+            delta_E, np.min(distances, axis=-1), decimal=7)
+
+    def test_query_radius(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.query_radius`
+        method.
+        """
+
+        for method in ('CIE 1976', 'CIE 2000', 'DIN99', 'CAM02-SCD'):
+            index = NearestColourIndex(self._references, method)
+            indexes, delta_E = index.query_radius(
+                self._samples, 15, chunk_size=5)
+            self.assertTupleEqual(indexes.shape, (4, 16))
+
+            delta_E_ab = delta_E_pairwise(self._samples, self._references,
+                                          method)
+            for i in np.ndindex(4, 16):
+                within = np.where(delta_E_ab[i] <= 15)[0]
+                within = within[np.argsort(delta_E_ab[i][within])]
+                np.testing.assert_equal(indexes[i], within)
+                np.testing.assert_almost_equal(
+                    delta_E[i], delta_E_ab[i][within], decimal=7)
+
+    def test_domain_range_scale_query(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.query`
+        method domain and range scale support.
+        """
+
+        for method in ('CIE 2000', 'DIN99'):
+            index = NearestColourIndex(self._references, method)
+            indexes, delta_E = index.query(self._samples)
+
+            d_r = (('reference', 1), (1, 0.01), (100, 1))
+            for scale, factor in d_r:
+                with domain_range_scale(scale):
+                    index = NearestColourIndex(self._references * factor,
+                                               method)
+                    indexes_s, delta_E_s = index.query(self._samples * factor)
+                    np.testing.assert_equal(indexes_s, indexes)
+                    np.testing.assert_almost_equal(
+                        delta_E_s, delta_E, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,19 +2,32 @@
 
 from __future__ import absolute_import
 
-from .ies_tm2714 import SpectralDistribution_IESTM2714
+from .common import SpectralDistributionsView
+from .ies_tm2714 import (SpectralDistribution_IESTM2714,
+                         read_multi_sd_from_IESTM2714_files)
 from .luts import *  # noqa
 from . import luts
-from .image import ImageAttribute_Specification, read_image, write_image
+from .image import (ImageAttribute_Specification, convert_bit_depth,
+                    read_image_scanlines, read_image, write_image_scanlines,
+                    write_image)
+from .pipeline import ImagePipeline
 from .tabular import (read_spectral_data_from_csv_file, read_sds_from_csv_file,
-                      write_sds_to_csv_file)
-from .xrite import read_sds_from_xrite_file
+                      read_multi_sd_from_csv_file, write_sds_to_csv_file)
+from .xrite import read_sds_from_xrite_file, read_multi_sd_from_xrite_file
 
-__all__ = ['SpectralDistribution_IESTM2714']
+__all__ = ['SpectralDistributionsView']
+__all__ += [
+    'SpectralDistribution_IESTM2714', 'read_multi_sd_from_IESTM2714_files'
+]
 __all__ += luts.__all__
-__all__ += ['ImageAttribute_Specification', 'read_image', 'write_image']
+__all__ += [
+    'ImageAttribute_Specification', 'convert_bit_depth',
+    'read_image_scanlines', 'read_image', 'write_image_scanlines',
+    'write_image'
+]
+__all__ += ['ImagePipeline']
 __all__ += [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'read_multi_sd_from_csv_file', 'write_sds_to_csv_file'
 ]
-__all__ += ['read_sds_from_xrite_file']
+__all__ += ['read_sds_from_xrite_file', 'read_multi_sd_from_xrite_file']
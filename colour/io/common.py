@@ -9,8 +9,11 @@ category.
 
 from __future__ import division, unicode_literals
 
+from collections import Mapping, OrderedDict
 from pprint import pformat
 
+from colour.colorimetry import SpectralDistribution
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['format_spectral_data']
+__all__ = ['format_spectral_data', 'SpectralDistributionsView']
 
 
 def format_spectral_data(data):
@@ -127,3 +130,126 @@ def format_spectral_data(data):
     """
 
     return pformat(data)
+
+
+class SpectralDistributionsView(Mapping):
+    """
+    Defines a read-only mapping of spectral distributions backed by a single
+    values array: the :class:`colour.SpectralDistribution` class instances
+    are only created, and then cached, when accessed.
+
+    Parameters
+    ----------
+    names : array_like
+        Spectral distributions names, if a name is repeated, the last
+        corresponding spectral distribution is used.
+    wavelengths : array_like
+        Wavelengths of the spectral distributions.
+    values : array_like
+        Values of the spectral distributions of shape (names, wavelengths).
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the :class:`colour.SpectralDistribution` class
+        instances.
+
+    Attributes
+    ----------
+    wavelengths
+    array
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> sds = SpectralDistributionsView(
+    ...     ['a', 'b'], np.arange(400, 500, 10), np.ones([2, 10]))
+    >>> list(sds)
+    ['a', 'b']
+    >>> sds['b'].values
+    array([ 1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.])
+    """
+
+    def __init__(self, names, wavelengths, values, **kwargs):
+        self._indexes = OrderedDict((name, i) for i, name in enumerate(names))
+        self._wavelengths = wavelengths
+        self._values = values
+        self._kwargs = kwargs
+        self._sds = {}
+
+    @property
+    def wavelengths(self):
+        """
+        Getter property for the wavelengths of the spectral distributions.
+
+        Returns
+        -------
+        ndarray
+            Wavelengths of the spectral distributions.
+        """
+
+        return self._wavelengths
+
+    @property
+    def array(self):
+        """
+        Getter property for the values array of the spectral distributions.
+
+        Returns
+        -------
+        ndarray
+            Values of the spectral distributions of shape
+            (names, wavelengths).
+        """
+
+        return self._values
+
+    def __getitem__(self, name):
+        """
+        Returns the spectral distribution with given name, creating it on
+        first access.
+
+        Parameters
+        ----------
+        name : unicode
+            Spectral distribution name.
+
+        Returns
+        -------
+        SpectralDistribution
+            Spectral distribution.
+        """
+
+        sd = self._sds.get(name)
+        if sd is None:
+            sd = self._sds[name] = SpectralDistribution(
+                self._values[self._indexes[name]],
+                self._wavelengths,
+                name=name,
+                **self._kwargs)
+
+        return sd
+
+    def __iter__(self):
+        """
+        Returns a generator for the spectral distributions names.
+
+        Returns
+        -------
+        generator
+            Spectral distributions names generator.
+        """
+
+        return iter(self._indexes)
+
+    def __len__(self):
+        """
+        Returns the spectral distributions count.
+
+        Returns
+        -------
+        int
+            Spectral distributions count.
+        """
+
+        return len(self._indexes)
@@ -3,8 +3,10 @@
 IES TM-27-14 Data Input / Output
 ================================
 
-Defines the :class:`colour.SpectralDistribution_IESTM2714` class handling
-*IES TM-27-14* spectral data XML files.
+Defines the objects handling *IES TM-27-14* spectral data XML files:
+
+-   :class:`colour.SpectralDistribution_IESTM2714`
+-   :func:`colour.read_multi_sd_from_IESTM2714_files`
 
 References
 ----------
@@ -15,15 +17,18 @@ References
 
 from __future__ import division, unicode_literals
 
+import glob
+import multiprocessing
+import numpy as np
 import os
-import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from functools import partial
 from xml.etree import ElementTree
-from xml.dom import minidom
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import (MultiSpectralDistribution,
+                                SpectralDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import Structure, is_numeric, is_string, tstack
+from colour.utilities import Structure, is_numeric, is_string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -35,7 +40,7 @@ __status__ = 'Production'
 __all__ = [
     'IES_TM2714_VERSION', 'IES_TM2714_NAMESPACE',
     'IES_TM2714_ElementSpecification', 'IES_TM2714_Header',
-    'SpectralDistribution_IESTM2714'
+    'SpectralDistribution_IESTM2714', 'read_multi_sd_from_IESTM2714_files'
 ]
 
 IES_TM2714_VERSION = '1.0'
@@ -557,6 +562,82 @@ class IES_TM2714_Header(object):
         self._comments = value
 
 
+def _parse_IESTM2714_file(path,
+                          data_element='SpectralData',
+                          data_attribute='wavelength'):
+    """
+    Parses given *IES TM-27-14* spectral data XML file incrementally, the
+    container elements being cleared once read so that the document tree is
+    never built entirely.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral data XML file path.
+    data_element : unicode, optional
+        Spectral data element name.
+    data_attribute : unicode, optional
+        Spectral data wavelength attribute name.
+
+    Returns
+    -------
+    tuple
+        Elements texts keyed by (parent element name, element name) tuples,
+        wavelengths and values.
+    """
+
+    texts, wavelengths, values = {}, [], []
+    tags = {}
+    for _event, element in ElementTree.iterparse(path):
+        tag = tags.get(element.tag)
+        if tag is None:
+            # Removing the namespace, e.g. "{http://www.ies.org/iestm2714}".
+            tag = tags[element.tag] = element.tag.rsplit('}', 1)[-1]
+
+        if tag == data_element:
+            wavelengths.append(element.attrib[data_attribute])
+            values.append(element.text)
+        elif len(element):
+            for child in element:
+                if len(child) == 0 and child.text is not None:
+                    texts[(tag, tags[child.tag])] = child.text
+
+            element.clear()
+
+    return (texts, np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE),
+            np.array(values, dtype=DEFAULT_FLOAT_DTYPE))
+
+
+def _IESTM2714_elements(sd, texts):
+    """
+    Yields the header element, attribute and converted value of the
+    elements of given spectral distribution mapping that are present in given
+    texts.
+    """
+
+    for header_element in (sd.header, sd):
+        mapping = header_element.mapping
+        for specification in mapping.elements:
+            text = texts.get((mapping.element, specification.element))
+            if text is not None:
+                yield (header_element, specification.attribute,
+                       specification.read_conversion(text))
+
+
+def _indent_element(element, level=0):
+    """
+    Indents given element children in-place with tabulations.
+    """
+
+    indentation = '\n' + level * '\t'
+    if len(element):
+        element.text = indentation + '\t'
+        for child in element:
+            _indent_element(child, level + 1)
+            child.tail = indentation + '\t'
+        child.tail = indentation
+
+
 class SpectralDistribution_IESTM2714(SpectralDistribution):
     """
     Defines a *IES TM-27-14* spectral distribution.
@@ -959,36 +1040,15 @@ class SpectralDistribution_IESTM2714(SpectralDistribution):
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
+        texts, wavelengths, values = _parse_IESTM2714_file(
+            self._path, self.mapping.data.element,
+            self.mapping.data.attribute)
 
         self.name = os.path.splitext(os.path.basename(self._path))[0]
 
-        iterator = root.iter
-
-        for header_element in (self.header, self):
-            mapping = header_element.mapping
-            for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
-                    setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
-
-        # Reading spectral data.
-        wavelengths = []
-        values = []
-        for spectral_data in iterator('{{{0}}}{1}'.format(
-                namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(
-                    spectral_data.attrib[self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+        for header_element, attribute, value in _IESTM2714_elements(
+                self, texts):
+            setattr(header_element, attribute, value)
 
         self.wavelengths = wavelengths
         self.values = values
@@ -1041,18 +1101,123 @@ class SpectralDistribution_IESTM2714(SpectralDistribution):
                 spectral_distribution = element
 
         # Writing spectral data.
-        for (wavelength, value) in tstack([self.wavelengths, self.values]):
-            element_child = ElementTree.SubElement(spectral_distribution,
-                                                   mapping.data.element)
+        for wavelength, value in zip(self.wavelengths.tolist(),
+                                     self.values.tolist()):
+            element_child = ElementTree.SubElement(
+                spectral_distribution, mapping.data.element,
+                {mapping.data.attribute: mapping.data.write_conversion(
+                    wavelength)})
             element_child.text = mapping.data.write_conversion(value)
-            element_child.attrib = {
-                mapping.data.attribute:
-                    mapping.data.write_conversion(wavelength)
-            }
 
-        xml = minidom.parseString(ElementTree.tostring(root)).toprettyxml()
+        _indent_element(root)
+        root.tail = '\n'
 
-        with open(self._path, 'w') as file:
-            file.write(xml)
+        ElementTree.ElementTree(root).write(
+            self._path, encoding='utf-8', xml_declaration=True)
 
         return True
+
+
+def read_multi_sd_from_IESTM2714_files(paths,
+                                       shape=None,
+                                       processes=None,
+                                       name=None):
+    """
+    Reads given *IES TM-27-14* spectral data XML files and returns their
+    spectral data stacked in a :class:`colour.MultiSpectralDistribution`
+    class instance along with their metadata.
+
+    The files are parsed incrementally by a pool of worker processes, only
+    their texts and spectral data being sent back to the current process.
+
+    Parameters
+    ----------
+    paths : unicode or array_like
+        Spectral data XML files paths or directory path, in which case the
+        *.spdx* files it contains are read in alphabetical order.
+    shape : SpectralShape, optional
+        Spectral shape the spectral distributions are aligned to, if not
+        given, the files must all have the same wavelengths.
+    processes : int, optional
+        Worker processes count, a value of 1 reads the files in the current
+        process, default to :func:`multiprocessing.cpu_count` definition.
+    name : unicode, optional
+        Multi-spectral distribution name.
+
+    Returns
+    -------
+    tuple
+        Multi-spectral distribution labelled with the files names and
+        *OrderedDict* of the files header and spectral distribution metadata,
+        e.g. *description* or *spectral_quantity*, keyed by label.
+
+    Raises
+    ------
+    ValueError
+        If the files do not have the same wavelengths and no spectral shape
+        is given.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> multi_sd, metadata = read_multi_sd_from_IESTM2714_files(directory)
+    >>> multi_sd.labels
+    ['Fluorescent']
+    >>> metadata['Fluorescent']['description']
+    'Rare earth fluorescent lamp'
+    """
+
+    if is_string(paths):
+        paths = sorted(glob.glob(os.path.join(paths, '*.spdx')))
+    paths = list(paths)
+
+    assert paths, 'No "IES TM-27-14" spectral data XML files to read!'
+
+    template = SpectralDistribution_IESTM2714()
+    parse = partial(_parse_IESTM2714_file,
+                    data_element=template.mapping.data.element,
+                    data_attribute=template.mapping.data.attribute)
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    if processes == 1 or len(paths) < 2:
+        files = [parse(path) for path in paths]
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            files = pool.map(
+                parse, paths, max(1, len(paths) // (processes * 4)))
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    labels, metadata, data = [], OrderedDict(), []
+    for path, (texts, wavelengths, values) in zip(paths, files):
+        label = os.path.splitext(os.path.basename(path))[0]
+        labels.append(label)
+
+        metadata[label] = OrderedDict(
+            (attribute, value)
+            for _header_element, attribute, value in _IESTM2714_elements(
+                template, texts))
+
+        if shape is not None:
+            sd = SpectralDistribution(values, wavelengths).align(shape)
+            wavelengths, values = sd.wavelengths, sd.values
+        elif data and not np.array_equal(wavelengths, data[0][0]):
+            raise ValueError(
+                '"{0}" file wavelengths do not match "{1}" file wavelengths, '
+                'a spectral shape must be given!'.format(path, paths[0]))
+
+        data.append((wavelengths, values))
+
+    multi_sd = MultiSpectralDistribution(
+        np.transpose([values for _wavelengths, values in data]),
+        data[0][0],
+        labels=labels,
+        name=name)
+
+    return multi_sd, metadata
@@ -9,11 +9,13 @@ Defines image related input / output utilities objects.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import re
 from collections import namedtuple
 from six import string_types
 
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              is_openimageio_installed)
+                              is_openimageio_installed, profiled)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +26,8 @@ __status__ = 'Production'
 
 __all__ = [
     'BitDepth_Specification', 'ImageAttribute_Specification',
-    'BIT_DEPTH_MAPPING', 'read_image', 'write_image'
+    'BIT_DEPTH_MAPPING', 'convert_bit_depth', 'read_image_scanlines',
+    'read_image', 'write_image_scanlines', 'write_image'
 ]
 
 BitDepth_Specification = namedtuple(
@@ -84,9 +87,212 @@ else:
     })
 
 
+def convert_bit_depth(a, bit_depth='float32', out=None):
+    """
+    Converts given floating point image data normalised to [0, 1] to given
+    bit depth.
+
+    Parameters
+    ----------
+    a : array_like
+        Image data to convert.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth to convert the image data to.
+    out : ndarray, optional
+        Array to store the result into, it must have the shape of the image
+        data and its dtype is used in place of the bit depth dtype.
+
+    Returns
+    -------
+    ndarray
+        Converted image data.
+
+    Notes
+    -----
+    -   Integer bit depths are scaled to their domain, clipped and truncated,
+        the scaling and clipping happen in place on a single temporary array
+        while floating point bit depths are cast directly into the output
+        array.
+    -   Given image data is never modified.
+
+    Examples
+    --------
+    >>> convert_bit_depth(np.array([0.0, 0.5, 1.0, 1.5]), 'uint8')
+    array([  0, 127, 255, 255], dtype=uint8)
+    """
+
+    bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
+    domain = bit_depth_specification.domain
+
+    a = np.asarray(a)
+    if a.dtype.kind != 'f':
+        a = as_float_array(a)
+
+    if out is None:
+        out = np.empty(a.shape, bit_depth_specification.numpy)
+
+    if domain != 1:
+        a = a * domain
+        if bit_depth_specification.clip:
+            np.clip(a, 0, domain, out=a)
+    elif bit_depth_specification.clip:
+        a = np.clip(a, 0, domain)
+
+    np.copyto(out, a, casting='unsafe')
+
+    return out
+
+
+def _is_PFM_file(path):
+    """
+    Returns whether given path is a *Portable Float Map* (PFM) file path.
+    """
+
+    return os.path.splitext(str(path))[-1].lower() == '.pfm'
+
+
+def _read_PFM_header(file_handle):
+    """
+    Reads the header of given *Portable Float Map* (PFM) file handle.
+
+    Returns
+    -------
+    tuple
+        Height, width, channels count and dtype of the image data.
+    """
+
+    identifier = file_handle.readline().strip()
+    if identifier not in (b'PF', b'Pf'):
+        raise ValueError('"{0}" file is not a "PFM" file!'.format(
+            file_handle.name))
+
+    tokens = []
+    while len(tokens) < 3:
+        line = file_handle.readline()
+        if not line:
+            raise ValueError('"{0}" file header is incomplete!'.format(
+                file_handle.name))
+
+        tokens.extend(re.split(br'\s+', line.strip()))
+
+    width, height, scale = int(tokens[0]), int(tokens[1]), float(tokens[2])
+
+    return (height, width, 3 if identifier == b'PF' else 1,
+            np.dtype('<f4' if scale < 0 else '>f4'))
+
+
+def _read_scanlines_PFM(path, scanlines):
+    """
+    Reads given *Portable Float Map* (PFM) file by blocks of scanlines.
+
+    Yields
+    ------
+    tuple
+        Block starting scanline index, block image data and image shape.
+    """
+
+    with open(path, 'rb') as file_handle:
+        height, width, channels, dtype = _read_PFM_header(file_handle)
+        offset = file_handle.tell()
+        row_size = width * channels * dtype.itemsize
+
+        # PFM scanlines are stored from bottom to top.
+        for y in range(0, height, scanlines):
+            rows = min(scanlines, height - y)
+            file_handle.seek(offset + (height - y - rows) * row_size)
+            block = np.fromfile(file_handle, dtype, rows * width * channels)
+
+            yield y, block.reshape(rows, width,
+                                   channels)[::-1], (height, width, channels)
+
+
+def _read_scanlines_OpenImageIO(path, bit_depth, scanlines):
+    """
+    Reads given image by blocks of scanlines using *OpenImageIO*.
+
+    Yields
+    ------
+    tuple
+        Block starting scanline index, block image data and image shape.
+    """
+
+    from OpenImageIO import ImageInput
+
+    image = ImageInput.open(path)
+    try:
+        specification = image.spec()
+        height, width, channels = (specification.height,
+                                   specification.width,
+                                   specification.nchannels)
+        for y in range(0, height, scanlines):
+            rows = min(scanlines, height - y)
+            block = np.array(
+                image.read_scanlines(specification.y + y,
+                                     specification.y + y + rows, 0, 0,
+                                     channels, bit_depth))
+
+            yield y, block.reshape(rows, width, channels), (height, width,
+                                                            channels)
+    finally:
+        image.close()
+
+
+def read_image_scanlines(path, bit_depth='float32', scanlines=64):
+    """
+    Reads given image by blocks of scanlines using *OpenImageIO* or the
+    *NumPy* based *Portable Float Map* (PFM) reader, so that arbitrarily
+    large images can be processed with bounded memory.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    scanlines : int, optional
+        Scanlines count of the yielded blocks, the last block may be smaller.
+
+    Yields
+    ------
+    tuple
+        Block starting scanline index and block image data with shape
+        (scanlines, width, channels).
+
+    Notes
+    -----
+    -   For convenience, the channels axis of single channel images is
+        removed.
+    -   *PFM* files are read with *NumPy* and do not require *OpenImageIO*.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> for y, block in read_image_scanlines(path):  # doctest: +SKIP
+    ...     pass
+    """
+
+    path = str(path)
+
+    if _is_PFM_file(path):
+        blocks = (
+            (y, convert_bit_depth(block, bit_depth), shape)
+            for y, block, shape in _read_scanlines_PFM(path, scanlines))
+    elif is_openimageio_installed(raise_exception=True):
+        blocks = _read_scanlines_OpenImageIO(
+            path, BIT_DEPTH_MAPPING[bit_depth].openimageio, scanlines)
+
+    for y, block, shape in blocks:
+        yield y, block[..., 0] if shape[-1] == 1 else block
+
+
+@profiled
 def read_image(path, bit_depth='float32', attributes=False):
     """
-    Reads given image using *OpenImageIO*.
+    Reads given image using *OpenImageIO* or the *NumPy* based
+    *Portable Float Map* (PFM) reader.
 
     Parameters
     ----------
@@ -106,6 +312,7 @@ def read_image(path, bit_depth='float32', attributes=False):
     Notes
     -----
     -   For convenience, single channel images are squeezed to 2d arrays.
+    -   *PFM* files do not store any attributes.
 
     Examples
     --------
@@ -114,11 +321,23 @@ def read_image(path, bit_depth='float32', attributes=False):
     >>> image = read_image(path)  # doctest: +SKIP
     """
 
+    path = str(path)
+
+    if _is_PFM_file(path):
+        image = None
+        for y, block, shape in _read_scanlines_PFM(path, 64):
+            if image is None:
+                image = np.empty(shape, BIT_DEPTH_MAPPING[bit_depth].numpy)
+
+            convert_bit_depth(block, bit_depth, image[y:y + len(block)])
+
+        image = np.squeeze(image)
+
+        return (image, []) if attributes else image
+
     if is_openimageio_installed(raise_exception=True):
         from OpenImageIO import ImageInput
 
-        path = str(path)
-
         bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
 
         image = ImageInput.open(path)
@@ -142,9 +361,184 @@ def read_image(path, bit_depth='float32', attributes=False):
             return image
 
 
+def _write_scanlines_PFM(blocks, path, shape, bit_depth, attributes):
+    """
+    Writes given blocks of scanlines to given *Portable Float Map* (PFM)
+    file.
+
+    Returns
+    -------
+    int
+        Written scanlines count.
+    """
+
+    if bit_depth != 'float32':
+        raise ValueError(
+            '"PFM" files only support "float32" bit depth, "{0}" was given!'.
+            format(bit_depth))
+
+    height, width, channels = shape
+    if channels not in (1, 3):
+        raise ValueError(
+            '"PFM" files only support 1 or 3 channels, {0} were given!'.format(
+                channels))
+
+    header = '{0}\n{1} {2}\n-1.0\n'.format('PF' if channels == 3 else 'Pf',
+                                           width, height).encode('ascii')
+    row_size = width * channels * 4
+
+    y = 0
+    with open(path, 'wb') as file_handle:
+        file_handle.write(header)
+        file_handle.truncate(len(header) + height * row_size)
+
+        # PFM scanlines are stored from bottom to top.
+        for block in blocks:
+            block = np.reshape(block, (-1, width, channels))
+            rows = len(block)
+            if y + rows > height:
+                raise ValueError(
+                    'More than {0} scanlines were given!'.format(height))
+
+            file_handle.seek(len(header) + (height - y - rows) * row_size)
+            file_handle.write(
+                convert_bit_depth(block[::-1],
+                                  out=np.empty(block.shape, '<f4')).tobytes())
+            y += rows
+
+    return y
+
+
+def _write_scanlines_OpenImageIO(blocks, path, shape, bit_depth, attributes):
+    """
+    Writes given blocks of scanlines to given image using *OpenImageIO*.
+
+    Returns
+    -------
+    int
+        Written scanlines count.
+    """
+
+    from OpenImageIO import ImageOutput, ImageOutputOpenMode, ImageSpec
+
+    height, width, channels = shape
+
+    bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
+    bit_depth = bit_depth_specification.openimageio
+
+    specification = ImageSpec(width, height, channels, bit_depth)
+    for attribute in attributes:
+        name = str(attribute.name)
+        value = (str(attribute.value) if isinstance(
+            attribute.value, string_types) else attribute.value)
+        type_ = attribute.type_
+        if attribute.type_ is None:
+            specification.attribute(name, value)
+        else:
+            specification.attribute(name, type_, value)
+
+    y = 0
+    image_output = ImageOutput.create(path)
+    image_output.open(path, specification, ImageOutputOpenMode.Create)
+    try:
+        for block in blocks:
+            block = np.reshape(block, (-1, width, channels))
+            rows = len(block)
+            if y + rows > height:
+                raise ValueError(
+                    'More than {0} scanlines were given!'.format(height))
+
+            image_output.write_scanlines(
+                y, y + rows, 0, bit_depth,
+                convert_bit_depth(block,
+                                  bit_depth_specification.name).tostring())
+            y += rows
+    finally:
+        image_output.close()
+
+    return y
+
+
+def write_image_scanlines(blocks, path, shape, bit_depth='float32',
+                          attributes=None):
+    """
+    Writes given blocks of scanlines using *OpenImageIO* or the *NumPy* based
+    *Portable Float Map* (PFM) writer, so that arbitrarily large images can be
+    processed with bounded memory.
+
+    Parameters
+    ----------
+    blocks : iterable
+        Blocks of image data with shape (scanlines, width[, channels]),
+        written from top to bottom, typically a generator.
+    path : unicode
+        Image path.
+    shape : array_like
+        Image shape, i.e. (height, width[, channels]).
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    attributes : array_like, optional
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances used to set attributes of the image, ignored for *PFM*
+        files.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the blocks scanlines count does not match the image height.
+
+    Notes
+    -----
+    -   *PFM* files are written with *NumPy* and do not require
+        *OpenImageIO*, they only support *float32* bit depth and 1 or 3
+        channels.
+
+    Examples
+    --------
+    >>> import os
+    >>> from colour import sRGB_to_XYZ
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> blocks = (sRGB_to_XYZ(block)
+    ...           for y, block in read_image_scanlines(path))
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.pfm')
+    >>> write_image_scanlines(
+    ...     blocks, path, (1080, 1920, 3))  # doctest: +SKIP
+    True
+    """
+
+    path = str(path)
+
+    if attributes is None:
+        attributes = []
+
+    shape = tuple(shape)
+    if len(shape) == 2:
+        shape += (1, )
+
+    if _is_PFM_file(path):
+        writer = _write_scanlines_PFM
+    elif is_openimageio_installed(raise_exception=True):
+        writer = _write_scanlines_OpenImageIO
+
+    scanlines = writer(blocks, path, shape, bit_depth, attributes)
+    if scanlines != shape[0]:
+        raise ValueError('{0} scanlines were written instead of {1}!'.format(
+            scanlines, shape[0]))
+
+    return True
+
+
+@profiled
 def write_image(image, path, bit_depth='float32', attributes=None):
     """
-    Writes given image using *OpenImageIO*.
+    Writes given image using *OpenImageIO* or the *NumPy* based
+    *Portable Float Map* (PFM) writer.
 
     Parameters
     ----------
@@ -157,7 +551,8 @@ def write_image(image, path, bit_depth='float32', attributes=None):
         Image bit_depth.
     attributes : array_like, optional
         An array of :class:`colour.io.ImageAttribute_Specification` class
-        instances used to set attributes of the image.
+        instances used to set attributes of the image, ignored for *PFM*
+        files.
 
     Returns
     -------
@@ -182,43 +577,7 @@ def write_image(image, path, bit_depth='float32', attributes=None):
     True
     """
 
-    if is_openimageio_installed(raise_exception=True):
-        from OpenImageIO import ImageOutput, ImageOutputOpenMode, ImageSpec
-
-        path = str(path)
-
-        if attributes is None:
-            attributes = []
-
-        bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
-        bit_depth = bit_depth_specification.openimageio
-
-        image = as_float_array(image)
-        image *= bit_depth_specification.domain
-        if bit_depth_specification.clip:
-            image = np.clip(image, 0, bit_depth_specification.domain)
-        image = image.astype(bit_depth_specification.numpy)
-
-        if image.ndim == 2:
-            height, width = image.shape
-            channels = 1
-        else:
-            height, width, channels = image.shape
-
-        specification = ImageSpec(width, height, channels, bit_depth)
-        for attribute in attributes:
-            name = str(attribute.name)
-            value = (str(attribute.value) if isinstance(
-                attribute.value, string_types) else attribute.value)
-            type_ = attribute.type_
-            if attribute.type_ is None:
-                specification.attribute(name, value)
-            else:
-                specification.attribute(name, type_, value)
-
-        image_output = ImageOutput.create(path)
-        image_output.open(path, specification, ImageOutputOpenMode.Create)
-        image_output.write_image(bit_depth, image.tostring())
-        image_output.close()
+    image = np.asarray(image)
 
-        return True
+    return write_image_scanlines([image], path, image.shape, bit_depth,
+                                 attributes)
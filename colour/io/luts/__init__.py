@@ -17,7 +17,7 @@ from __future__ import absolute_import
 
 import os
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import CaseInsensitiveMapping, filter_kwargs, profiled
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT2D, LUT3D,
                   LUTSequence, LUT_to_LUT)
 from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
@@ -69,6 +69,7 @@ LUT_READ_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def read_LUT(path, method=None, **kwargs):
     """
     Reads given *LUT* file using given method.
@@ -167,6 +168,7 @@ LUT_WRITE_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     """
     Writes given *LUT* to given file using given method.
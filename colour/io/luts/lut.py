@@ -35,8 +35,8 @@ from six import add_metaclass
 from colour.algebra import LinearInterpolator, table_interpolation_trilinear
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (as_float_array, is_numeric, is_iterable,
-                              is_string, linear_conversion, runtime_warning,
-                              tsplit, tstack, usage_warning)
+                              is_string, linear_conversion, profiled,
+                              runtime_warning, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -947,6 +947,7 @@ class LUT1D(AbstractLUT):
 
             return np.linspace(domain[0], domain[1], size)
 
+    @profiled(name='LUT1D.apply')
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
@@ -1303,6 +1304,7 @@ class LUT2D(AbstractLUT):
 
             return tstack(samples)
 
+    @profiled(name='LUT2D.apply')
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
@@ -1768,6 +1770,7 @@ class LUT3D(AbstractLUT):
 
         return table
 
+    @profiled(name='LUT3D.apply')
     def apply(self,
               RGB,
               interpolator=table_interpolation_trilinear,
@@ -2326,6 +2329,7 @@ class LUTSequence(MutableSequence):
 
         self._sequence.insert(index, LUT)
 
+    @profiled(name='LUTSequence.apply')
     def apply(self,
               RGB,
               interpolator_1D=LinearInterpolator,
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+Image Sequence Processing Pipeline
+==================================
+
+Defines the image sequence processing pipeline object:
+
+-   :class:`colour.io.ImagePipeline`
+"""
+
+from __future__ import division, unicode_literals
+
+import multiprocessing
+from collections import OrderedDict, deque
+from timeit import default_timer
+
+from colour.io.image import read_image, write_image
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['ImagePipeline']
+
+_WORKER_PIPELINE = None
+"""
+Pipeline used by the current worker process, set by the pool initializer.
+
+_WORKER_PIPELINE : ImagePipeline
+"""
+
+
+def _stage_name(function):
+    """
+    Returns the name of given stage function.
+    """
+
+    function = getattr(function, 'func', function)
+
+    name = getattr(function, '__name__', None)
+    if name is None:
+        name = function.__class__.__name__
+    elif getattr(function, '__self__', None) is not None:
+        name = '{0}.{1}'.format(function.__self__.__class__.__name__, name)
+
+    return name
+
+
+def _initialise_worker(pipeline):
+    """
+    Initialises the current worker process with given pipeline.
+    """
+
+    global _WORKER_PIPELINE
+
+    _WORKER_PIPELINE = pipeline
+
+
+def _process_frame_worker(input_path, output_path):
+    """
+    Processes given frame with the current worker process pipeline.
+    """
+
+    return _WORKER_PIPELINE.process_frame(input_path, output_path)
+
+
+class ImagePipeline(object):
+    """
+    Defines an image sequence processing pipeline: each frame is read, goes
+    through the given stages in order, and is written.
+
+    Frames are processed by a pool of worker processes, each worker reading,
+    processing and writing whole frames so that the input / output of some
+    frames overlaps the computations of the others. The count of frames
+    submitted to the pool but not yet collected is bounded by the prefetch
+    queue size, so that memory usage does not grow with the sequence length.
+
+    Parameters
+    ----------
+    stages : array_like
+        Stages applied to each frame, either callables or
+        (name, callable) tuples, e.g. :func:`colour.decoding_cctf`
+        definition partial objects, :meth:`colour.LUT3D.apply` method or
+        :meth:`colour.RGB_to_RGB_Converter.apply` method. They must be
+        picklable to be used with a worker processes pool.
+    read_bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth the frames are read with.
+    write_bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth the frames are written with.
+    processes : int, optional
+        Worker processes count, default to :func:`multiprocessing.cpu_count`
+        definition, a value of 1 processes the frames in the current process.
+    prefetch : int, optional
+        Frames count submitted ahead per worker process.
+
+    Attributes
+    ----------
+    stages
+    read_bit_depth
+    write_bit_depth
+    processes
+    prefetch
+    timings
+
+    Methods
+    -------
+    apply
+    process_frame
+    process
+
+    Notes
+    -----
+    -   The timings of the read and write stages are respectively reported
+        with the *read* and *write* names.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from functools import partial
+    >>> from colour import decoding_cctf, encoding_cctf
+    >>> pipeline = ImagePipeline([
+    ...     partial(decoding_cctf, function='sRGB'),
+    ...     ('Exposure', partial(np.multiply, 2)),
+    ...     partial(encoding_cctf, function='sRGB'),
+    ... ])
+    >>> pipeline.apply(np.array([0.25, 0.50, 0.75]))  # doctest: +ELLIPSIS
+    array([ 0.3521261...,  0.6858361...,  1.0195460...])
+    >>> frames = [('Input.{0:04d}.exr'.format(i),
+    ...            'Output.{0:04d}.exr'.format(i)) for i in range(24)]
+    >>> for path, timings in pipeline.process(frames):  # doctest: +SKIP
+    ...     pass
+    """
+
+    def __init__(self,
+                 stages,
+                 read_bit_depth='float32',
+                 write_bit_depth='float32',
+                 processes=None,
+                 prefetch=2):
+        self._stages = None
+        self.stages = stages
+        self._read_bit_depth = read_bit_depth
+        self._write_bit_depth = write_bit_depth
+        self._processes = None
+        self.processes = processes
+        self._prefetch = None
+        self.prefetch = prefetch
+        self._timings = OrderedDict()
+
+    @property
+    def stages(self):
+        """
+        Getter and setter property for the stages.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the stages with.
+
+        Returns
+        -------
+        tuple
+            (name, callable) stages tuples.
+        """
+
+        return self._stages
+
+    @stages.setter
+    def stages(self, value):
+        """
+        Setter for **self.stages** property.
+        """
+
+        stages = []
+        for stage in value:
+            if isinstance(stage, tuple):
+                name, function = stage
+            else:
+                name, function = _stage_name(stage), stage
+
+            assert callable(function), (
+                '"{0}" stage is not callable!'.format(name))
+
+            stages.append((name, function))
+
+        self._stages = tuple(stages)
+
+    @property
+    def read_bit_depth(self):
+        """
+        Getter property for the bit depth the frames are read with.
+
+        Returns
+        -------
+        unicode
+            Read bit depth.
+        """
+
+        return self._read_bit_depth
+
+    @property
+    def write_bit_depth(self):
+        """
+        Getter property for the bit depth the frames are written with.
+
+        Returns
+        -------
+        unicode
+            Write bit depth.
+        """
+
+        return self._write_bit_depth
+
+    @property
+    def processes(self):
+        """
+        Getter and setter property for the worker processes count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the worker processes count with.
+
+        Returns
+        -------
+        int
+            Worker processes count.
+        """
+
+        return self._processes
+
+    @processes.setter
+    def processes(self, value):
+        """
+        Setter for **self.processes** property.
+        """
+
+        if value is None:
+            value = multiprocessing.cpu_count()
+
+        assert value > 0, (
+            '"{0}" attribute: "{1}" must be greater than 0!'.format(
+                'processes', value))
+
+        self._processes = int(value)
+
+    @property
+    def prefetch(self):
+        """
+        Getter and setter property for the frames count submitted ahead per
+        worker process.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the frames count submitted ahead with.
+
+        Returns
+        -------
+        int
+            Frames count submitted ahead per worker process.
+        """
+
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, value):
+        """
+        Setter for **self.prefetch** property.
+        """
+
+        assert value > 0, (
+            '"{0}" attribute: "{1}" must be greater than 0!'.format(
+                'prefetch', value))
+
+        self._prefetch = int(value)
+
+    @property
+    def timings(self):
+        """
+        Getter property for the cumulative timings, in seconds, of each stage
+        over the frames processed with :meth:`colour.io.ImagePipeline.process`
+        method.
+
+        Returns
+        -------
+        OrderedDict
+            Cumulative timings of each stage.
+        """
+
+        return self._timings
+
+    def __getstate__(self):
+        """
+        Returns the state sent to the worker processes, the timings are not
+        part of it.
+        """
+
+        state = self.__dict__.copy()
+        state['_timings'] = OrderedDict()
+
+        return state
+
+    def apply(self, image, timings=None):
+        """
+        Applies the stages to given image.
+
+        Parameters
+        ----------
+        image : array_like
+            Image to process.
+        timings : dict, optional
+            Mapping the stages timings, in seconds, are added to.
+
+        Returns
+        -------
+        ndarray
+            Processed image.
+        """
+
+        for name, function in self._stages:
+            start = default_timer()
+            image = function(image)
+            if timings is not None:
+                timings[name] = (
+                    timings.get(name, 0) + default_timer() - start)
+
+        return image
+
+    def process_frame(self, input_path, output_path):
+        """
+        Reads given input frame, applies the stages and writes the output
+        frame.
+
+        Parameters
+        ----------
+        input_path : unicode
+            Input frame path.
+        output_path : unicode
+            Output frame path.
+
+        Returns
+        -------
+        OrderedDict
+            Read, stages and write timings, in seconds.
+        """
+
+        timings = OrderedDict()
+
+        start = default_timer()
+        image = read_image(input_path, self._read_bit_depth)
+        timings['read'] = default_timer() - start
+
+        image = self.apply(image, timings)
+
+        start = default_timer()
+        write_image(image, output_path, self._write_bit_depth)
+        timings['write'] = default_timer() - start
+
+        return timings
+
+    def _collect(self, output_path, timings):
+        """
+        Adds given frame timings to the cumulative timings.
+        """
+
+        for name, timing in timings.items():
+            self._timings[name] = self._timings.get(name, 0) + timing
+
+        return output_path, timings
+
+    def process(self, frames):
+        """
+        Processes given frames.
+
+        Parameters
+        ----------
+        frames : iterable
+            (input path, output path) frames tuples, typically a generator.
+
+        Yields
+        ------
+        tuple
+            Output path and read, stages and write timings, in seconds, of
+            each frame, in the frames order.
+        """
+
+        if self._processes == 1:
+            for input_path, output_path in frames:
+                yield self._collect(output_path,
+                                    self.process_frame(
+                                        input_path, output_path))
+
+            return
+
+        pool = multiprocessing.Pool(
+            self._processes,
+            initializer=_initialise_worker,
+            initargs=(self, ))
+        try:
+            pending = deque()
+            for input_path, output_path in frames:
+                pending.append((output_path,
+                                pool.apply_async(_process_frame_worker,
+                                                 (input_path, output_path))))
+
+                if len(pending) >= self._processes * self._prefetch:
+                    output_path, result = pending.popleft()
+                    yield self._collect(output_path, result.get())
+
+            while pending:
+                output_path, result = pending.popleft()
+                yield self._collect(output_path, result.get())
+
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
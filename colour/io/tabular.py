@@ -7,15 +7,18 @@ Defines various input / output objects for *CSV* tabular data files:
 
 -   :func:`colour.read_spectral_data_from_csv_file`
 -   :func:`colour.read_sds_from_csv_file`
+-   :func:`colour.read_multi_sd_from_csv_file`
 -   :func:`colour.write_sds_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 from collections import OrderedDict
 import csv
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import (MultiSpectralDistribution,
+                                SpectralDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
@@ -27,10 +30,74 @@ __status__ = 'Production'
 
 __all__ = [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'read_multi_sd_from_csv_file', 'write_sds_to_csv_file'
 ]
 
 
+def _read_spectral_array_from_csv_file(path,
+                                       delimiter=',',
+                                       fields=None,
+                                       default=0):
+    """
+    Reads the spectral data from given *CSV* file as a single array.
+
+    The numeric block is converted at once, the rows are only parsed one by
+    one with the :mod:`csv` module if the file uses quoting or has rows with
+    missing or invalid values. The missing or invalid values are replaced
+    with given default value, the rows are sorted by wavelength.
+
+    Returns
+    -------
+    tuple
+        Spectral data fields names, wavelengths field name, wavelengths
+        array and values array of shape (wavelengths, fields).
+
+    Raises
+    ------
+    ValueError
+        If a row wavelength is missing or invalid.
+    """
+
+    delimiter = str(delimiter)
+
+    with open(path, 'rU') as csv_file:
+        lines = [line for line in csv_file.read().splitlines() if line]
+
+    if fields is None:
+        fields, lines = next(csv.reader(lines[:1],
+                                        delimiter=delimiter)), lines[1:]
+    fields = list(fields)
+
+    if len(fields) == 1:
+        raise RuntimeError(('A "CSV" spectral data file should define '
+                            'the following fields: '
+                            '("wavelength", "field 1", ..., "field n")!'))
+
+    data = None
+    if (not any('"' in line for line in lines) and
+            all(line.count(delimiter) == len(fields) - 1 for line in lines)):
+        try:
+            data = np.array(
+                delimiter.join(lines).split(delimiter),
+                dtype=DEFAULT_FLOAT_DTYPE).reshape([len(lines), len(fields)])
+        except ValueError:
+            pass
+
+    if data is None:
+        data = np.full([len(lines), len(fields)], default, DEFAULT_FLOAT_DTYPE)
+        for i, row in enumerate(csv.reader(lines, delimiter=delimiter)):
+            data[i, 0] = DEFAULT_FLOAT_DTYPE(row[0])
+            for j, value in enumerate(row[1:len(fields)], 1):
+                try:
+                    data[i, j] = DEFAULT_FLOAT_DTYPE(value)
+                except ValueError:
+                    pass
+
+    data = data[np.argsort(data[:, 0], kind='mergesort')]
+
+    return fields[1:], fields[0], data[:, 0], data[:, 1:]
+
+
 def read_spectral_data_from_csv_file(path,
                                      delimiter=',',
                                      fields=None,
@@ -115,27 +182,11 @@ def read_spectral_data_from_csv_file(path,
      '24']
     """
 
-    with open(path, 'rU') as csv_file:
-        reader = csv.DictReader(
-            csv_file, delimiter=str(delimiter), fieldnames=fields)
-        if len(reader.fieldnames) == 1:
-            raise RuntimeError(('A "CSV" spectral data file should define '
-                                'the following fields: '
-                                '("wavelength", "field 1", ..., "field n")!'))
-
-        wavelength = reader.fieldnames[0]
-        fields = reader.fieldnames[1:]
-
-        data = OrderedDict(zip(fields, ({} for _ in range(len(fields)))))
-        for line in reader:
-            for field in fields:
-                try:
-                    value = DEFAULT_FLOAT_DTYPE(line[field])
-                except ValueError:
-                    value = default
+    fields, _wavelength, wavelengths, values = (
+        _read_spectral_array_from_csv_file(path, delimiter, fields, default))
 
-                data[field][DEFAULT_FLOAT_DTYPE(line[wavelength])] = value
-        return data
+    return OrderedDict((field, dict(zip(wavelengths, values[:, i])))
+                       for i, field in enumerate(fields))
 
 
 def read_sds_from_csv_file(path, delimiter=',', fields=None, default=0):
@@ -259,20 +310,78 @@ def read_sds_from_csv_file(path, delimiter=',', fields=None, default=0):
                          extrapolator_args={...})
     """
 
-    data = read_spectral_data_from_csv_file(path, delimiter, fields, default)
+    fields, _wavelength, wavelengths, values = (
+        _read_spectral_array_from_csv_file(path, delimiter, fields, default))
 
-    sds = OrderedDict(((key, SpectralDistribution(value, name=key))
-                       for key, value in data.items()))
+    sds = OrderedDict(((field,
+                        SpectralDistribution(
+                            values[:, i], wavelengths, name=field))
+                       for i, field in enumerate(fields)))
     return sds
 
 
+def read_multi_sd_from_csv_file(path,
+                                delimiter=',',
+                                fields=None,
+                                default=0,
+                                name=None):
+    """
+    Reads the spectral data from given *CSV* file and return its content as a
+    :class:`colour.MultiSpectralDistribution` class instance.
+
+    Contrary to :func:`colour.read_sds_from_csv_file` definition, the
+    spectral data values are directly used as the multi-spectral
+    distribution values, which is well suited to large reflectance databases.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used for as spectral data fields names.
+    default : numeric
+        Default value for fields row with missing value.
+    name : unicode, optional
+        Multi-spectral distribution name, default to the *CSV* file
+        wavelengths field name.
+
+    Returns
+    -------
+    MultiSpectralDistribution
+        Multi-spectral distribution of given *CSV* file.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> multi_sd = read_multi_sd_from_csv_file(csv_file)
+    >>> print(multi_sd.labels)  # doctest: +ELLIPSIS
+    ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', ...]
+    >>> multi_sd.values.shape
+    (81, 24)
+    """
+
+    fields, wavelength, wavelengths, values = (
+        _read_spectral_array_from_csv_file(path, delimiter, fields, default))
+
+    return MultiSpectralDistribution(
+        values,
+        wavelengths,
+        labels=fields,
+        name=wavelength if name is None else name)
+
+
 def write_sds_to_csv_file(sds, path, delimiter=',', fields=None):
     """
     Writes the given spectral distributions to given *CSV* file.
 
     Parameters
     ----------
-    sds : dict
+    sds : dict or MultiSpectralDistribution
         Spectral distributions to write.
     path : unicode
         Absolute *CSV* file path.
@@ -281,7 +390,7 @@ def write_sds_to_csv_file(sds, path, delimiter=',', fields=None):
     fields : array_like, optional
         *CSV* file spectral data fields names. If no value is provided the
         order of fields will be the one defined by the sorted spectral
-        distributions *dict*.
+        distributions *dict* or the multi-spectral distribution labels.
 
     Returns
     -------
@@ -294,27 +403,35 @@ def write_sds_to_csv_file(sds, path, delimiter=',', fields=None):
         If the given spectral distributions have different shapes.
     """
 
-    if len(sds) != 1:
-        shapes = [sd.shape for sd in sds.values()]
-        if not all(shape == shapes[0] for shape in shapes):
-            raise RuntimeError(('Cannot write spectral distributions '
-                                'with different shapes to "CSV" file!'))
+    if isinstance(sds, MultiSpectralDistribution):
+        labels = list(sds.labels)
+        fields = list(fields) if fields is not None else labels
+        wavelengths = sds.wavelengths
+        values = sds.values[:, [labels.index(field) for field in fields]]
+    else:
+        if len(sds) != 1:
+            shapes = [sd.shape for sd in sds.values()]
+            if not all(shape == shapes[0] for shape in shapes):
+                raise RuntimeError(('Cannot write spectral distributions '
+                                    'with different shapes to "CSV" file!'))
 
-    wavelengths = tuple(sds.values())[0].wavelengths
-    with open(path, 'w') as csv_file:
         fields = list(fields) if fields is not None else sorted(sds.keys())
-        writer = csv.DictWriter(
-            csv_file,
-            delimiter=str(delimiter),
-            fieldnames=['wavelength'] + fields,
-            lineterminator='\n')
-        # Python 2.7.x / 3.4.x only.
-        # writer.writeheader()
-        writer.writerow(dict((name, name) for name in writer.fieldnames))
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, sds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+        wavelengths = tuple(sds.values())[0].wavelengths
+        values = np.transpose([
+            sds[field].values if np.array_equal(
+                sds[field].wavelengths, wavelengths) else
+            sds[field][wavelengths] for field in fields
+        ])
+
+    delimiter = str(delimiter)
+
+    # "repr" gives the shortest representation round-tripping exactly.
+    rows = np.column_stack([wavelengths, values]).tolist()
+    with open(path, 'w') as csv_file:
+        csv.writer(
+            csv_file, delimiter=delimiter,
+            lineterminator='\n').writerow(['wavelength'] + fields)
+        csv_file.write(''.join(
+            delimiter.join(map(repr, row)) + '\n' for row in rows))
 
     return True
@@ -11,9 +11,11 @@ import shutil
 import unittest
 import tempfile
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import (MultiSpectralDistribution,
+                                SpectralDistribution, SpectralShape)
 from colour.io.ies_tm2714 import (IES_TM2714_Header,
-                                  SpectralDistribution_IESTM2714)
+                                  SpectralDistribution_IESTM2714,
+                                  read_multi_sd_from_IESTM2714_files)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,7 +27,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'FLUORESCENT_FILE_HEADER',
     'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION', 'FLUORESCENT_FILE_SPECTRAL_DATA',
-    'TestIES_TM2714_Header', 'TestIES_TM2714_Sd'
+    'TestIES_TM2714_Header', 'TestIES_TM2714_Sd',
+    'TestReadMultiSdFromIESTM2714Files'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -251,5 +254,94 @@ class TestIES_TM2714_Sd(unittest.TestCase):
         self.assertEquals(sd_r, sd_t)
 
 
+class TestReadMultiSdFromIESTM2714Files(unittest.TestCase):
+    """
+    Defines :func:`colour.io.iestm2714.read_multi_sd_from_IESTM2714_files`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        sd = SpectralDistribution_IESTM2714(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        sd.read()
+        for i in range(3):
+            sd.path = os.path.join(self._temporary_directory,
+                                   'Fluorescent_{0}.spdx'.format(i))
+            sd.header.description = 'Lamp {0}'.format(i)
+            sd.values = sd.values * 2
+            sd.write()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_multi_sd_from_IESTM2714_files(self):
+        """
+        Tests :func:`colour.io.iestm2714.read_multi_sd_from_IESTM2714_files`
+        definition.
+        """
+
+        sd = SpectralDistribution(FLUORESCENT_FILE_SPECTRAL_DATA)
+
+        for processes in (1, 2):
+            multi_sd, metadata = read_multi_sd_from_IESTM2714_files(
+                self._temporary_directory, processes=processes)
+
+            self.assertIsInstance(multi_sd, MultiSpectralDistribution)
+            self.assertListEqual(
+                multi_sd.labels,
+                ['Fluorescent_{0}'.format(i) for i in range(3)])
+            np.testing.assert_array_equal(multi_sd.wavelengths, sd.domain)
+            for i in range(3):
+                np.testing.assert_almost_equal(
+                    multi_sd.values[:, i], sd.values * 2 ** (i + 1),
+                    decimal=7)
+
+            self.assertListEqual(list(metadata), multi_sd.labels)
+            self.assertEqual(metadata['Fluorescent_1']['description'],
+                             'Lamp 1')
+            self.assertEqual(metadata['Fluorescent_1']['spectral_quantity'],
+                             'relative')
+            self.assertEqual(metadata['Fluorescent_1']['bandwidth_FWHM'], 2)
+            self.assertTrue(metadata['Fluorescent_1']['bandwidth_corrected'])
+
+    def test_raise_exception_read_multi_sd_from_IESTM2714_files(self):
+        """
+        Tests :func:`colour.io.iestm2714.read_multi_sd_from_IESTM2714_files`
+        definition raised exception and *shape* argument.
+        """
+
+        sd = SpectralDistribution_IESTM2714(
+            os.path.join(self._temporary_directory, 'Uniform.spdx'),
+            spectral_quantity='relative',
+            bandwidth_FWHM=5)
+        sd.wavelengths = np.arange(400, 701, 5)
+        sd.values = np.linspace(0, 1, 61)
+        sd.write()
+
+        self.assertRaises(
+            ValueError,
+            lambda: read_multi_sd_from_IESTM2714_files(
+                self._temporary_directory, processes=1))
+
+        multi_sd, _metadata = read_multi_sd_from_IESTM2714_files(
+            self._temporary_directory, SpectralShape(400, 700, 10), 1)
+        self.assertEqual(multi_sd.shape, SpectralShape(400, 700, 10))
+        self.assertEqual(len(multi_sd.labels), 4)
+
+        self.assertRaises(
+            AssertionError,
+            lambda: read_multi_sd_from_IESTM2714_files([]))
+
+
 if __name__ == '__main__':
     unittest.main()
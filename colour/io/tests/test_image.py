@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.image` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.io import (convert_bit_depth, read_image_scanlines, read_image,
+                       write_image_scanlines, write_image)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestConvertBitDepth', 'TestReadImageScanlines', 'TestReadImage',
+    'TestWriteImageScanlines', 'TestWriteImage'
+]
+
+IMAGE = np.reshape(np.linspace(0, 1.5, 10 * 7 * 3), (10, 7, 3))
+
+
+class TestConvertBitDepth(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.convert_bit_depth` definition unit tests
+    methods.
+    """
+
+    def test_convert_bit_depth(self):
+        """
+        Tests :func:`colour.io.image.convert_bit_depth` definition.
+        """
+
+        a = np.array([-0.5, 0.0, 0.5, 1.0, 1.5])
+        b = a.copy()
+
+        np.testing.assert_equal(
+            convert_bit_depth(a, 'uint8'),
+            np.array([0, 0, 127, 255, 255], dtype=np.uint8))
+
+        np.testing.assert_equal(
+            convert_bit_depth(a, 'uint16'),
+            np.array([0, 0, 32767, 65535, 65535], dtype=np.uint16))
+
+        self.assertEqual(convert_bit_depth(a, 'float16').dtype, np.float16)
+        np.testing.assert_equal(convert_bit_depth(a, 'float32'), a)
+
+        np.testing.assert_equal(a, b)
+
+    def test_convert_bit_depth_out(self):
+        """
+        Tests :func:`colour.io.image.convert_bit_depth` definition *out*
+        argument.
+        """
+
+        a = np.array([0.0, 0.5, 1.0])
+        out = np.zeros(3, np.uint8)
+        self.assertIs(convert_bit_depth(a, 'uint8', out), out)
+        np.testing.assert_equal(out, np.array([0, 127, 255]))
+
+
+class TestReadImageScanlines(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image_scanlines` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_image_scanlines(self):
+        """
+        Tests :func:`colour.io.image.read_image_scanlines` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Image.pfm')
+        write_image(IMAGE, path)
+
+        blocks = list(read_image_scanlines(path, scanlines=4))
+        self.assertListEqual([y for y, _block in blocks], [0, 4, 8])
+        self.assertListEqual([len(block) for _y, block in blocks], [4, 4, 2])
+        np.testing.assert_almost_equal(
+            np.concatenate([block for _y, block in blocks]),
+            IMAGE,
+            decimal=7)
+
+        blocks = list(read_image_scanlines(path, 'uint8', 3))
+        np.testing.assert_equal(
+            np.concatenate([block for _y, block in blocks]),
+            convert_bit_depth(IMAGE.astype(np.float32), 'uint8'))
+
+        path = os.path.join(self._temporary_directory, 'Single.pfm')
+        write_image(IMAGE[..., 0], path)
+        for y, block in read_image_scanlines(path, scanlines=5):
+            np.testing.assert_almost_equal(
+                block, IMAGE[y:y + 5, :, 0], decimal=7)
+
+
+class TestReadImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_image(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Image.pfm')
+        write_image(IMAGE, path)
+
+        image = read_image(path)
+        self.assertEqual(image.dtype, np.float32)
+        np.testing.assert_almost_equal(image, IMAGE, decimal=7)
+
+        image, attributes = read_image(path, 'uint16', True)
+        np.testing.assert_equal(
+            image, convert_bit_depth(IMAGE.astype(np.float32), 'uint16'))
+        self.assertListEqual(attributes, [])
+
+        with open(path, 'rb') as file_handle:
+            data = file_handle.read()
+
+        # Big endian file with the header split on multiple lines.
+        path = os.path.join(self._temporary_directory, 'Big.pfm')
+        with open(path, 'wb') as file_handle:
+            file_handle.write(b'PF\n7\n10\n1.0\n')
+            file_handle.write(
+                np.frombuffer(data[data.index(b'-1.0\n') + 5:],
+                              '<f4').astype('>f4').tobytes())
+
+        np.testing.assert_almost_equal(read_image(path), IMAGE, decimal=7)
+
+        path = os.path.join(self._temporary_directory, 'Invalid.pfm')
+        with open(path, 'wb') as file_handle:
+            file_handle.write(b'P6\n7 10\n255\n')
+
+        self.assertRaises(ValueError, lambda: read_image(path))
+
+
+class TestWriteImageScanlines(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.write_image_scanlines` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_image_scanlines(self):
+        """
+        Tests :func:`colour.io.image.write_image_scanlines` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Image.pfm')
+        write_image(IMAGE, path)
+
+        path_streamed = os.path.join(self._temporary_directory,
+                                     'Streamed.pfm')
+        blocks = (block * 2
+                  for _y, block in read_image_scanlines(path, scanlines=3))
+        self.assertTrue(
+            write_image_scanlines(blocks, path_streamed, IMAGE.shape))
+
+        np.testing.assert_almost_equal(
+            read_image(path_streamed), IMAGE * 2, decimal=6)
+
+        self.assertRaises(
+            ValueError, lambda: write_image_scanlines(
+                [IMAGE[:4]], path_streamed, IMAGE.shape))
+
+        self.assertRaises(
+            ValueError, lambda: write_image_scanlines(
+                [IMAGE, IMAGE[:1]], path_streamed, IMAGE.shape))
+
+        self.assertRaises(
+            ValueError, lambda: write_image_scanlines(
+                [IMAGE], path_streamed, IMAGE.shape, 'uint8'))
+
+
+class TestWriteImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.write_image` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_image(self):
+        """
+        Tests :func:`colour.io.image.write_image` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Image.pfm')
+        image = IMAGE.copy()
+        self.assertTrue(write_image(image, path))
+        np.testing.assert_equal(image, IMAGE)
+
+        with open(path, 'rb') as file_handle:
+            self.assertTrue(file_handle.read().startswith(b'PF\n7 10\n-1.0\n'))
+
+        self.assertRaises(
+            ValueError, lambda: write_image(
+                np.zeros([4, 4, 4]),
+                os.path.join(self._temporary_directory, 'RGBA.pfm')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.pipeline` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+from functools import partial
+
+from colour.io import ImagePipeline, LUT3D, read_image, write_image
+from colour.models import decoding_cctf, encoding_cctf
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['STAGES', 'TestImagePipeline']
+
+STAGES = [
+    partial(decoding_cctf, function='sRGB'),
+    ('Exposure', partial(np.multiply, 0.5)),
+    LUT3D(size=9).apply,
+    partial(encoding_cctf, function='sRGB'),
+]
+
+
+class TestImagePipeline(unittest.TestCase):
+    """
+    Defines :class:`colour.io.pipeline.ImagePipeline` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._frames = []
+        for i in range(5):
+            input_path = os.path.join(self._temporary_directory,
+                                      'Input.{0:04d}.pfm'.format(i))
+            output_path = os.path.join(self._temporary_directory,
+                                       'Output.{0:04d}.pfm'.format(i))
+            write_image(
+                np.reshape(np.linspace(0, 1, 8 * 6 * 3), (8, 6, 3)) * i / 4,
+                input_path)
+            self._frames.append((input_path, output_path))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('stages', 'read_bit_depth', 'write_bit_depth',
+                               'processes', 'prefetch', 'timings')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ImagePipeline))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'apply', 'process_frame', 'process')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ImagePipeline))
+
+    def test_stages(self):
+        """
+        Tests :attr:`colour.io.pipeline.ImagePipeline.stages` property.
+        """
+
+        pipeline = ImagePipeline(STAGES)
+        self.assertListEqual([name for name, _function in pipeline.stages], [
+            'decoding_cctf', 'Exposure', 'LUT3D.apply', 'encoding_cctf'
+        ])
+
+        self.assertRaises(AssertionError, lambda: ImagePipeline([1]))
+        self.assertRaises(AssertionError,
+                          lambda: ImagePipeline(STAGES, processes=0))
+        self.assertRaises(AssertionError,
+                          lambda: ImagePipeline(STAGES, prefetch=0))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.io.pipeline.ImagePipeline.apply` method.
+        """
+
+        RGB = np.array([0.25, 0.50, 0.75])
+        timings = {}
+        np.testing.assert_almost_equal(
+            ImagePipeline(STAGES).apply(RGB, timings),
+            encoding_cctf(decoding_cctf(RGB, 'sRGB') * 0.5, 'sRGB'),
+            decimal=7)
+        self.assertSetEqual(
+            set(timings),
+            set(['decoding_cctf', 'Exposure', 'LUT3D.apply', 'encoding_cctf']))
+
+    def test_process(self):
+        """
+        Tests :meth:`colour.io.pipeline.ImagePipeline.process` method.
+        """
+
+        for processes in (1, 2):
+            pipeline = ImagePipeline(STAGES, processes=processes, prefetch=1)
+            results = list(pipeline.process(iter(self._frames)))
+
+            self.assertListEqual([path for path, _timings in results],
+                                 [output for _input, output in self._frames])
+            for input_path, output_path in self._frames:
+                np.testing.assert_almost_equal(
+                    read_image(output_path),
+                    pipeline.apply(read_image(input_path)),
+                    decimal=6)
+
+            self.assertListEqual(
+                list(pipeline.timings), [
+                    'read', 'decoding_cctf', 'Exposure', 'LUT3D.apply',
+                    'encoding_cctf', 'write'
+                ])
+            self.assertAlmostEqual(
+                pipeline.timings['read'],
+                sum(timings['read'] for _path, timings in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,11 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import (MultiSpectralDistribution,
+                                SpectralDistribution)
 from colour.io import (read_spectral_data_from_csv_file,
-                       read_sds_from_csv_file, write_sds_to_csv_file)
+                       read_sds_from_csv_file, read_multi_sd_from_csv_file,
+                       write_sds_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -26,7 +28,7 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
     'TestReadSpectralDataFromCsvFile', 'TestReadSdsFromCsvFile',
-    'TestWriteSdsToCsvFile'
+    'TestReadMultiSdFromCsvFile', 'TestWriteSdsToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -169,6 +171,94 @@ class TestReadSdsFromCsvFile(unittest.TestCase):
                              COLOURCHECKER_N_OHTA_1, name='1'))
 
 
+class TestReadMultiSdFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_multi_sd_from_csv_file` definition
+    units tests methods.
+    """
+
+    def test_read_multi_sd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_sd_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_sd = read_multi_sd_from_csv_file(colour_checker_n_ohta)
+        self.assertIsInstance(multi_sd, MultiSpectralDistribution)
+        self.assertListEqual(multi_sd.labels,
+                             [text_type(x) for x in range(1, 25)])
+        np.testing.assert_equal(multi_sd.wavelengths,
+                                sorted(COLOURCHECKER_N_OHTA_1))
+        np.testing.assert_equal(multi_sd.values[:, 0], [
+            COLOURCHECKER_N_OHTA_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_N_OHTA_1)
+        ])
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        multi_sd = read_multi_sd_from_csv_file(
+            linss2_10e_5,
+            fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+            default=-1,
+            name='LMS')
+        self.assertEqual(multi_sd.name, 'LMS')
+        self.assertEqual(multi_sd[760][2], -1)
+
+    def test_unsorted_read_multi_sd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_sd_from_csv_file`
+        definition with unsorted rows.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            rows = [(400 + 10 * i, 0.1 * i, 0.05 * i ** 2) for i in range(7)]
+            paths = []
+            for name, order in (('sorted', rows), ('unsorted', rows[::-1])):
+                paths.append(
+                    os.path.join(temporary_directory, '{0}.csv'.format(name)))
+                with open(paths[-1], 'w') as csv_file:
+                    csv_file.write('wavelength,a,b\n')
+                    for row in order:
+                        csv_file.write('{0},{1},{2}\n'.format(*row))
+
+            multi_sd = read_multi_sd_from_csv_file(paths[1])
+            np.testing.assert_equal(multi_sd.wavelengths,
+                                    [row[0] for row in rows])
+            np.testing.assert_almost_equal(
+                multi_sd.values, [row[1:] for row in rows], decimal=7)
+
+            sds = read_sds_from_csv_file(paths[1])
+            sds_sorted = read_sds_from_csv_file(paths[0])
+            np.testing.assert_equal(sds['b'].wavelengths,
+                                    [row[0] for row in rows])
+            np.testing.assert_almost_equal(
+                sds['b'][405], sds_sorted['b'][405], decimal=7)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+    def test_raise_exception_read_multi_sd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_sd_from_csv_file`
+        definition raised exception.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'invalid.csv')
+            with open(path, 'w') as csv_file:
+                csv_file.write('wavelength,a,b\n'
+                               '400,0.1,0.4\n'
+                               'bad,0.3,0.4\n'
+                               '420,0.3,0.6\n')
+
+            self.assertRaises(ValueError, read_multi_sd_from_csv_file, path)
+            self.assertRaises(ValueError, read_sds_from_csv_file, path)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
 class TestWriteSdsToCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.write_sds_to_csv_file` definition units
@@ -218,6 +308,19 @@ class TestWriteSdsToCsvFile(unittest.TestCase):
         sds_test = read_sds_from_csv_file(colour_checker_n_ohta_test)
         self.assertEqual(len(sds_test), 1)
 
+        multi_sd = read_multi_sd_from_csv_file(colour_checker_n_ohta)
+        write_sds_to_csv_file(multi_sd, colour_checker_n_ohta_test)
+        multi_sd_test = read_multi_sd_from_csv_file(colour_checker_n_ohta_test)
+        np.testing.assert_equal(multi_sd_test.values, multi_sd.values)
+        self.assertListEqual(multi_sd_test.labels, multi_sd.labels)
+
+        write_sds_to_csv_file(
+            multi_sd, colour_checker_n_ohta_test, fields=['2', '1'])
+        multi_sd_test = read_multi_sd_from_csv_file(colour_checker_n_ohta_test)
+        self.assertListEqual(multi_sd_test.labels, ['2', '1'])
+        np.testing.assert_equal(multi_sd_test.values,
+                                multi_sd.values[:, [1, 0]])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.io.xrite` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
 import unittest
 
-from colour.colorimetry import SpectralDistribution
-from colour.io import read_sds_from_xrite_file
+from colour.colorimetry import MultiSpectralDistribution, SpectralDistribution
+from colour.io import (SpectralDistributionsView,
+                       read_multi_sd_from_xrite_file, read_sds_from_xrite_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +21,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSdsFromXRiteFile'
+    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSdsFromXRiteFile',
+    'TestReadMultiSdFromXRiteFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -85,6 +88,58 @@ class TestReadSdsFromXRiteFile(unittest.TestCase):
                          SpectralDistribution(
                              COLOURCHECKER_XRITE_1, name='X1'))
 
+    def test_lazy_read_sds_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_sds_from_xrite_file` definition
+        *lazy* argument.
+        """
+
+        colour_checker_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                            'xrite_digital_colour_checker.txt')
+        sds = read_sds_from_xrite_file(colour_checker_xrite, lazy=True)
+        self.assertIsInstance(sds, SpectralDistributionsView)
+        self.assertEqual(len(sds), 10)
+        self.assertListEqual(
+            list(sds), ['X{0}'.format(i) for i in range(1, 11)])
+        self.assertTupleEqual(sds.array.shape, (10, 36))
+
+        self.assertEqual(sds['X1'],
+                         SpectralDistribution(
+                             COLOURCHECKER_XRITE_1, name='X1'))
+        self.assertIs(sds['X1'], sds['X1'])
+        self.assertRaises(KeyError, lambda: sds['X11'])
+
+        self.assertDictEqual(
+            dict(sds), dict(read_sds_from_xrite_file(colour_checker_xrite)))
+
+
+class TestReadMultiSdFromXRiteFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.read_multi_sd_from_xrite_file` definition
+    units tests methods.
+    """
+
+    def test_read_multi_sd_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_multi_sd_from_xrite_file`
+        definition.
+        """
+
+        colour_checker_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                            'xrite_digital_colour_checker.txt')
+        multi_sd = read_multi_sd_from_xrite_file(colour_checker_xrite,
+                                                 'ColorChecker')
+        self.assertIsInstance(multi_sd, MultiSpectralDistribution)
+        self.assertEqual(multi_sd.name, 'ColorChecker')
+        self.assertListEqual(multi_sd.labels,
+                             ['X{0}'.format(i) for i in range(1, 11)])
+        np.testing.assert_almost_equal(multi_sd.wavelengths,
+                                       sorted(COLOURCHECKER_XRITE_1))
+        np.testing.assert_almost_equal(multi_sd.values[:, 0], [
+            COLOURCHECKER_XRITE_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_XRITE_1)
+        ])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,19 +3,22 @@
 X-Rite Data Input
 =================
 
-Defines input object for *X-Rite* spectral data files:
+Defines input objects for *X-Rite* / *CGATS* spectral data files:
 
 -   :func:`colour.read_sds_from_xrite_file`
+-   :func:`colour.read_multi_sd_from_xrite_file`
 """
 
 from __future__ import division, unicode_literals
 
 import codecs
+import numpy as np
 import re
 from collections import OrderedDict
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import MultiSpectralDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.common import SpectralDistributionsView
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,12 +27,70 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XRITE_FILE_ENCODING', 'read_sds_from_xrite_file']
+__all__ = [
+    'XRITE_FILE_ENCODING', 'read_sds_from_xrite_file',
+    'read_multi_sd_from_xrite_file'
+]
 
 XRITE_FILE_ENCODING = 'utf-8'
 
 
-def read_sds_from_xrite_file(path):
+def _read_spectral_array_from_xrite_file(path):
+    """
+    Reads the spectral data from given *X-Rite* / *CGATS* file as a single
+    array.
+
+    The data block is converted at once, the lines are only parsed one by one
+    if they do not all have the same tokens count as the data format, e.g.
+    because of quoted names containing whitespaces.
+
+    Returns
+    -------
+    tuple
+        Patches names, wavelengths array and values array of shape
+        (patches, wavelengths).
+    """
+
+    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
+        content = xrite_file.read()
+
+    def block(begin, end):
+        """
+        Returns the lines between given begin and end keywords.
+        """
+
+        match = re.search(
+            '^\\s*{0}\\s*$(.*?)^\\s*{1}\\s*$'.format(begin, end), content,
+            re.MULTILINE | re.DOTALL)
+
+        return [] if match is None else [
+            line for line in match.group(1).strip().splitlines()
+            if line.strip()
+        ]
+
+    data_format = ' '.join(block('BEGIN_DATA_FORMAT', 'END_DATA_FORMAT'))
+    fields = data_format.split()
+    wavelengths = np.array(
+        re.findall('nm(\\d+)', data_format), dtype=DEFAULT_FLOAT_DTYPE)
+    index = len(wavelengths)
+
+    lines = block('BEGIN_DATA', 'END_DATA')
+    tokens = ' '.join(lines).split()
+    if fields and len(tokens) == len(lines) * len(fields):
+        tokens = np.array(tokens).reshape([len(lines), len(fields)])
+        names = tokens[:, 1].tolist()
+        values = tokens[:, -index:].astype(DEFAULT_FLOAT_DTYPE)
+    else:
+        tokens = [line.split() for line in lines]
+        names = [line_tokens[1] for line_tokens in tokens]
+        values = np.array(
+            [line_tokens[-index:] for line_tokens in tokens],
+            dtype=DEFAULT_FLOAT_DTYPE).reshape([len(lines), index])
+
+    return names, wavelengths, values
+
+
+def read_sds_from_xrite_file(path, lazy=False):
     """
     Reads the spectral data from given *X-Rite* file and returns it as an
     *OrderedDict* of :class:`colour.SpectralDistribution` classes.
@@ -38,16 +99,22 @@ def read_sds_from_xrite_file(path):
     ----------
     path : unicode
         Absolute *X-Rite* file path.
+    lazy : bool, optional
+        Whether to return a :class:`colour.io.SpectralDistributionsView`
+        class instance creating the :class:`colour.SpectralDistribution`
+        class instances only when accessed, which is well suited to files
+        with many patches.
 
     Returns
     -------
-    OrderedDict
+    OrderedDict or SpectralDistributionsView
         :class:`colour.SpectralDistribution` classes of given *X-Rite*
         file.
 
     Notes
     -----
     -   This parser is minimalistic and absolutely not bullet proof.
+    -   The patches names are read from the second column of the data block.
 
     Examples
     --------
@@ -61,37 +128,44 @@ def read_sds_from_xrite_file(path):
     ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
     """
 
-    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
-        lines = xrite_file.read().strip().split('\n')
+    sds = SpectralDistributionsView(
+        *_read_spectral_array_from_xrite_file(path))
 
-        xrite_sds = OrderedDict()
-        is_spectral_data_format, is_spectral_data = False, False
-        for line in lines:
-            line = line.strip()
+    return sds if lazy else OrderedDict(sds.items())
 
-            if line == 'END_DATA_FORMAT':
-                is_spectral_data_format = False
 
-            if line == 'END_DATA':
-                is_spectral_data = False
+def read_multi_sd_from_xrite_file(path, name=None):
+    """
+    Reads the spectral data from given *X-Rite* file and returns it as a
+    :class:`colour.MultiSpectralDistribution` class instance whose labels are
+    the patches names.
 
-            if is_spectral_data_format:
-                wavelengths = [
-                    DEFAULT_FLOAT_DTYPE(x)
-                    for x in re.findall('nm(\\d+)', line)
-                ]
-                index = len(wavelengths)
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* file path.
+    name : unicode, optional
+        Multi-spectral distribution name.
 
-            if is_spectral_data:
-                tokens = line.split()
-                values = [DEFAULT_FLOAT_DTYPE(x) for x in tokens[-index:]]
-                xrite_sds[tokens[1]] = (SpectralDistribution(
-                    dict(zip(wavelengths, values)), name=tokens[1]))
+    Returns
+    -------
+    MultiSpectralDistribution
+        Multi-spectral distribution of given *X-Rite* file.
 
-            if line == 'BEGIN_DATA_FORMAT':
-                is_spectral_data_format = True
+    Examples
+    --------
+    >>> import os
+    >>> xrite_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'xrite_digital_colour_checker.txt')
+    >>> multi_sd = read_multi_sd_from_xrite_file(xrite_file)
+    >>> print(multi_sd.labels)
+    ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
+    >>> multi_sd.values.shape
+    (36, 10)
+    """
 
-            if line == 'BEGIN_DATA':
-                is_spectral_data = True
+    names, wavelengths, values = _read_spectral_array_from_xrite_file(path)
 
-        return xrite_sds
+    return MultiSpectralDistribution(
+        np.transpose(values), wavelengths, labels=names, name=name)
@@ -27,7 +27,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.algebra import cartesian_to_polar, polar_to_cartesian, spow
+from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
@@ -47,7 +47,8 @@ __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 def XYZ_to_Lab(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\\*a\\*b\\**
     colourspace.
@@ -59,6 +60,9 @@ def XYZ_to_Lab(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE L\\*a\\*b\\** colourspace array into,
+        allowing repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -101,28 +105,38 @@ def XYZ_to_Lab(
 
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
-    XYZ_f = XYZ / XYZ_r
+    if out is None:
+        out = np.empty(np.broadcast(XYZ, XYZ_r).shape, XYZ.dtype)
 
-    XYZ_f = np.where(
-        XYZ_f > CIE_E,
-        spow(XYZ_f, 1 / 3),
-        (CIE_K * XYZ_f + 16) / 116,
-    )
+    L, a, b = out[..., 0], out[..., 1], out[..., 2]
 
-    X_f, Y_f, Z_f = tsplit(XYZ_f)
+    # The output channels first store the :math:`f(Y/Y_r)`, :math:`f(X/X_r)`
+    # and :math:`f(Z/Z_r)` values so that the computations happen in place.
+    np.divide(XYZ[..., 1], XYZ_r[..., 1], out=L)
+    np.divide(XYZ[..., 0], XYZ_r[..., 0], out=a)
+    np.divide(XYZ[..., 2], XYZ_r[..., 2], out=b)
 
-    L = 116 * Y_f - 16
-    a = 500 * (X_f - Y_f)
-    b = 200 * (Y_f - Z_f)
+    cube_root = out > CIE_E
+    np.power(out, 1 / 3, out=out, where=cube_root)
+    linear = np.logical_not(cube_root, out=cube_root)
+    np.multiply(out, CIE_K, out=out, where=linear)
+    np.add(out, 16, out=out, where=linear)
+    np.divide(out, 116, out=out, where=linear)
 
-    Lab = tstack([L, a, b])
+    np.subtract(L, b, out=b)
+    b *= 200
+    np.subtract(a, L, out=a)
+    a *= 500
+    L *= 116
+    L -= 16
 
-    return from_range_100(Lab)
+    return from_range_100(out)
 
 
 def Lab_to_XYZ(
         Lab,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE L\\*a\\*b\\** colourspace to *CIE XYZ* tristimulus
     values.
@@ -134,6 +148,9 @@ def Lab_to_XYZ(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE XYZ* tristimulus values into, allowing
+        repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -172,21 +189,40 @@ def Lab_to_XYZ(
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    L, a, b = tsplit(to_domain_100(Lab))
+    Lab = to_domain_100(Lab)
+    L, a, b = Lab[..., 0], Lab[..., 1], Lab[..., 2]
 
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
-    f_y = (L + 16) / 116
-    f_x = a / 500 + f_y
-    f_z = f_y - b / 200
+    if out is None:
+        out = np.empty(np.broadcast(Lab, XYZ_r).shape, Lab.dtype)
+
+    f_x, f_y, f_z = out[..., 0], out[..., 1], out[..., 2]
+
+    np.add(L, 16, out=f_y)
+    f_y /= 116
+    np.divide(a, 500, out=f_x)
+    f_x += f_y
+    np.divide(b, 200, out=f_z)
+    np.subtract(f_y, f_z, out=f_z)
+
+    # :math:`f^3 > \\epsilon` is equivalent to :math:`f > \\epsilon^{1/3}`,
+    # the latter does not require a temporary array.
+    f_xz = out[..., ::2]
+    cube = f_xz > CIE_E ** (1 / 3)
+    np.power(f_xz, 3, out=f_xz, where=cube)
+    linear = np.logical_not(cube, out=cube)
+    np.multiply(f_xz, 116, out=f_xz, where=linear)
+    np.subtract(f_xz, 16, out=f_xz, where=linear)
+    np.divide(f_xz, CIE_K, out=f_xz, where=linear)
 
-    x_r = np.where(f_x ** 3 > CIE_E, f_x ** 3, (116 * f_x - 16) / CIE_K)
-    y_r = np.where(L > CIE_K * CIE_E, ((L + 16) / 116) ** 3, L / CIE_K)
-    z_r = np.where(f_z ** 3 > CIE_E, f_z ** 3, (116 * f_z - 16) / CIE_K)
+    cube = L > CIE_K * CIE_E
+    np.power(f_y, 3, out=f_y, where=cube)
+    np.divide(L, CIE_K, out=f_y, where=~cube)
 
-    XYZ = tstack([x_r, y_r, z_r]) * XYZ_r
+    out *= XYZ_r
 
-    return from_range_1(XYZ)
+    return from_range_1(out)
 
 
 def Lab_to_LCHab(Lab):
@@ -38,7 +38,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.algebra import cartesian_to_polar, polar_to_cartesian, spow
+from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
@@ -61,7 +61,8 @@ __all__ = [
 
 def XYZ_to_Luv(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\\*u\\*v\\**
     colourspace.
@@ -73,6 +74,9 @@ def XYZ_to_Luv(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE L\\*u\\*v\\** colourspace array into,
+        allowing repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -111,22 +115,43 @@ def XYZ_to_Luv(
     array([ 41.5278752...,  96.8362605...,  17.7521014...])
     """
 
-    X, Y, Z = tsplit(to_domain_1(XYZ))
+    XYZ = to_domain_1(XYZ)
+    X, Y, Z = XYZ[..., 0], XYZ[..., 1], XYZ[..., 2]
 
-    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    X_r, Y_r, Z_r = tsplit(XYZ_r)
 
-    y_r = Y / Y_r
+    if out is None:
+        out = np.empty(np.broadcast(XYZ, XYZ_r).shape, XYZ.dtype)
 
-    L = np.where(y_r > CIE_E, 116 * spow(y_r, 1 / 3) - 16, CIE_K * y_r)
+    L, u, v = out[..., 0], out[..., 1], out[..., 2]
 
-    u = (13 * L * ((4 * X / (X + 15 * Y + 3 * Z)) -
-                   (4 * X_r / (X_r + 15 * Y_r + 3 * Z_r))))
-    v = (13 * L * ((9 * Y / (X + 15 * Y + 3 * Z)) -
-                   (9 * Y_r / (X_r + 15 * Y_r + 3 * Z_r))))
+    np.divide(Y, Y_r, out=L)
+    cube_root = L > CIE_E
+    np.power(L, 1 / 3, out=L, where=cube_root)
+    np.multiply(L, 116, out=L, where=cube_root)
+    np.subtract(L, 16, out=L, where=cube_root)
+    np.multiply(L, CIE_K, out=L, where=~cube_root)
 
-    Luv = tstack([L, u, v])
+    # The *v* channel stores the :math:`X + 15Y + 3Z` denominator first.
+    np.multiply(Y, 15, out=v)
+    v += X
+    np.multiply(Z, 3, out=u)
+    v += u
+
+    np.multiply(X, 4, out=u)
+    u /= v
+    u -= 4 * X_r / (X_r + 15 * Y_r + 3 * Z_r)
+    u *= L
+    u *= 13
+
+    np.divide(Y, v, out=v)
+    v *= 9
+    v -= 9 * Y_r / (X_r + 15 * Y_r + 3 * Z_r)
+    v *= L
+    v *= 13
 
-    return from_range_100(Luv)
+    return from_range_100(out)
 
 
 def Luv_to_XYZ(
@@ -34,9 +34,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_float_array, from_range_1, to_domain_1,
-                              tsplit, tstack)
+from colour.utilities import (as_float_array, from_range_1,
+                              get_default_float_dtype, to_domain_1, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -53,7 +53,8 @@ __all__ = [
 
 def XYZ_to_xyY(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE xyY* colourspace and
     reference *illuminant*.
@@ -64,6 +65,9 @@ def XYZ_to_xyY(
         *CIE XYZ* tristimulus values.
     illuminant : array_like, optional
         Reference *illuminant* chromaticity coordinates.
+    out : ndarray, optional
+        Array to write the *CIE xyY* colourspace array into, allowing
+        repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -97,20 +101,27 @@ def XYZ_to_xyY(
     """
 
     XYZ = to_domain_1(XYZ)
-    X, Y, Z = tsplit(XYZ)
+    X, Y, Z = XYZ[..., 0], XYZ[..., 1], XYZ[..., 2]
     xy_w = as_float_array(illuminant)
 
-    XYZ_n = np.zeros(XYZ.shape)
-    XYZ_n[..., 0:2] = xy_w
+    if out is None:
+        out = np.empty(XYZ.shape, XYZ.dtype)
 
-    xyY = np.where(
-        np.all(XYZ == 0, axis=-1)[..., np.newaxis],
-        XYZ_n,
-        tstack([X / (X + Y + Z), Y / (X + Y + Z),
-                from_range_1(Y)]),
-    )
+    x, y, Y_o = out[..., 0], out[..., 1], out[..., 2]
 
-    return xyY
+    # The output *Y* channel stores the :math:`X + Y + Z` sum first.
+    np.add(X, Y, out=Y_o)
+    Y_o += Z
+    np.divide(X, Y_o, out=x)
+    np.divide(Y, Y_o, out=y)
+    Y_o[...] = Y
+    from_range_1(Y_o)
+
+    black = np.all(XYZ == 0, axis=-1)
+    np.copyto(out[..., 0:2], xy_w, where=black[..., np.newaxis])
+    np.copyto(Y_o, 0, where=black)
+
+    return out
 
 
 def xyY_to_XYZ(xyY):
@@ -288,7 +299,7 @@ def xy_to_xyY(xy, Y=1):
 
     x, y = tsplit(xy)
 
-    Y = np.full(x.shape, from_range_1(Y), DEFAULT_FLOAT_DTYPE)
+    Y = np.full(x.shape, from_range_1(Y), get_default_float_dtype())
     xyY = tstack([x, y, Y])
 
     return xyY
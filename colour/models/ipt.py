@@ -81,7 +81,7 @@ IPT_IPT_TO_LMS_MATRIX : array_like, (3, 3)
 """
 
 
-def XYZ_to_IPT(XYZ):
+def XYZ_to_IPT(XYZ, out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *IPT* colourspace.
 
@@ -89,6 +89,9 @@ def XYZ_to_IPT(XYZ):
     ----------
     XYZ : array_like
         *CIE XYZ* tristimulus values.
+    out : ndarray, optional
+        Array to write the *IPT* colourspace array into, allowing repeated
+        conversions without allocating the output array.
 
     Returns
     -------
@@ -130,9 +133,11 @@ def XYZ_to_IPT(XYZ):
 
     XYZ = to_domain_1(XYZ)
 
-    LMS = dot_vector(IPT_XYZ_TO_LMS_MATRIX, XYZ)
-    LMS_prime = spow(LMS, 0.43)
-    IPT = dot_vector(IPT_LMS_TO_IPT_MATRIX, LMS_prime)
+    # The domain-scaled input array and the output array are alternately used
+    # as source and destination of the computations.
+    LMS = dot_vector(IPT_XYZ_TO_LMS_MATRIX, XYZ, out=out)
+    LMS_prime = spow(LMS, 0.43, out=XYZ)
+    IPT = dot_vector(IPT_LMS_TO_IPT_MATRIX, LMS_prime, out=LMS)
 
     return from_range_1(IPT)
 
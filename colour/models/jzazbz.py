@@ -101,7 +101,7 @@ JZAZBZ_IZAZBZ_TO_LMS_P_MATRIX : array_like, (3, 3)
 """
 
 
-def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
+def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS, out=None):
     """
     Converts from *CIE XYZ* tristimulus values to :math:`J_zA_zB_z`
     colourspace.
@@ -113,6 +113,9 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
         *CIE Standard Illuminant D Series D65*.
     constants : Structure, optional
         :math:`J_zA_zB_z` colourspace constants.
+    out : ndarray, optional
+        Array to write the :math:`J_zA_zB_z` colourspace array into, allowing
+        repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -151,23 +154,36 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
     array([ 0.0053504...,  0.0092430...,  0.0052600...])
     """
 
-    X_D65, Y_D65, Z_D65 = tsplit(to_domain_1(XYZ_D65))
+    XYZ_D65 = to_domain_1(XYZ_D65)
+    X_D65, Y_D65, Z_D65 = XYZ_D65[..., 0], XYZ_D65[..., 1], XYZ_D65[..., 2]
 
-    X_p_D65 = constants.b * X_D65 - (constants.b - 1) * Z_D65
-    Y_p_D65 = constants.g * Y_D65 - (constants.g - 1) * X_D65
+    if out is None:
+        out = np.empty(XYZ_D65.shape, XYZ_D65.dtype)
 
-    XYZ_p_D65 = tstack([X_p_D65, Y_p_D65, Z_D65])
+    # The domain-scaled input array and the output array are alternately used
+    # as source and destination of the computations.
+    X_p_D65, Y_p_D65, Z_p_D65 = out[..., 0], out[..., 1], out[..., 2]
+    np.multiply(Z_D65, constants.b - 1, out=Z_p_D65)
+    np.multiply(X_D65, constants.b, out=X_p_D65)
+    X_p_D65 -= Z_p_D65
+    np.multiply(X_D65, constants.g - 1, out=Z_p_D65)
+    np.multiply(Y_D65, constants.g, out=Y_p_D65)
+    Y_p_D65 -= Z_p_D65
+    Z_p_D65[...] = Z_D65
 
-    LMS = dot_vector(JZAZBZ_XYZ_TO_LMS_MATRIX, XYZ_p_D65)
+    LMS = dot_vector(JZAZBZ_XYZ_TO_LMS_MATRIX, out, out=XYZ_D65)
 
     with domain_range_scale('ignore'):
         LMS_p = oetf_ST2084(LMS, 10000, constants)
 
-    I_z, A_z, B_z = tsplit(dot_vector(JZAZBZ_LMS_P_TO_IZAZBZ_MATRIX, LMS_p))
+    JzAzBz = dot_vector(JZAZBZ_LMS_P_TO_IZAZBZ_MATRIX, LMS_p, out=out)
 
-    J_z = ((1 + constants.d) * I_z) / (1 + constants.d * I_z) - constants.d_0
-
-    JzAzBz = tstack([J_z, A_z, B_z])
+    I_z = JzAzBz[..., 0]
+    denominator = np.multiply(I_z, constants.d, out=LMS[..., 0])
+    denominator += 1
+    I_z *= 1 + constants.d
+    I_z /= denominator
+    I_z -= constants.d_0
 
     return from_range_1(JzAzBz)
 
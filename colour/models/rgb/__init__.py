@@ -7,7 +7,8 @@ from .derivation import (normalised_primary_matrix,
                          RGB_luminance_equation, RGB_luminance)
 from .rgb_colourspace import RGB_Colourspace
 from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB
+from .rgb_colourspace import (RGB_to_RGB_matrix, RGB_to_RGB,
+                              RGB_to_RGB_Converter)
 from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .dataset import *  # noqa
@@ -18,7 +19,8 @@ from .deprecated import (RGB_to_HSV, HSV_to_RGB, RGB_to_HSL, HSL_to_RGB,
                          RGB_to_CMY, CMY_to_RGB, CMY_to_CMYK, CMYK_to_CMY)
 from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
 from .ycbcr import (YCBCR_WEIGHTS, RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc,
-                    YcCbcCrc_to_RGB)
+                    YcCbcCrc_to_RGB, RGB_to_YCbCr_Converter,
+                    YCbCr_to_RGB_Converter)
 from .ycocg import RGB_to_YCoCg, YCoCg_to_RGB
 from .ictcp import RGB_to_ICTCP, ICTCP_to_RGB
 
@@ -28,7 +30,7 @@ __all__ = [
 ]
 __all__ += ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
-__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
+__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB', 'RGB_to_RGB_Converter']
 __all__ += transfer_functions.__all__
 __all__ += dataset.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
@@ -40,7 +42,7 @@ __all__ += [
 __all__ += ['RGB_to_Prismatic', 'Prismatic_to_RGB']
 __all__ += [
     'YCBCR_WEIGHTS', 'RGB_to_YCbCr', 'YCbCr_to_RGB', 'RGB_to_YcCbcCrc',
-    'YcCbcCrc_to_RGB'
+    'YcCbcCrc_to_RGB', 'RGB_to_YCbCr_Converter', 'YCbCr_to_RGB_Converter'
 ]
 __all__ += ['RGB_to_YCoCg', 'YCoCg_to_RGB']
 __all__ += ['RGB_to_ICTCP', 'ICTCP_to_RGB']
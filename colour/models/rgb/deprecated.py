@@ -327,8 +327,8 @@ def HSL_to_RGB(HSL):
 
         vH = as_float_array(vH)
 
-        vH[np.asarray(vH < 0)] += 1
-        vH[np.asarray(vH > 1)] -= 1
+        vH = np.where(vH < 0, vH + 1, vH)
+        vH = np.where(vH > 1, vH - 1, vH)
 
         v = np.full(vi.shape, np.nan)
 
@@ -11,6 +11,7 @@ dataset from :mod:`colour.models.dataset.aces_rgb`, etc... and the following
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
 -   :func:`colour.RGB_to_RGB`
+-   :class:`colour.RGB_to_RGB_Converter`
 
 See Also
 --------
@@ -34,13 +35,14 @@ from __future__ import division, unicode_literals
 import numpy as np
 from copy import deepcopy
 
-from colour.models import xy_to_XYZ, xy_to_xyY, xyY_to_XYZ
+from colour.models import xy_to_xyY, xyY_to_XYZ
 from colour.models.rgb import (chromatically_adapted_primaries,
                                normalised_primary_matrix)
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
 from colour.utilities import (as_float_array, domain_range_scale, dot_matrix,
-                              dot_vector, from_range_1, to_domain_1, is_string,
-                              runtime_warning)
+                              dot_vector, from_range_1, get_domain_range_scale,
+                              profiled, register_cache, to_domain_1,
+                              is_string, runtime_warning)
 from colour.utilities.deprecation import Renamed
 
 __author__ = 'Colour Developers'
@@ -52,9 +54,14 @@ __status__ = 'Production'
 
 __all__ = [
     'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'RGB_to_RGB', 'RGB_to_RGB_Converter'
 ]
 
+_CHROMATIC_ADAPTATION_MATRICES_CACHE = register_cache(
+    '_CHROMATIC_ADAPTATION_MATRICES_CACHE',
+    maximum_size=256,
+    persistent=False)
+
 
 class RGB_Colourspace(object):
     """
@@ -883,12 +890,65 @@ class RGB_Colourspace(object):
         self.whitepoint_name = value
 
 
+def _chromatic_adaptation_matrix(illuminant_source, illuminant_target,
+                                 transform):
+    """
+    Returns the *Von Kries* chromatic adaptation matrix from given source
+    illuminant to target illuminant and caches it if not existing.
+
+    Parameters
+    ----------
+    illuminant_source : array_like
+        Source *illuminant* chromaticity coordinates or *CIE xyY* colourspace
+        array.
+    illuminant_target : array_like
+        Target *illuminant* chromaticity coordinates or *CIE xyY* colourspace
+        array.
+    transform : unicode
+        *Chromatic adaptation* transform.
+
+    Returns
+    -------
+    ndarray
+        Read-only chromatic adaptation matrix.
+
+    Notes
+    -----
+    -   Only the matrices of single illuminants are cached, i.e. not those of
+        n-dimensional illuminants arrays.
+    """
+
+    illuminant_source = as_float_array(illuminant_source)
+    illuminant_target = as_float_array(illuminant_target)
+
+    cacheable = illuminant_source.ndim == illuminant_target.ndim == 1
+    if cacheable:
+        key = (illuminant_source.tobytes(), illuminant_target.tobytes(),
+               transform, get_domain_range_scale())
+        M_CAT = _CHROMATIC_ADAPTATION_MATRICES_CACHE.get(key)
+        if M_CAT is not None:
+            return M_CAT
+
+    M_CAT = chromatic_adaptation_matrix_VonKries(
+        xyY_to_XYZ(xy_to_xyY(illuminant_source)),
+        xyY_to_XYZ(xy_to_xyY(illuminant_target)),
+        transform=transform)
+
+    if cacheable:
+        M_CAT.setflags(write=False)
+        _CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = M_CAT
+
+    return M_CAT
+
+
+@profiled
 def XYZ_to_RGB(XYZ,
                illuminant_XYZ,
                illuminant_RGB,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
-               encoding_cctf=None):
+               encoding_cctf=None,
+               out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *RGB* colourspace array.
 
@@ -913,6 +973,9 @@ def XYZ_to_RGB(XYZ,
     encoding_cctf : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Array to write the *RGB* colourspace array into, allowing repeated
+        conversions without allocating the output array.
 
     Returns
     -------
@@ -956,29 +1019,31 @@ def XYZ_to_RGB(XYZ,
 
     XYZ = to_domain_1(XYZ)
 
+    M = XYZ_to_RGB_matrix
+
     if chromatic_adaptation_transform is not None:
-        M_CAT = chromatic_adaptation_matrix_VonKries(
-            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-            transform=chromatic_adaptation_transform)
+        M_CAT = _chromatic_adaptation_matrix(illuminant_XYZ, illuminant_RGB,
+                                             chromatic_adaptation_transform)
 
-        XYZ = dot_vector(M_CAT, XYZ)
+        M = dot_matrix(XYZ_to_RGB_matrix, M_CAT)
 
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ)
+    RGB = dot_vector(M, XYZ, out=out)
 
     if encoding_cctf is not None:
         with domain_range_scale('ignore'):
-            RGB = encoding_cctf(RGB)
+            RGB[...] = encoding_cctf(RGB)
 
     return from_range_1(RGB)
 
 
+@profiled
 def RGB_to_XYZ(RGB,
                illuminant_RGB,
                illuminant_XYZ,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
-               decoding_cctf=None):
+               decoding_cctf=None,
+               out=None):
     """
     Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values.
 
@@ -1003,6 +1068,9 @@ def RGB_to_XYZ(RGB,
     decoding_cctf : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Array to write the *CIE XYZ* tristimulus values into, allowing
+        repeated conversions without allocating the output array.
 
     Returns
     -------
@@ -1050,15 +1118,15 @@ def RGB_to_XYZ(RGB,
         with domain_range_scale('ignore'):
             RGB = decoding_cctf(RGB)
 
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
+    M = RGB_to_XYZ_matrix
 
     if chromatic_adaptation_transform is not None:
-        M_CAT = chromatic_adaptation_matrix_VonKries(
-            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-            transform=chromatic_adaptation_transform)
+        M_CAT = _chromatic_adaptation_matrix(illuminant_RGB, illuminant_XYZ,
+                                             chromatic_adaptation_transform)
+
+        M = dot_matrix(M_CAT, RGB_to_XYZ_matrix)
 
-        XYZ = dot_vector(M_CAT, XYZ)
+    XYZ = dot_vector(M, RGB, out=out)
 
     return from_range_1(XYZ)
 
@@ -1102,10 +1170,9 @@ def RGB_to_RGB_matrix(input_colourspace,
     M = input_colourspace.RGB_to_XYZ_matrix
 
     if chromatic_adaptation_transform is not None:
-        M_CAT = chromatic_adaptation_matrix_VonKries(
-            xy_to_XYZ(input_colourspace.whitepoint),
-            xy_to_XYZ(output_colourspace.whitepoint),
-            chromatic_adaptation_transform)
+        M_CAT = _chromatic_adaptation_matrix(input_colourspace.whitepoint,
+                                             output_colourspace.whitepoint,
+                                             chromatic_adaptation_transform)
 
         M = dot_matrix(M_CAT, input_colourspace.RGB_to_XYZ_matrix)
 
@@ -1114,6 +1181,7 @@ def RGB_to_RGB_matrix(input_colourspace,
     return M
 
 
+@profiled
 def RGB_to_RGB(RGB,
                input_colourspace,
                output_colourspace,
@@ -1190,3 +1258,290 @@ def RGB_to_RGB(RGB,
             RGB = output_colourspace.encoding_cctf(RGB)
 
     return from_range_1(RGB)
+
+
+class RGB_to_RGB_Converter(object):
+    """
+    Converts *RGB* colourspace arrays from given input *RGB* colourspace to
+    output *RGB* colourspace using given *chromatic adaptation* method.
+
+    Contrary to :func:`colour.RGB_to_RGB` definition, the conversion matrix
+    combining the input colourspace normalised primary matrix, the
+    chromatic adaptation matrix and the output colourspace inverse normalised
+    primary matrix is computed once at instantiation. The decoding colour
+    component transfer function, the conversion matrix and the encoding
+    colour component transfer function are then applied tile by tile, i.e.
+    with temporary arrays bounded by the tile size, optionally writing the
+    result in a given output array.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC', None}**,
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+    apply_decoding_cctf : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_encoding_cctf : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+    tile_size : int, optional
+        Maximum *RGB* colourspace array pixels count processed at once, the
+        whole array is processed at once if *None*.
+
+    Attributes
+    ----------
+    input_colourspace
+    output_colourspace
+    chromatic_adaptation_transform
+    apply_decoding_cctf
+    apply_encoding_cctf
+    tile_size
+    matrix
+
+    Methods
+    -------
+    apply
+
+    Notes
+    -----
+    -   Changes to the input or output colourspaces made after instantiation
+        are not reflected by the converter.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> converter = RGB_to_RGB_Converter(sRGB_COLOURSPACE,
+    ...                                  PROPHOTO_RGB_COLOURSPACE)
+    >>> RGB = np.array([0.45595571, 0.03039702, 0.04087245])
+    >>> converter.apply(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2568891...,  0.0721446...,  0.0465553...])
+
+    Converting in-place:
+
+    >>> RGB = np.array([[0.45595571, 0.03039702, 0.04087245]])
+    >>> converter.apply(RGB, out=RGB)  # doctest: +ELLIPSIS
+    array([[ 0.2568891...,  0.0721446...,  0.0465553...]])
+    >>> RGB  # doctest: +ELLIPSIS
+    array([[ 0.2568891...,  0.0721446...,  0.0465553...]])
+    """
+
+    def __init__(self,
+                 input_colourspace,
+                 output_colourspace,
+                 chromatic_adaptation_transform='CAT02',
+                 apply_decoding_cctf=False,
+                 apply_encoding_cctf=False,
+                 tile_size=2 ** 18):
+        self._input_colourspace = input_colourspace
+        self._output_colourspace = output_colourspace
+        self._chromatic_adaptation_transform = chromatic_adaptation_transform
+        self._apply_decoding_cctf = apply_decoding_cctf
+        self._apply_encoding_cctf = apply_encoding_cctf
+        self._tile_size = None
+        self.tile_size = tile_size
+
+        self._decoding_cctf = (input_colourspace.decoding_cctf
+                               if apply_decoding_cctf else None)
+        self._encoding_cctf = (output_colourspace.encoding_cctf
+                               if apply_encoding_cctf else None)
+
+        self._matrix = np.transpose(
+            RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                              chromatic_adaptation_transform))
+        self._matrix.setflags(write=False)
+
+    @property
+    def input_colourspace(self):
+        """
+        Getter property for the *RGB* input colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* input colourspace.
+        """
+
+        return self._input_colourspace
+
+    @property
+    def output_colourspace(self):
+        """
+        Getter property for the *RGB* output colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* output colourspace.
+        """
+
+        return self._output_colourspace
+
+    @property
+    def chromatic_adaptation_transform(self):
+        """
+        Getter property for the *chromatic adaptation* transform.
+
+        Returns
+        -------
+        unicode
+            *Chromatic adaptation* transform.
+        """
+
+        return self._chromatic_adaptation_transform
+
+    @property
+    def apply_decoding_cctf(self):
+        """
+        Getter property for whether the input colourspace decoding colour
+        component transfer function is applied.
+
+        Returns
+        -------
+        bool
+            Whether the decoding colour component transfer function is
+            applied.
+        """
+
+        return self._apply_decoding_cctf
+
+    @property
+    def apply_encoding_cctf(self):
+        """
+        Getter property for whether the output colourspace encoding colour
+        component transfer function is applied.
+
+        Returns
+        -------
+        bool
+            Whether the encoding colour component transfer function is
+            applied.
+        """
+
+        return self._apply_encoding_cctf
+
+    @property
+    def tile_size(self):
+        """
+        Getter and setter property for the tile size.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the tile size with, *None* processes the whole array
+            at once.
+
+        Returns
+        -------
+        int
+            Maximum *RGB* colourspace array pixels count processed at once.
+        """
+
+        return self._tile_size
+
+    @tile_size.setter
+    def tile_size(self, value):
+        """
+        Setter for **self.tile_size** property.
+        """
+
+        if value is not None:
+            assert value > 0, (
+                '"{0}" attribute: "{1}" must be greater than 0!'.format(
+                    'tile_size', value))
+
+            value = int(value)
+
+        self._tile_size = value
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the conversion matrix :math:`M`, as given by
+        :func:`colour.RGB_to_RGB_matrix` definition.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix :math:`M`.
+        """
+
+        return np.transpose(self._matrix)
+
+    def apply(self, RGB, out=None):
+        """
+        Converts given *RGB* colourspace array from the input *RGB*
+        colourspace to the output *RGB* colourspace.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        out : ndarray, optional
+            Array with the same shape than ``RGB`` to write the result into,
+            it can be ``RGB`` itself to perform the conversion in-place.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace array, ``out`` if given.
+
+        Notes
+        -----
+
+        +------------+-----------------------+---------------+
+        | **Domain** | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        +------------+-----------------------+---------------+
+        | **Range**  | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+        """
+
+        if out is None:
+            RGB = as_float_array(RGB)
+            out = np.empty(RGB.shape, dtype=RGB.dtype)
+        else:
+            RGB = np.asarray(RGB)
+            assert out.shape == RGB.shape, (
+                '"out" shape "{0}" is different from "RGB" shape '
+                '"{1}"!'.format(out.shape, RGB.shape))
+
+        RGB_i = np.reshape(RGB, (-1, 3))
+        RGB_o = np.reshape(out, (-1, 3))
+
+        # "RGB_o" must be a view on "out" for the tiles to be written into it.
+        assert RGB_o.size == 0 or np.may_share_memory(RGB_o, out), (
+            '"out" array must be contiguous!')
+
+        tile_size = self._tile_size
+        if tile_size is None:
+            tile_size = max(RGB_i.shape[0], 1)
+
+        for i in range(0, RGB_i.shape[0], tile_size):
+            tile = to_domain_1(RGB_i[i:i + tile_size])
+
+            if self._decoding_cctf is not None:
+                with domain_range_scale('ignore'):
+                    tile = self._decoding_cctf(tile)
+
+            tile = np.dot(tile, self._matrix)
+
+            if self._encoding_cctf is not None:
+                with domain_range_scale('ignore'):
+                    tile = self._encoding_cctf(tile)
+
+            RGB_o[i:i + tile_size] = from_range_1(tile)
+
+        return out
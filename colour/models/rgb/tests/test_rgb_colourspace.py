@@ -16,7 +16,8 @@ from itertools import permutations
 
 from colour.models import (
     RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
-    RGB_to_RGB_matrix, RGB_to_RGB, chromatically_adapted_primaries,
+    RGB_to_RGB_matrix, RGB_to_RGB, RGB_to_RGB_Converter,
+    chromatically_adapted_primaries,
     normalised_primary_matrix, oetf_sRGB, oetf_reverse_sRGB)
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
@@ -29,7 +30,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB',
+    'TestRGB_to_RGB_Converter'
 ]
 
 
@@ -470,6 +472,28 @@ class TestXYZ_to_RGB(unittest.TestCase):
             RGB,
             decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        out argument support.
+        """
+
+        a = np.random.RandomState(4).uniform(0, 1, (4, 8, 3))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+
+        for cctf in (None, oetf_sRGB):
+            out = np.empty((4, 8, 3))
+            self.assertIs(
+                XYZ_to_RGB(a, W_R, W_T, M, 'Bradford', cctf, out), out)
+            np.testing.assert_almost_equal(
+                out, XYZ_to_RGB(a, W_R, W_T, M, 'Bradford', cctf), decimal=7)
+
     def test_domain_range_scale_XYZ_to_RGB(self):
         """
         Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
@@ -614,6 +638,28 @@ class TestRGB_to_XYZ(unittest.TestCase):
             XYZ,
             decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        out argument support.
+        """
+
+        a = np.random.RandomState(4).uniform(0, 1, (4, 8, 3))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+
+        for cctf in (None, oetf_reverse_sRGB):
+            out = np.empty((4, 8, 3))
+            self.assertIs(
+                RGB_to_XYZ(a, W_R, W_T, M, 'Bradford', cctf, out), out)
+            np.testing.assert_almost_equal(
+                out, RGB_to_XYZ(a, W_R, W_T, M, 'Bradford', cctf), decimal=7)
+
     def test_domain_range_scale_XYZ_to_RGB(self):
         """
         Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
@@ -850,5 +896,169 @@ class TestRGB_to_RGB(unittest.TestCase):
             RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace)
 
 
+class TestRGB_to_RGB_Converter(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('input_colourspace', 'output_colourspace',
+                               'chromatic_adaptation_transform',
+                               'apply_decoding_cctf', 'apply_encoding_cctf',
+                               'tile_size', 'matrix')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_to_RGB_Converter))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('apply', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_to_RGB_Converter))
+
+    def test_matrix(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter.\
+matrix` attribute.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        for transform in ('CAT02', 'Bradford', None):
+            np.testing.assert_almost_equal(
+                RGB_to_RGB_Converter(aces_2065_1_colourspace,
+                                     sRGB_colourspace, transform).matrix,
+                RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace,
+                                  transform),
+                decimal=7)
+
+    def test_apply(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter.\
+apply` method.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        RGB = np.random.RandomState(4).random_sample((16, 16, 3))
+        for colourspace_i, colourspace_o in (
+            (aces_2065_1_colourspace, sRGB_colourspace),
+            (aces_cc_colourspace, sRGB_colourspace),
+        ):
+            for transform in ('CAT02', 'Bradford', None):
+                for tile_size in (1, 37, 256, 2 ** 18, None):
+                    converter = RGB_to_RGB_Converter(
+                        colourspace_i,
+                        colourspace_o,
+                        transform,
+                        apply_decoding_cctf=True,
+                        apply_encoding_cctf=True,
+                        tile_size=tile_size)
+
+                    np.testing.assert_almost_equal(
+                        converter.apply(RGB),
+                        RGB_to_RGB(
+                            RGB,
+                            colourspace_i,
+                            colourspace_o,
+                            transform,
+                            apply_decoding_cctf=True,
+                            apply_encoding_cctf=True),
+                        decimal=7)
+
+        converter = RGB_to_RGB_Converter(aces_2065_1_colourspace,
+                                         sRGB_colourspace)
+        RGB_o = RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace)
+
+        out = np.zeros(RGB.shape)
+        self.assertIs(converter.apply(RGB, out=out), out)
+        np.testing.assert_almost_equal(out, RGB_o, decimal=7)
+
+        RGB_i = np.copy(RGB)
+        self.assertIs(converter.apply(RGB_i, out=RGB_i), RGB_i)
+        np.testing.assert_almost_equal(RGB_i, RGB_o, decimal=7)
+
+        self.assertRaises(
+            AssertionError, converter.apply, RGB, out=np.zeros((16, 3)))
+
+        converter = RGB_to_RGB_Converter(
+            aces_2065_1_colourspace, sRGB_colourspace, tile_size=None)
+        self.assertIsNone(converter.tile_size)
+        self.assertTupleEqual(converter.apply(np.zeros((0, 3))).shape, (0, 3))
+
+        self.assertRaises(
+            AssertionError, RGB_to_RGB_Converter, aces_2065_1_colourspace,
+            sRGB_colourspace, tile_size=0)
+
+    def test_n_dimensional_apply(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter.\
+apply` method n-dimensions support.
+        """
+
+        converter = RGB_to_RGB_Converter(RGB_COLOURSPACES['ACES2065-1'],
+                                         RGB_COLOURSPACES['sRGB'])
+        RGB_i = np.array([0.21931722, 0.06950287, 0.04694832])
+        RGB_o = np.array([0.45595289, 0.03040780, 0.04087313])
+        np.testing.assert_almost_equal(
+            converter.apply(RGB_i), RGB_o, decimal=7)
+
+        RGB_i = np.tile(RGB_i, (6, 1))
+        RGB_o = np.tile(RGB_o, (6, 1))
+        np.testing.assert_almost_equal(
+            converter.apply(RGB_i), RGB_o, decimal=7)
+
+        RGB_i = np.reshape(RGB_i, (2, 3, 3))
+        RGB_o = np.reshape(RGB_o, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            converter.apply(RGB_i), RGB_o, decimal=7)
+
+    def test_domain_range_scale_apply(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter.\
+apply` method domain and range scale support.
+        """
+
+        converter = RGB_to_RGB_Converter(
+            RGB_COLOURSPACES['ACES2065-1'],
+            RGB_COLOURSPACES['sRGB'],
+            apply_encoding_cctf=True)
+        RGB_i = np.array([0.21931722, 0.06950287, 0.04694832])
+        RGB_o = converter.apply(RGB_i)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    converter.apply(RGB_i * factor), RGB_o * factor, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Converter.\
+apply` method nan support.
+        """
+
+        converter = RGB_to_RGB_Converter(RGB_COLOURSPACES['ACES2065-1'],
+                                         RGB_COLOURSPACES['sRGB'])
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            converter.apply(np.array(case))
+
+
 if __name__ == '__main__':
     unittest.main()
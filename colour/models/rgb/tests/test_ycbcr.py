@@ -9,10 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
-                                     RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
-                                     YCBCR_WEIGHTS)
-from colour.utilities import domain_range_scale, ignore_numpy_errors
+from colour.models.rgb.ycbcr import (
+    RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
+    RGB_to_YCbCr_Converter, YCbCr_to_RGB_Converter, YCBCR_WEIGHTS)
+from colour.utilities import domain_range_scale, ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -23,7 +23,8 @@ __status__ = 'Development'
 
 __all__ = [
     'TestRGB_to_YCbCr', 'TestYCbCr_to_RGB', 'TestRGB_to_YcCbcCrc',
-    'TestYcCbcCrc_to_RGB'
+    'TestYcCbcCrc_to_RGB', 'TestRGB_to_YCbCr_Converter',
+    'TestYCbCr_to_RGB_Converter'
 ]
 
 
@@ -399,5 +400,198 @@ class TestYcCbcCrc_to_RGB(unittest.TestCase):
             YcCbcCrc_to_RGB(YcCbcCrc)
 
 
+class TestRGB_to_YCbCr_Converter(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.ycbcr.RGB_to_YCbCr_Converter` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(4)
+        self._RGB = prng.randint(0, 1024, (5, 7, 3)).astype(np.uint16)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('matrix', 'offset', 'subsampling',
+                               'fixed_point', 'dtype', 'tile_size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_to_YCbCr_Converter))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.ycbcr.RGB_to_YCbCr_Converter.apply`
+        method.
+        """
+
+        YCbCr = RGB_to_YCbCr(
+            self._RGB, in_bits=10, in_int=True, out_bits=10, out_int=True)
+        for fixed_point in (True, False):
+            converter = RGB_to_YCbCr_Converter(
+                in_bits=10,
+                in_int=True,
+                out_bits=10,
+                out_int=True,
+                fixed_point=fixed_point,
+                tile_size=8)
+            self.assertEqual(converter.fixed_point, fixed_point)
+            YCbCr_c = converter.apply(self._RGB)
+            self.assertEqual(YCbCr_c.dtype, np.uint16)
+            np.testing.assert_equal(YCbCr_c, YCbCr)
+
+        RGB = self._RGB / 1023
+        np.testing.assert_almost_equal(
+            RGB_to_YCbCr_Converter(
+                K=YCBCR_WEIGHTS['ITU-R BT.2020'], dtype=np.float64).apply(RGB),
+            RGB_to_YCbCr(RGB, K=YCBCR_WEIGHTS['ITU-R BT.2020']),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_YCbCr_Converter().apply(RGB), RGB_to_YCbCr(RGB), decimal=5)
+
+        out = np.zeros((5, 7, 3), dtype=np.uint8)
+        converter = RGB_to_YCbCr_Converter(
+            in_bits=10, in_int=True, out_int=True)
+        self.assertIs(converter.apply(self._RGB, out), out)
+        np.testing.assert_equal(
+            out, RGB_to_YCbCr(
+                self._RGB, in_bits=10, in_int=True, out_int=True))
+
+    def test_apply_subsampling(self):
+        """
+        Tests :meth:`colour.models.rgb.ycbcr.RGB_to_YCbCr_Converter.apply`
+        method chroma subsampling.
+        """
+
+        YCbCr = RGB_to_YCbCr(
+            self._RGB, in_bits=10, in_int=True, out_bits=10) * 1023
+        for subsampling, (h, w) in (('4:2:2', (1, 2)), ('4:2:0', (2, 2))):
+            converter = RGB_to_YCbCr_Converter(
+                in_bits=10,
+                in_int=True,
+                out_bits=10,
+                out_int=True,
+                subsampling=subsampling,
+                tile_size=8)
+            Y, Cb, Cr = converter.apply(self._RGB)
+
+            np.testing.assert_equal(Y, np.round(YCbCr[..., 0]))
+
+            YCbCr_p = np.pad(
+                YCbCr, ((0, -5 % h), (0, -7 % w), (0, 0)), mode='edge')
+            YCbCr_s = np.mean(
+                np.reshape(
+                    YCbCr_p,
+                    (YCbCr_p.shape[0] // h, h, YCbCr_p.shape[1] // w, w, 3)),
+                axis=(1, 3))
+            np.testing.assert_allclose(Cb, YCbCr_s[..., 1], atol=1)
+            np.testing.assert_allclose(Cr, YCbCr_s[..., 2], atol=1)
+
+        self.assertRaises(ValueError,
+                          RGB_to_YCbCr_Converter(subsampling='4:2:0').apply,
+                          np.ones((4, 3)))
+
+    def test_domain_range_scale_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.ycbcr.RGB_to_YCbCr_Converter.apply`
+        method domain and range scale support.
+        """
+
+        RGB = self._RGB / 1023
+        converter = RGB_to_YCbCr_Converter(dtype=np.float64)
+        YCbCr = converter.apply(RGB)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    converter.apply(RGB * factor), YCbCr * factor, decimal=7)
+
+    def test_raise_exception_RGB_to_YCbCr_Converter(self):
+        """
+        Tests :class:`colour.models.rgb.ycbcr.RGB_to_YCbCr_Converter` class
+        raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, RGB_to_YCbCr_Converter, subsampling='4:1:1')
+        self.assertRaises(ValueError, RGB_to_YCbCr_Converter, fixed_point=True)
+
+
+class TestYCbCr_to_RGB_Converter(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.ycbcr.YCbCr_to_RGB_Converter` class unit
+    tests methods.
+    """
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.ycbcr.YCbCr_to_RGB_Converter.apply`
+        method.
+        """
+
+        prng = np.random.RandomState(4)
+        YCbCr = prng.randint(64, 941, (5, 7, 3)).astype(np.uint16)
+
+        RGB = np.clip(
+            YCbCr_to_RGB(
+                YCbCr, in_bits=10, in_int=True, out_bits=10, out_int=True), 0,
+            1023)
+        for fixed_point in (True, False):
+            converter = YCbCr_to_RGB_Converter(
+                in_bits=10,
+                in_int=True,
+                out_bits=10,
+                out_int=True,
+                fixed_point=fixed_point,
+                tile_size=8)
+            np.testing.assert_equal(converter.apply(YCbCr), RGB)
+
+        YCbCr = YCbCr / 1023
+        np.testing.assert_almost_equal(
+            YCbCr_to_RGB_Converter(in_bits=10, dtype=np.float64).apply(YCbCr),
+            YCbCr_to_RGB(YCbCr, in_bits=10),
+            decimal=7)
+
+    def test_apply_subsampling(self):
+        """
+        Tests :meth:`colour.models.rgb.ycbcr.YCbCr_to_RGB_Converter.apply`
+        method chroma subsampling.
+        """
+
+        prng = np.random.RandomState(4)
+        RGB = prng.randint(0, 1024, (5, 7, 3)).astype(np.uint16)
+
+        for subsampling in ('4:2:2', '4:2:0'):
+            settings = {
+                'in_bits': 10,
+                'in_int': True,
+                'out_bits': 10,
+                'out_int': True,
+                'subsampling': subsampling,
+                'tile_size': 8
+            }
+            Y, Cb, Cr = RGB_to_YCbCr_Converter(**settings).apply(RGB)
+            settings.update({'in_legal': True, 'out_legal': False})
+            RGB_c = YCbCr_to_RGB_Converter(**settings).apply((Y, Cb, Cr))
+
+            h = 2 if subsampling == '4:2:0' else 1
+            Cb, Cr = [
+                np.repeat(np.repeat(C, 2, axis=1), h, axis=0)[:5, :7]
+                for C in (Cb, Cr)
+            ]
+            del settings['subsampling']
+            np.testing.assert_equal(
+                RGB_c,
+                YCbCr_to_RGB_Converter(**settings).apply(tstack([Y, Cb, Cr])))
+
+
 if __name__ == '__main__':
     unittest.main()
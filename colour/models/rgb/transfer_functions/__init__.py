@@ -2,9 +2,11 @@
 
 from __future__ import absolute_import
 
+import numpy as np
 from functools import partial
 
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
+from colour.utilities import (CaseInsensitiveMapping, domain_range_scale,
+                              filter_kwargs, profiled, register_cache,
                               usage_warning)
 
 from .common import CV_range, legal_to_full, full_to_legal
@@ -52,6 +54,7 @@ from .sony_slog import (log_encoding_SLog, log_decoding_SLog,
                         log_encoding_SLog3, log_decoding_SLog3)
 from .srgb import oetf_sRGB, oetf_reverse_sRGB
 from .viper_log import log_encoding_ViperLog, log_decoding_ViperLog
+from .baked import CCTF_SHAPERS, BakedCCTF
 
 __all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
 __all__ += [
@@ -105,6 +108,7 @@ __all__ += [
 ]
 __all__ += ['oetf_sRGB', 'oetf_reverse_sRGB']
 __all__ += ['log_encoding_ViperLog', 'log_decoding_ViperLog']
+__all__ += ['CCTF_SHAPERS', 'BakedCCTF']
 
 LOG_ENCODING_CURVES = CaseInsensitiveMapping({
     'ACEScc': log_encoding_ACEScc,
@@ -407,6 +411,7 @@ OETFS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def oetf(value, function='sRGB', **kwargs):
     """
     Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
@@ -484,6 +489,7 @@ OETFS_REVERSE : CaseInsensitiveMapping
 """
 
 
+@profiled
 def oetf_reverse(value, function='sRGB', **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to tristimulus values
@@ -547,6 +553,7 @@ EOTFS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def eotf(value, function='ITU-R BT.1886', **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to tristimulus values
@@ -627,6 +634,7 @@ EOTFS_REVERSE : CaseInsensitiveMapping
 """
 
 
+@profiled
 def eotf_reverse(value, function='ITU-R BT.1886', **kwargs):
     """
     Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
@@ -705,6 +713,7 @@ ENCODING_CCTFS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def encoding_cctf(value, function='sRGB', **kwargs):
     """
     Encodes linear :math:`RGB` values to non linear :math:`R'G'B'` values using
@@ -793,6 +802,7 @@ DECODING_CCTFS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def decoding_cctf(value, function='Cineon', **kwargs):
     """
     Decodes non-linear :math:`R'G'B'` values to linear :math:`RGB` values using
@@ -852,6 +862,166 @@ def decoding_cctf(value, function='Cineon', **kwargs):
 __all__ += ['ENCODING_CCTFS', 'DECODING_CCTFS']
 __all__ += ['encoding_cctf', 'decoding_cctf']
 
+_BAKED_CCTFS_CACHE = register_cache(
+    '_BAKED_CCTFS_CACHE', maximum_size=64, persistent=False)
+"""
+Cache for the baked colour component transfer functions.
+
+_BAKED_CCTFS_CACHE : Cache
+"""
+
+
+def _bake_cctf(functions, reverse_functions, function, domain, size, shaper,
+               default_shaper, **kwargs):
+    """
+    Bakes given colour component transfer function from given collection,
+    caching the resulting :class:`colour.BakedCCTF` class instance.
+    """
+
+    function_name = function
+    function = functions[function]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if domain is None:
+        domain = np.array([0, 1])
+        reverse_function = reverse_functions.get(function_name)
+        if reverse_function is not None:
+            with domain_range_scale('ignore'):
+                reverse_domain = np.sort(
+                    reverse_function(
+                        np.array([0, 1]), **filter_kwargs(
+                            reverse_function, **kwargs)))
+            if np.all(np.isfinite(reverse_domain)):
+                domain = reverse_domain
+
+    if shaper is None:
+        shaper = default_shaper
+
+    key = (id(function), tuple(np.ravel(domain)), size, shaper.lower(),
+           tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    baked = _BAKED_CCTFS_CACHE.get(key)
+    if baked is None:
+        baked = BakedCCTF(function, domain, size, shaper, **kwargs)
+        _BAKED_CCTFS_CACHE[key] = baked
+
+    return baked
+
+
+def bake_encoding_cctf(function='sRGB',
+                       domain=None,
+                       size=2 ** 14,
+                       shaper=None,
+                       **kwargs):
+    """
+    Bakes given encoding colour component transfer function (Encoding CCTF)
+    into a cached dense 1D look-up table.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        {:attr:`colour.ENCODING_CCTFS`},
+        Computation function.
+    domain : array_like, optional
+        Linear :math:`RGB` values domain of the look-up table, default to the
+        range of the reciprocal decoding CCTF of
+        :attr:`colour.DECODING_CCTFS` attribute collection over [0, 1] if
+        available, [0, 1] otherwise.
+    size : int, optional
+        Look-up table size.
+    shaper : unicode, optional
+        **{'Log2', 'Linear'}**,
+        Shaper distributing the look-up table samples over the domain, default
+        to *Log2*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the relevant encoding CCTF of the
+        :attr:`colour.ENCODING_CCTFS` attribute collection.
+
+    Returns
+    -------
+    BakedCCTF
+        Baked encoding CCTF.
+
+    Notes
+    -----
+    -   The maximum absolute error of the look-up table is reported by the
+        :attr:`colour.BakedCCTF.max_error` attribute.
+
+    Examples
+    --------
+    >>> baked = bake_encoding_cctf('ALEXA Log C')
+    >>> baked.domain  # doctest: +ELLIPSIS
+    array([ -1.7...e-02,   5.5...e+01])
+    >>> baked.apply(0.18)  # doctest: +ELLIPSIS
+    0.3910068...
+    >>> baked.max_error < 1e-6
+    True
+    """
+
+    return _bake_cctf(ENCODING_CCTFS, DECODING_CCTFS, function, domain, size,
+                      shaper, 'Log2', **kwargs)
+
+
+def bake_decoding_cctf(function='Cineon',
+                       domain=np.array([0, 1]),
+                       size=2 ** 14,
+                       shaper=None,
+                       **kwargs):
+    """
+    Bakes given decoding colour component transfer function (Decoding CCTF)
+    into a cached dense 1D look-up table.
+
+    Integer code values are decoded by direct indexing of an exact look-up
+    table with an entry per code value.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        {:attr:`colour.DECODING_CCTFS`},
+        Computation function.
+    domain : array_like, optional
+        Non-linear :math:`R'G'B'` values domain of the look-up table.
+    size : int, optional
+        Look-up table size.
+    shaper : unicode, optional
+        **{'Linear', 'Log2'}**,
+        Shaper distributing the look-up table samples over the domain, default
+        to *Linear*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the relevant decoding CCTF of the
+        :attr:`colour.DECODING_CCTFS` attribute collection.
+
+    Returns
+    -------
+    BakedCCTF
+        Baked decoding CCTF.
+
+    Notes
+    -----
+    -   The maximum absolute error of the look-up table is reported by the
+        :attr:`colour.BakedCCTF.max_error` attribute.
+
+    Examples
+    --------
+    >>> baked = bake_decoding_cctf('ST 2084', L_p=1000)
+    >>> baked.apply(0.182011532850008)  # doctest: +ELLIPSIS
+    0.1...
+    >>> baked.apply(np.array([0, 512, 1023], dtype=np.uint16), bits=10)
+    ... # doctest: +ELLIPSIS
+    array([    0.        ,     9.2698470...,  1000.        ])
+    """
+
+    return _bake_cctf(DECODING_CCTFS, ENCODING_CCTFS, function, domain, size,
+                      shaper, 'Linear', **kwargs)
+
+
+__all__ += ['bake_encoding_cctf', 'bake_decoding_cctf']
+
 OOTFS = CaseInsensitiveMapping({
     'ITU-R BT.2100 HLG': ootf_BT2100_HLG,
     'ITU-R BT.2100 PQ': ootf_BT2100_PQ,
@@ -864,6 +1034,7 @@ OOTFS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def ootf(value, function='ITU-R BT.2100 PQ', **kwargs):
     """
     Maps relative scene linear light to display linear light using given
@@ -907,6 +1078,7 @@ OOTFS_REVERSE : CaseInsensitiveMapping
 """
 
 
+@profiled
 def ootf_reverse(value, function='ITU-R BT.2100 PQ', **kwargs):
     """
     Maps relative display linear light to scene linear light using given
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+Baked Colour Component Transfer Functions
+=========================================
+
+Defines the object baking colour component transfer functions (CCTFs) into
+dense 1D look-up tables for fast evaluation:
+
+-   :class:`colour.BakedCCTF`
+
+See Also
+--------
+`RGB Colourspaces Jupyter Notebook
+<http://nbviewer.jupyter.org/github/colour-science/colour-notebooks/\
+blob/master/notebooks/models/rgb.ipynb>`_
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.utilities import (CaseInsensitiveMapping, as_float, as_float_array,
+                              domain_range_scale, from_range_1, to_domain_1)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['CCTF_SHAPERS', 'BakedCCTF']
+
+
+def _shaper_Linear(x, domain):
+    """
+    Linear shaper, maps given domain to [0, 1].
+    """
+
+    y = np.asarray(x - domain[0])
+    y /= domain[1] - domain[0]
+
+    return y
+
+
+def _shaper_reverse_Linear(y, domain):
+    """
+    Reverse linear shaper, maps [0, 1] to given domain.
+    """
+
+    return domain[0] + y * (domain[1] - domain[0])
+
+
+_LOG2_SHAPER_STOPS = 24
+"""
+Stops count covered by the *Log2* shaper below the maximum of the domain.
+
+_LOG2_SHAPER_STOPS : int
+"""
+
+
+def _shaper_Log2(x, domain):
+    """
+    Logarithmic shaper, maps given domain to [0, 1] and allocates an equal
+    samples count to each stop.
+    """
+
+    span = domain[1] - domain[0]
+    offset = span * 2 ** -_LOG2_SHAPER_STOPS
+
+    y = np.asarray(x - domain[0])
+    np.maximum(y, 0, out=y)
+    y += offset
+    np.log2(y, out=y)
+    y -= np.log2(offset)
+    y /= np.log2(span + offset) - np.log2(offset)
+
+    return y
+
+
+def _shaper_reverse_Log2(y, domain):
+    """
+    Reverse logarithmic shaper, maps [0, 1] to given domain.
+    """
+
+    span = domain[1] - domain[0]
+    offset = span * 2 ** -_LOG2_SHAPER_STOPS
+
+    return domain[0] + 2 ** (
+        np.log2(offset) + y *
+        (np.log2(span + offset) - np.log2(offset))) - offset
+
+
+CCTF_SHAPERS = CaseInsensitiveMapping({
+    'Linear': (_shaper_Linear, _shaper_reverse_Linear),
+    'Log2': (_shaper_Log2, _shaper_reverse_Log2),
+})
+CCTF_SHAPERS.__doc__ = """
+Supported shapers distributing the samples of a :class:`colour.BakedCCTF`
+class instance look-up table over its domain.
+
+CCTF_SHAPERS : CaseInsensitiveMapping
+    **{'Linear', 'Log2'}**
+
+Notes
+-----
+-   The *Linear* shaper is suited to functions smooth over their domain,
+    typically the decoding CCTFs.
+-   The *Log2* shaper covers 24 stops below the maximum of the domain and is
+    suited to the encoding CCTFs whose curvature is concentrated near black.
+"""
+
+
+class BakedCCTF(object):
+    """
+    Bakes given colour component transfer function (CCTF) into a dense 1D
+    look-up table evaluated with linear interpolation.
+
+    The look-up table samples are distributed over the domain by the given
+    shaper. Values outside the domain are evaluated with the transfer
+    function itself and integer code values are served by direct indexing of
+    an exact table with an entry per code value.
+
+    Parameters
+    ----------
+    function : callable
+        Colour component transfer function to bake.
+    domain : array_like, optional
+        Domain of the look-up table, in the reference domain-range scale.
+    size : int, optional
+        Look-up table size.
+    shaper : unicode, optional
+        **{'Linear', 'Log2'}**,
+        Shaper distributing the look-up table samples over the domain.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Attributes
+    ----------
+    function
+    domain
+    size
+    shaper
+    table
+    max_error
+
+    Methods
+    -------
+    apply
+
+    Notes
+    -----
+    -   The transfer function is baked and evaluated in the reference
+        domain-range scale, the input and output values of the
+        :meth:`colour.BakedCCTF.apply` method are scaled according to the
+        current domain-range scale.
+
+    Examples
+    --------
+    >>> from colour.models import oetf_reverse_sRGB
+    >>> baked = BakedCCTF(oetf_reverse_sRGB)
+    >>> baked.apply(0.5)  # doctest: +ELLIPSIS
+    0.2140411...
+    >>> baked.max_error < 1e-6
+    True
+    >>> baked.apply(np.array([0, 512, 1023]), bits=10)  # doctest: +ELLIPSIS
+    array([ 0.        ,  0.2144938...,  1.        ])
+    """
+
+    def __init__(self,
+                 function,
+                 domain=np.array([0, 1]),
+                 size=2 ** 14,
+                 shaper='Linear',
+                 **kwargs):
+        self._function = function
+        self._kwargs = kwargs
+        self._domain = np.array(as_float_array(domain))
+        self._domain.setflags(write=False)
+        self._size = int(size)
+        self._shaper = shaper
+
+        shaper, shaper_reverse = CCTF_SHAPERS[shaper]
+        self._shaper_function = shaper
+
+        samples = shaper_reverse(np.linspace(0, 1, self._size), self._domain)
+        samples[0], samples[-1] = self._domain
+        self._table = self._evaluate(samples)
+        self._table.setflags(write=False)
+        self._slopes = np.diff(self._table)
+
+        # Linear interpolation error peaks near the middle of the intervals.
+        midpoints = shaper_reverse(
+            (np.arange(self._size - 1) + 0.5) / (self._size - 1), self._domain)
+        self._max_error = np.nanmax(
+            np.abs(self._interpolate(midpoints) - self._evaluate(midpoints)))
+
+        self._integer_tables = {}
+
+    @property
+    def function(self):
+        """
+        Getter property for the baked transfer function.
+
+        Returns
+        -------
+        callable
+            Baked transfer function.
+        """
+
+        return self._function
+
+    @property
+    def domain(self):
+        """
+        Getter property for the look-up table domain.
+
+        Returns
+        -------
+        ndarray
+            Look-up table domain.
+        """
+
+        return self._domain
+
+    @property
+    def size(self):
+        """
+        Getter property for the look-up table size.
+
+        Returns
+        -------
+        int
+            Look-up table size.
+        """
+
+        return self._size
+
+    @property
+    def shaper(self):
+        """
+        Getter property for the look-up table shaper.
+
+        Returns
+        -------
+        unicode
+            Look-up table shaper.
+        """
+
+        return self._shaper
+
+    @property
+    def table(self):
+        """
+        Getter property for the look-up table, i.e. the transfer function
+        sampled at the shaped domain values.
+
+        Returns
+        -------
+        ndarray
+            Look-up table.
+        """
+
+        return self._table
+
+    @property
+    def max_error(self):
+        """
+        Getter property for the maximum absolute error of the look-up table
+        linear interpolation against the transfer function, measured at the
+        middle of the look-up table intervals.
+
+        Returns
+        -------
+        numeric
+            Maximum absolute error.
+        """
+
+        return self._max_error
+
+    def _evaluate(self, value):
+        """
+        Evaluates the transfer function in the reference domain-range scale.
+        """
+
+        with domain_range_scale('ignore'):
+            return as_float_array(self._function(value, **self._kwargs))
+
+    def _interpolate(self, value):
+        """
+        Interpolates the look-up table at given domain values.
+
+        The look-up table samples are uniformly distributed in the shaper
+        space, thus the intervals are indexed directly rather than searched.
+        """
+
+        position = self._shaper_function(value, self._domain)
+        position *= self._size - 1
+        np.clip(position, 0, self._size - 1, out=position)
+
+        index = position.astype(np.intp)
+        np.clip(index, 0, self._size - 2, out=index)
+        position -= index
+
+        position *= self._slopes[index]
+        position += self._table[index]
+
+        return position
+
+    def _integer_table(self, bits):
+        """
+        Returns the exact look-up table with an entry per code value for given
+        bit depth.
+        """
+
+        table = self._integer_tables.get(bits)
+        if table is None:
+            table = self._evaluate(
+                _shaper_reverse_Linear(
+                    np.linspace(0, 1, 2 ** bits), self._domain))
+            table.setflags(write=False)
+            self._integer_tables[bits] = table
+
+        return table
+
+    def apply(self, value, bits=None):
+        """
+        Evaluates the baked transfer function at given values.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Values to evaluate the baked transfer function at. *uint8* and
+            *uint16* values, or integer values with given bit depth, are
+            treated as code values spanning the look-up table domain, other
+            values are evaluated as floating point numbers.
+        bits : int, optional
+            Bit depth of the integer code values, at most *16*, default to the
+            bit depth of the integer dtype, e.g. *16* for *uint16*.
+
+        Returns
+        -------
+        numeric or ndarray
+            Baked transfer function values.
+        """
+
+        value = np.asarray(value)
+
+        if value.dtype.kind in 'ui' and (bits is not None or
+                                         value.dtype in (np.uint8, np.uint16)):
+            if bits is None:
+                bits = value.dtype.itemsize * 8
+
+            assert bits <= 16, '"bits" must be lower than or equal to 16!'
+
+            table = self._integer_table(bits)
+
+            return as_float(from_range_1(np.take(table, value, mode='clip')))
+
+        value = as_float_array(to_domain_1(value))
+
+        output = self._interpolate(value)
+
+        outside = ~((value >= self._domain[0]) & (value <= self._domain[1]))
+        if np.any(outside):
+            output[outside] = self._evaluate(value[outside])
+
+        return as_float(from_range_1(output))
@@ -26,7 +26,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.algebra import Extrapolator, LinearInterpolator
-from colour.utilities import from_range_1, to_domain_1
+from colour.utilities import from_range_1, register_cache, to_domain_1
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -95,7 +95,9 @@ def log_encoding_FilmicPro6(t):
     return from_range_1(y)
 
 
-_LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE = None
+_LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE = register_cache(
+    '_LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE',
+    warmer=lambda: _log_decoding_FilmicPro6_interpolator())
 
 
 def _log_decoding_FilmicPro6_interpolator():
@@ -110,14 +112,16 @@ def _log_decoding_FilmicPro6_interpolator():
         function interpolator.
     """
 
-    global _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE
-
-    t = np.arange(0, 1, 0.0001)
-    if _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE is None:
-        _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE = Extrapolator(
+    interpolator = _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE.get(
+        'FilmicPro6')
+    if interpolator is None:
+        t = np.arange(0, 1, 0.0001)
+        interpolator = Extrapolator(
             LinearInterpolator(log_encoding_FilmicPro6(t), t))
+        _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE['FilmicPro6'] = (
+            interpolator)
 
-    return _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE
+    return interpolator
 
 
 def log_decoding_FilmicPro6(y):
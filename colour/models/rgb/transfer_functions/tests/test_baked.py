@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.transfer_functions.baked`
+module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models.rgb.transfer_functions import (
+    BakedCCTF, bake_decoding_cctf, bake_encoding_cctf, eotf_ST2084,
+    log_decoding_ALEXALogC, log_encoding_ACEScct, oetf_BT2100_HLG)
+from colour.utilities import domain_range_scale, ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestBakedCCTF', 'TestBake_encoding_cctf', 'TestBake_decoding_cctf']
+
+
+class TestBakedCCTF(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.transfer_functions.baked.BakedCCTF`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'domain', 'size', 'shaper', 'table',
+                               'max_error')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(BakedCCTF))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('apply', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(BakedCCTF))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.baked.BakedCCTF.\
+apply` method.
+        """
+
+        x = np.linspace(0, 1, 1001)
+        for function, shaper, domain in (
+            (log_decoding_ALEXALogC, 'Linear', (0, 1)),
+            (eotf_ST2084, 'Linear', (0, 1)),
+            (log_encoding_ACEScct, 'Log2', (0, 65504)),
+            (oetf_BT2100_HLG, 'Log2', (0, 1)),
+        ):
+            baked = BakedCCTF(function, domain, shaper=shaper)
+            value = domain[0] + x * (domain[1] - domain[0])
+            np.testing.assert_allclose(
+                baked.apply(value),
+                function(value),
+                atol=baked.max_error * 1.01)
+            self.assertLess(baked.max_error / np.ptp(baked.table), 1e-4)
+
+        baked = BakedCCTF(log_decoding_ALEXALogC, size=16)
+        value = np.array([-0.5, -0.1, 0.5, 1.1, 2.0])
+        np.testing.assert_almost_equal(
+            baked.apply(value)[[0, 1, 3, 4]],
+            log_decoding_ALEXALogC(value)[[0, 1, 3, 4]],
+            decimal=7)
+
+    def test_apply_integer(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.baked.BakedCCTF.\
+apply` method integer input support.
+        """
+
+        baked = BakedCCTF(eotf_ST2084, size=16)
+        for bits, dtype in ((8, np.uint8), (10, np.uint16), (16, np.uint16)):
+            code_values = np.arange(2 ** bits, dtype=dtype)
+            np.testing.assert_almost_equal(
+                baked.apply(code_values, bits),
+                eotf_ST2084(code_values / (2 ** bits - 1)),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            baked.apply(np.array([0, 255], dtype=np.uint8)),
+            eotf_ST2084(np.array([0, 1])),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            baked.apply(np.array([1023, 1024]), 10),
+            eotf_ST2084(np.array([1, 1])),
+            decimal=7)
+
+        baked = bake_decoding_cctf('sRGB')
+        np.testing.assert_almost_equal(
+            baked.apply(1), baked.apply(1.0), decimal=7)
+
+        np.testing.assert_almost_equal(
+            baked.apply(np.array([0, 512, 1023])),
+            baked.apply(np.array([0.0, 512.0, 1023.0])),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            baked.apply(np.array([0, 32768, 65535], dtype=np.uint16)),
+            baked.apply(np.array([0, 32768, 65535]) / 65535),
+            decimal=7)
+
+        self.assertRaises(AssertionError, baked.apply,
+                          np.array([0, 1], dtype=np.uint32), 32)
+
+    def test_n_dimensional_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.baked.BakedCCTF.\
+apply` method n-dimensional arrays support.
+        """
+
+        baked = BakedCCTF(log_decoding_ALEXALogC)
+
+        t = 0.391006832034084
+        x = baked.apply(t)
+        self.assertIsInstance(x, float)
+
+        t = np.tile(t, 6)
+        x = np.tile(x, 6)
+        np.testing.assert_almost_equal(baked.apply(t), x, decimal=7)
+
+        t = np.reshape(t, (2, 3, 1))
+        x = np.reshape(x, (2, 3, 1))
+        np.testing.assert_almost_equal(baked.apply(t), x, decimal=7)
+
+        t = np.reshape(t * 1023, (2, 3, 1)).astype(np.uint16)
+        self.assertTupleEqual(baked.apply(t, 10).shape, (2, 3, 1))
+
+    def test_domain_range_scale_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.baked.BakedCCTF.\
+apply` method domain and range scale support.
+        """
+
+        baked = BakedCCTF(log_decoding_ALEXALogC)
+
+        t = 0.391006832034084
+        x = baked.apply(t)
+        x_i = baked.apply(np.uint16(400), 10)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    baked.apply(t * factor), x * factor, decimal=7)
+                np.testing.assert_almost_equal(
+                    baked.apply(np.uint16(400), 10), x_i * factor, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.baked.BakedCCTF.\
+apply` method nan support.
+        """
+
+        baked = BakedCCTF(log_decoding_ALEXALogC)
+        value = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        np.testing.assert_equal(
+            baked.apply(value), log_decoding_ALEXALogC(value))
+
+
+class TestBake_encoding_cctf(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.bake_encoding_cctf`
+    definition unit tests methods.
+    """
+
+    def test_bake_encoding_cctf(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.bake_encoding_cctf`
+        definition.
+        """
+
+        baked = bake_encoding_cctf('ST 2084', L_p=1000)
+        self.assertIs(baked, bake_encoding_cctf('ST 2084', L_p=1000))
+        self.assertIsNot(baked, bake_encoding_cctf('ST 2084'))
+        self.assertEqual(baked.shaper, 'Log2')
+        np.testing.assert_almost_equal(baked.domain, (0, 1000), decimal=7)
+        self.assertAlmostEqual(baked.apply(0.18), 0.1820115, places=5)
+
+        baked = bake_encoding_cctf('sRGB', domain=(0, 2), shaper='Linear')
+        np.testing.assert_equal(baked.domain, (0, 2))
+        self.assertEqual(baked.shaper, 'Linear')
+
+
+class TestBake_decoding_cctf(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.bake_decoding_cctf`
+    definition unit tests methods.
+    """
+
+    def test_bake_decoding_cctf(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.bake_decoding_cctf`
+        definition.
+        """
+
+        baked = bake_decoding_cctf('ALEXA Log C')
+        self.assertIs(baked, bake_decoding_cctf('ALEXA Log C'))
+        self.assertEqual(baked.shaper, 'Linear')
+        np.testing.assert_equal(baked.domain, (0, 1))
+        self.assertAlmostEqual(baked.apply(0.391006832034084), 0.18, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
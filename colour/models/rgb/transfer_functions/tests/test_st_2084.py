@@ -10,7 +10,8 @@ import numpy as np
 import unittest
 
 from colour.models.rgb.transfer_functions import oetf_ST2084, eotf_ST2084
-from colour.utilities import domain_range_scale, ignore_numpy_errors
+from colour.utilities import (default_float_dtype, domain_range_scale,
+                              ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -79,6 +80,21 @@ oetf_ST2084` definition domain and range scale support.
                 np.testing.assert_almost_equal(
                     oetf_ST2084(C * factor), N * factor, decimal=7)
 
+    def test_default_float_dtype_oetf_ST2084(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.st_2084.\
+oetf_ST2084` definition default float dtype support.
+        """
+
+        C = np.linspace(0, 10000, 1024)
+        N = oetf_ST2084(C)
+
+        with default_float_dtype(np.float32):
+            N_f = oetf_ST2084(C)
+
+            self.assertEqual(N_f.dtype, np.float32)
+            np.testing.assert_allclose(N_f, N, atol=1e-4)
+
     @ignore_numpy_errors
     def test_nan_oetf_ST2084(self):
         """
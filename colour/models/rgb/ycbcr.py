@@ -7,6 +7,8 @@ Defines the *Y'CbCr* colour encoding related transformations:
 
 -   :func:`colour.RGB_to_YCbCr`
 -   :func:`colour.YCbCr_to_RGB`
+-   :class:`colour.RGB_to_YCbCr_Converter`
+-   :class:`colour.YCbCr_to_RGB_Converter`
 -   :func:`colour.RGB_to_YcCbcCrc`
 -   :func:`colour.YcCbcCrc_to_RGB`
 
@@ -57,8 +59,9 @@ from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.models.rgb.transfer_functions import (CV_range, oetf_BT2020,
                                                   eotf_BT2020)
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              domain_range_scale, from_range_1, to_domain_1,
-                              tsplit, tstack)
+                              domain_range_scale, from_range_1,
+                              get_domain_range_scale, to_domain_1, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -69,7 +72,8 @@ __status__ = 'Development'
 
 __all__ = [
     'YCBCR_WEIGHTS', 'YCbCr_ranges', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
-    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB'
+    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB', 'RGB_to_YCbCr_Converter',
+    'YCbCr_to_RGB_Converter'
 ]
 
 YCBCR_WEIGHTS = CaseInsensitiveMapping({
@@ -427,7 +431,7 @@ def YCbCr_to_RGB(YCbCr,
     else:
         YCbCr = to_domain_1(YCbCr)
 
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
+    YCbCr = YCbCr.astype(DEFAULT_FLOAT_DTYPE)
     Kr, Kb = K
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
@@ -435,12 +439,9 @@ def YCbCr_to_RGB(YCbCr,
     RGB_min, RGB_max = kwargs.get('out_range',
                                   CV_range(out_bits, out_legal, out_int))
 
-    Y -= Y_min
-    Cb -= (C_max + C_min) / 2
-    Cr -= (C_max + C_min) / 2
-    Y *= 1 / (Y_max - Y_min)
-    Cb *= 1 / (C_max - C_min)
-    Cr *= 1 / (C_max - C_min)
+    YCbCr -= [Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2]
+    YCbCr *= [1 / (Y_max - Y_min), 1 / (C_max - C_min), 1 / (C_max - C_min)]
+    Y, Cb, Cr = tsplit(YCbCr)
     R = Y + (2 - 2 * Kr) * Cr
     B = Y + (2 - 2 * Kb) * Cb
     G = (Y - Kr * R - Kb * B) / (1 - Kr - Kb)
@@ -644,17 +645,16 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     else:
         YcCbcCrc = to_domain_1(YcCbcCrc)
 
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
+    YcCbcCrc = YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE)
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
                                                 in_bits, in_legal, in_int))
 
-    Yc -= Y_min
-    Cbc -= (C_max + C_min) / 2
-    Crc -= (C_max + C_min) / 2
-    Yc *= 1 / (Y_max - Y_min)
-    Cbc *= 1 / (C_max - C_min)
-    Crc *= 1 / (C_max - C_min)
+    YcCbcCrc -= [Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2]
+    YcCbcCrc *= [
+        1 / (Y_max - Y_min), 1 / (C_max - C_min), 1 / (C_max - C_min)
+    ]
+    Yc, Cbc, Crc = tsplit(YcCbcCrc)
     B = np.where(Cbc <= 0, Cbc * 1.9404 + Yc, Cbc * 1.5816 + Yc)
     R = np.where(Crc <= 0, Crc * 1.7184 + Yc, Crc * 0.9936 + Yc)
 
@@ -668,3 +668,660 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     RGB = tstack([R, G, B])
 
     return from_range_1(RGB)
+
+
+def _YCbCr_affine_transform(K, RGB_range, YCbCr_range):
+    """
+    Returns the matrix and offset converting *R'G'B'* values in given range to
+    *Y'CbCr* colour encoding values in given range.
+    """
+
+    Kr, Kb = K
+    RGB_min, RGB_max = RGB_range
+    Y_min, Y_max, C_min, C_max = YCbCr_range
+
+    M_K = np.array([
+        [Kr, 1 - Kr - Kb, Kb],
+        [-0.5 * Kr / (1 - Kb), -0.5 * (1 - Kr - Kb) / (1 - Kb), 0.5],
+        [0.5, -0.5 * (1 - Kr - Kb) / (1 - Kr), -0.5 * Kb / (1 - Kr)],
+    ])
+
+    S = np.array([Y_max - Y_min, C_max - C_min, C_max - C_min])
+    matrix = S[:, np.newaxis] * M_K / (RGB_max - RGB_min)
+    offset = np.array([Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+    offset = offset - np.sum(matrix, axis=-1) * RGB_min
+
+    return matrix, offset
+
+
+def _integer_dtype(bits):
+    """
+    Returns the smallest unsigned integer dtype storing given bit depth.
+    """
+
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if bits <= np.iinfo(dtype).bits:
+            return dtype
+
+    return np.uint64
+
+
+class _YCbCr_Converter(object):
+    """
+    Defines the base class for the *Y'CbCr* colour encoding converters
+    applying a precomputed affine transform, optionally in fixed-point integer
+    arithmetic, with chroma subsampling support.
+    """
+
+    _SUBSAMPLINGS = {'4:4:4': (1, 1), '4:2:2': (1, 2), '4:2:0': (2, 2)}
+
+    def __init__(self, matrix, offset, in_bits, in_int, out_bits, out_int,
+                 subsampling, dtype, fixed_point, tile_size):
+        if subsampling not in self._SUBSAMPLINGS:
+            raise ValueError(
+                '"{0}" subsampling is invalid, it must be one of {1}!'.format(
+                    subsampling, sorted(self._SUBSAMPLINGS.keys())))
+
+        if fixed_point is None:
+            fixed_point = in_int and out_int
+        elif fixed_point and not (in_int and out_int):
+            raise ValueError('Fixed-point arithmetic requires both integer '
+                             'input and integer output!')
+
+        self._matrix = matrix
+        self._offset = offset
+        self._in_int = in_int
+        self._out_int = out_int
+        self._out_max = 2 ** out_bits - 1
+        self._subsampling = subsampling
+        self._dtype = np.dtype(dtype)
+        self._fixed_point = fixed_point
+        self._out_dtype = (np.dtype(_integer_dtype(out_bits))
+                           if out_int else self._dtype)
+        self._tile_size = None
+        self.tile_size = tile_size
+
+        self._matrix.setflags(write=False)
+        self._offset.setflags(write=False)
+
+        if fixed_point:
+            self._initialise_fixed_point(2 ** in_bits - 1)
+
+    def _initialise_fixed_point(self, in_max):
+        """
+        Computes the fixed-point integer matrix and offset, the fractional bits
+        count being the largest one preventing the accumulator from
+        overflowing, using a 32-bit accumulator whenever it allows for 16
+        fractional bits.
+        """
+
+        # Up to 4 pixels are accumulated for the chroma subsampling.
+        bound = 4 * (np.max(np.sum(np.abs(self._matrix), axis=-1)) * in_max +
+                     np.max(np.abs(self._offset)) + 1)
+
+        for accumulator_dtype in (np.int32, np.int64):
+            headroom = np.iinfo(accumulator_dtype).max / bound
+            shift = min(int(np.floor(np.log2(headroom))), 24)
+            if shift >= 16:
+                break
+
+        self._accumulator_dtype = np.dtype(accumulator_dtype)
+        self._shift = shift
+        self._matrix_i = np.transpose(
+            np.round(self._matrix * 2 ** shift).astype(accumulator_dtype))
+        self._offset_i = np.round(
+            self._offset * 2 ** shift).astype(accumulator_dtype)
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the conversion matrix.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix.
+        """
+
+        return self._matrix
+
+    @property
+    def offset(self):
+        """
+        Getter property for the conversion offset.
+
+        Returns
+        -------
+        ndarray
+            Conversion offset.
+        """
+
+        return self._offset
+
+    @property
+    def subsampling(self):
+        """
+        Getter property for the chroma subsampling.
+
+        Returns
+        -------
+        unicode
+            Chroma subsampling.
+        """
+
+        return self._subsampling
+
+    @property
+    def fixed_point(self):
+        """
+        Getter property for whether the conversion uses fixed-point integer
+        arithmetic.
+
+        Returns
+        -------
+        bool
+            Whether the conversion uses fixed-point integer arithmetic.
+        """
+
+        return self._fixed_point
+
+    @property
+    def dtype(self):
+        """
+        Getter property for the floating point computation and output dtype.
+
+        Returns
+        -------
+        dtype
+            Floating point computation and output dtype.
+        """
+
+        return self._dtype
+
+    @property
+    def tile_size(self):
+        """
+        Getter and setter property for the maximum pixels count processed at
+        once.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the tile size with.
+
+        Returns
+        -------
+        int
+            Tile size.
+        """
+
+        return self._tile_size
+
+    @tile_size.setter
+    def tile_size(self, value):
+        """
+        Setter for **self.tile_size** property.
+        """
+
+        assert value > 0, (
+            '"{0}" attribute: "{1}" is not greater than 0!'.format(
+                'tile_size', value))
+
+        self._tile_size = int(value)
+
+    def _scaled_transform(self):
+        """
+        Returns the matrix and offset accounting for the current domain-range
+        scale of the floating point input and output.
+        """
+
+        scale = 100 if get_domain_range_scale() == '100' else 1
+
+        matrix, offset = self._matrix, self._offset
+        if not self._in_int:
+            matrix = matrix / scale
+        if not self._out_int:
+            matrix, offset = matrix * scale, offset * scale
+
+        return (np.transpose(matrix).astype(self._dtype),
+                offset.astype(self._dtype))
+
+    def _accumulate(self, array, transform):
+        """
+        Applies the conversion matrix to given :math:`(N, 3)` array and
+        returns the accumulator before the offset is added.
+        """
+
+        if self._fixed_point:
+            return np.dot(
+                array.astype(self._accumulator_dtype), self._matrix_i)
+        else:
+            return np.dot(array.astype(self._dtype), transform[0])
+
+    def _finalise(self, accumulator, channels, transform, count, out=None):
+        """
+        Adds the offset to given accumulator of ``count`` summed pixels,
+        quantises the integer output and writes it to given output array if
+        any.
+        """
+
+        if self._fixed_point:
+            extra = count.bit_length() - 1
+            accumulator += (
+                self._offset_i[channels] * count + (1 <<
+                                                    (self._shift + extra - 1)))
+            accumulator >>= self._shift + extra
+        else:
+            if count != 1:
+                accumulator *= 1 / count
+            accumulator += transform[1][channels]
+            if self._out_int:
+                np.round(accumulator, out=accumulator)
+
+        if self._out_int:
+            np.clip(accumulator, 0, self._out_max, out=accumulator)
+
+        if out is None:
+            return accumulator
+
+        np.copyto(out, accumulator, casting='unsafe')
+
+    def _apply_full(self, array, out, transform):
+        """
+        Converts given array without chroma subsampling, tile by tile.
+        """
+
+        out = self._output(array.shape, out)
+
+        array_f = np.reshape(array, (-1, 3))
+        out_f = np.reshape(out, (-1, 3))
+        for i in range(0, array_f.shape[0], self._tile_size):
+            self._finalise(
+                self._accumulate(array_f[i:i + self._tile_size], transform),
+                slice(None), transform, 1, out_f[i:i + self._tile_size])
+
+        if not np.may_share_memory(out_f, out):
+            out[...] = np.reshape(out_f, out.shape)
+
+        return out
+
+    def _output(self, shape, out):
+        """
+        Returns given output array or a new array of given shape after
+        checking its shape.
+        """
+
+        if out is None:
+            return np.empty(shape, dtype=self._out_dtype)
+
+        assert out.shape == shape, (
+            'Output array shape "{0}" does not match "{1}"!'.format(
+                out.shape, shape))
+
+        return out
+
+
+class RGB_to_YCbCr_Converter(_YCbCr_Converter):
+    """
+    Converts *R'G'B'* arrays to *Y'CbCr* colour encoding arrays with a
+    precomputed affine transform.
+
+    Contrary to :func:`colour.RGB_to_YCbCr` definition, the input and output
+    range scaling and the luma weighting coefficients are combined into a
+    single matrix and offset at instantiation. The conversion is applied tile
+    by tile either in fixed-point integer arithmetic or in the given floating
+    point dtype, the integer code values are written directly to *uint8* or
+    *uint16* output arrays and the chroma can be subsampled to *4:2:2* or
+    *4:2:0* planar layouts.
+
+    Parameters
+    ----------
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth for integer input, or used in the calculation of the
+        denominator for legal range float values, i.e. 8-bit means the float
+        value for legal white is *235 / 255*. Default is *10*.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range. Default is *False*.
+    in_int : bool, optional
+        Whether to treat the input values as ``in_bits`` integer code values.
+        Default is *False*.
+    out_bits : int, optional
+        Bit depth for integer output, or used in the calculation of the
+        denominator for legal range float values, i.e. 8-bit means the float
+        value for legal white is *235 / 255*. Ignored if ``out_legal`` and
+        ``out_int`` are both *False*. Default is *8*.
+    out_legal : bool, optional
+        Whether to return legal range values. Default is *True*.
+    out_int : bool, optional
+        Whether to return values as ``out_bits`` integer code values stored in
+        the smallest unsigned integer dtype, e.g. *uint16* for 10-bit. Default
+        is *False*.
+    subsampling : unicode, optional
+        **{'4:4:4', '4:2:2', '4:2:0'}**,
+        Chroma subsampling, the *4:2:2* and *4:2:0* layouts return the
+        :math:`Y'`, :math:`Cb` and :math:`Cr` planes.
+    dtype : object, optional
+        Floating point dtype of the computations and of the float output.
+    fixed_point : bool, optional
+        Whether to use fixed-point integer arithmetic, default to *True* if
+        both ``in_int`` and ``out_int`` are *True*.
+    tile_size : int, optional
+        Maximum pixels count processed at once.
+
+    Other Parameters
+    ----------------
+    in_range : array_like, optional
+        Array overriding the computed range such as
+        *in_range = (RGB_min, RGB_max)*. If ``in_range`` is undefined,
+        *RGB_min* and *RGB_max* will be computed using :func:`colour.CV_range`
+        definition.
+    out_range : array_like, optional
+        Array overriding the computed range such as
+        *out_range = (Y_min, Y_max, C_min, C_max)`. If ``out_range`` is
+        undefined, *Y_min*, *Y_max*, *C_min* and *C_max* will be computed
+        using :func:`colour.models.rgb.ycbcr.YCbCr_ranges` definition.
+
+    Attributes
+    ----------
+    matrix
+    offset
+    subsampling
+    fixed_point
+    dtype
+    tile_size
+
+    Methods
+    -------
+    apply
+
+    Notes
+    -----
+    -   The integer code values are clipped to [0, 2 ** ``out_bits`` - 1].
+    -   The chroma subsampling averages the chroma of each 2x1 or 2x2 block of
+        pixels, the last column and row being repeated for odd dimensions.
+    -   The fixed-point arithmetic rounds the half integer code values upward
+        whereas :func:`colour.RGB_to_YCbCr` definition rounds them to the
+        nearest even value, the results may thus differ by one code value.
+
+    Examples
+    --------
+    >>> converter = RGB_to_YCbCr_Converter(
+    ...     in_int=True, out_bits=10, out_int=True)
+    >>> RGB = np.array([[1023, 1023, 1023], [1023, 0, 0]], dtype=np.uint16)
+    >>> converter.apply(RGB)
+    array([[940, 512, 512],
+           [250, 409, 960]], dtype=uint16)
+
+    Subsampling the chroma to *4:2:0*:
+
+    >>> converter = RGB_to_YCbCr_Converter(
+    ...     in_int=True, out_bits=10, out_int=True, subsampling='4:2:0')
+    >>> RGB = np.tile(RGB, (2, 1, 1))
+    >>> Y, Cb, Cr = converter.apply(RGB)
+    >>> Y
+    array([[940, 250],
+           [940, 250]], dtype=uint16)
+    >>> Cb
+    array([[461]], dtype=uint16)
+    """
+
+    def __init__(self,
+                 K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                 in_bits=10,
+                 in_legal=False,
+                 in_int=False,
+                 out_bits=8,
+                 out_legal=True,
+                 out_int=False,
+                 subsampling='4:4:4',
+                 dtype=np.float32,
+                 fixed_point=None,
+                 tile_size=2 ** 18,
+                 **kwargs):
+        matrix, offset = _YCbCr_affine_transform(
+            K, kwargs.get('in_range', CV_range(in_bits, in_legal, in_int)),
+            kwargs.get('out_range', YCbCr_ranges(out_bits, out_legal,
+                                                 out_int)))
+
+        super(RGB_to_YCbCr_Converter, self).__init__(
+            matrix, offset, in_bits, in_int, out_bits, out_int, subsampling,
+            dtype, fixed_point, tile_size)
+
+    def apply(self, RGB, out=None):
+        """
+        Converts given *R'G'B'* array to *Y'CbCr* colour encoding.
+
+        Parameters
+        ----------
+        RGB : array_like
+            Input *R'G'B'* array of floats or integer values, of shape
+            :math:`(H, W, 3)` for the *4:2:2* and *4:2:0* subsamplings.
+        out : ndarray or tuple, optional
+            Array or :math:`Y'`, :math:`Cb` and :math:`Cr` planes to write the
+            *Y'CbCr* colour encoding values into.
+
+        Returns
+        -------
+        ndarray or tuple
+            *Y'CbCr* colour encoding array or :math:`Y'`, :math:`Cb` and
+            :math:`Cr` planes for the *4:2:2* and *4:2:0* subsamplings.
+        """
+
+        RGB = np.asarray(RGB)
+        transform = self._scaled_transform()
+
+        if self._subsampling == '4:4:4':
+            return self._apply_full(RGB, out, transform)
+
+        if RGB.ndim != 3:
+            raise ValueError('"4:2:2" and "4:2:0" subsamplings require an '
+                             '"(H, W, 3)" shaped array!')
+
+        h_s, w_s = self._SUBSAMPLINGS[self._subsampling]
+        height, width = RGB.shape[:2]
+        C_shape = (-(-height // h_s), -(-width // w_s))
+        if out is None:
+            out = (None, None, None)
+        Y = self._output((height, width), out[0])
+        Cb = self._output(C_shape, out[1])
+        Cr = self._output(C_shape, out[2])
+
+        rows = max(self._tile_size // width, 1)
+        rows += rows % h_s
+        for i in range(0, height, rows):
+            band = RGB[i:i + rows]
+            accumulator = np.reshape(
+                self._accumulate(np.reshape(band, (-1, 3)), transform),
+                band.shape)
+
+            self._finalise(accumulator[..., 0], 0, transform, 1, Y[i:i + rows])
+
+            C = accumulator[..., 1:]
+            if C.shape[1] % w_s:
+                C = np.concatenate([C, C[:, -1:]], axis=1)
+            if C.shape[0] % h_s:
+                C = np.concatenate([C, C[-1:]], axis=0)
+            C = np.sum(
+                np.reshape(
+                    C, (C.shape[0] // h_s, h_s, C.shape[1] // w_s, w_s, 2)),
+                axis=(1, 3),
+                dtype=C.dtype)
+
+            C = self._finalise(C, slice(1, 3), transform, h_s * w_s)
+            j = i // h_s
+            np.copyto(Cb[j:j + C.shape[0]], C[..., 0], casting='unsafe')
+            np.copyto(Cr[j:j + C.shape[0]], C[..., 1], casting='unsafe')
+
+        return Y, Cb, Cr
+
+
+class YCbCr_to_RGB_Converter(_YCbCr_Converter):
+    """
+    Converts *Y'CbCr* colour encoding arrays to *R'G'B'* arrays with a
+    precomputed affine transform.
+
+    Contrary to :func:`colour.YCbCr_to_RGB` definition, the input and output
+    range scaling and the luma weighting coefficients are combined into a
+    single matrix and offset at instantiation. The conversion is applied tile
+    by tile either in fixed-point integer arithmetic or in the given floating
+    point dtype, the integer code values are written directly to *uint8* or
+    *uint16* output arrays and *4:2:2* or *4:2:0* planar layouts can be
+    converted.
+
+    Parameters
+    ----------
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth for integer input, or used in the calculation of the
+        denominator for legal range float values, i.e. 8-bit means the float
+        value for legal white is *235 / 255*. Default is *8*.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range. Default is *True*.
+    in_int : bool, optional
+        Whether to treat the input values as ``in_bits`` integer code values.
+        Default is *False*.
+    out_bits : int, optional
+        Bit depth for integer output, or used in the calculation of the
+        denominator for legal range float values, i.e. 8-bit means the float
+        value for legal white is *235 / 255*. Ignored if ``out_legal`` and
+        ``out_int`` are both *False*. Default is *10*.
+    out_legal : bool, optional
+        Whether to return legal range values. Default is *False*.
+    out_int : bool, optional
+        Whether to return values as ``out_bits`` integer code values stored in
+        the smallest unsigned integer dtype, e.g. *uint16* for 10-bit. Default
+        is *False*.
+    subsampling : unicode, optional
+        **{'4:4:4', '4:2:2', '4:2:0'}**,
+        Chroma subsampling, the *4:2:2* and *4:2:0* layouts expect the
+        :math:`Y'`, :math:`Cb` and :math:`Cr` planes.
+    dtype : object, optional
+        Floating point dtype of the computations and of the float output.
+    fixed_point : bool, optional
+        Whether to use fixed-point integer arithmetic, default to *True* if
+        both ``in_int`` and ``out_int`` are *True*.
+    tile_size : int, optional
+        Maximum pixels count processed at once.
+
+    Other Parameters
+    ----------------
+    in_range : array_like, optional
+        Array overriding the computed range such as
+        *in_range = (Y_min, Y_max, C_min, C_max)*. If ``in_range`` is
+        undefined, *Y_min*, *Y_max*, *C_min* and *C_max* will be computed
+        using :func:`colour.models.rgb.ycbcr.YCbCr_ranges` definition.
+    out_range : array_like, optional
+        Array overriding the computed range such as
+        *out_range = (RGB_min, RGB_max)*. If ``out_range`` is undefined,
+        *RGB_min* and *RGB_max* will be computed using :func:`colour.CV_range`
+        definition.
+
+    Attributes
+    ----------
+    matrix
+    offset
+    subsampling
+    fixed_point
+    dtype
+    tile_size
+
+    Methods
+    -------
+    apply
+
+    Notes
+    -----
+    -   The integer code values are clipped to [0, 2 ** ``out_bits`` - 1].
+    -   The subsampled chroma is upsampled by repeating each sample over its
+        2x1 or 2x2 block of pixels.
+
+    Examples
+    --------
+    >>> converter = YCbCr_to_RGB_Converter(
+    ...     in_bits=10, in_int=True, out_bits=10, out_int=True)
+    >>> YCbCr = np.array([[940, 512, 512], [250, 409, 960]], dtype=np.uint16)
+    >>> converter.apply(YCbCr)
+    array([[1023, 1023, 1023],
+           [1023,    0,    0]], dtype=uint16)
+    """
+
+    def __init__(self,
+                 K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                 in_bits=8,
+                 in_legal=True,
+                 in_int=False,
+                 out_bits=10,
+                 out_legal=False,
+                 out_int=False,
+                 subsampling='4:4:4',
+                 dtype=np.float32,
+                 fixed_point=None,
+                 tile_size=2 ** 18,
+                 **kwargs):
+        matrix, offset = _YCbCr_affine_transform(
+            K, kwargs.get('out_range', CV_range(out_bits, out_legal, out_int)),
+            kwargs.get('in_range', YCbCr_ranges(in_bits, in_legal, in_int)))
+        matrix = np.linalg.inv(matrix)
+        offset = -np.dot(matrix, offset)
+
+        super(YCbCr_to_RGB_Converter, self).__init__(
+            matrix, offset, in_bits, in_int, out_bits, out_int, subsampling,
+            dtype, fixed_point, tile_size)
+
+    def apply(self, YCbCr, out=None):
+        """
+        Converts given *Y'CbCr* colour encoding array to *R'G'B'*.
+
+        Parameters
+        ----------
+        YCbCr : array_like or tuple
+            Input *Y'CbCr* colour encoding array of floats or integer values
+            or :math:`Y'`, :math:`Cb` and :math:`Cr` planes for the *4:2:2* and
+            *4:2:0* subsamplings.
+        out : ndarray, optional
+            Array to write the *R'G'B'* values into.
+
+        Returns
+        -------
+        ndarray
+            *R'G'B'* array.
+        """
+
+        transform = self._scaled_transform()
+
+        if self._subsampling == '4:4:4':
+            return self._apply_full(np.asarray(YCbCr), out, transform)
+
+        Y, Cb, Cr = [np.asarray(plane) for plane in YCbCr]
+
+        h_s, w_s = self._SUBSAMPLINGS[self._subsampling]
+        height, width = Y.shape
+        RGB = self._output((height, width, 3), out)
+
+        rows = max(self._tile_size // width, 1)
+        rows += rows % h_s
+        for i in range(0, height, rows):
+            Y_b = Y[i:i + rows]
+            j = i // h_s
+            C_b = [
+                np.repeat(
+                    np.repeat(C[j:j + -(-Y_b.shape[0] // h_s)], w_s,
+                              axis=1)[:, :width],
+                    h_s,
+                    axis=0)[:Y_b.shape[0]] for C in (Cb, Cr)
+            ]
+            band = tstack([Y_b, C_b[0], C_b[1]])
+
+            self._finalise(
+                np.reshape(
+                    self._accumulate(np.reshape(band, (-1, 3)), transform),
+                    band.shape), slice(None), transform, 1, RGB[i:i + rows])
+
+        return RGB
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for the array allocations of :mod:`colour.models` package
+conversion definitions supporting the ``out`` argument.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+from colour.models import (RGB_COLOURSPACES, XYZ_to_IPT, XYZ_to_JzAzBz,
+                           XYZ_to_Lab, XYZ_to_Luv, XYZ_to_RGB, XYZ_to_xyY,
+                           Lab_to_XYZ, RGB_to_XYZ)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['peak_allocated_memory', 'TestAllocations']
+
+
+def peak_allocated_memory(definition, *args, **kwargs):
+    """
+    Returns the peak memory allocated while calling given definition with
+    given arguments, *Numpy* reports its array allocations to
+    :mod:`tracemalloc` module.
+
+    Parameters
+    ----------
+    definition : callable
+        Definition to trace the allocations of.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments to call the definition with.
+    \\**kwargs : dict, optional
+        Keywords arguments to call the definition with.
+
+    Returns
+    -------
+    int
+        Peak allocated memory in bytes.
+    """
+
+    # Warming up so that the definition caches do not contribute.
+    definition(*args, **kwargs)
+
+    tracemalloc.start()
+    try:
+        definition(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+@unittest.skipIf(tracemalloc is None or tracemalloc.is_tracing(),
+                 'Memory allocations cannot be traced!')
+class TestAllocations(unittest.TestCase):
+    """
+    Defines the array allocations unit tests of the conversion definitions
+    supporting the ``out`` argument.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.random.RandomState(4).uniform(0, 1, (256, 256, 3))
+        self._out = np.empty(self._XYZ.shape)
+
+        self._colourspace = RGB_COLOURSPACES['sRGB']
+
+    def assert_allocations(self, definition, bound, *args):
+        """
+        Asserts that the peak memory allocated by given definition, relative
+        to the input array size, is lower than given bound.
+
+        With the ``out`` argument, the only array allocations remaining are
+        the domain-scaled copy of the input array and some boolean masks,
+        without it, the output array is additionally allocated.
+        """
+
+        size = self._XYZ.nbytes
+
+        self.assertLess(
+            peak_allocated_memory(definition, self._XYZ, *args, out=self._out)
+            / size, bound)
+
+        self.assertLess(
+            peak_allocated_memory(definition, self._XYZ, *args) / size,
+            bound + 1)
+
+    def test_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition array
+        allocations.
+        """
+
+        self.assert_allocations(XYZ_to_Lab, 1.5)
+
+    def test_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition array
+        allocations.
+        """
+
+        self.assert_allocations(Lab_to_XYZ, 1.5)
+
+    def test_XYZ_to_xyY(self):
+        """
+        Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition array
+        allocations.
+        """
+
+        self.assert_allocations(XYZ_to_xyY, 1.5)
+
+    def test_XYZ_to_Luv(self):
+        """
+        Tests :func:`colour.models.cie_luv.XYZ_to_Luv` definition array
+        allocations.
+        """
+
+        self.assert_allocations(XYZ_to_Luv, 1.5)
+
+    def test_XYZ_to_IPT(self):
+        """
+        Tests :func:`colour.models.ipt.XYZ_to_IPT` definition array
+        allocations.
+        """
+
+        self.assert_allocations(XYZ_to_IPT, 1.75)
+
+    def test_XYZ_to_JzAzBz(self):
+        """
+        Tests :func:`colour.models.jzazbz.XYZ_to_JzAzBz` definition array
+        allocations.
+        """
+
+        # :func:`colour.models.oetf_ST2084` definition allocates its own
+        # intermediate arrays.
+        self.assert_allocations(XYZ_to_JzAzBz, 7.5)
+
+    def test_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        array allocations.
+        """
+
+        colourspace = self._colourspace
+        self.assert_allocations(XYZ_to_RGB, 1.25, colourspace.whitepoint,
+                                colourspace.whitepoint,
+                                colourspace.XYZ_to_RGB_matrix)
+
+    def test_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        array allocations.
+        """
+
+        colourspace = self._colourspace
+        self.assert_allocations(RGB_to_XYZ, 1.25, colourspace.whitepoint,
+                                colourspace.whitepoint,
+                                colourspace.RGB_to_XYZ_matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
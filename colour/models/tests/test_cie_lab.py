@@ -10,7 +10,8 @@ import unittest
 from itertools import permutations
 
 from colour.models import XYZ_to_Lab, Lab_to_XYZ, Lab_to_LCHab, LCHab_to_Lab
-from colour.utilities import domain_range_scale, ignore_numpy_errors
+from colour.utilities import (default_float_dtype, domain_range_scale,
+                              ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -98,6 +99,19 @@ class TestXYZ_to_Lab(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_Lab(XYZ, illuminant), Lab, decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition
+        out argument support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(-0.1, 1.1, (4, 8, 3))
+        illuminant = np.array([0.34570, 0.35850])
+        out = np.empty((4, 8, 3))
+        self.assertIs(XYZ_to_Lab(XYZ, illuminant, out=out), out)
+        np.testing.assert_almost_equal(
+            out, XYZ_to_Lab(XYZ, illuminant), decimal=7)
+
     def test_domain_range_scale_XYZ_to_Lab(self):
         """
         Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition
@@ -116,6 +130,21 @@ class TestXYZ_to_Lab(unittest.TestCase):
                     Lab * factor_b,
                     decimal=7)
 
+    def test_default_float_dtype_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition default
+        float dtype support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 1, (16, 3))
+        Lab = XYZ_to_Lab(XYZ)
+
+        with default_float_dtype(np.float32):
+            Lab_f = XYZ_to_Lab(XYZ)
+
+            self.assertEqual(Lab_f.dtype, np.float32)
+            np.testing.assert_allclose(Lab_f, Lab, atol=1e-3)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -204,6 +233,19 @@ class TestLab_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             Lab_to_XYZ(Lab, illuminant), XYZ, decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition
+        out argument support.
+        """
+
+        Lab = np.random.RandomState(4).uniform(-100, 100, (4, 8, 3))
+        illuminant = np.tile(np.array([0.34570, 0.35850]), (4, 8, 1))
+        out = np.empty((4, 8, 3))
+        self.assertIs(Lab_to_XYZ(Lab, illuminant, out=out), out)
+        np.testing.assert_almost_equal(
+            out, Lab_to_XYZ(Lab, illuminant), decimal=7)
+
     def test_domain_range_scale_Lab_to_XYZ(self):
         """
         Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition
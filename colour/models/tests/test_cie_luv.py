@@ -100,6 +100,19 @@ class TestXYZ_to_Luv(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_Luv(XYZ, illuminant), Luv, decimal=7)
 
+    def test_out_XYZ_to_Luv(self):
+        """
+        Tests :func:`colour.models.cie_luv.XYZ_to_Luv` definition
+        out argument support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(-0.1, 1.1, (4, 8, 3))
+        illuminant = np.tile(np.array([0.34570, 0.35850]), (4, 8, 1))
+        out = np.empty((4, 8, 3))
+        self.assertIs(XYZ_to_Luv(XYZ, illuminant, out=out), out)
+        np.testing.assert_almost_equal(
+            out, XYZ_to_Luv(XYZ, illuminant), decimal=7)
+
     def test_domain_range_scale_XYZ_to_Luv(self):
         """
         Tests :func:`colour.models.cie_luv.XYZ_to_Luv` definition
@@ -98,6 +98,20 @@ class TestXYZ_to_xyY(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_xyY(XYZ, illuminant), xyY, decimal=7)
 
+    def test_out_XYZ_to_xyY(self):
+        """
+        Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition
+        out argument support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 1, (4, 8, 3))
+        XYZ[0, 0] = 0
+        illuminant = np.array([0.34570, 0.35850])
+        out = np.empty((4, 8, 3))
+        self.assertIs(XYZ_to_xyY(XYZ, illuminant, out=out), out)
+        np.testing.assert_almost_equal(
+            out, XYZ_to_xyY(XYZ, illuminant), decimal=7)
+
     def test_domain_range_scale_XYZ_to_xyY(self):
         """
         Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition domain and
@@ -66,6 +66,17 @@ class TestXYZ_to_IPT(unittest.TestCase):
         IPT = np.reshape(IPT, (2, 3, 3))
         np.testing.assert_almost_equal(XYZ_to_IPT(XYZ), IPT, decimal=7)
 
+    def test_out_XYZ_to_IPT(self):
+        """
+        Tests :func:`colour.models.ipt.XYZ_to_IPT` definition
+        out argument support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(-0.1, 1.1, (4, 8, 3))
+        out = np.empty((4, 8, 3))
+        self.assertIs(XYZ_to_IPT(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ_to_IPT(XYZ), decimal=7)
+
     def test_domain_range_scale_XYZ_to_IPT(self):
         """
         Tests :func:`colour.models.ipt.XYZ_to_IPT` definition domain and
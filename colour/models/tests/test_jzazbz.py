@@ -66,6 +66,17 @@ class TestXYZ_to_JzAzBz(unittest.TestCase):
         JzAzBz = np.reshape(JzAzBz, (2, 3, 3))
         np.testing.assert_almost_equal(XYZ_to_JzAzBz(XYZ), JzAzBz, decimal=7)
 
+    def test_out_XYZ_to_JzAzBz(self):
+        """
+        Tests :func:`colour.models.jzazbz.XYZ_to_JzAzBz` definition
+        out argument support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 1, (4, 8, 3))
+        out = np.empty((4, 8, 3))
+        self.assertIs(XYZ_to_JzAzBz(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ_to_JzAzBz(XYZ), decimal=7)
+
     def test_domain_range_scale_XYZ_to_JzAzBz(self):
         """
         Tests :func:`colour.models.jzazbz.XYZ_to_JzAzBz` definition domain and
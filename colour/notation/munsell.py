@@ -132,8 +132,9 @@ from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (CaseInsensitiveMapping, Lookup, as_float_array,
                               as_float, domain_range_scale, from_range_1,
                               from_range_10, get_domain_range_scale,
-                              to_domain_1, to_domain_10, to_domain_100,
-                              is_integer, is_numeric, tsplit, usage_warning)
+                              profiled, register_cache, to_domain_1,
+                              to_domain_10, to_domain_100, is_integer,
+                              is_numeric, tsplit, usage_warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -197,9 +198,15 @@ MUNSELL_DEFAULT_ILLUMINANT = 'C'
 MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = (ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][MUNSELL_DEFAULT_ILLUMINANT])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_SPECIFICATIONS_CACHE = register_cache(
+    '_MUNSELL_SPECIFICATIONS_CACHE',
+    warmer=lambda: _munsell_specifications())
+_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = register_cache(
+    '_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE',
+    warmer=lambda: _munsell_value_ASTMD153508_interpolator())
+_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = register_cache(
+    '_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE',
+    warmer=lambda: _munsell_maximum_chromas_from_renotation())
 
 
 def _munsell_specifications():
@@ -227,15 +234,14 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
-
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = [
+    specifications = _MUNSELL_SPECIFICATIONS_CACHE.get('All')
+    if specifications is None:
+        _MUNSELL_SPECIFICATIONS_CACHE['All'] = specifications = [
             munsell_colour_to_munsell_specification(
                 MUNSELL_COLOUR_FORMAT.format(*colour[0]))
             for colour in MUNSELL_COLOURS_ALL
         ]
-    return _MUNSELL_SPECIFICATIONS_CACHE
+    return specifications
 
 
 def _munsell_value_ASTMD153508_interpolator():
@@ -249,15 +255,17 @@ def _munsell_value_ASTMD153508_interpolator():
         *Munsell* value interpolator for *ASTM D1535-08e1* method.
     """
 
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
-
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
+    interpolator = _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE.get(
+        'ASTM D1535-08')
+    if interpolator is None:
+        munsell_values = np.arange(0, 10, 0.001)
+        interpolator = Extrapolator(
             LinearInterpolator(
                 luminance_ASTMD153508(munsell_values), munsell_values))
+        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE[
+            'ASTM D1535-08'] = interpolator
 
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    return interpolator
 
 
 def _munsell_maximum_chromas_from_renotation():
@@ -271,9 +279,8 @@ def _munsell_maximum_chromas_from_renotation():
         Maximum *Munsell* chromas.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
-
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
+    maximum_chromas = _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE.get('All')
+    if maximum_chromas is None:
         chromas = OrderedDict()
         for munsell_colour in MUNSELL_COLOURS_ALL:
             hue, value, chroma, code = munsell_colour_to_munsell_specification(
@@ -284,9 +291,10 @@ def _munsell_maximum_chromas_from_renotation():
 
             chromas[index] = chroma
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        maximum_chromas = tuple(zip(chromas.keys(), chromas.values()))
+        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE['All'] = (
+            maximum_chromas)
+    return maximum_chromas
 
 
 def munsell_value_Priest1920(Y):
@@ -657,6 +665,7 @@ Aliases:
 MUNSELL_VALUE_METHODS['astm2008'] = (MUNSELL_VALUE_METHODS['ASTM D1535-08'])
 
 
+@profiled
 def munsell_value(Y, method='ASTM D1535-08'):
     """
     Returns the *Munsell* value :math:`V` of given *luminance* :math:`Y` using
@@ -37,7 +37,8 @@ from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import as_float_array, domain_range_scale, tsplit
+from colour.utilities import (as_float_array, domain_range_scale, profiled,
+                              tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -111,6 +112,7 @@ class CQS_Specification(
     """
 
 
+@profiled
 def colour_quality_scale(sd_test, additional_data=False):
     """
     Returns the *Colour Quality Scale* (CQS) of given spectral
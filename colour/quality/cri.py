@@ -33,7 +33,7 @@ from colour.colorimetry import (
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
-from colour.utilities import domain_range_scale
+from colour.utilities import domain_range_scale, profiled
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -87,6 +87,7 @@ class CRI_Specification(
     """
 
 
+@profiled
 def colour_rendering_index(sd_test, additional_data=False):
     """
     Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given spectral
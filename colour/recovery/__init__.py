@@ -13,7 +13,7 @@ References
 from __future__ import absolute_import
 
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs)
+                              filter_kwargs, profiled)
 
 from .dataset import *  # noqa
 from . import dataset
@@ -41,6 +41,7 @@ XYZ_TO_SD_METHODS : CaseInsensitiveMapping
 """
 
 
+@profiled
 def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
     """
     Recovers the spectral distribution of given *CIE XYZ* tristimulus
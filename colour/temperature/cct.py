@@ -94,8 +94,8 @@ from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
                                 sd_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
-                              filter_kwargs, runtime_warning, tsplit, tstack,
-                              usage_warning)
+                              filter_kwargs, profiled, runtime_warning, tsplit,
+                              tstack, usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -670,6 +670,7 @@ UV_TO_CCT_METHODS['ohno2013'] = UV_TO_CCT_METHODS['Ohno 2013']
 UV_TO_CCT_METHODS['robertson1968'] = UV_TO_CCT_METHODS['Robertson 1968']
 
 
+@profiled
 def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     """
     Returns the correlated colour temperature :math:`T_{cp}` and
@@ -752,6 +753,7 @@ CCT_TO_UV_METHODS['ohno2013'] = CCT_TO_UV_METHODS['Ohno 2013']
 CCT_TO_UV_METHODS['robertson1968'] = CCT_TO_UV_METHODS['Robertson 1968']
 
 
+@profiled
 def CCT_to_uv(CCT, method='Ohno 2013', **kwargs):
     """
     Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
@@ -1011,6 +1013,7 @@ XY_TO_CCT_METHODS['mccamy1992'] = XY_TO_CCT_METHODS['McCamy 1992']
 XY_TO_CCT_METHODS['hernandez1999'] = XY_TO_CCT_METHODS['Hernandez 1999']
 
 
+@profiled
 def xy_to_CCT(xy, method='McCamy 1992'):
     """
     Returns the correlated colour temperature :math:`T_{cp}` from given
@@ -1063,6 +1066,7 @@ CCT_TO_XY_METHODS['kang2002'] = CCT_TO_XY_METHODS['Kang 2002']
 CCT_TO_XY_METHODS['cie_d'] = CCT_TO_XY_METHODS['CIE Illuminant D Series']
 
 
+@profiled
 def CCT_to_xy(CCT, method='Kang 2002'):
     """
     Returns the *CIE XYZ* tristimulus values *xy* chromaticity coordinates from
@@ -12,12 +12,18 @@ from .common import (
     domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
     to_domain_degrees, to_domain_int, from_range_1, from_range_10,
     from_range_100, from_range_degrees, from_range_int)
-from .array import (as_array, as_int_array, as_float_array, as_numeric, as_int,
-                    as_float, as_namedtuple, closest_indexes, closest,
-                    normalise_maximum, interval, is_uniform, in_array, tstack,
-                    tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, lerp, fill_nan, ndarray_write)
+from .array import (get_default_float_dtype, set_default_float_dtype,
+                    default_float_dtype, as_array, as_int_array,
+                    as_float_array, as_numeric, as_int, as_float,
+                    as_namedtuple, closest_indexes, closest, normalise_maximum,
+                    interval, is_uniform, in_array, tstack, tsplit,
+                    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
+                    linear_conversion, lerp, fill_nan, ndarray_write)
 from .metrics import metric_mse, metric_psnr
+from .profiling import (CallStatistics, CacheStatistics, ProfilingStatistics,
+                        profiling, profiled, profile_cache_access)
+from .cache import (Cache, CACHE_REGISTRY, register_cache, clear_caches,
+                    warm_up_caches, write_caches, read_caches)
 from .verbose import (ColourWarning, ColourUsageWarning, ColourRuntimeWarning,
                       message_box, show_warning, warning, runtime_warning,
                       usage_warning, filter_warnings, suppress_warnings,
@@ -38,13 +44,23 @@ __all__ += [
     'from_range_int'
 ]
 __all__ += [
-    'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'lerp', 'ndarray_write'
+    'get_default_float_dtype', 'set_default_float_dtype',
+    'default_float_dtype', 'as_array', 'as_int_array', 'as_float_array',
+    'as_numeric', 'as_int', 'as_float', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'fill_nan', 'lerp',
+    'ndarray_write'
 ]
 __all__ += ['metric_mse', 'metric_psnr']
+__all__ += [
+    'CallStatistics', 'CacheStatistics', 'ProfilingStatistics', 'profiling',
+    'profiled', 'profile_cache_access'
+]
+__all__ += [
+    'Cache', 'CACHE_REGISTRY', 'register_cache', 'clear_caches',
+    'warm_up_caches', 'write_caches', 'read_caches'
+]
 __all__ += [
     'ColourWarning', 'ColourUsageWarning', 'ColourRuntimeWarning',
     'message_box', 'show_warning', 'warning', 'runtime_warning',
@@ -19,7 +19,9 @@ numpy-fastest-way-of-computing-diagonal-for-each-row-of-a-2d-array/\
 
 from __future__ import division, unicode_literals
 
+import functools
 import numpy as np
+import threading
 from collections import Mapping
 from contextlib import contextmanager
 
@@ -33,15 +35,213 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'lerp', 'fill_nan', 'ndarray_write'
+    'get_default_float_dtype', 'set_default_float_dtype',
+    'default_float_dtype', 'as_array', 'as_int_array', 'as_float_array',
+    'as_numeric', 'as_int', 'as_float', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'lerp', 'fill_nan',
+    'ndarray_write'
 ]
 
 
-def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
+class _ThreadLocalVariable(object):
+    """
+    A minimal thread-local substitute for :class:`contextvars.ContextVar`
+    class used when the :mod:`contextvars` module is not available, i.e.
+    *Python* 2.7 and *Python* 3.6.
+
+    Parameters
+    ----------
+    name : unicode
+        Variable name.
+    default : object, optional
+        Value returned when the variable is not set in the current thread.
+    """
+
+    def __init__(self, name, default=None):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        """
+        Returns the variable value in the current thread.
+        """
+
+        return getattr(self._local, 'value', self._default)
+
+    def set(self, value):
+        """
+        Sets the variable value in the current thread and returns a token
+        that can be used to restore the previous value.
+        """
+
+        token = getattr(self._local, 'value', self._default)
+        self._local.value = value
+
+        return token
+
+    def reset(self, token):
+        """
+        Restores the variable value in the current thread to the value it had
+        before the :meth:`_ThreadLocalVariable.set` call that created given
+        token.
+        """
+
+        self._local.value = token
+
+
+try:
+    from contextvars import ContextVar as _ContextVariable
+except ImportError:  # pragma: no cover
+    _ContextVariable = _ThreadLocalVariable
+
+_DEFAULT_FLOAT_DTYPE = DEFAULT_FLOAT_DTYPE
+"""
+Global variable storing the current *Colour* process-wide floating point
+number dtype.
+
+_DEFAULT_FLOAT_DTYPE : type
+"""
+
+_DEFAULT_FLOAT_DTYPE_CONTEXT = _ContextVariable(
+    'colour_default_float_dtype', default=None)
+"""
+Context-local variable storing the floating point number dtype set by the
+:class:`colour.utilities.default_float_dtype` class context manager and
+decorator. It is local to the current thread and to the current
+:mod:`asyncio` task.
+
+_DEFAULT_FLOAT_DTYPE_CONTEXT : ContextVar
+"""
+
+
+def _float_dtype(dtype):
+    """
+    Validates given floating point number dtype and returns its scalar type.
+    """
+
+    dtype = np.dtype(dtype)
+
+    assert dtype.type in (np.float16, np.float32, np.float64), (
+        '"{0}" dtype is not a supported floating point number dtype!'.format(
+            dtype))
+
+    return dtype.type
+
+
+def get_default_float_dtype():
+    """
+    Returns the current *Colour* floating point number dtype, i.e. the dtype
+    used by :func:`colour.utilities.as_float_array`,
+    :func:`colour.utilities.tstack`, :func:`colour.utilities.to_domain_1` and
+    the related definitions for the conversions to *ndarray*.
+
+    Returns
+    -------
+    type
+        *Colour* floating point number dtype.
+
+    Examples
+    --------
+    >>> get_default_float_dtype()
+    <class 'numpy.float64'>
+    """
+
+    dtype = _DEFAULT_FLOAT_DTYPE_CONTEXT.get()
+
+    return _DEFAULT_FLOAT_DTYPE if dtype is None else dtype
+
+
+def set_default_float_dtype(dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Sets the current *Colour* process-wide floating point number dtype.
+
+    Parameters
+    ----------
+    dtype : object, optional
+        **{np.float64, np.float32, np.float16}**,
+        *Colour* floating point number dtype to set.
+
+    Warnings
+    --------
+    Computations performed with a reduced precision dtype trade accuracy for
+    memory bandwidth and throughput, *np.float32* is typically sufficient for
+    image processing.
+
+    Examples
+    --------
+    >>> set_default_float_dtype(np.float32)
+    >>> as_float_array([1, 2, 3]).dtype
+    dtype('float32')
+    >>> set_default_float_dtype()
+    >>> as_float_array([1, 2, 3]).dtype
+    dtype('float64')
+    """
+
+    global _DEFAULT_FLOAT_DTYPE
+
+    _DEFAULT_FLOAT_DTYPE = _float_dtype(dtype)
+
+
+class default_float_dtype(object):
+    """
+    A context manager and decorator temporarily setting *Colour* floating
+    point number dtype for the current thread and :mod:`asyncio` task.
+
+    Parameters
+    ----------
+    dtype : object
+        **{np.float64, np.float32, np.float16}**,
+        *Colour* floating point number dtype to set.
+
+    Examples
+    --------
+    >>> with default_float_dtype(np.float32):
+    ...     as_float_array([1, 2, 3]).dtype
+    dtype('float32')
+    """
+
+    def __init__(self, dtype):
+        self._dtype = _float_dtype(dtype)
+        self._tokens = []
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        self._tokens.append(_DEFAULT_FLOAT_DTYPE_CONTEXT.set(self._dtype))
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        _DEFAULT_FLOAT_DTYPE_CONTEXT.reset(self._tokens.pop())
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # The token is kept local so that the decorated definition can be
+            # called concurrently from multiple threads.
+            token = _DEFAULT_FLOAT_DTYPE_CONTEXT.set(self._dtype)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _DEFAULT_FLOAT_DTYPE_CONTEXT.reset(token)
+
+        return wrapper
+
+
+def as_array(a, dtype=None):
     """
     Converts given :math:`a` variable to *ndarray* with given type.
 
@@ -49,8 +249,9 @@ def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    dtype : object
-        Type to use for conversion.
+    dtype : object, optional
+        Type to use for conversion, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -65,6 +266,9 @@ def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
     array([1, 2, 3])
     """
 
+    if dtype is None:
+        dtype = get_default_float_dtype()
+
     return np.asarray(a, dtype)
 
 
@@ -94,8 +298,8 @@ def as_int_array(a):
 
 def as_float_array(a):
     """
-    Converts given :math:`a` variable to *ndarray* using the type defined by
-    :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    Converts given :math:`a` variable to *ndarray* using the type returned by
+    :func:`colour.utilities.get_default_float_dtype` definition.
 
     Parameters
     ----------
@@ -113,10 +317,10 @@ def as_float_array(a):
     array([ 1.,  2.,  3.])
     """
 
-    return as_array(a, DEFAULT_FLOAT_DTYPE)
+    return as_array(a, get_default_float_dtype())
 
 
-def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
+def as_numeric(a, dtype=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -125,8 +329,9 @@ def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    dtype : object
-        Type to use for conversion.
+    dtype : object, optional
+        Type to use for conversion, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -141,6 +346,9 @@ def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if dtype is None:
+        dtype = get_default_float_dtype()
+
     try:
         return dtype(a)
     except TypeError:
@@ -190,10 +398,10 @@ def as_int(a):
 
 def as_float(a):
     """
-    Converts given :math:`a` variable to *numeric* using the type defined by
-    :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute. In the event where
-    :math:`a` cannot be converted, it is converted to *ndarray* using the type
-    defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    Converts given :math:`a` variable to *numeric* using the type returned by
+    :func:`colour.utilities.get_default_float_dtype` definition. In the event
+    where :math:`a` cannot be converted, it is converted to *ndarray* using
+    the same type.
 
     Parameters
     ----------
@@ -210,8 +418,9 @@ def as_float(a):
     The behaviour of this definition is different than
     :func:`colour.utilities.as_numeric` definition when it comes to conversion
     failure: the former will forcibly convert :math:`a` variable to *ndarray*
-    using the type defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE`
-    attribute while the later will pass the :math:`a` variable as is.
+    using the type returned by
+    :func:`colour.utilities.get_default_float_dtype` definition while the
+    later will pass the :math:`a` variable as is.
 
     Examples
     --------
@@ -221,10 +430,12 @@ def as_float(a):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    dtype = get_default_float_dtype()
+
     try:
-        return DEFAULT_FLOAT_DTYPE(a)
+        return dtype(a)
     except TypeError:
-        return as_float_array(a)
+        return as_array(a, dtype)
 
 
 def as_namedtuple(a, named_tuple):
@@ -495,7 +706,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
+def tstack(a, dtype=None, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -505,13 +716,25 @@ def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
     ----------
     a : array_like
         Array to perform the stacking.
-    dtype : object
-        Type to use for initial conversion to *ndarray*.
+    dtype : object, optional
+        Type to use for initial conversion to *ndarray*, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
+    out : ndarray, optional
+        Array to store the result into, its last axis length must match the
+        number of arrays to stack. Any writeable view is accepted, e.g. a
+        channel-first, i.e. planar, buffer seen through
+        :func:`numpy.moveaxis` definition.
 
     Returns
     -------
     ndarray
 
+    Notes
+    -----
+    -   The arrays are written directly into the output array without any
+        intermediate copy, lower dimensional arrays are broadcast to the
+        shape of the highest dimensional one.
+
     Examples
     --------
     >>> a = 0
@@ -541,14 +764,32 @@ def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
              [ 3.,  3.,  3.],
              [ 4.,  4.,  4.],
              [ 5.,  5.,  5.]]]])
+    >>> a = np.arange(0, 6)
+    >>> planar = np.zeros([3, 6])
+    >>> b = tstack([a, a, a], out=np.moveaxis(planar, 0, -1))
+    >>> planar
+    array([[ 0.,  1.,  2.,  3.,  4.,  5.],
+           [ 0.,  1.,  2.,  3.,  4.,  5.],
+           [ 0.,  1.,  2.,  3.,  4.,  5.]])
     """
 
-    a = as_array(a, dtype)
+    if not isinstance(a, np.ndarray):
+        a = [np.asarray(x) for x in a]
+
+    if out is None:
+        if dtype is None:
+            dtype = get_default_float_dtype()
+
+        shape = max([np.shape(x) for x in a], key=len)
+        out = np.empty(shape + (len(a), ), dtype)
+
+    for i, x in enumerate(a):
+        out[..., i] = x
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+    return out
 
 
-def tsplit(a, dtype=DEFAULT_FLOAT_DTYPE):
+def tsplit(a, dtype=None):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -556,12 +797,22 @@ def tsplit(a, dtype=DEFAULT_FLOAT_DTYPE):
     ----------
     a : array_like
         Array to perform the splitting.
-    dtype : object
-        Type to use for initial conversion to *ndarray*.
+    dtype : object, optional
+        Type to use for initial conversion to *ndarray*, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
     ndarray
+        Read-only view on the given array with its last axis moved first.
+
+    Notes
+    -----
+    -   No copy is made if the given array already has the requested dtype,
+        the returned array is a read-only view so that modifying the split
+        components does not silently modify the given array. Use
+        :meth:`numpy.ndarray.copy` method if writeable components are
+        required.
 
     Examples
     --------
@@ -596,9 +847,10 @@ def tsplit(a, dtype=DEFAULT_FLOAT_DTYPE):
            [[ 0.,  1.,  2.,  3.,  4.,  5.]]])
     """
 
-    a = as_array(a, dtype)
+    a = np.moveaxis(as_array(a, dtype), -1, 0)
+    a.setflags(write=False)
 
-    return np.array([a[..., x] for x in range(a.shape[-1])])
+    return a
 
 
 def row_as_diagonal(a):
@@ -654,7 +906,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -668,6 +920,9 @@ def dot_vector(m, v):
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array the dot product is written into, it must not overlap with
+        :math:`v`.
 
     Returns
     -------
@@ -692,7 +947,13 @@ def dot_vector(m, v):
            [ 0.1954094...,  0.0620396...,  0.0527952...]])
     """
 
-    return np.einsum('...ij,...j->...i', m, v)
+    m = as_float_array(m)
+    v = as_float_array(v)
+
+    if out is None:
+        return np.einsum('...ij,...j->...i', m, v)
+
+    return np.einsum('...ij,...j->...i', m, v, out=out, casting='same_kind')
 
 
 def dot_matrix(a, b):
@@ -750,7 +1011,8 @@ def dot_matrix(a, b):
             [-0.0044203...,  0.0377490...,  0.9666713...]]])
     """
 
-    return np.einsum('...ij,...jk->...ik', a, b)
+    return np.einsum('...ij,...jk->...ik', as_float_array(a),
+                     as_float_array(b))
 
 
 def orient(a, orientation):
@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+Cache
+=====
+
+Defines the thread-safe cache objects used by *Colour* internally and the
+definitions managing them globally:
+
+-   :class:`colour.utilities.Cache`
+-   :attr:`colour.utilities.CACHE_REGISTRY`
+-   :func:`colour.utilities.register_cache`
+-   :func:`colour.utilities.clear_caches`
+-   :func:`colour.utilities.warm_up_caches`
+-   :func:`colour.utilities.write_caches`
+-   :func:`colour.utilities.read_caches`
+"""
+
+from __future__ import division, unicode_literals
+
+import pickle
+import threading
+from collections import OrderedDict
+
+from colour.utilities.data_structures import CaseInsensitiveMapping
+from colour.utilities.profiling import CacheStatistics, profile_cache_access
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'Cache', 'CACHE_REGISTRY', 'register_cache', 'clear_caches',
+    'warm_up_caches', 'write_caches', 'read_caches'
+]
+
+
+class Cache(object):
+    """
+    Defines a thread-safe cache with an optional least recently used items
+    eviction policy.
+
+    The cache records its hits and misses and reports them to the
+    :class:`colour.utilities.profiling` class instances being entered.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name.
+    maximum_size : int, optional
+        Maximum items count, the least recently used items being evicted
+        when exceeded, the cache is unbounded if not given.
+    persistent : bool, optional
+        Whether the cache items can be written to and read from disk with
+        :func:`colour.utilities.write_caches` and
+        :func:`colour.utilities.read_caches` definitions, the items must be
+        picklable and their keys must be stable across processes.
+    warmer : callable, optional
+        Callable filling the cache, called by
+        :func:`colour.utilities.warm_up_caches` definition.
+
+    Attributes
+    ----------
+    name
+    maximum_size
+    persistent
+    statistics
+
+    Methods
+    -------
+    __len__
+    __contains__
+    __setitem__
+    get
+    items
+    update
+    warm_up
+    clear
+
+    Notes
+    -----
+    -   The cache lock is not held while the missing items are computed by
+        the caller, concurrent misses on the same key may thus compute the
+        item more than once, the last one being kept.
+
+    Examples
+    --------
+    >>> cache = Cache('_CACHE', maximum_size=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> print(cache.get('b'))
+    None
+    >>> cache.statistics
+    CacheStatistics(hits=1, misses=1)
+    """
+
+    def __init__(self, name, maximum_size=None, persistent=True, warmer=None):
+        self._name = name
+        self._maximum_size = None
+        self._persistent = persistent
+        self._warmer = warmer
+
+        self._lock = threading.RLock()
+        self._items = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+        self.maximum_size = maximum_size
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the cache maximum items count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the cache maximum items count with, the least
+            recently used items are evicted if exceeded.
+
+        Returns
+        -------
+        int
+            Cache maximum items count.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self.maximum_size** property.
+        """
+
+        if value is not None:
+            assert value > 0, '"maximum_size" must be greater than 0!'
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def persistent(self):
+        """
+        Getter property for whether the cache items can be written to and
+        read from disk.
+
+        Returns
+        -------
+        bool
+            Whether the cache items can be written to and read from disk.
+        """
+
+        return self._persistent
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the cache hits and misses.
+
+        Returns
+        -------
+        CacheStatistics
+            Cache hits and misses.
+        """
+
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses)
+
+    def __len__(self):
+        """
+        Returns the cache items count.
+
+        Returns
+        -------
+        int
+            Cache items count.
+        """
+
+        return len(self._items)
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key, the access is not
+        recorded.
+
+        Parameters
+        ----------
+        key : object
+            Key to check the presence.
+
+        Returns
+        -------
+        bool
+            Whether the cache contains given key.
+        """
+
+        with self._lock:
+            return key in self._items
+
+    def __setitem__(self, key, value):
+        """
+        Sets given key with given value, evicting the least recently used
+        items if the cache maximum items count is exceeded.
+
+        Parameters
+        ----------
+        key : object
+            Key.
+        value : object
+            Value.
+        """
+
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            self._evict()
+
+    def _evict(self):
+        """
+        Evicts the least recently used items exceeding the cache maximum items
+        count.
+        """
+
+        if self._maximum_size is None:
+            return
+
+        while len(self._items) > self._maximum_size:
+            self._items.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of given key if existing and records the access.
+
+        Parameters
+        ----------
+        key : object
+            Key.
+        default : object, optional
+            Value returned if the key does not exist.
+
+        Returns
+        -------
+        object
+            Key value or default value.
+        """
+
+        with self._lock:
+            value = self._items.pop(key, self)
+            hit = value is not self
+            if hit:
+                self._items[key] = value
+                self._hits += 1
+            else:
+                value = default
+                self._misses += 1
+
+        profile_cache_access(self._name, hit)
+
+        return value
+
+    def items(self):
+        """
+        Returns a copy of the cache items from the least to the most recently
+        used.
+
+        Returns
+        -------
+        list
+            Cache items.
+        """
+
+        with self._lock:
+            return list(self._items.items())
+
+    def update(self, items):
+        """
+        Updates the cache with given items.
+
+        Parameters
+        ----------
+        items : list
+            Items to update the cache with.
+        """
+
+        with self._lock:
+            for key, value in items:
+                self._items.pop(key, None)
+                self._items[key] = value
+
+            self._evict()
+
+    def warm_up(self):
+        """
+        Fills the cache by calling its warmer if any.
+        """
+
+        if self._warmer is not None:
+            self._warmer()
+
+    def clear(self):
+        """
+        Clears the cache items and statistics.
+        """
+
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+CACHE_REGISTRY = CaseInsensitiveMapping()
+"""
+*Colour* caches registry.
+
+CACHE_REGISTRY : CaseInsensitiveMapping
+"""
+
+
+def register_cache(name, maximum_size=None, persistent=True, warmer=None):
+    """
+    Registers a new :class:`colour.utilities.Cache` class instance with given
+    name into the caches registry, replacing any existing cache with the same
+    name.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name.
+    maximum_size : int, optional
+        Maximum items count, the cache is unbounded if not given.
+    persistent : bool, optional
+        Whether the cache items can be written to and read from disk.
+    warmer : callable, optional
+        Callable filling the cache.
+
+    Returns
+    -------
+    Cache
+        Registered cache.
+
+    Examples
+    --------
+    >>> cache = register_cache('_CACHE_A')
+    >>> cache.name
+    '_CACHE_A'
+    >>> CACHE_REGISTRY['_CACHE_A'] is cache
+    True
+    """
+
+    cache = CACHE_REGISTRY[name] = Cache(name, maximum_size, persistent,
+                                         warmer)
+
+    return cache
+
+
+def _caches(names=None):
+    """
+    Returns the registered caches with given names or all of them.
+    """
+
+    if names is None:
+        return list(CACHE_REGISTRY.values())
+
+    return [CACHE_REGISTRY[name] for name in names]
+
+
+def clear_caches(names=None):
+    """
+    Clears the registered caches with given names.
+
+    Parameters
+    ----------
+    names : array_like, optional
+        Names of the caches to clear, all the registered caches are cleared
+        if not given.
+
+    Examples
+    --------
+    >>> cache = register_cache('_CACHE_B')
+    >>> cache['a'] = 1
+    >>> clear_caches(['_CACHE_B'])
+    >>> len(cache)
+    0
+    """
+
+    for cache in _caches(names):
+        cache.clear()
+
+
+def warm_up_caches(names=None):
+    """
+    Fills the registered caches with given names, e.g. at the start of a
+    server process.
+
+    Only the caches with a warmer are filled, the caches keyed by arbitrary
+    arguments fill themselves while being used.
+
+    Parameters
+    ----------
+    names : array_like, optional
+        Names of the caches to fill, all the registered caches are filled if
+        not given.
+
+    Examples
+    --------
+    >>> warm_up_caches(['_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE'])
+    >>> len(CACHE_REGISTRY['_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE'])
+    1
+    """
+
+    for cache in _caches(names):
+        cache.warm_up()
+
+
+def write_caches(path, names=None):
+    """
+    Writes the items of the registered persistent caches with given names to
+    given file.
+
+    Parameters
+    ----------
+    path : unicode
+        File path.
+    names : array_like, optional
+        Names of the caches to write, all the registered persistent caches
+        are written if not given.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'caches.pickle')
+    >>> write_caches(path)
+    True
+    """
+
+    caches = OrderedDict((cache.name, cache.items())
+                         for cache in _caches(names) if cache.persistent)
+
+    with open(path, 'wb') as file_handle:
+        pickle.dump(caches, file_handle, pickle.HIGHEST_PROTOCOL)
+
+    return True
+
+
+def read_caches(path):
+    """
+    Reads the items of the registered persistent caches from given file
+    written with :func:`colour.utilities.write_caches` definition.
+
+    The caches not registered or not persistent in the current process are
+    ignored.
+
+    Parameters
+    ----------
+    path : unicode
+        File path.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Warnings
+    --------
+    The file is unpickled, only files from trusted sources should be read.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'caches.pickle')
+    >>> write_caches(path)
+    True
+    >>> read_caches(path)
+    True
+    """
+
+    with open(path, 'rb') as file_handle:
+        caches = pickle.load(file_handle)
+
+    for name, items in caches.items():
+        cache = CACHE_REGISTRY.get(name)
+        if cache is not None and cache.persistent:
+            cache.update(items)
+
+    return True
@@ -21,11 +21,18 @@ import numpy as np
 import re
 import warnings
 from collections import OrderedDict
-from copy import deepcopy
 from six import string_types
 
-from colour.constants import INTEGER_THRESHOLD, DEFAULT_FLOAT_DTYPE
+from colour.constants import INTEGER_THRESHOLD
 from colour.utilities import Lookup
+from colour.utilities.array import (_ContextVariable, as_array,
+                                    default_float_dtype,
+                                    get_default_float_dtype)
+
+try:
+    from contextvars import copy_context as _copy_context
+except ImportError:  # pragma: no cover
+    _copy_context = None
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -351,6 +358,42 @@ def is_sibling(element, mapping):
                           set(type(element) for element in mapping.values())))
 
 
+_FILTER_KWARGS_CACHE = {}
+"""
+Cache for the keyword arguments accepted by the functions given to
+:func:`colour.utilities.filter_kwargs` definition.
+
+_FILTER_KWARGS_CACHE : dict
+"""
+
+
+def _function_arguments(function):
+    """
+    Returns the names of the arguments that can be passed by keyword to given
+    function.
+
+    Parameters
+    ----------
+    function : callable
+        Callable to return the arguments of.
+
+    Returns
+    -------
+    frozenset
+        Arguments names.
+    """
+
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except AttributeError:  # Python 2.7
+        function = getattr(function, '__wrapped__', function)
+        return frozenset(inspect.getargspec(function)[0])
+
+    return frozenset(parameter.name for parameter in parameters
+                     if parameter.kind not in (parameter.VAR_POSITIONAL,
+                                               parameter.VAR_KEYWORD))
+
+
 def filter_kwargs(function, **kwargs):
     """
     Filters keyword arguments incompatible with the given function signature.
@@ -370,6 +413,11 @@ def filter_kwargs(function, **kwargs):
     dict
         Filtered keyword arguments.
 
+    Notes
+    -----
+    -   The arguments accepted by given function are cached, the keyword
+        arguments values are not copied.
+
     Examples
     --------
     >>> def fn_a(a):
@@ -386,11 +434,19 @@ def filter_kwargs(function, **kwargs):
     (1, 2, 3)
     """
 
-    kwargs = deepcopy(kwargs)
-    args, _varargs, _keywords, _defaults = inspect.getargspec(function)
+    if not kwargs:
+        return kwargs
 
-    args = set(kwargs.keys()) - set(args)
-    for key in args:
+    try:
+        args = _FILTER_KWARGS_CACHE.get(function)
+    except TypeError:  # Unhashable callable.
+        args = _function_arguments(function)
+    else:
+        if args is None:
+            args = _function_arguments(function)
+            _FILTER_KWARGS_CACHE[function] = args
+
+    for key in set(kwargs.keys()) - args:
         kwargs.pop(key)
 
     return kwargs
@@ -518,11 +574,35 @@ def first_item(a):
 
 _DOMAIN_RANGE_SCALE = 'reference'
 """
-Global variable storing the current *Colour* domain-range scale.
+Global variable storing the current *Colour* process-wide domain-range scale.
 
 _DOMAIN_RANGE_SCALE : unicode
 """
 
+_DOMAIN_RANGE_SCALE_CONTEXT = _ContextVariable(
+    'colour_domain_range_scale', default=None)
+"""
+Context-local variable storing the domain-range scale set by the
+:class:`colour.utilities.domain_range_scale` class context manager and
+decorator. It is local to the current thread and to the current
+:mod:`asyncio` task.
+
+_DOMAIN_RANGE_SCALE_CONTEXT : ContextVar
+"""
+
+
+def _domain_range_scale(scale):
+    """
+    Validates given *Colour* domain-range scale and returns its normalised
+    value.
+    """
+
+    scale = str(scale).lower()
+    valid = ('1', '100', 'reference', 'ignore')
+    assert scale in valid, 'Scale must be one of "{0}".'.format(valid)
+
+    return scale
+
 
 def get_domain_range_scale():
     """
@@ -541,9 +621,22 @@ def get_domain_range_scale():
     -------
     unicode
         *Colour* domain-range scale.
+
+    Notes
+    -----
+    -   The scale set by the :class:`colour.utilities.domain_range_scale`
+        class context manager and decorator takes precedence over the
+        process-wide scale, it is local to the current thread and
+        :mod:`asyncio` task.
+    -   New threads, e.g. thread pool workers, only see the process-wide
+        scale, the *Colour* thread pools, e.g. the one used by
+        :func:`colour.difference.delta_E_pairwise` definition, run their
+        tasks with the caller scale.
     """
 
-    return _DOMAIN_RANGE_SCALE
+    scale = _DOMAIN_RANGE_SCALE_CONTEXT.get()
+
+    return _DOMAIN_RANGE_SCALE if scale is None else scale
 
 
 def set_domain_range_scale(scale='Reference'):
@@ -564,21 +657,30 @@ def set_domain_range_scale(scale='Reference'):
     scale : unicode or int
         **{'Reference', '1'}**,
         *Colour* domain-range scale to set.
+
+    Notes
+    -----
+    -   The process-wide scale is set unless a
+        :class:`colour.utilities.domain_range_scale` class context manager or
+        decorator is active in the current context, in which case only its
+        scale is modified until it exits.
     """
 
     global _DOMAIN_RANGE_SCALE
 
-    scale = str(scale).lower()
-    valid = ('1', '100', 'reference', 'ignore')
-    assert scale in valid, 'Scale must be one of "{0}".'.format(valid)
+    scale = _domain_range_scale(scale)
 
-    _DOMAIN_RANGE_SCALE = scale
+    if _DOMAIN_RANGE_SCALE_CONTEXT.get() is None:
+        _DOMAIN_RANGE_SCALE = scale
+    else:
+        _DOMAIN_RANGE_SCALE_CONTEXT.set(scale)
 
 
 class domain_range_scale(object):
     """
     A context manager and decorator temporarily setting *Colour* domain-range
-    scale. The following scales are available:
+    scale for the current thread and :mod:`asyncio` task. The following
+    scales are available:
 
     -   **'Reference'**, the default *Colour* domain-range scale which varies
         depending on the referenced algorithm, e.g. [0, 1], [0, 10], [0, 100],
@@ -596,15 +698,15 @@ class domain_range_scale(object):
     """
 
     def __init__(self, scale):
-        self._scale = scale
-        self._previous_scale = get_domain_range_scale()
+        self._scale = _domain_range_scale(scale)
+        self._tokens = []
 
     def __enter__(self):
         """
         Called upon entering the context manager and decorator.
         """
 
-        set_domain_range_scale(self._scale)
+        self._tokens.append(_DOMAIN_RANGE_SCALE_CONTEXT.set(self._scale))
 
         return self
 
@@ -613,7 +715,7 @@ class domain_range_scale(object):
         Called upon exiting the context manager and decorator.
         """
 
-        set_domain_range_scale(self._previous_scale)
+        _DOMAIN_RANGE_SCALE_CONTEXT.reset(self._tokens.pop())
 
     def __call__(self, function):
         """
@@ -622,13 +724,77 @@ class domain_range_scale(object):
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            with self:
+            # The token is kept local so that the decorated definition can be
+            # called concurrently from multiple threads.
+            token = _DOMAIN_RANGE_SCALE_CONTEXT.set(self._scale)
+            try:
                 return function(*args, **kwargs)
+            finally:
+                _DOMAIN_RANGE_SCALE_CONTEXT.reset(token)
 
         return wrapper
 
 
-def to_domain_1(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
+def _bind_context(function):
+    """
+    Returns a definition calling given definition with the current context,
+    i.e. the current domain-range scale and floating point number dtype, so
+    that it can be called from other threads, e.g. thread pool workers which
+    start in a new context.
+
+    Parameters
+    ----------
+    function : callable
+        Definition to bind the current context to.
+
+    Returns
+    -------
+    callable
+        Definition bound to the current context.
+
+    Notes
+    -----
+    -   Each call runs in its own copy of the context so that the bound
+        definition can be called concurrently.
+    -   The domain-range scale and floating point number dtype are captured
+        and set again for each call when the :mod:`contextvars` module is not
+        available, i.e. *Python* 2.7 and *Python* 3.6.
+
+    Examples
+    --------
+    >>> from multiprocessing.pool import ThreadPool
+    >>> pool = ThreadPool(1)
+    >>> with domain_range_scale('1'):
+    ...     pool.apply(_bind_context(get_domain_range_scale))
+    '1'
+    >>> pool.close()
+    """
+
+    if _copy_context is not None:
+        context = _copy_context()
+
+        def bound(*args, **kwargs):
+            """
+            Calls the definition in a copy of the bound context.
+            """
+
+            return context.copy().run(function, *args, **kwargs)
+    else:  # pragma: no cover
+        scale = get_domain_range_scale()
+        dtype = get_default_float_dtype()
+
+        def bound(*args, **kwargs):
+            """
+            Calls the definition with the bound scale and dtype.
+            """
+
+            with domain_range_scale(scale), default_float_dtype(dtype):
+                return function(*args, **kwargs)
+
+    return bound
+
+
+def to_domain_1(a, scale_factor=100, dtype=None):
     """
     Scales given array :math:`a` to domain **'1'**. The behaviour is as
     follows:
@@ -648,7 +814,8 @@ def to_domain_1(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
         Scale factor, usually *numeric* but can be an *array_like* if some
         axis need different scaling to be brought to domain **'1'**.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -676,15 +843,16 @@ def to_domain_1(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
     array(0.01)
     """
 
-    a = np.asarray(a, dtype).copy()
+    a = as_array(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    scale = get_domain_range_scale()
+    if scale == '100':
         a /= scale_factor
 
     return a
 
 
-def to_domain_10(a, scale_factor=10, dtype=DEFAULT_FLOAT_DTYPE):
+def to_domain_10(a, scale_factor=10, dtype=None):
     """
     Scales given array :math:`a` to domain **'10'**, used by
     *Munsell Renotation System*. The behaviour is as follows:
@@ -706,7 +874,8 @@ def to_domain_10(a, scale_factor=10, dtype=DEFAULT_FLOAT_DTYPE):
         Scale factor, usually *numeric* but can be an *array_like* if some
         axis need different scaling to be brought to domain **'10'**.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -734,18 +903,19 @@ def to_domain_10(a, scale_factor=10, dtype=DEFAULT_FLOAT_DTYPE):
     array(0.1)
     """
 
-    a = np.asarray(a, dtype).copy()
+    a = as_array(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if scale == '100':
         a /= scale_factor
 
     return a
 
 
-def to_domain_100(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
+def to_domain_100(a, scale_factor=100, dtype=None):
     """
     Scales given array :math:`a` to domain **'100'**. The behaviour is as
     follows:
@@ -765,7 +935,8 @@ def to_domain_100(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
         Scale factor, usually *numeric* but can be an *array_like* if some
         axis need different scaling to be brought to domain **'100'**.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -793,15 +964,16 @@ def to_domain_100(a, scale_factor=100, dtype=DEFAULT_FLOAT_DTYPE):
     array(1.0)
     """
 
-    a = np.asarray(a, dtype).copy()
+    a = as_array(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a *= scale_factor
 
     return a
 
 
-def to_domain_degrees(a, scale_factor=360, dtype=DEFAULT_FLOAT_DTYPE):
+def to_domain_degrees(a, scale_factor=360, dtype=None):
     """
     Scales given array :math:`a` to degrees domain. The behaviour is as
     follows:
@@ -823,7 +995,8 @@ def to_domain_degrees(a, scale_factor=360, dtype=DEFAULT_FLOAT_DTYPE):
         Scale factor, usually *numeric* but can be an *array_like* if some
         axis need different scaling to be brought to degrees domain.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -851,18 +1024,19 @@ def to_domain_degrees(a, scale_factor=360, dtype=DEFAULT_FLOAT_DTYPE):
     array(3.6)
     """
 
-    a = np.asarray(a, dtype).copy()
+    a = as_array(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if scale == '100':
         a *= scale_factor / 100
 
     return a
 
 
-def to_domain_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
+def to_domain_int(a, bit_depth=8, dtype=None):
     """
     Scales given array :math:`a` to int domain. The behaviour is as follows:
 
@@ -883,7 +1057,8 @@ def to_domain_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
         Bit depth, usually *int* but can be an *array_like* if some axis need
         different scaling to be brought to int domain.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -916,13 +1091,14 @@ def to_domain_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
     array(2.55)
     """
 
-    a = np.asarray(a, dtype).copy()
+    a = as_array(a, dtype).copy()
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a *= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if scale == '100':
         a *= maximum_code_value / 100
 
     return a
@@ -973,7 +1149,8 @@ def from_range_1(a, scale_factor=100):
     100
     """
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    scale = get_domain_range_scale()
+    if scale == '100':
         a *= scale_factor
 
     return a
@@ -1026,10 +1203,11 @@ def from_range_10(a, scale_factor=10):
     10
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if scale == '100':
         a *= scale_factor
 
     return a
@@ -1080,7 +1258,8 @@ def from_range_100(a, scale_factor=100):
     1
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a /= scale_factor
 
     return a
@@ -1133,16 +1312,17 @@ def from_range_degrees(a, scale_factor=360):
     0.2777777...
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    scale = get_domain_range_scale()
+    if scale == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if scale == '100':
         a /= scale_factor / 100
 
     return a
 
 
-def from_range_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
+def from_range_int(a, bit_depth=8, dtype=None):
     """
     Scales given array :math:`a` from int range. The behaviour is as follows:
 
@@ -1162,7 +1342,8 @@ def from_range_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
         Bit depth, usually *int* but can be an *array_like* if some axis need
         different scaling to be brought from int range.
     dtype : object, optional
-        Data type used for the conversion to :class:`np.ndarray`.
+        Data type used for the conversion to :class:`np.ndarray`, default to
+        :func:`colour.utilities.get_default_float_dtype` definition output.
 
     Returns
     -------
@@ -1196,12 +1377,13 @@ def from_range_int(a, bit_depth=8, dtype=DEFAULT_FLOAT_DTYPE):
     """
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
-        a = np.asarray(a, dtype)
+    scale = get_domain_range_scale()
+    if scale == '1':
+        a = as_array(a, dtype)
         a /= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
-        a = np.asarray(a, dtype)
+    if scale == '100':
+        a = as_array(a, dtype)
         a /= maximum_code_value / 100
 
     return a
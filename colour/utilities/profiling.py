@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Profiling
+=========
+
+Defines the opt-in profiling objects recording the calls of the instrumented
+*Colour* definitions and the accesses to its internal caches:
+
+-   :class:`colour.utilities.ProfilingStatistics`
+-   :class:`colour.utilities.profiling`
+-   :func:`colour.utilities.profiled`
+-   :func:`colour.utilities.profile_cache_access`
+"""
+
+from __future__ import division, unicode_literals
+
+import functools
+import numpy as np
+import threading
+from collections import OrderedDict, namedtuple
+from timeit import default_timer
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CallStatistics', 'CacheStatistics', 'ProfilingStatistics', 'profiling',
+    'profiled', 'profile_cache_access'
+]
+
+_PROFILING_STATISTICS = []
+"""
+Profiling statistics of the :class:`colour.utilities.profiling` class
+instances being entered, nothing is recorded when empty.
+
+_PROFILING_STATISTICS : list
+"""
+
+_PROFILING_LOCK = threading.Lock()
+"""
+Lock guarding the profiling statistics updates.
+
+_PROFILING_LOCK : Lock
+"""
+
+
+class CallStatistics(
+        namedtuple('CallStatistics', ('calls', 'time', 'items'))):
+    """
+    Defines the call statistics of a profiled definition.
+
+    Parameters
+    ----------
+    calls : int
+        Calls count.
+    time : numeric
+        Cumulative time in seconds, including the time spent in the nested
+        profiled definitions.
+    items : int
+        Cumulative count of items of the largest *array_like* positional
+        argument of each call.
+    """
+
+
+class CacheStatistics(namedtuple('CacheStatistics', ('hits', 'misses'))):
+    """
+    Defines the access statistics of a cache.
+
+    Parameters
+    ----------
+    hits : int
+        Hits count.
+    misses : int
+        Misses count.
+    """
+
+
+class ProfilingStatistics(object):
+    """
+    Defines the statistics recorded while profiling.
+
+    Attributes
+    ----------
+    calls
+    caches
+
+    Methods
+    -------
+    reset
+
+    Examples
+    --------
+    >>> statistics = ProfilingStatistics()
+    >>> statistics.calls
+    OrderedDict()
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._caches = {}
+
+    @property
+    def calls(self):
+        """
+        Getter property for the calls statistics of the profiled definitions
+        sorted by decreasing cumulative time.
+
+        Returns
+        -------
+        OrderedDict
+            :class:`colour.utilities.CallStatistics` class instances.
+        """
+
+        with _PROFILING_LOCK:
+            calls = [(name, CallStatistics(*statistics))
+                     for name, statistics in self._calls.items()]
+
+        return OrderedDict(
+            sorted(calls, key=lambda x: x[1].time, reverse=True))
+
+    @property
+    def caches(self):
+        """
+        Getter property for the caches access statistics sorted by name.
+
+        Returns
+        -------
+        OrderedDict
+            :class:`colour.utilities.CacheStatistics` class instances.
+        """
+
+        with _PROFILING_LOCK:
+            caches = [(name, CacheStatistics(*statistics))
+                      for name, statistics in self._caches.items()]
+
+        return OrderedDict(sorted(caches))
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the statistics.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        lines = ['{0:<48} {1:>10} {2:>12} {3:>14}'.format(
+            'Definition', 'Calls', 'Time (s)', 'Items')]
+        for name, statistics in self.calls.items():
+            lines.append('{0:<48} {1:>10} {2:>12.6f} {3:>14}'.format(
+                name, statistics.calls, statistics.time, statistics.items))
+
+        lines.append('')
+        lines.append('{0:<48} {1:>10} {2:>12}'.format('Cache', 'Hits',
+                                                      'Misses'))
+        for name, statistics in self.caches.items():
+            lines.append('{0:<48} {1:>10} {2:>12}'.format(
+                name, statistics.hits, statistics.misses))
+
+        return '\n'.join(lines)
+
+    def reset(self):
+        """
+        Resets the statistics.
+        """
+
+        with _PROFILING_LOCK:
+            self._calls.clear()
+            self._caches.clear()
+
+
+class profiling(object):
+    """
+    A context manager and decorator recording, while entered, the calls of
+    the definitions decorated with :func:`colour.utilities.profiled`
+    definition and the accesses to the *Colour* internal caches.
+
+    The calls of every thread are recorded, when not entered, the profiled
+    definitions only check that no statistics are being recorded.
+
+    Parameters
+    ----------
+    statistics : ProfilingStatistics, optional
+        Statistics to record into, allowing to accumulate them over multiple
+        contexts, a new :class:`colour.utilities.ProfilingStatistics` class
+        instance is used if not given.
+
+    Attributes
+    ----------
+    statistics
+
+    Examples
+    --------
+    >>> from colour import delta_E
+    >>> Lab_1 = np.array([100.00000000, 21.57210357, 272.22819350])
+    >>> Lab_2 = np.array([100.00000000, 426.67945353, 72.39590835])
+    >>> with profiling() as statistics:
+    ...     for i in range(3):
+    ...         delta_E_CIE2000 = delta_E(Lab_1, Lab_2)
+    >>> statistics.calls['delta_E'].calls
+    3
+    """
+
+    def __init__(self, statistics=None):
+        self._statistics = (statistics
+                            if statistics is not None else
+                            ProfilingStatistics())
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the recorded statistics.
+
+        Returns
+        -------
+        ProfilingStatistics
+            Recorded statistics.
+        """
+
+        return self._statistics
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        with _PROFILING_LOCK:
+            _PROFILING_STATISTICS.append(self._statistics)
+
+        return self._statistics
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        with _PROFILING_LOCK:
+            _PROFILING_STATISTICS.remove(self._statistics)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def _items_count(args):
+    """
+    Returns the items count of the largest *array_like* given argument.
+    """
+
+    count = 0
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            count = max(count, arg.size)
+        elif isinstance(arg, (list, tuple)):
+            count = max(count, np.size(arg))
+
+    return count
+
+
+def profiled(function=None, name=None):
+    """
+    Decorator recording the calls statistics of given definition while a
+    :class:`colour.utilities.profiling` class instance is entered.
+
+    Parameters
+    ----------
+    function : callable, optional
+        Definition to profile.
+    name : unicode, optional
+        Name the statistics are recorded with, default to the definition
+        name, it should be given for methods, e.g. *LUT3D.apply*.
+
+    Returns
+    -------
+    object
+
+    Examples
+    --------
+    >>> @profiled
+    ... def f(a):
+    ...     return a
+    >>> with profiling() as statistics:
+    ...     f(np.zeros([4, 3])).shape
+    (4, 3)
+    >>> statistics.calls['f']  # doctest: +ELLIPSIS
+    CallStatistics(calls=1, time=..., items=12)
+    """
+
+    if function is None:
+        return functools.partial(profiled, name=name)
+
+    if name is None:
+        name = function.__name__
+
+    @functools.wraps(function)
+    def wrapped(*args, **kwargs):
+        """
+        Wrapped function.
+        """
+
+        if not _PROFILING_STATISTICS:
+            return function(*args, **kwargs)
+
+        start = default_timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            time = default_timer() - start
+            items = _items_count(args)
+            with _PROFILING_LOCK:
+                for statistics in _PROFILING_STATISTICS:
+                    call = statistics._calls.get(name)
+                    if call is None:
+                        call = statistics._calls[name] = [0, 0, 0]
+
+                    call[0] += 1
+                    call[1] += time
+                    call[2] += items
+
+    # Python 2.7 "functools.wraps" does not set the wrapped definition.
+    wrapped.__wrapped__ = function
+
+    return wrapped
+
+
+def profile_cache_access(cache, hit):
+    """
+    Records an access to given cache while a
+    :class:`colour.utilities.profiling` class instance is entered.
+
+    Parameters
+    ----------
+    cache : unicode
+        Cache name.
+    hit : bool
+        Whether the cache access is a hit or a miss.
+
+    Examples
+    --------
+    >>> with profiling() as statistics:
+    ...     profile_cache_access('_CACHE', False)
+    ...     profile_cache_access('_CACHE', True)
+    >>> statistics.caches['_CACHE']
+    CacheStatistics(hits=1, misses=1)
+    """
+
+    if not _PROFILING_STATISTICS:
+        return
+
+    with _PROFILING_LOCK:
+        for statistics in _PROFILING_STATISTICS:
+            access = statistics._caches.get(cache)
+            if access is None:
+                access = statistics._caches[cache] = [0, 0]
+
+            access[0 if hit else 1] += 1
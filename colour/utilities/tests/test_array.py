@@ -6,16 +6,18 @@ Defines unit tests for :mod:`colour.utilities.array` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import threading
 import unittest
 from collections import namedtuple
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (
-    as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    as_namedtuple, closest_indexes, closest, normalise_maximum, interval,
-    is_uniform, in_array, tstack, tsplit, row_as_diagonal, dot_vector,
-    dot_matrix, orient, centroid, linear_conversion, lerp, fill_nan,
-    ndarray_write)
+    get_default_float_dtype, set_default_float_dtype, default_float_dtype,
+    to_domain_1, as_array, as_int_array, as_float_array, as_numeric, as_int,
+    as_float, as_namedtuple, closest_indexes, closest, normalise_maximum,
+    interval, is_uniform, in_array, tstack, tsplit, row_as_diagonal,
+    dot_vector, dot_matrix, orient, centroid, linear_conversion, lerp,
+    fill_nan, ndarray_write)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,15 +27,194 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestAsArray', 'TestAsIntArray', 'TestAsFloatArray', 'TestAsNumeric',
-    'TestAsInt', 'TestAsFloat', 'TestAsNametuple', 'TestClosestIndexes',
-    'TestClosest', 'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform',
-    'TestInArray', 'TestTstack', 'TestTsplit', 'TestRowAsDiagonal',
-    'TestDotVector', 'TestDotMatrix', 'TestOrient', 'TestCentroid',
-    'TestLinearConversion', 'TestLerp', 'TestFillNan', 'TestNdarrayWrite'
+    'TestGetDefaultFloatDtype', 'TestSetDefaultFloatDtype',
+    'TestDefaultFloatDtype', 'TestAsArray', 'TestAsIntArray',
+    'TestAsFloatArray', 'TestAsNumeric', 'TestAsInt', 'TestAsFloat',
+    'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
+    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
+    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
+    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
+    'TestLerp', 'TestFillNan', 'TestNdarrayWrite'
 ]
 
 
+class TestGetDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.get_default_float_dtype` definition
+    unit tests methods.
+    """
+
+    def test_get_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.get_default_float_dtype`
+        definition.
+        """
+
+        self.assertIs(get_default_float_dtype(), DEFAULT_FLOAT_DTYPE)
+
+        with default_float_dtype(np.float32):
+            self.assertIs(get_default_float_dtype(), np.float32)
+
+
+class TestSetDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.set_default_float_dtype` definition
+    unit tests methods.
+    """
+
+    def test_set_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.set_default_float_dtype`
+        definition.
+        """
+
+        try:
+            set_default_float_dtype('float32')
+            self.assertIs(get_default_float_dtype(), np.float32)
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+
+            with default_float_dtype(np.float64):
+                self.assertIs(get_default_float_dtype(), np.float64)
+
+            self.assertIs(get_default_float_dtype(), np.float32)
+        finally:
+            set_default_float_dtype()
+
+        self.assertIs(get_default_float_dtype(), DEFAULT_FLOAT_DTYPE)
+
+    def test_raise_exception_set_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.set_default_float_dtype`
+        definition raised exception.
+        """
+
+        self.assertRaises(AssertionError, set_default_float_dtype, np.int32)
+
+
+class TestDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.array.default_float_dtype` class unit
+    tests methods.
+    """
+
+    def test_default_float_dtype(self):
+        """
+        Tests :class:`colour.utilities.array.default_float_dtype` class.
+        """
+
+        with default_float_dtype(np.float32):
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+            self.assertIsInstance(as_float(1), np.float32)
+            self.assertIsInstance(as_numeric(1), np.float32)
+            self.assertEqual(tstack([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(tsplit([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(to_domain_1([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(
+                dot_vector(np.identity(3), [1, 2, 3]).dtype, np.float32)
+
+            with default_float_dtype(np.float16):
+                self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float16)
+
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+        @default_float_dtype(np.float32)
+        def fn_a(a):
+            """
+            :class:`default_float_dtype` unit tests :func:`fn_a` definition.
+            """
+
+            return as_float_array(a)
+
+        self.assertEqual(fn_a([1, 2, 3]).dtype, np.float32)
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+    def test_default_float_dtype_threads(self):
+        """
+        Tests :class:`colour.utilities.array.default_float_dtype` class
+        threads isolation.
+        """
+
+        dtypes = []
+        event = threading.Event()
+
+        def worker():
+            """
+            :class:`default_float_dtype` unit tests :func:`worker` definition.
+            """
+
+            event.wait()
+            dtypes.append(as_float_array([1, 2, 3]).dtype)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        with default_float_dtype(np.float32):
+            event.set()
+            thread.join()
+
+        self.assertListEqual(dtypes, [DEFAULT_FLOAT_DTYPE])
+
+    def test_default_float_dtype_decorator_threads(self):
+        """
+        Tests :class:`colour.utilities.array.default_float_dtype` class
+        decorator concurrent calls from multiple threads.
+        """
+
+        barrier = threading.Barrier(2)
+        event = threading.Event()
+
+        @default_float_dtype(np.float32)
+        def fn_a(a, wait=False):
+            """
+            :class:`default_float_dtype` unit tests :func:`fn_a` definition.
+            """
+
+            barrier.wait()
+            if wait:
+                event.wait()
+
+            return as_float_array(a).dtype
+
+        results = {}
+
+        def run_a():
+            """
+            :class:`default_float_dtype` unit tests :func:`run_a` definition.
+            """
+
+            with default_float_dtype(np.float16):
+                results['a'] = fn_a([1, 2, 3])
+                event.set()
+                results['a_after'] = get_default_float_dtype()
+
+        def run_b():
+            """
+            :class:`default_float_dtype` unit tests :func:`run_b` definition.
+            """
+
+            results['b'] = fn_a([1, 2, 3], True)
+            results['b_after'] = get_default_float_dtype()
+
+        threads = [
+            threading.Thread(target=run_a),
+            threading.Thread(target=run_b)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertDictEqual(
+            results, {
+                'a': np.float32,
+                'a_after': np.float16,
+                'b': np.float32,
+                'b_after': DEFAULT_FLOAT_DTYPE
+            })
+        self.assertEqual(get_default_float_dtype(), DEFAULT_FLOAT_DTYPE)
+
+
 class TestAsArray(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.as_array` definition unit tests
@@ -459,6 +640,36 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+        a = np.arange(0, 6)
+        np.testing.assert_almost_equal(
+            tstack([a, 1, a]),
+            np.array([
+                [0, 1, 0],
+                [1, 1, 1],
+                [2, 1, 2],
+                [3, 1, 3],
+                [4, 1, 4],
+                [5, 1, 5],
+            ]))
+
+        np.testing.assert_equal(
+            tstack([a] * 40), np.tile(a[..., np.newaxis], (1, 40)))
+
+    def test_tstack_out(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition *out*
+        argument.
+        """
+
+        a = np.arange(0, 6)
+        out = np.zeros([6, 3])
+        self.assertIs(tstack([a, a, a], out=out), out)
+        np.testing.assert_equal(out, np.transpose([a, a, a]))
+
+        planar = np.zeros([3, 6])
+        tstack([a, a * 2, a * 3], out=np.moveaxis(planar, 0, -1))
+        np.testing.assert_equal(planar, np.array([a, a * 2, a * 3]))
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -512,6 +723,29 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_tsplit_view(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition read-only view
+        output.
+        """
+
+        a = np.arange(0, 18, dtype=DEFAULT_FLOAT_DTYPE).reshape([6, 3])
+        b = tsplit(a)
+        self.assertTrue(np.shares_memory(a, b))
+        self.assertFalse(b.flags.writeable)
+        self.assertTrue(a.flags.writeable)
+
+        def assign():
+            """
+            :func:`tsplit` unit tests :func:`assign` definition.
+            """
+
+            b[0] += 1
+
+        self.assertRaises(ValueError, assign)
+
+        self.assertFalse(np.shares_memory(a, tsplit(a, dtype=np.float32)))
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -585,6 +819,10 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+        out = np.empty((6, 3), np.float32)
+        self.assertIs(dot_vector(m, v, out), out)
+        np.testing.assert_almost_equal(out, dot_vector(m, v), decimal=7)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
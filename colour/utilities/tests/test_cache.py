@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.cache` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from colour.notation import munsell_value
+from colour.utilities import (Cache, CACHE_REGISTRY, CacheStatistics,
+                              register_cache, clear_caches, warm_up_caches,
+                              write_caches, read_caches, profiling)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestCache', 'TestRegisterCache', 'TestClearCaches', 'TestWarmUpCaches',
+    'TestWriteCaches'
+]
+
+
+class TestCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.cache.Cache` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'persistent',
+                               'statistics')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Cache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__len__', '__contains__', '__setitem__', 'get',
+                            'items', 'update', 'warm_up', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Cache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.cache.Cache.get` method.
+        """
+
+        cache = Cache('_CACHE')
+        cache['a'] = 1
+
+        with profiling() as statistics:
+            self.assertEqual(cache.get('a'), 1)
+            self.assertIsNone(cache.get('b'))
+            self.assertEqual(cache.get('b', 2), 2)
+
+        self.assertEqual(cache.statistics, CacheStatistics(hits=1, misses=2))
+        self.assertEqual(statistics.caches['_CACHE'],
+                         CacheStatistics(hits=1, misses=2))
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.cache.Cache.maximum_size` property.
+        """
+
+        cache = Cache('_CACHE', maximum_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+
+        self.assertListEqual(cache.items(), [('a', 1), ('c', 3)])
+
+        cache.maximum_size = 1
+        self.assertListEqual(cache.items(), [('c', 3)])
+
+        cache.maximum_size = None
+        cache.update([('d', 4), ('e', 5)])
+        self.assertEqual(len(cache), 3)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.cache.Cache.clear` method.
+        """
+
+        cache = Cache('_CACHE')
+        cache['a'] = 1
+        cache.get('a')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.statistics, CacheStatistics(hits=0, misses=0))
+
+    def test_threads(self):
+        """
+        Tests :class:`colour.utilities.cache.Cache` class accesses from
+        multiple threads.
+        """
+
+        cache = Cache('_CACHE', maximum_size=8)
+
+        def worker():
+            """
+            Accesses the cache.
+            """
+
+            for i in range(1000):
+                if cache.get(i % 16) is None:
+                    cache[i % 16] = i
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.hits + statistics.misses, 4000)
+        self.assertLessEqual(len(cache), 8)
+
+    def test_raise_exception_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.cache.Cache.maximum_size` property
+        raised exception.
+        """
+
+        self.assertRaises(AssertionError, Cache, '_CACHE', 0)
+
+
+class TestRegisterCache(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.register_cache` definition unit tests
+    methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        del CACHE_REGISTRY['_TEST_CACHE']
+
+    def test_register_cache(self):
+        """
+        Tests :func:`colour.utilities.cache.register_cache` definition.
+        """
+
+        cache = register_cache('_TEST_CACHE', 4, False)
+
+        self.assertIs(CACHE_REGISTRY['_TEST_CACHE'], cache)
+        self.assertEqual(cache.maximum_size, 4)
+        self.assertFalse(cache.persistent)
+
+        self.assertIn('_TRISTIMULUS_WEIGHTING_FACTORS_CACHE', CACHE_REGISTRY)
+
+
+class TestClearCaches(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.clear_caches` definition unit tests
+    methods.
+    """
+
+    def test_clear_caches(self):
+        """
+        Tests :func:`colour.utilities.cache.clear_caches` definition.
+        """
+
+        munsell_value(12.23634268)
+
+        cache = CACHE_REGISTRY[
+            '_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE']
+        self.assertEqual(len(cache), 1)
+
+        clear_caches()
+        self.assertEqual(len(cache), 0)
+
+        np.testing.assert_almost_equal(
+            munsell_value(12.23634268), 4.0824437076, decimal=7)
+
+
+class TestWarmUpCaches(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.warm_up_caches` definition unit
+    tests methods.
+    """
+
+    def test_warm_up_caches(self):
+        """
+        Tests :func:`colour.utilities.cache.warm_up_caches` definition.
+        """
+
+        names = ['_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE',
+                 '_XYZ_POINTER_GAMUT_CACHE']
+        clear_caches(names)
+        warm_up_caches(names)
+
+        for name in names:
+            self.assertEqual(len(CACHE_REGISTRY[name]), 1)
+
+        warmers = [cache.name for cache in CACHE_REGISTRY.values()
+                   if cache._warmer is not None]
+        self.assertIn('_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE', warmers)
+
+
+class TestWriteCaches(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.write_caches` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_caches(self):
+        """
+        Tests :func:`colour.utilities.cache.write_caches` and
+        :func:`colour.utilities.cache.read_caches` definitions.
+        """
+
+        path = os.path.join(self._temporary_directory, 'caches.pickle')
+
+        names = [
+            '_XYZ_POINTER_GAMUT_CACHE', '_CHROMATIC_ADAPTATION_MATRICES_CACHE'
+        ]
+        warm_up_caches(names)
+        XYZ = CACHE_REGISTRY['_XYZ_POINTER_GAMUT_CACHE'].items()[0][1]
+        CACHE_REGISTRY['_CHROMATIC_ADAPTATION_MATRICES_CACHE']['a'] = 1
+
+        self.assertTrue(write_caches(path, names))
+
+        clear_caches(names)
+        self.assertTrue(read_caches(path))
+
+        cache = CACHE_REGISTRY['_XYZ_POINTER_GAMUT_CACHE']
+        np.testing.assert_equal(cache.items()[0][1], XYZ)
+
+        self.assertEqual(
+            len(CACHE_REGISTRY['_CHROMATIC_ADAPTATION_MATRICES_CACHE']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,11 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import threading
 import unittest
 from collections import OrderedDict
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from colour.utilities import (
     batch, is_iterable, is_string, is_numeric, is_integer, is_sibling,
@@ -15,6 +18,9 @@ from colour.utilities import (
     set_domain_range_scale, domain_range_scale, to_domain_1, to_domain_10,
     to_domain_100, to_domain_int, to_domain_degrees, from_range_1,
     from_range_10, from_range_100, from_range_int, from_range_degrees)
+from colour.utilities import common
+from colour.utilities.array import default_float_dtype, get_default_float_dtype
+from colour.utilities.common import _FILTER_KWARGS_CACHE, _bind_context
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -229,6 +235,40 @@ class TestFilterKwargs(unittest.TestCase):
         self.assertTupleEqual((1, 2, 3),
                               fn_c(1, **filter_kwargs(fn_c, b=2, c=3)))
 
+        fn_p = partial(fn_c, b=4)
+        self.assertTupleEqual((1, 4, 3),
+                              fn_p(1, **filter_kwargs(fn_p, c=3, d=5)))
+
+        def fn_d(a, *args, **kwargs):
+            """
+            :func:`filter_kwargs` unit tests :func:`fn_d` definition.
+            """
+
+            return a, args, kwargs
+
+        self.assertDictEqual(
+            filter_kwargs(fn_d, a=1, args=2, kwargs=3), {'a': 1})
+
+    def test_filter_kwargs_cache(self):
+        """
+        Tests :func:`colour.utilities.common.filter_kwargs` definition
+        signature caching.
+        """
+
+        def fn_a(a, b=0):
+            """
+            :func:`filter_kwargs` unit tests :func:`fn_a` definition.
+            """
+
+            return a, b
+
+        self.assertNotIn(fn_a, _FILTER_KWARGS_CACHE)
+        filter_kwargs(fn_a, b=2, c=3)
+        self.assertSetEqual(_FILTER_KWARGS_CACHE[fn_a], {'a', 'b'})
+
+        b = [2]
+        self.assertIs(filter_kwargs(fn_a, b=b, c=3)['b'], b)
+
 
 class TestFilterMapping(unittest.TestCase):
     """
@@ -392,6 +432,158 @@ class TestDomainRangeScale(unittest.TestCase):
 
         self.assertEqual(get_domain_range_scale(), 'reference')
 
+        scale = domain_range_scale('1')
+        with scale:
+            with domain_range_scale('100'):
+                with scale:
+                    self.assertEqual(get_domain_range_scale(), '1')
+
+                self.assertEqual(get_domain_range_scale(), '100')
+
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
+        @domain_range_scale('1')
+        def fn_a(a):
+            """
+            :class:`domain_range_scale` unit tests :func:`fn_a` definition.
+            """
+
+            return to_domain_10(a)
+
+        self.assertEqual(fn_a(1), 10)
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
+    def test_domain_range_scale_threads(self):
+        """
+        Tests :func:`colour.utilities.common.domain_range_scale` definition
+        threads isolation.
+        """
+
+        scales = []
+        event = threading.Event()
+
+        def worker():
+            """
+            :class:`domain_range_scale` unit tests :func:`worker` definition.
+            """
+
+            event.wait()
+            scales.append(get_domain_range_scale())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        with domain_range_scale('1'):
+            event.set()
+            thread.join()
+
+        self.assertListEqual(scales, ['reference'])
+
+        @domain_range_scale('1')
+        def fn_a(a):
+            """
+            :class:`domain_range_scale` unit tests :func:`fn_a` definition.
+            """
+
+            barrier.wait()
+
+            return to_domain_10(a)
+
+        @domain_range_scale('100')
+        def fn_b(a):
+            """
+            :class:`domain_range_scale` unit tests :func:`fn_b` definition.
+            """
+
+            barrier.wait()
+
+            return to_domain_10(a)
+
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def run(name, function):
+            """
+            :class:`domain_range_scale` unit tests :func:`run` definition.
+            """
+
+            results[name] = function(10)
+
+        threads = [
+            threading.Thread(target=run, args=(name, function))
+            for name, function in (('a1', fn_a), ('a2', fn_a), ('b1', fn_b),
+                                   ('b2', fn_b))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertDictEqual(results, {
+            'a1': 100,
+            'a2': 100,
+            'b1': 1,
+            'b2': 1
+        })
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
+
+class TestBindContext(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common._bind_context` definition units
+    tests methods.
+    """
+
+    def _context(self):
+        """
+        Returns the domain-range scale and floating point number dtype seen
+        by thread pool workers running a bound definition.
+        """
+
+        def context(_i):
+            """
+            :func:`_bind_context` unit tests :func:`context` definition.
+            """
+
+            return get_domain_range_scale(), get_default_float_dtype()
+
+        pool = ThreadPool(processes=2)
+        try:
+            unbound = pool.map(context, range(4))
+            with domain_range_scale('1'), default_float_dtype(np.float32):
+                bound = pool.map(_bind_context(context), range(4))
+        finally:
+            pool.close()
+            pool.join()
+
+        return unbound, bound
+
+    def test_bind_context(self):
+        """
+        Tests :func:`colour.utilities.common._bind_context` definition.
+        """
+
+        unbound, bound = self._context()
+
+        self.assertListEqual(unbound, [('reference', np.float64)] * 4)
+        self.assertListEqual(bound, [('1', np.float32)] * 4)
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
+    def test_bind_context_fallback(self):
+        """
+        Tests :func:`colour.utilities.common._bind_context` definition without
+        the :mod:`contextvars` module.
+        """
+
+        copy_context = common._copy_context
+        common._copy_context = None
+        try:
+            unbound, bound = self._context()
+        finally:
+            common._copy_context = copy_context
+
+        self.assertListEqual(bound, [('1', np.float32)] * 4)
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
 
 class TestToDomain1(unittest.TestCase):
     """
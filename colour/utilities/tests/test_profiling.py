@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.profiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import threading
+import unittest
+
+from colour.colorimetry import (ILLUMINANTS_SDS, STANDARD_OBSERVERS_CMFS,
+                                SpectralShape, sd_to_XYZ)
+from colour.utilities import (CacheStatistics, ProfilingStatistics, profiling,
+                              profiled, profile_cache_access, clear_caches)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestProfilingStatistics', 'TestProfiling', 'TestProfiled',
+    'TestProfileCacheAccess'
+]
+
+
+@profiled
+def _profiled_definition(a):
+    """
+    Profiled definition used by the unit tests.
+    """
+
+    return a
+
+
+@profiled(name='Named.definition')
+def _profiled_named_definition(a):
+    """
+    Profiled named definition used by the unit tests.
+    """
+
+    return _profiled_definition(a)
+
+
+class TestProfilingStatistics(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.profiling.ProfilingStatistics` class unit
+    tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__str__', 'reset')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ProfilingStatistics))
+
+    def test__str__(self):
+        """
+        Tests :meth:`colour.utilities.profiling.ProfilingStatistics.__str__`
+        method.
+        """
+
+        with profiling() as statistics:
+            _profiled_definition(1)
+            profile_cache_access('_CACHE', True)
+
+        string = str(statistics)
+        self.assertIn('_profiled_definition', string)
+        self.assertIn('_CACHE', string)
+
+    def test_reset(self):
+        """
+        Tests :meth:`colour.utilities.profiling.ProfilingStatistics.reset`
+        method.
+        """
+
+        with profiling() as statistics:
+            _profiled_definition(1)
+            profile_cache_access('_CACHE', True)
+
+        statistics.reset()
+        self.assertDictEqual(dict(statistics.calls), {})
+        self.assertDictEqual(dict(statistics.caches), {})
+
+
+class TestProfiling(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.profiling.profiling` class unit tests
+    methods.
+    """
+
+    def test_profiling(self):
+        """
+        Tests :class:`colour.utilities.profiling.profiling` class.
+        """
+
+        _profiled_definition(1)
+
+        with profiling() as statistics:
+            _profiled_definition(1)
+            _profiled_definition(1)
+
+        _profiled_definition(1)
+
+        self.assertEqual(statistics.calls['_profiled_definition'].calls, 2)
+
+        accumulated = ProfilingStatistics()
+        for _ in range(2):
+            with profiling(accumulated):
+                _profiled_definition(1)
+
+        self.assertEqual(accumulated.calls['_profiled_definition'].calls, 2)
+
+        with profiling() as outer:
+            _profiled_definition(1)
+            with profiling() as inner:
+                _profiled_definition(1)
+
+        self.assertEqual(outer.calls['_profiled_definition'].calls, 2)
+        self.assertEqual(inner.calls['_profiled_definition'].calls, 1)
+
+        decorated_statistics = ProfilingStatistics()
+
+        @profiling(decorated_statistics)
+        def decorated():
+            """
+            Decorated definition.
+            """
+
+            return _profiled_definition(1)
+
+        self.assertEqual(decorated(), 1)
+        self.assertEqual(
+            decorated_statistics.calls['_profiled_definition'].calls, 1)
+
+    def test_threads(self):
+        """
+        Tests :class:`colour.utilities.profiling.profiling` class statistics
+        recording from multiple threads.
+        """
+
+        def worker():
+            """
+            Calls the profiled definition.
+            """
+
+            for _ in range(100):
+                _profiled_definition(1)
+
+        with profiling() as statistics:
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(statistics.calls['_profiled_definition'].calls, 400)
+
+
+class TestProfiled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.profiled` definition unit tests
+    methods.
+    """
+
+    def test_profiled(self):
+        """
+        Tests :func:`colour.utilities.profiling.profiled` definition.
+        """
+
+        self.assertEqual(_profiled_definition.__name__, '_profiled_definition')
+        self.assertIsNotNone(_profiled_definition.__wrapped__)
+
+        with profiling() as statistics:
+            _profiled_definition(np.zeros([4, 3]))
+            _profiled_definition([1, 2])
+            _profiled_named_definition(1)
+
+        self.assertListEqual(
+            sorted(statistics.calls.keys()),
+            ['Named.definition', '_profiled_definition'])
+
+        call = statistics.calls['_profiled_definition']
+        self.assertEqual(call.calls, 3)
+        self.assertEqual(call.items, 14)
+        self.assertGreaterEqual(call.time, 0)
+
+        self.assertEqual(statistics.calls['Named.definition'].calls, 1)
+
+    def test_raise_exception_profiled(self):
+        """
+        Tests :func:`colour.utilities.profiling.profiled` definition raised
+        exception.
+        """
+
+        @profiled
+        def raising():
+            """
+            Raising definition.
+            """
+
+            raise ValueError()
+
+        with profiling() as statistics:
+            self.assertRaises(ValueError, raising)
+
+        self.assertEqual(statistics.calls['raising'].calls, 1)
+
+
+class TestProfileCacheAccess(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.profile_cache_access` definition
+    unit tests methods.
+    """
+
+    def test_profile_cache_access(self):
+        """
+        Tests :func:`colour.utilities.profiling.profile_cache_access`
+        definition.
+        """
+
+        with profiling() as statistics:
+            profile_cache_access('_CACHE', False)
+            profile_cache_access('_CACHE', True)
+            profile_cache_access('_CACHE', True)
+
+        profile_cache_access('_CACHE', True)
+
+        self.assertEqual(statistics.caches['_CACHE'],
+                         CacheStatistics(hits=2, misses=1))
+
+    def test_tristimulus_weighting_factors_cache(self):
+        """
+        Tests :func:`colour.utilities.profiling.profile_cache_access`
+        definition with the tristimulus weighting factors cache.
+        """
+
+        sd = ILLUMINANTS_SDS['A'].copy().align(SpectralShape(360, 830, 20))
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        illuminant = ILLUMINANTS_SDS['D65']
+
+        clear_caches(['_TRISTIMULUS_WEIGHTING_FACTORS_CACHE'])
+
+        with profiling() as statistics:
+            sd_to_XYZ(sd, cmfs, illuminant, method='ASTM E308-15')
+            sd_to_XYZ(sd, cmfs, illuminant, method='ASTM E308-15')
+
+        self.assertEqual(statistics.calls['sd_to_XYZ'].calls, 2)
+
+        cache = statistics.caches['_TRISTIMULUS_WEIGHTING_FACTORS_CACHE']
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
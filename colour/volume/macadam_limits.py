@@ -14,11 +14,10 @@ blob/master/notebooks/volume/macadam_limits.ipynb>`_
 
 from __future__ import division, unicode_literals
 
-import numpy as np
-from scipy.spatial import Delaunay
-
 from colour.models import xyY_to_XYZ
-from colour.volume import ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
+from colour.volume import (ILLUMINANTS_OPTIMAL_COLOUR_STIMULI,
+                           is_within_mesh_volume)
+from colour.utilities import register_cache
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -29,8 +28,12 @@ __status__ = 'Production'
 
 __all__ = ['is_within_macadam_limits']
 
-_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = {}
-_XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE = {}
+_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = register_cache(
+    '_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE',
+    warmer=lambda: [
+        _XYZ_optimal_colour_stimuli(illuminant)
+        for illuminant in ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
+    ])
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -93,6 +96,7 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
@@ -102,13 +106,6 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     """
 
     optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
-        illuminant)
-    if triangulation is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
-
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
 
-    return simplex
+    return is_within_mesh_volume(
+        xyY_to_XYZ(xyY), optimal_colour_stimuli, tolerance)
@@ -11,6 +11,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 from scipy.spatial import Delaunay
 
+from colour.utilities import as_float_array, register_cache
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -20,6 +22,38 @@ __status__ = 'Production'
 
 __all__ = ['is_within_mesh_volume']
 
+_TRIANGULATIONS_CACHE = register_cache(
+    '_TRIANGULATIONS_CACHE', maximum_size=16)
+
+
+def _mesh_triangulation(mesh):
+    """
+    Returns the Delaunay triangulation of given mesh and caches it if not
+    existing.
+
+    The cache is keyed by the mesh content so that identical meshes, e.g.
+    recomputed for every call, share the same triangulation.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+
+    Returns
+    -------
+    Delaunay
+        Mesh Delaunay triangulation.
+    """
+
+    mesh = as_float_array(mesh)
+
+    key = (mesh.shape, mesh.tobytes())
+    triangulation = _TRIANGULATIONS_CACHE.get(key)
+    if triangulation is None:
+        _TRIANGULATIONS_CACHE[key] = triangulation = Delaunay(mesh)
+
+    return triangulation
+
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
     """
@@ -40,6 +74,11 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     bool
         Is within mesh volume.
 
+    Notes
+    -----
+    -   The Delaunay triangulation of the mesh is cached and reused for
+        subsequent calls with a mesh of identical content.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -57,7 +96,7 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    triangulation = _mesh_triangulation(mesh)
 
     simplex = triangulation.find_simplex(points, tol=tolerance)
     simplex = np.where(simplex >= 0, True, False)
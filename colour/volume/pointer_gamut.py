@@ -17,6 +17,7 @@ from __future__ import division, unicode_literals
 from colour.models import (Lab_to_XYZ, LCHab_to_Lab, POINTER_GAMUT_DATA,
                            POINTER_GAMUT_ILLUMINANT)
 from colour.volume import is_within_mesh_volume
+from colour.utilities import domain_range_scale, register_cache
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -27,6 +28,30 @@ __status__ = 'Production'
 
 __all__ = ['is_within_pointer_gamut']
 
+_XYZ_POINTER_GAMUT_CACHE = register_cache(
+    '_XYZ_POINTER_GAMUT_CACHE', warmer=lambda: _XYZ_pointer_gamut())
+
+
+def _XYZ_pointer_gamut():
+    """
+    Returns *Pointer's Gamut* in *CIE XYZ* tristimulus values and caches it if
+    not existing.
+
+    Returns
+    -------
+    ndarray
+        *Pointer's Gamut* *CIE XYZ* tristimulus values.
+    """
+
+    XYZ = _XYZ_POINTER_GAMUT_CACHE.get('Pointer Gamut')
+    if XYZ is None:
+        with domain_range_scale('ignore'):
+            XYZ = Lab_to_XYZ(
+                LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT)
+        _XYZ_POINTER_GAMUT_CACHE['Pointer Gamut'] = XYZ
+
+    return XYZ
+
 
 def is_within_pointer_gamut(XYZ, tolerance=None):
     """
@@ -64,7 +89,4 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    XYZ_p = Lab_to_XYZ(
-        LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT)
-
-    return is_within_mesh_volume(XYZ, XYZ_p, tolerance)
+    return is_within_mesh_volume(XYZ, _XYZ_pointer_gamut(), tolerance)
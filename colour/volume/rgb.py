@@ -10,6 +10,10 @@ Defines various RGB colourspace volume computation objects:
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_Mesh`
+-   :func:`colour.RGB_colourspace_volume_coverage_Mesh`
+-   :func:`colour.RGB_colourspace_pointer_gamut_coverage_Mesh`
+-   :func:`colour.RGB_colourspace_visible_spectrum_coverage_Mesh`
 
 See Also
 --------
@@ -23,12 +27,16 @@ from __future__ import division, unicode_literals
 import itertools
 import multiprocessing
 import numpy as np
+from scipy.spatial import ConvexHull
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
+from colour.models import (LCHab_to_Lab, Lab_to_XYZ, POINTER_GAMUT_DATA,
+                           POINTER_GAMUT_ILLUMINANT, RGB_to_XYZ, XYZ_to_Lab,
+                           XYZ_to_RGB)
+from colour.volume import (XYZ_outer_surface, is_within_pointer_gamut,
+                           is_within_visible_spectrum)
 from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
@@ -43,10 +51,81 @@ __all__ = [
     'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_coverage_Mesh',
+    'RGB_colourspace_pointer_gamut_coverage_Mesh',
+    'RGB_colourspace_visible_spectrum_coverage_Mesh'
 ]
 
 
+def _chunks_sizes(samples, chunk_size):
+    """
+    Returns the sizes of the chunks needed to process given samples count with
+    chunks of given maximum size.
+
+    Parameters
+    ----------
+    samples : numeric
+        Samples count.
+    chunk_size : numeric
+        Maximum samples count per chunk.
+
+    Returns
+    -------
+    list
+        Chunks sizes.
+
+    Examples
+    --------
+    >>> _chunks_sizes(10, 4)
+    [4, 4, 2]
+    """
+
+    samples = DEFAULT_INT_DTYPE(samples)
+    chunk_size = max(DEFAULT_INT_DTYPE(chunk_size), 1)
+
+    sizes = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        sizes.append(samples % chunk_size)
+
+    return sizes
+
+
+def _random_samples(random_generator, size, limits=None, random_state=None):
+    """
+    Returns given size random triplets from given random generator as an
+    :class:`ndarray`.
+
+    Parameters
+    ----------
+    random_generator : generator
+        Random triplet generator.
+    size : integer
+        Random triplets count.
+    limits : array_like, optional
+        Random values limits on each triplet axis, the random generator
+        default limits are used if not given.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator to use in the random
+        number generator.
+
+    Returns
+    -------
+    ndarray
+        Random triplets.
+    """
+
+    if limits is None:
+        samples = random_generator(size, random_state=random_state)
+    else:
+        samples = random_generator(size, limits, random_state)
+
+    if isinstance(samples, np.ndarray):
+        return as_float_array(samples)
+    else:
+        return as_float_array(list(samples))
+
+
 def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     """
     Convenient wrapper to be able to call
@@ -75,7 +154,8 @@ def sample_RGB_colourspace_volume_MonteCarlo(
             'D65'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e5):
     """
     Randomly samples the *Lab* colourspace volume and returns the ratio of
     samples within the given *RGB* colourspace volume.
@@ -101,6 +181,9 @@ def sample_RGB_colourspace_volume_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Maximum samples count processed at once, bounding the memory usage
+        irrespective of the samples count.
 
     Returns
     -------
@@ -130,17 +213,21 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = as_float_array(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.XYZ_to_RGB_matrix,
-        chromatic_adaptation_transform=chromatic_adaptation_method)
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    within = 0
+    for size in _chunks_sizes(samples, chunk_size):
+        Lab = _random_samples(random_generator, size, limits, random_state)
+        RGB = XYZ_to_RGB(
+            Lab_to_XYZ(Lab, illuminant_Lab),
+            illuminant_Lab,
+            colourspace.whitepoint,
+            colourspace.XYZ_to_RGB_matrix,
+            chromatic_adaptation_transform=chromatic_adaptation_method)
+        within += np.count_nonzero(
+            np.logical_and(
+                np.min(RGB, axis=-1) >= 0,
+                np.max(RGB, axis=-1) <= 1))
+
+    return within
 
 
 def RGB_colourspace_limits(
@@ -194,7 +281,10 @@ def RGB_colourspace_volume_MonteCarlo(
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
         random_state=None,
-        processes=None):
+        processes=None,
+        chunk_size=10e5,
+        tolerance=None,
+        pool=None):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
@@ -204,7 +294,7 @@ def RGB_colourspace_volume_MonteCarlo(
     colourspace : RGB_Colourspace
         *RGB* colourspace to compute the volume of.
     samples : numeric, optional
-        Samples count.
+        Samples count, the maximum samples count if ``tolerance`` is given.
     limits : array_like, optional
         *Lab* colourspace volume.
     illuminant_Lab : array_like, optional
@@ -219,10 +309,22 @@ def RGB_colourspace_volume_MonteCarlo(
         colourspace volume.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        number generator, it is used to seed the independent pseudo-random
+        number generator of each chunk.
     processes : integer, optional
         Processes count, default to :func:`multiprocessing.cpu_count`
-        definition.
+        definition, a value of 1 performs the computation in the current
+        process.
+    chunk_size : numeric, optional
+        Maximum samples count processed at once by a process.
+    tolerance : numeric, optional
+        Relative standard error of the volume estimate under which the
+        computation is stopped early, the samples are processed until
+        exhaustion if not given.
+    pool : Pool, optional
+        :class:`multiprocessing.Pool` class instance to use for the
+        computation, it is neither closed nor joined so that it can be reused
+        across calls, e.g. when computing the volume of many colourspaces.
 
     Returns
     -------
@@ -231,6 +333,10 @@ def RGB_colourspace_volume_MonteCarlo(
 
     Notes
     -----
+    -   The samples are split into chunks of ``chunk_size`` samples, each chunk
+        having its own pseudo-random number generator seeded from
+        ``random_state``: the memory usage is bounded and the result for a
+        given ``random_state`` does not depend on the processes count.
     -   The doctest is assuming that :func:`np.random.RandomState` definition
         will return the same sequence no matter which *OS* or *Python*
         version is used. There is however no formal promise about the *prng*
@@ -248,23 +354,53 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng,
     ...                                   processes=processes)
     ... # doctest: +ELLIPSIS
-    816...
+    869...
     """
 
-    cpu_count = processes if processes else multiprocessing.cpu_count()
-    pool = multiprocessing.Pool(processes=cpu_count)
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
 
-    process_samples = DEFAULT_INT_DTYPE(np.round(samples / cpu_count))
+    sizes = _chunks_sizes(samples, chunk_size)
+    seeds = random_state.randint(
+        np.iinfo(np.int32).max, size=len(sizes), dtype=DEFAULT_INT_DTYPE)
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+    cpu_count = processes if processes else multiprocessing.cpu_count()
 
-    results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                       [arguments for _ in range(cpu_count)])
+    owned_pool = None
+    if pool is not None:
+        mapper = pool.map
+    elif cpu_count > 1:
+        owned_pool = multiprocessing.Pool(processes=cpu_count)
+        mapper = owned_pool.map
+    else:
+        mapper = map
 
     Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    return Lab_volume * np.sum(results) / (process_samples * cpu_count)
+    total, within = 0, 0
+    try:
+        for i in range(0, len(sizes), cpu_count):
+            arguments = [(colourspace, size, limits, illuminant_Lab,
+                          chromatic_adaptation_method, random_generator,
+                          np.random.RandomState(seed))
+                         for size, seed in zip(sizes[i:i + cpu_count],
+                                               seeds[i:i + cpu_count])]
+
+            within += np.sum(
+                list(mapper(_wrapper_RGB_colourspace_volume_MonteCarlo,
+                            arguments)))
+            total += np.sum(sizes[i:i + cpu_count])
+
+            # Relative standard error of the binomial proportion estimate.
+            if tolerance is not None and within > 0:
+                if np.sqrt((total - within) / (within * total)) <= tolerance:
+                    break
+    finally:
+        if owned_pool is not None:
+            owned_pool.close()
+            owned_pool.join()
+
+    return Lab_volume * within / total
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -272,7 +408,8 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         coverage_sampler,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e5):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -289,6 +426,9 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Maximum samples count processed at once, bounding the memory usage
+        irrespective of the samples count.
 
     Returns
     -------
@@ -308,19 +448,22 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = as_float_array(
-        list(random_generator(samples, random_state=random_state)))
-    XYZ_vs = XYZ[coverage_sampler(XYZ)]
+    within_volume, within_colourspace = 0, 0
+    for size in _chunks_sizes(samples, chunk_size):
+        XYZ = _random_samples(
+            random_generator, size, random_state=random_state)
+        XYZ_vs = XYZ[coverage_sampler(XYZ)]
 
-    RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.XYZ_to_RGB_matrix)
+        RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint,
+                         colourspace.whitepoint, colourspace.XYZ_to_RGB_matrix)
 
-    RGB_c = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
+        within_volume += len(XYZ_vs)
+        within_colourspace += np.count_nonzero(
+            np.logical_and(
+                np.min(RGB, axis=-1) >= 0,
+                np.max(RGB, axis=-1) <= 1))
 
-    return 100 * RGB_c.size / XYZ_vs.size
+    return 100 * within_colourspace / within_volume
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
@@ -401,3 +544,313 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_visible_spectrum, samples, random_generator,
         random_state)
+
+
+def _RGB_cube_surface(segments):
+    """
+    Returns the triangles tessellating the surface of the unit *RGB* cube with
+    given segments count per edge, the triangles are oriented so that their
+    normals point outward.
+
+    Parameters
+    ----------
+    segments : int
+        Segments count per cube edge.
+
+    Returns
+    -------
+    ndarray
+        Triangles of shape (6 * 2 * segments ** 2, 3, 3).
+
+    Examples
+    --------
+    >>> _RGB_cube_surface(1).shape
+    (12, 3, 3)
+    """
+
+    u, v = np.meshgrid(
+        np.linspace(0, 1, segments + 1),
+        np.linspace(0, 1, segments + 1),
+        indexing='ij')
+
+    p_00, p_10 = u[:-1, :-1].ravel(), u[1:, :-1].ravel()
+    p_11, p_01 = u[1:, 1:].ravel(), u[:-1, 1:].ravel()
+    q_00, q_10 = v[:-1, :-1].ravel(), v[1:, :-1].ravel()
+    q_11, q_01 = v[1:, 1:].ravel(), v[:-1, 1:].ravel()
+
+    # Triangles in the (u, v) plane with counter-clockwise winding.
+    uv = np.concatenate([
+        np.stack([
+            np.stack([p_00, q_00], axis=-1),
+            np.stack([p_10, q_10], axis=-1),
+            np.stack([p_11, q_11], axis=-1),
+        ],
+                 axis=1),
+        np.stack([
+            np.stack([p_00, q_00], axis=-1),
+            np.stack([p_11, q_11], axis=-1),
+            np.stack([p_01, q_01], axis=-1),
+        ],
+                 axis=1),
+    ])
+
+    triangles = []
+    for axis in range(3):
+        # Cyclic axes ordering ensures that the "u" and "v" axes cross product
+        # points toward the positive direction of the fixed axis.
+        axis_u, axis_v = (axis + 1) % 3, (axis + 2) % 3
+        for value in (0, 1):
+            face = np.zeros(uv.shape[:-1] + (3, ))
+            face[..., axis] = value
+            face[..., axis_u] = uv[..., 0]
+            face[..., axis_v] = uv[..., 1]
+
+            triangles.append(face if value == 1 else face[:, ::-1, :])
+
+    return np.concatenate(triangles)
+
+
+def _clipped_convex_hull_volume(points, halfspaces):
+    """
+    Returns the volume of the convex hull of given points clipped by given
+    halfspaces.
+
+    The convex hull is successively clipped by each halfspace: the points on
+    the outer side of the halfspace plane are discarded and replaced with the
+    intersections of the plane with the hull edges crossing it.
+
+    Parameters
+    ----------
+    points : array_like
+        Points defining the convex hull.
+    halfspaces : array_like
+        Halfspaces in the :math:`Ax + b <= 0` form, i.e. stacked :math:`[A; b]`
+        as returned by :attr:`scipy.spatial.ConvexHull.equations` attribute.
+
+    Returns
+    -------
+    float
+        Clipped convex hull volume, 0 if the clipped convex hull is empty or
+        flat.
+
+    Examples
+    --------
+    >>> points = np.array(list(itertools.product([0, 1], repeat=3)))
+    >>> halfspaces = np.array([[1, 0, 0, -0.5]])
+    >>> _clipped_convex_hull_volume(points, halfspaces)  # doctest: +ELLIPSIS
+    0.5...
+    """
+
+    points = as_float_array(points)
+
+    for halfspace in as_float_array(halfspaces):
+        if len(points) < 4:
+            return 0
+
+        # Joggling the input guarantees that *Qhull* does not fail on
+        # degenerate, i.e. flat, clipped hulls.
+        simplices = ConvexHull(points, qhull_options='QJ').simplices
+
+        edges = np.vstack(
+            [simplices[..., [0, 1]], simplices[..., [1, 2]],
+             simplices[..., [2, 0]]])
+        edges = np.unique(np.sort(edges, axis=-1), axis=0)
+
+        distances = np.dot(points, halfspace[:-1]) + halfspace[-1]
+
+        d_a, d_b = distances[edges[..., 0]], distances[edges[..., 1]]
+        crossing = d_a * d_b < 0
+        edges, d_a, d_b = edges[crossing], d_a[crossing], d_b[crossing]
+
+        t = (d_a / (d_a - d_b))[..., np.newaxis]
+        p_a, p_b = points[edges[..., 0]], points[edges[..., 1]]
+
+        points = np.vstack([points[distances <= 0], p_a + t * (p_b - p_a)])
+
+    if len(points) < 4:
+        return 0
+
+    return ConvexHull(points, qhull_options='QJ').volume
+
+
+def RGB_colourspace_volume_Mesh(
+        colourspace,
+        segments=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Performs given *RGB* colourspace volume computation in *CIE L\\*a\\*b\\**
+    colourspace by integration over its tessellated surface.
+
+    The *RGB* cube surface is tessellated, converted to
+    *CIE L\\*a\\*b\\** colourspace and the enclosed volume is computed with
+    the divergence theorem, i.e. the sum of the signed volumes of the
+    tetrahedra formed by the origin and each surface triangle.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    segments : int, optional
+        Segments count per *RGB* cube edge, the error decreases with its
+        square.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   Contrary to :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition, the volume is not bounded by *Lab* colourspace limits.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_Mesh(sRGB)  # doctest: +ELLIPSIS
+    819688.4360073...
+    """
+
+    triangles = _RGB_cube_surface(segments)
+
+    Lab = XYZ_to_Lab(
+        RGB_to_XYZ(
+            triangles,
+            colourspace.whitepoint,
+            illuminant_Lab,
+            colourspace.RGB_to_XYZ_matrix,
+            chromatic_adaptation_transform=chromatic_adaptation_method),
+        illuminant_Lab)
+
+    volume = np.sum(
+        np.einsum('...i,...i->...', Lab[:, 0],
+                  np.cross(Lab[:, 1], Lab[:, 2]))) / 6
+
+    return np.abs(volume)
+
+
+def RGB_colourspace_volume_coverage_Mesh(colourspace, points):
+    """
+    Returns given *RGB* colourspace percentage coverage of the convex volume
+    defined by given points using exact polytope intersection.
+
+    The *RGB* colourspace gamut is the parallelepiped bounded by
+    :math:`0 <= RGB <= 1` in *CIE XYZ* tristimulus values, its intersection
+    with the convex hull of given points, bounded by the unit cube as the
+    samples of :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
+    definition are, is computed by clipping the convex hull with the
+    parallelepiped planes.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    points : array_like
+        *CIE XYZ* tristimulus values of the points whose convex hull defines
+        the volume to compute the coverage of.
+
+    Returns
+    -------
+    float
+        Percentage coverage of volume.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> from colour.volume import XYZ_outer_surface
+    >>> RGB_colourspace_volume_coverage_Mesh(sRGB, XYZ_outer_surface())
+    ... # doctest: +ELLIPSIS
+    48.4788852...
+    """
+
+    points = as_float_array(points)
+
+    eye = np.identity(3)
+    M = as_float_array(colourspace.XYZ_to_RGB_matrix)
+
+    # Unit cube, i.e. the *Monte Carlo* samples domain.
+    cube = np.vstack([
+        np.hstack([-eye, np.zeros((3, 1))]),
+        np.hstack([eye, -np.ones((3, 1))]),
+    ])
+
+    # *RGB* colourspace gamut in *CIE XYZ* tristimulus values.
+    RGB = np.vstack([
+        np.hstack([-M, np.zeros((3, 1))]),
+        np.hstack([M, -np.ones((3, 1))]),
+    ])
+
+    volume = _clipped_convex_hull_volume(points, cube)
+
+    if volume == 0:
+        return 0
+
+    return 100 * _clipped_convex_hull_volume(points, np.vstack([cube, RGB
+                                                                ])) / volume
+
+
+def RGB_colourspace_pointer_gamut_coverage_Mesh(colourspace):
+    """
+    Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
+    volume using exact polytope intersection.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the *Pointer's Gamut* coverage percentage.
+
+    Returns
+    -------
+    float
+        Percentage coverage of *Pointer's Gamut* volume.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_pointer_gamut_coverage_Mesh(sRGB)
+    ... # doctest: +ELLIPSIS
+    81.1925815...
+    """
+
+    return RGB_colourspace_volume_coverage_Mesh(
+        colourspace,
+        Lab_to_XYZ(LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT))
+
+
+def RGB_colourspace_visible_spectrum_coverage_Mesh(colourspace, interval=10):
+    """
+    Returns given *RGB* colourspace percentage coverage of visible spectrum
+    volume using exact polytope intersection.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the visible spectrum coverage percentage.
+    interval : int, optional
+        Wavelength :math:`\\lambda_{i}` range interval used to compute the
+        pulse waves for the *CIE XYZ* colourspace outer surface.
+
+    Returns
+    -------
+    float
+        Percentage coverage of visible spectrum volume.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_visible_spectrum_coverage_Mesh(sRGB)
+    ... # doctest: +ELLIPSIS
+    48.4788852...
+    """
+
+    return RGB_colourspace_volume_coverage_Mesh(colourspace,
+                                                XYZ_outer_surface(interval))
@@ -24,12 +24,14 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+from scipy.spatial import ConvexHull
 
 from colour.algebra import NearestNeighbourInterpolator
 from colour.colorimetry import (
     DEFAULT_SPECTRAL_SHAPE, STANDARD_OBSERVERS_CMFS,
     multi_sd_to_XYZ_integration, SpectralShape, sd_ones)
-from colour.volume import is_within_mesh_volume
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_float_array, register_cache
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -42,8 +44,10 @@ __all__ = [
     'generate_pulse_waves', 'XYZ_outer_surface', 'is_within_visible_spectrum'
 ]
 
-_XYZ_OUTER_SURFACE_CACHE = {}
-_XYZ_OUTER_SURFACE_POINTS_CACHE = {}
+_XYZ_OUTER_SURFACE_CACHE = register_cache(
+    '_XYZ_OUTER_SURFACE_CACHE', maximum_size=16, persistent=False)
+_XYZ_OUTER_SURFACE_HULL_CACHE = register_cache(
+    '_XYZ_OUTER_SURFACE_HULL_CACHE', maximum_size=16, persistent=False)
 
 
 def generate_pulse_waves(bins):
@@ -118,13 +122,15 @@ def generate_pulse_waves(bins):
            [ 1.,  1.,  1.,  1.,  1.]])
     """
 
-    square_waves = []
-    square_waves_basis = np.tril(np.ones((bins, bins)))[0:-1, :]
-    for square_wave_basis in square_waves_basis:
-        for i in range(bins):
-            square_waves.append(np.roll(square_wave_basis, i))
+    # A square wave of given width and offset is non-zero where the distance
+    # from its offset, wrapped around the bins, is lower than its width.
+    widths = np.arange(1, bins)[:, np.newaxis, np.newaxis]
+    offsets = np.arange(bins)[np.newaxis, :, np.newaxis]
+    distances = (np.arange(bins)[np.newaxis, np.newaxis, :] - offsets) % bins
 
-    return np.vstack([np.zeros(bins), np.vstack(square_waves), np.ones(bins)])
+    square_waves = np.reshape(distances < widths, (-1, bins))
+
+    return np.vstack([np.zeros(bins), square_waves, np.ones(bins)])
 
 
 def XYZ_outer_surface(
@@ -137,6 +143,11 @@ def XYZ_outer_surface(
     functions using multi-spectral conversion of pulse waves to *CIE XYZ*
     tristimulus values.
 
+    The conversion being linear, the *CIE XYZ* tristimulus values of every
+    pulse wave are computed as sums over windows of the cumulative *CIE XYZ*
+    tristimulus values of the single bin pulses, avoiding the generation of
+    the dense pulse waves matrix.
+
     Parameters
     ----------
     interval : int, optional
@@ -200,14 +211,31 @@ def XYZ_outer_surface(
         wavelengths = SpectralShape(DEFAULT_SPECTRAL_SHAPE.start,
                                     DEFAULT_SPECTRAL_SHAPE.end,
                                     interval).range()
-        values = []
+        bins = len(wavelengths)
         domain = DEFAULT_SPECTRAL_SHAPE.range()
-        for wave in generate_pulse_waves(len(wavelengths)):
-            values.append(
-                NearestNeighbourInterpolator(wavelengths, wave)(domain))
 
-        XYZ = multi_sd_to_XYZ_integration(values, DEFAULT_SPECTRAL_SHAPE, cmfs,
-                                          illuminant)
+        values = [
+            NearestNeighbourInterpolator(wavelengths, wave)(domain)
+            for wave in np.identity(bins)
+        ]
+
+        XYZ_b = multi_sd_to_XYZ_integration(values, DEFAULT_SPECTRAL_SHAPE,
+                                            cmfs, illuminant)
+
+        # Cumulative tristimulus values over two periods so that the windows
+        # wrapping around the bins are contiguous.
+        XYZ_c = np.vstack(
+            [np.zeros(3),
+             np.cumsum(np.vstack([XYZ_b, XYZ_b]), axis=0)])
+
+        offsets = np.arange(bins)[np.newaxis, :]
+        widths = np.arange(1, bins)[:, np.newaxis]
+
+        XYZ = np.vstack([
+            np.zeros(3),
+            np.reshape(XYZ_c[offsets + widths] - XYZ_c[offsets], (-1, 3)),
+            XYZ_c[bins],
+        ])
 
         XYZ = XYZ / np.max(XYZ[-1, 1])
 
@@ -239,7 +267,7 @@ def is_within_visible_spectrum(
     illuminant : SpectralDistribution, optional
         Illuminant spectral distribution.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance, i.e. distance, allowed in the inside-facet check.
 
     Returns
     -------
@@ -248,6 +276,11 @@ def is_within_visible_spectrum(
 
     Notes
     -----
+    -   The visible spectrum volume being convex, given *CIE XYZ* tristimulus
+        values are checked against the facets planes of the convex hull of
+        the *CIE XYZ* colourspace outer surface, in chunks bounding the memory
+        usage. The convex hull is cached per ``interval``, ``cmfs`` and
+        ``illuminant``.
 
     +------------+-----------------------+---------------+
     | **Domain** | **Scale - Reference** | **Scale - 1** |
@@ -267,11 +300,25 @@ def is_within_visible_spectrum(
     """
 
     key = (interval, hash(cmfs), hash(illuminant))
-    vertices = _XYZ_OUTER_SURFACE_POINTS_CACHE.get(key)
-    if vertices is None:
-        _XYZ_OUTER_SURFACE_POINTS_CACHE[key] = vertices = (XYZ_outer_surface(
-            interval,
-            STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
-            illuminant))
-
-    return is_within_mesh_volume(XYZ, vertices, tolerance)
+    equations = _XYZ_OUTER_SURFACE_HULL_CACHE.get(key)
+    if equations is None:
+        _XYZ_OUTER_SURFACE_HULL_CACHE[key] = equations = ConvexHull(
+            XYZ_outer_surface(interval, cmfs, illuminant)).equations
+
+    tolerance = (tolerance if tolerance is not None else
+                 100 * np.finfo(DEFAULT_FLOAT_DTYPE).eps)
+
+    XYZ = as_float_array(XYZ)
+    shape = XYZ.shape
+    XYZ = np.reshape(XYZ, (-1, 3))
+
+    normals, offsets = equations[..., :-1], equations[..., -1]
+
+    within = np.zeros(XYZ.shape[0], dtype=np.bool_)
+    chunk_size = max(2 ** 22 // len(equations), 1)
+    for i in range(0, XYZ.shape[0], chunk_size):
+        distances = np.dot(XYZ[i:i + chunk_size], np.transpose(normals))
+        within[i:i + chunk_size] = np.all(
+            distances + offsets <= tolerance, axis=-1)
+
+    return np.reshape(within, shape[:-1])
@@ -62,6 +62,14 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(
                 np.array([0.4325, 0.3788, 0.1034]), self._mesh))
 
+        mesh = np.copy(self._mesh)
+        self.assertTrue(
+            is_within_mesh_volume(np.array([0.0005, 0.0031, 0.0010]), mesh))
+
+        mesh += 10
+        self.assertFalse(
+            is_within_mesh_volume(np.array([0.0005, 0.0031, 0.0010]), mesh))
+
     def test_n_dimensional_is_within_mesh_volume(self):
         """
         Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
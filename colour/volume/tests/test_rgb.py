@@ -30,6 +30,9 @@ from colour.volume import (
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
+    RGB_colourspace_volume_Mesh, RGB_colourspace_volume_coverage_Mesh,
+    RGB_colourspace_pointer_gamut_coverage_Mesh,
+    RGB_colourspace_visible_spectrum_coverage_Mesh, XYZ_outer_surface,
     is_within_pointer_gamut)
 
 __author__ = 'Colour Developers'
@@ -43,7 +46,10 @@ __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
-    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
+    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh', 'TestRGB_colourspaceVolumeCoverageMesh',
+    'TestRGB_colourspacePointerGamutCoverageMesh',
+    'TestRGB_colourspaceVisibleSpectrumCoverageMesh'
 ]
 
 
@@ -107,7 +113,38 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
                 BT709_COLOURSPACE,
                 10e3,
                 random_state=np.random.RandomState(2),
-                processes=1), 816300.0)
+                processes=1), 868500.0)
+
+        self.assertEquals(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                chunk_size=2500),
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=2,
+                chunk_size=2500))
+
+    def test_tolerance_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition convergence based early stop.
+        """
+
+        np.testing.assert_allclose(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e7,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                chunk_size=10e3,
+                tolerance=0.01),
+            832000.0,
+            rtol=0.05)
 
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
@@ -186,5 +223,119 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             decimal=7)
 
 
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            819554.61782972,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE, 16),
+            809916.29084462,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT2020_COLOURSPACE),
+            1853654.26731156,
+            places=5)
+
+        np.testing.assert_allclose(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e5,
+                random_state=np.random.RandomState(2),
+                processes=1),
+            rtol=0.01)
+
+
+class TestRGB_colourspaceVolumeCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_coverage_Mesh`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_coverage_Mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE,
+                                                 XYZ_outer_surface()),
+            48.472687025353544,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE,
+                                                 np.array([
+                                                     [2, 2, 2],
+                                                     [3, 2, 2],
+                                                     [2, 3, 2],
+                                                     [2, 2, 3],
+                                                 ])),
+            0,
+            places=7)
+
+
+class TestRGB_colourspacePointerGamutCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_pointer_gamut_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage_Mesh` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_pointer_gamut_coverage_Mesh(BT709_COLOURSPACE),
+            81.18209163354464,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_pointer_gamut_coverage_Mesh(
+                ACES_2065_1_COLOURSPACE),
+            100.00000000000000,
+            places=5)
+
+
+class TestRGB_colourspaceVisibleSpectrumCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_visible_spectrum_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage_Mesh` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_visible_spectrum_coverage_Mesh(BT709_COLOURSPACE),
+            48.472687025353544,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_visible_spectrum_coverage_Mesh(BT2020_COLOURSPACE),
+            84.627189957245850,
+            places=5)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
+from colour.algebra import NearestNeighbourInterpolator
+from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
+                                STANDARD_OBSERVERS_CMFS, SpectralShape,
+                                multi_sd_to_XYZ_integration, sd_ones)
 from colour.volume import (generate_pulse_waves, XYZ_outer_surface,
                            is_within_visible_spectrum)
 from colour.utilities import ignore_numpy_errors
@@ -116,6 +120,23 @@ class TestXYZOuterSurface(unittest.TestCase):
             ]),
             decimal=7)
 
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1964 10 Degree Standard Observer']
+        illuminant = sd_ones(cmfs.shape)
+        wavelengths = SpectralShape(DEFAULT_SPECTRAL_SHAPE.start,
+                                    DEFAULT_SPECTRAL_SHAPE.end, 20).range()
+        values = [
+            NearestNeighbourInterpolator(wavelengths, wave)(
+                DEFAULT_SPECTRAL_SHAPE.range())
+            for wave in generate_pulse_waves(len(wavelengths))
+        ]
+        XYZ = multi_sd_to_XYZ_integration(values, DEFAULT_SPECTRAL_SHAPE,
+                                          cmfs, illuminant)
+
+        np.testing.assert_almost_equal(
+            XYZ_outer_surface(20, cmfs, illuminant),
+            XYZ / XYZ[-1, 1],
+            decimal=7)
+
 
 class TestIsWithinVisibleSpectrum(unittest.TestCase):
     """
@@ -138,6 +159,14 @@ class TestIsWithinVisibleSpectrum(unittest.TestCase):
         self.assertTrue(
             is_within_visible_spectrum(np.array([0.4325, 0.3788, 0.1034])))
 
+        self.assertTrue(
+            is_within_visible_spectrum(
+                np.array([0.4325, 0.3788, 0.1034]), interval=1))
+
+        self.assertFalse(
+            is_within_visible_spectrum(
+                np.array([-0.0005, 0.0031, 0.0010]), interval=1))
+
         self.assertFalse(
             is_within_visible_spectrum(np.array([0.0025, 0.0088, 0.0340])))
 
@@ -52,7 +52,7 @@ if sys.version_info[:2] <= (3, 2):
     TESTS_REQUIREMENTS += ['mock']
 
 DEVELOPMENT_REQUIREMENTS = DOCS_REQUIREMENTS + TESTS_REQUIREMENTS + [
-    'invoke', 'restructuredtext_lint', 'twine', 'yapf'
+    'asv', 'invoke', 'restructuredtext_lint', 'twine', 'yapf'
 ]
 
 
@@ -84,7 +84,7 @@ setup(
     author=__author__,
     author_email=__email__,
     include_package_data=True,
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     scripts=[],
     url='http://github.com/colour-science/colour',
     license=__license__,
@@ -27,8 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'PYTHON_PACKAGE_NAME', 'PYPI_PACKAGE_NAME', 'clean',
-    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'preflight',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'formatting', 'tests', 'quality', 'examples', 'benchmarks', 'docs', 'todo',
+    'preflight', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -195,6 +195,57 @@ def examples(ctx, plots=False):
             ctx.run('python {0}'.format(os.path.join(root, filename)))
 
 
+@task
+def benchmarks(ctx, compare=None, factor=1.1, existing=False, quick=False):
+    """
+    Runs the *asv* benchmarks of the current revision and stores their
+    results, or compares them with the benchmarks of given revision and fails
+    if any of them regressed.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    compare : unicode, optional
+        Revision, e.g. *develop*, to compare the current revision benchmarks
+        with, both revisions results are stored.
+    factor : numeric, optional
+        Ratio from which a benchmark is considered as regressed when
+        comparing.
+    existing : bool, optional
+        Whether to run the benchmarks in the current *Python* environment
+        rather than in an environment built by *asv*, only used when not
+        comparing.
+    quick : bool, optional
+        Whether to run each benchmark only once, the results are then not
+        stored.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Running "asv" benchmarks...')
+
+    ctx.run('asv machine --yes')
+
+    if compare is not None:
+        ctx.run('asv continuous --split --factor {0} {1} HEAD'.format(
+            factor, compare))
+        return
+
+    command = 'asv run HEAD^!'
+    if existing:
+        command += ' --python=same --set-commit-hash {0}'.format(
+            ctx.run('git rev-parse HEAD', hide=True).stdout.strip())
+
+    if quick:
+        command += ' --quick'
+
+    ctx.run(command)
+
+
 @task
 def docs(ctx, plots=True, html=True, pdf=True):
     """